@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Compare cdd with equalities as linearity rows or pairs of inequalities."""
+
+import time
+
+import cdd
+import numpy as np
+
+from lpsolvers import solve_lp
+
+
+def make_problem(n: int, p: int, seed: int = 42):
+    """Generate a bounded feasible linear program with many equalities.
+
+    Parameters
+    ----------
+    n :
+        Number of optimization variables.
+    p :
+        Number of equality constraints.
+    seed :
+        Seed of the random number generator.
+
+    Returns
+    -------
+    :
+        Tuple ``(c, G, h, A, b)`` defining the linear program.
+    """
+    rng = np.random.default_rng(seed)
+    x_feas = rng.uniform(-0.5, 0.5, n)
+    G = np.vstack([np.eye(n), -np.eye(n)])
+    h = np.ones(2 * n)
+    A = rng.standard_normal((p, n))
+    b = A @ x_feas
+    c = rng.standard_normal(n)
+    return c, G, h, A, b
+
+
+def solve_with_duplicated_rows(c, G, h, A, b) -> np.ndarray:
+    """Solve a linear program with cdd, encoding A x = b as two inequalities.
+
+    This was the encoding of the cdd interface before linearity rows.
+
+    Returns
+    -------
+    :
+        Optimal solution of the linear program.
+    """
+    v = np.hstack([h, b, -b])
+    U = np.vstack([G, A, -A])
+    v = v.reshape((v.shape[0], 1))
+    constraints = np.hstack([v, -U])
+    objective = np.hstack([[0.0], c])
+    tableau = np.vstack([constraints, objective])
+    lp = cdd.linprog_from_array(tableau, obj_type=cdd.LPObjType.MIN)
+    cdd.linprog_solve(lp)
+    if lp.status != cdd.LPStatusType.OPTIMAL:
+        raise ValueError("Linear program is not feasible")
+    return np.array(lp.primal_solution)
+
+
+def average_time(function, nb_calls: int) -> float:
+    """Average the run time of a function over several calls.
+
+    Returns
+    -------
+    :
+        Average run time in milliseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(nb_calls):
+        function()
+    return 1e3 * (time.perf_counter() - start) / nb_calls
+
+
+if __name__ == "__main__":
+    nb_calls = 10
+    print(f"{'n':>4} | {'p':>4} | {'rows (ms)':>10} | {'linearity (ms)':>14}")
+    for n, p in ((20, 10), (40, 30), (60, 50), (80, 70)):
+        problem = make_problem(n, p)
+        x_rows = solve_with_duplicated_rows(*problem)
+        x_lin = solve_lp(*problem, solver="cdd")
+        assert np.allclose(x_rows, x_lin, atol=1e-6)
+        rows = average_time(
+            lambda: solve_with_duplicated_rows(*problem), nb_calls
+        )
+        lin = average_time(lambda: solve_lp(*problem, solver="cdd"), nb_calls)
+        print(f"{n:4d} | {p:4d} | {rows:10.2f} | {lin:14.2f}")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Compare CVXPY solves with and without the cache of built problems."""
+
+import time
+import warnings
+from unittest import mock
+
+import numpy as np
+
+from lpsolvers import solve_lp
+from lpsolvers.cvxpy_ import problem_cache
+
+
+def time_solves(maxsize: int, C, G, h) -> float:
+    """Measure the time to solve perturbed LPs with the same structure.
+
+    Parameters
+    ----------
+    maxsize :
+        Maximum size of the CVXPY problem cache, zero to disable it.
+    C :
+        Stack of cost vectors.
+    G :
+        Linear inequality constraint matrix, perturbed at each solve.
+    h :
+        Linear inequality constraint vector.
+
+    Returns
+    -------
+    :
+        Time per linear program, in milliseconds.
+    """
+    problem_cache.maxsize = maxsize
+    problem_cache.clear()
+    solve_lp(C[0], G, h, solver="cvxpy")  # fill the cache
+    start = time.perf_counter()
+    for i, c in enumerate(C):
+        solve_lp(c, G + 1e-3 * i, h, solver="cvxpy")
+    return 1e3 * (time.perf_counter() - start) / C.shape[0]
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore", category=UserWarning)
+    print(
+        f"{'n':>4} | {'m':>4} | {'entries':>7} | {'fresh (ms)':>10} | "
+        f"{'cached (ms)':>11} | {'parametrized (ms)':>17}"
+    )
+    for n, m, nb_solves in (
+        (10, 40, 20),
+        (20, 80, 20),
+        (50, 200, 10),
+        (100, 300, 5),
+        (300, 1000, 2),
+    ):
+        rng = np.random.default_rng(42)
+        G = np.vstack([rng.standard_normal((m, n)), np.eye(n), -np.eye(n)])
+        h = np.hstack([rng.uniform(1.0, 2.0, m), np.ones(2 * n)])
+        C = rng.standard_normal((nb_solves, n))
+        fresh = time_solves(0, C, G, h)
+        cached = time_solves(32, C, G, h)
+        # parametrize constraint matrices of all sizes, as a reference
+        with mock.patch("lpsolvers.cvxpy_.MAX_PARAMETER_ENTRIES", G.size):
+            parametrized = time_solves(32, C, G, h)
+        print(
+            f"{n:4d} | {m:4d} | {G.size:7d} | {fresh:10.2f} | "
+            f"{cached:11.2f} | {parametrized:17.2f}"
+        )
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Compare solve_lp loops and solve_lp_multi_cost on support functions."""
+
+import time
+import warnings
+
+import numpy as np
+
+from lpsolvers import available_solvers, solve_lp, solve_lp_multi_cost
+
+
+def make_polytope(n: int, m: int, seed: int = 42):
+    """Generate a bounded polytope away from the origin.
+
+    Parameters
+    ----------
+    n :
+        Dimension of the polytope.
+    m :
+        Number of random halfspaces, in addition to box constraints.
+    seed :
+        Seed of the random number generator.
+
+    Returns
+    -------
+    :
+        Pair ``(G, h)`` of the halfspace representation of the polytope.
+    """
+    rng = np.random.default_rng(seed)
+    G = np.vstack([rng.standard_normal((m, n)), np.eye(n), -np.eye(n)])
+    h = np.hstack([rng.uniform(0.5, 1.0, m), np.ones(n), np.ones(n)])
+    center = rng.uniform(2.0, 3.0, n)
+    return G, h + G @ center
+
+
+def time_loop(solver: str, C, G, h) -> float:
+    """Measure the time to solve all cost vectors with solve_lp.
+
+    Parameters
+    ----------
+    solver :
+        Name of the LP solver.
+    C :
+        Stack of cost vectors.
+    G :
+        Linear inequality constraint matrix.
+    h :
+        Linear inequality constraint vector.
+
+    Returns
+    -------
+    :
+        Time per cost vector, in milliseconds.
+    """
+    start = time.perf_counter()
+    for c in C:
+        solve_lp(c, G, h, solver=solver)
+    return 1e3 * (time.perf_counter() - start) / C.shape[0]
+
+
+def time_multi_cost(solver: str, C, G, h) -> float:
+    """Measure the time to solve all cost vectors with solve_lp_multi_cost.
+
+    Parameters
+    ----------
+    solver :
+        Name of the LP solver.
+    C :
+        Stack of cost vectors.
+    G :
+        Linear inequality constraint matrix.
+    h :
+        Linear inequality constraint vector.
+
+    Returns
+    -------
+    :
+        Time per cost vector, in milliseconds.
+    """
+    start = time.perf_counter()
+    solve_lp_multi_cost(C, G, h, solver=solver)
+    return 1e3 * (time.perf_counter() - start) / C.shape[0]
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore", category=UserWarning)
+    n, m, k = 6, 60, 200
+    G, h = make_polytope(n, m)
+    rng = np.random.default_rng(0)
+    C = np.cumsum(0.2 * rng.standard_normal((k, n)), axis=0) + 1.0
+    C /= np.linalg.norm(C, axis=1)[:, np.newaxis]  # sweep of directions
+    print(f"{k} cost vectors on a polytope with {G.shape[0]} halfspaces")
+    print(f"{'solver':>8} | {'loop (ms)':>10} | {'multi (ms)':>10} | speedup")
+    for solver in available_solvers:
+        solve_lp(C[0], G, h, solver=solver)  # import and warm up
+        try:
+            loop = time_loop(solver, C, G, h)
+        except ValueError:  # solver failed on one of the cost vectors
+            print(f"{solver:>8} | failed")
+            continue
+        multi = time_multi_cost(solver, C, G, h)
+        print(
+            f"{solver:>8} | {loop:10.3f} | {multi:10.3f} | {loop / multi:7.2f}"
+        )
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Compare iterations and wall time with and without scaling."""
+
+import time
+import warnings
+
+import numpy as np
+
+from lpsolvers import Problem, available_solvers, solve_problem
+
+# PDLP does not stop by itself on some badly scaled problems, while ProxQP
+# detects primal infeasibility too early on LPs with its default settings
+SOLVER_KWARGS = {
+    "pdlp": {"time_sec_limits": 5.0},
+    "proxqp": {"eps_primal_inf": 1e-12},
+}
+
+
+def make_problem(n: int, m: int, magnitude: float, seed: int = 42):
+    """Generate a bounded feasible LP with badly scaled rows and columns.
+
+    Parameters
+    ----------
+    n :
+        Number of optimization variables.
+    m :
+        Number of random inequality constraints, in addition to box
+        constraints.
+    magnitude :
+        Row and column factors are drawn log-uniformly between
+        ``10 ** -magnitude`` and ``10 ** magnitude``.
+    seed :
+        Seed of the random number generator.
+
+    Returns
+    -------
+    :
+        Badly scaled linear program.
+    """
+    rng = np.random.default_rng(seed)
+    G_rand = rng.standard_normal((m, n))
+    x_feas = rng.uniform(-0.5, 0.5, n)
+    h_rand = G_rand @ x_feas + rng.uniform(0.1, 1.0, m)
+    G = np.vstack([G_rand, np.eye(n), -np.eye(n)])
+    h = np.hstack([h_rand, np.ones(n), np.ones(n)])
+    c = rng.standard_normal(n)
+    row_scale = 10.0 ** rng.uniform(-magnitude, magnitude, G.shape[0])
+    col_scale = 10.0 ** rng.uniform(-magnitude, magnitude, n)
+    return Problem(
+        c * col_scale,
+        row_scale[:, np.newaxis] * G * col_scale,
+        row_scale * h,
+    )
+
+
+def run(solver: str, problem: Problem, scale: bool, nb_runs: int = 3):
+    """Solve a linear program several times.
+
+    Parameters
+    ----------
+    solver :
+        Name of the LP solver.
+    problem :
+        Linear program to solve.
+    scale :
+        If set, scale the linear program before solving it.
+    nb_runs :
+        Number of solves to average wall time over, after a first solve
+        that warms up the solver interface.
+
+    Returns
+    -------
+    :
+        Pair of average wall time in milliseconds and number of iterations,
+        or ``None`` if the solver failed.
+    """
+    wall_times = []
+    for _ in range(nb_runs + 1):
+        start_time = time.perf_counter()
+        try:
+            solution = solve_problem(
+                problem,
+                solver=solver,
+                scale=scale,
+                **SOLVER_KWARGS.get(solver, {}),
+            )
+        except RuntimeError:  # e.g. cycling detected by cdd
+            return None
+        wall_times.append(1e3 * (time.perf_counter() - start_time))
+        if not solution.found:
+            return None
+    return np.mean(wall_times[1:]), solution.iter
+
+
+def format_result(result) -> str:
+    """Format a benchmark result for the table.
+
+    Parameters
+    ----------
+    result :
+        Result returned by :func:`run`.
+
+    Returns
+    -------
+    :
+        Wall time and iterations, or ``failed``.
+    """
+    if result is None:
+        return f"{'failed':>10} | {'':>10}"
+    iterations = "-" if result[1] is None else str(result[1])
+    return f"{result[0]:10.2f} | {iterations:>10}"
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore", category=UserWarning)
+    n, m = 50, 100
+    for magnitude in (0.0, 3.0, 6.0):
+        problem = make_problem(n, m, magnitude)
+        print(
+            f"\nLP with {n} variables, {problem.G.shape[0]} inequalities and "
+            f"coefficients scaled by 1e-{magnitude:g} to 1e{magnitude:g}"
+        )
+        print(
+            f"{'solver':>8} | {'plain (ms)':>10} | {'plain (it)':>10} | "
+            f"{'scaled (ms)':>10} | {'scaled (it)':>10}"
+        )
+        for solver in available_solvers:
+            plain = run(solver, problem, scale=False)
+            scaled = run(solver, problem, scale=True)
+            print(
+                f"{solver:>8} | {format_result(plain)} | "
+                f"{format_result(scaled)}"
+            )
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Compare the built-in simplex with cdd and CVXOPT on tiny LPs."""
+
+import os
+import sys
+import timeit
+import warnings
+
+import numpy as np
+
+from lpsolvers import available_solvers, get_solve_function
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+
+from small_problems import problems  # noqa: E402
+
+
+def make_problem(n: int, m: int, seed: int = 42):
+    """Generate a bounded feasible linear program of robotics size.
+
+    Parameters
+    ----------
+    n :
+        Number of optimization variables.
+    m :
+        Number of random inequality constraints, in addition to box
+        constraints.
+    seed :
+        Seed of the random number generator.
+
+    Returns
+    -------
+    :
+        Tuple ``(c, G, h)`` defining the linear program.
+    """
+    rng = np.random.default_rng(seed)
+    G_rand = rng.standard_normal((m, n))
+    x_feas = rng.uniform(-0.5, 0.5, n)
+    h_rand = G_rand @ x_feas + rng.uniform(0.1, 1.0, m)
+    G = np.vstack([G_rand, np.eye(n), -np.eye(n)])
+    h = np.hstack([h_rand, np.ones(n), np.ones(n)])
+    c = rng.standard_normal(n)
+    return c, G, h
+
+
+def time_solver(solver: str, c, G, h, number: int = 200) -> float:
+    """Measure the time of a call to the solve function of a solver.
+
+    Parameters
+    ----------
+    solver :
+        Name of the LP solver.
+    c :
+        Linear cost vector.
+    G :
+        Linear inequality constraint matrix.
+    h :
+        Linear inequality constraint vector.
+    number :
+        Number of calls per measurement.
+
+    Returns
+    -------
+    :
+        Best time per call over five measurements, in microseconds.
+    """
+    solve_function = get_solve_function(solver)
+    solve_function(c, G, h)  # import and warm up the backend
+    times = timeit.repeat(
+        lambda: solve_function(c, G, h), number=number, repeat=5
+    )
+    return 1e6 * min(times) / number
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore", category=UserWarning)
+    solvers = [
+        solver
+        for solver in ("simplex", "cdd", "cvxopt", "highs")
+        if solver in available_solvers
+    ]
+    instances = [
+        (f"small_problems[{i}]", problem) for i, problem in enumerate(problems)
+    ]
+    instances.append(("random 20 x 100", make_problem(20, 60)))
+    print(f"{'instance':>20} | " + " | ".join(f"{s:>10}" for s in solvers))
+    print(f"{'':>20} | " + " | ".join(f"{'(us)':>10}" for _ in solvers))
+    for name, (c, G, h) in instances:
+        times = [time_solver(solver, c, G, h) for solver in solvers]
+        print(f"{name:>20} | " + " | ".join(f"{t:10.1f}" for t in times))
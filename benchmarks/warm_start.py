@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Compare cold and warm starts on a sequence of closely related LPs."""
+
+import warnings
+
+import numpy as np
+
+from lpsolvers import Problem, available_solvers, solve_problem
+
+
+def make_problem(n: int, m: int, seed: int = 42):
+    """Generate a bounded feasible linear program.
+
+    Parameters
+    ----------
+    n :
+        Number of optimization variables.
+    m :
+        Number of random inequality constraints, in addition to box
+        constraints.
+    seed :
+        Seed of the random number generator.
+
+    Returns
+    -------
+    :
+        Tuple ``(c, G, h)`` defining the linear program.
+    """
+    rng = np.random.default_rng(seed)
+    G_rand = rng.standard_normal((m, n))
+    x_feas = rng.uniform(-0.5, 0.5, n)
+    h_rand = G_rand @ x_feas + rng.uniform(0.1, 1.0, m)
+    G = np.vstack([G_rand, np.eye(n), -np.eye(n)])
+    h = np.hstack([h_rand, np.ones(n), np.ones(n)])
+    c = rng.standard_normal(n)
+    return c, G, h
+
+
+def run(solver: str, problems, warm: bool):
+    """Solve a sequence of problems, warm starting from the previous one.
+
+    Parameters
+    ----------
+    solver :
+        Name of the LP solver.
+    problems :
+        Sequence of linear programs.
+    warm :
+        If set, start each solve from the previous primal-dual solution.
+
+    Returns
+    -------
+    :
+        Pair of average solve time in milliseconds and average number of
+        iterations, or ``None`` if a solve failed.
+    """
+    solve_times, iterations = [], []
+    x, z = None, None
+    for problem in problems:
+        solution = solve_problem(
+            problem, solver=solver, initvals=x, dual_initvals=z
+        )
+        if not solution.found:
+            return None
+        solve_times.append(1e3 * solution.solve_time)
+        iterations.append(solution.iter or 0)
+        if warm:
+            x, z = solution.x, solution.z
+    return np.mean(solve_times), np.mean(iterations)
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore", category=UserWarning)
+    n, m, nb_steps = 100, 200, 20
+    c, G, h = make_problem(n, m)
+    rng = np.random.default_rng(0)
+    problems = [
+        Problem(c + 1e-3 * rng.standard_normal(n), G, h)
+        for _ in range(nb_steps)
+    ]
+    warm_solvers = [
+        solver
+        for solver in ("cvxpy", "pdlp", "proxqp")
+        if solver in available_solvers
+    ]
+    print(f"{nb_steps} LPs with {n} variables and {G.shape[0]} inequalities")
+    print(
+        f"{'solver':>8} | {'cold (ms)':>10} | {'cold (it)':>10} | "
+        f"{'warm (ms)':>10} | {'warm (it)':>10}"
+    )
+    for solver in warm_solvers:
+        cold = run(solver, problems, warm=False)
+        warm = run(solver, problems, warm=True)
+        if cold is None or warm is None:
+            print(f"{solver:>8} | failed")
+            continue
+        print(
+            f"{solver:>8} | {cold[0]:10.2f} | {cold[1]:10.1f} | "
+            f"{warm[0]:10.2f} | {warm[1]:10.1f}"
+        )
@@ -6,137 +6,85 @@
 
 """Linear programming solvers in Python with a unified API."""
 
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 import numpy as np
-
-from .exceptions import NoSolverSelected, SolverNotFound
+import scipy.sparse as spa
+
+from .cache import LPCache
+from .exceptions import (
+    InfeasibleProblem,
+    NoSolverSelected,
+    ProblemError,
+    SolverTimeout,
+    UnboundedProblem,
+)
+from .lp_solver import LPSolver, make_lp_solver
+from .problem import Problem
+from .selection import select_solver
+from .snapshot import Snapshot, load_problem, save_problem
+from .solution import Solution
+from .solve_async import solve_lp_async, solve_lps_async, solve_problem_async
+from .solve_lps import solve_lp_multi_cost, solve_lps
+from .solve_problem import solve_problem
+from .solvers import (
+    available_solvers,
+    get_missing_solve_function,
+    get_solve_function,
+    solver_packages,
+)
 
 __version__ = "2.1.0"
 
-available_solvers = []
-
-
-# cdd
-# ===
-
-try:
-    from .cdd_ import cdd_solve_lp
-
-    available_solvers.append("cdd")
-except ImportError:
-
-    def cdd_solve_lp(
-        c: np.ndarray,
-        G: np.ndarray,
-        h: np.ndarray,
-        A: Optional[np.ndarray] = None,
-        b: Optional[np.ndarray] = None,
-    ) -> np.ndarray:
-        """Error function defined when cdd is not available."""
-        raise ImportError("cdd not found")
-
-
-# CVXOPT
-# ======
 
-try:
-    from .cvxopt_ import cvxopt_solve_lp
+def __getattr__(name: str):
+    """Import solve functions of solver interfaces on first access.
 
-    available_solvers.append("cvxopt")
-except ImportError:
-
-    def cvxopt_solve_lp(
-        c: np.ndarray,
-        G: np.ndarray,
-        h: np.ndarray,
-        A: Optional[np.ndarray] = None,
-        b: Optional[np.ndarray] = None,
-        solver: Optional[str] = None,
-        **kwargs,
-    ) -> np.ndarray:
-        """Error function defined when CVXOPT is not available."""
-        raise ImportError("CVXOPT not found")
-
-
-# CVXPY
-# =====
-
-try:
-    from .cvxpy_ import cvxpy_solve_lp
-
-    available_solvers.append("cvxpy")
-except ImportError:
-
-    def cvxpy_solve_lp(
-        c: np.ndarray,
-        G: np.ndarray,
-        h: np.ndarray,
-        A: Optional[np.ndarray] = None,
-        b: Optional[np.ndarray] = None,
-        solver: Optional[str] = None,
-        verbose: bool = False,
-        **kwargs,
-    ) -> np.ndarray:
-        """Error function defined when CVXPY is not available."""
-        raise ImportError("CVXPY not found")
-
-
-# PDLP
-# ====
-
-try:
-    from .pdlp_ import pdlp_solve_lp
-
-    available_solvers.append("pdlp")
-except ImportError:
-
-    def pdlp_solve_lp(
-        c: np.ndarray,
-        G: np.ndarray,
-        h: np.ndarray,
-        A: Optional[np.ndarray] = None,
-        b: Optional[np.ndarray] = None,
-        verbose: bool = False,
-        eps_optimal_absolute: Optional[float] = None,
-        eps_optimal_relative: Optional[float] = None,
-        time_sec_limits: Optional[float] = None,
-        **kwargs,
-    ) -> np.ndarray:
-        """Error function defined when PDLP is not available."""
-        raise ImportError("PDLP not found")
-
-
-# ProxQP
-# ======
+    Parameters
+    ----------
+    name :
+        Name of the module attribute, *e.g.* ``"cvxopt_solve_lp"`` or
+        ``"pdhg_solve_lps"``.
 
-try:
-    from .proxqp_ import proxqp_solve_lp
+    Returns
+    -------
+    :
+        Solve function of the corresponding solver interface.
 
-    available_solvers.append("proxqp")
-except ImportError:
+    Raises
+    ------
+    AttributeError
+        If the attribute is not the solve function of a known solver.
+    """
+    if name == "pdhg_solve_lps":
+        from .pdhg_ import pdhg_solve_lps
 
-    def proxqp_solve_lp(
-        c: np.ndarray,
-        G: np.ndarray,
-        h: np.ndarray,
-        A: Optional[np.ndarray] = None,
-        b: Optional[np.ndarray] = None,
-        verbose: bool = False,
-        backend: Optional[str] = None,
-        **kwargs,
-    ) -> np.ndarray:
-        """Error function defined when ProxQP is not available."""
-        raise ImportError("ProxQP not found")
+        return pdhg_solve_lps
+    if name.endswith("_solve_lp"):
+        solver = name[: -len("_solve_lp")]
+        if solver in solver_packages:
+            try:
+                return get_solve_function(solver)
+            except ImportError as exn:
+                return get_missing_solve_function(solver, exn)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def solve_lp(
     c: np.ndarray,
-    G: np.ndarray,
+    G: Union[np.ndarray, spa.csc_matrix],
     h: np.ndarray,
-    A: Optional[np.ndarray] = None,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
     b: Optional[np.ndarray] = None,
-    solver: Optional[str] = None,
+    solver: Optional[Union[str, Sequence[str]]] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    presolve: bool = False,
+    scale: bool = False,
+    race: bool = False,
+    time_limit: Optional[float] = None,
     **kwargs,
 ) -> np.ndarray:
     r"""Solve a linear program using one of the available LP solvers.
@@ -150,7 +98,8 @@ def solve_lp(
                 c^T x \\
             \mbox{subject to}
                 & G x \leq h \\
-                & A x = b
+                & A x = b \\
+                & lb \leq x \leq ub
         \end{array}\end{split}
 
     Parameters
@@ -158,15 +107,44 @@ def solve_lp(
     c :
         Linear cost vector.
     G :
-        Linear inequality constraint matrix.
+        Linear inequality constraint matrix, dense or sparse.
     h :
         Linear inequality constraint vector.
     A :
-        Linear equality constraint matrix.
+        Linear equality constraint matrix, dense or sparse.
     b :
         Linear equality constraint vector.
     solver :
-        Name of the LP solver to choose in :data:`lpsolvers.available_solvers`.
+        Name of the LP solver to choose in :data:`lpsolvers.available_solvers`,
+        or ``"auto"`` to select one from the features of the problem with
+        :func:`lpsolvers.selection.select_solver`.
+    initvals :
+        Primal initial guess, if any, for solvers that support warm starting.
+    dual_initvals :
+        Dual initial guess, if any, stacking multipliers of inequality then
+        equality constraints. Multipliers are nonnegative for inequalities,
+        with the sign convention :math:`c + G^T z + A^T y = 0` at the optimum.
+    lb :
+        Lower bound constraint vector, if any. Infinite entries are allowed.
+    ub :
+        Upper bound constraint vector, if any. Infinite entries are allowed.
+    presolve :
+        If set, remove duplicate, zero and singleton rows as well as fixed
+        variables before calling the solver, see
+        :func:`lpsolvers.presolve.presolve_problem`.
+    scale :
+        If set, equilibrate rows and columns of the constraint matrices as
+        well as the cost vector before calling the solver, see
+        :func:`lpsolvers.scaling.scale_problem`. This helps first-order
+        solvers on linear programs with badly scaled coefficients.
+    race :
+        If set, ``solver`` is a list of solvers that are run in parallel
+        worker processes, see :func:`lpsolvers.race.race_problem`. The first
+        solution found is returned and the other solvers are terminated.
+    time_limit :
+        Wall-clock time limit in seconds, if any. It is enforced natively by
+        solvers that support it, and otherwise by running the solver in a
+        subprocess that is terminated when the time limit is reached.
 
     Returns
     -------
@@ -177,8 +155,14 @@ def solve_lp(
     ------
     ValueError
         If the LP is not feasible.
+    SolverTimeout
+        If the solver does not finish within the time limit. The solution
+        returned by the solver when it stopped, if any, is attached to the
+        exception.
     SolverNotFound
         If the requested LP solver is not found.
+    ImportError
+        If the backend of the requested LP solver is not installed.
 
     Notes
     -----
@@ -186,6 +170,10 @@ def solve_lp(
     underlying solver. For example, we can call ProxQP with a custom absolute
     feasibility tolerance by ``solve_lp(c, G, h, solver='proxqp',
     eps_abs=1e-8)``.
+
+    Variable bounds are passed to solvers that support them natively, such
+    as PDLP and CVXPY. Other solvers receive one inequality row per finite
+    bound.
     """
     if solver is None:
         raise NoSolverSelected(
@@ -194,26 +182,77 @@ def solve_lp(
         )
     if isinstance(G, np.ndarray) and G.ndim == 1:
         G = G.reshape((1, G.shape[0]))
+    if solver == "auto":
+        solver = select_solver(Problem(c, G, h, A, b, lb, ub))
+    if (
+        presolve
+        or scale
+        or race
+        or time_limit is not None
+        or not isinstance(solver, str)
+    ):
+        solution = solve_problem(
+            Problem(c, G, h, A, b, lb, ub),
+            solver,
+            initvals,
+            dual_initvals,
+            presolve=presolve,
+            scale=scale,
+            race=race,
+            time_limit=time_limit,
+            **kwargs,
+        )
+        if not solution.found:
+            raise ValueError(
+                f"Linear program is not feasible: {solution.status}"
+            )
+        return solution.x
+    solve_function = get_solve_function(solver)
     if solver == "cdd":
-        return cdd_solve_lp(c, G, h, A, b)
-    if solver == "cvxopt":
-        return cvxopt_solve_lp(c, G, h, A, b, **kwargs)
-    if solver == "cvxpy":
-        return cvxpy_solve_lp(c, G, h, A, b, **kwargs)
-    if solver == "pdlp":
-        return pdlp_solve_lp(c, G, h, A, b, **kwargs)
-    if solver == "proxqp":
-        return proxqp_solve_lp(c, G, h, A, b, **kwargs)
-    raise SolverNotFound(f"solver '{solver}' is not available")
+        kwargs = {}
+    return solve_function(
+        c,
+        G,
+        h,
+        A,
+        b,
+        initvals=initvals,
+        dual_initvals=dual_initvals,
+        lb=lb,
+        ub=ub,
+        **kwargs,
+    )
 
 
 __all__ = [
+    "InfeasibleProblem",
+    "LPCache",
+    "LPSolver",
+    "Problem",
+    "ProblemError",
+    "Snapshot",
+    "Solution",
+    "SolverTimeout",
+    "UnboundedProblem",
     "__version__",
     "available_solvers",
     "cdd_solve_lp",
     "cvxopt_solve_lp",
     "cvxpy_solve_lp",
+    "highs_solve_lp",
+    "load_problem",
+    "make_lp_solver",
+    "pdhg_solve_lps",
     "pdlp_solve_lp",
     "proxqp_solve_lp",
+    "save_problem",
+    "simplex_solve_lp",
+    "select_solver",
     "solve_lp",
+    "solve_lp_async",
+    "solve_lp_multi_cost",
+    "solve_lps",
+    "solve_lps_async",
+    "solve_problem",
+    "solve_problem_async",
 ]
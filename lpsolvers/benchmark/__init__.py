@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Benchmark LP solvers on scalable families of linear programs.
+
+The benchmark can be run from the command line, for instance:
+
+.. code:: bash
+
+    python -m lpsolvers.benchmark --sizes 10 100 1000 --csv results.csv
+
+Sparse families scale up to millions of variables, while dense ones are
+limited by the memory of their constraint matrices. Adding ``--calibrate``
+rebuilds the decision table of ``solver="auto"`` from local timings.
+"""
+
+from .calibration import calibrate_decision_table
+from .problems import BenchmarkProblem, families, formats, generate_problem
+from .runner import (
+    BenchmarkResult,
+    format_summary,
+    format_table,
+    run_benchmark,
+    run_case,
+    write_csv,
+)
+
+__all__ = [
+    "BenchmarkProblem",
+    "BenchmarkResult",
+    "calibrate_decision_table",
+    "families",
+    "format_summary",
+    "format_table",
+    "formats",
+    "generate_problem",
+    "run_benchmark",
+    "run_case",
+    "write_csv",
+]
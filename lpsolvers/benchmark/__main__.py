@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Command-line interface of the benchmark suite."""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .. import __version__
+from ..selection import decision_table_path, save_decision_table
+from ..solvers import available_solvers
+from .calibration import calibrate_decision_table
+from .problems import families, formats
+from .runner import format_summary, format_table, run_benchmark, write_csv
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Parameters
+    ----------
+    argv :
+        Command-line arguments, defaults to those of the process.
+
+    Returns
+    -------
+    :
+        Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m lpsolvers.benchmark",
+        description="Benchmark LP solvers on families of linear programs.",
+    )
+    parser.add_argument(
+        "--solvers",
+        nargs="+",
+        default=available_solvers,
+        choices=available_solvers,
+        help="solvers to benchmark (default: all available solvers)",
+    )
+    parser.add_argument(
+        "--families",
+        nargs="+",
+        default=list(families),
+        choices=families,
+        help="families of linear programs",
+    )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        default=list(formats),
+        choices=formats,
+        help="formats of constraint matrices",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[10, 100],
+        help="numbers of optimization variables, up to 10^6 for sparse LPs",
+    )
+    parser.add_argument(
+        "--seeds",
+        nargs="+",
+        type=int,
+        default=[0],
+        help="seeds of the random linear programs",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=1,
+        help="number of timed solves per case, the best of which is kept",
+    )
+    parser.add_argument(
+        "--max-dense-size",
+        type=int,
+        default=1000,
+        help="skip dense cases, or solvers that densify, above this size",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="do not trace memory allocations",
+    )
+    parser.add_argument(
+        "--csv",
+        metavar="PATH",
+        help="write results to this CSV file",
+    )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="rebuild the decision table of solver='auto' from the timings "
+        "of feasible problems",
+    )
+    parser.add_argument(
+        "--table",
+        metavar="PATH",
+        default=None,
+        help="path to the calibrated decision table "
+        f"(default: {decision_table_path()})",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="only print the summary table",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    argv :
+        Command-line arguments, defaults to those of the process.
+    """
+    args = parse_args(argv)
+    if args.calibrate:
+        args.families = ["feasible"]
+    if not args.quiet:
+        print(format_table([]))
+    results = run_benchmark(
+        solvers=args.solvers,
+        families=args.families,
+        formats=args.formats,
+        sizes=args.sizes,
+        seeds=args.seeds,
+        repeats=args.repeats,
+        trace_memory=not args.no_memory,
+        max_dense_size=args.max_dense_size,
+        verbose=not args.quiet,
+    )
+    print("")
+    print(format_summary(results))
+    if args.csv is not None:
+        with open(args.csv, "w", newline="") as file:
+            write_csv(results, file, version=__version__)
+        print(f"\nResults written to {args.csv}")
+    if args.calibrate:
+        table = calibrate_decision_table(results)
+        path = save_decision_table(table, args.table)
+        print(f"\nDecision table written to {path}:")
+        for rule in table:
+            print(
+                f"    n <= {rule.max_variables:g}, "
+                f"density >= {rule.min_density:.2f}: {', '.join(rule.solvers)}"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
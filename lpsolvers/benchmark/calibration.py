@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Calibrate the decision table of automatic solver selection."""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..selection import SelectionRule
+from .runner import BenchmarkResult
+
+
+def calibrate_decision_table(
+    results: Sequence[BenchmarkResult], nnz_per_row: int = 5
+) -> List[SelectionRule]:
+    """Build a decision table from benchmark results.
+
+    Each benchmarked size gives one rule for dense problems and one rule for
+    sparse problems, listing the solvers that succeeded on feasible problems
+    of this size and format from the fastest to the slowest. Size limits of
+    rules are placed halfway, on a logarithmic scale, between consecutive
+    sizes, and dense rules only match problems denser than the geometric
+    mean of the densities of generated dense and sparse problems.
+
+    Parameters
+    ----------
+    results :
+        Results of :func:`lpsolvers.benchmark.run_benchmark`, of which only
+        those on feasible problems are used.
+    nnz_per_row :
+        Number of nonzeros per row of the sparse problems benchmarked.
+
+    Returns
+    -------
+    :
+        Decision table, to save with
+        :func:`lpsolvers.selection.save_decision_table`.
+    """
+    run_times: Dict[Tuple[int, str], Dict[str, float]] = {}
+    for result in results:
+        if result.family != "feasible":
+            continue
+        times = run_times.setdefault((result.n, result.format), {})
+        if not result.success:
+            times.setdefault(result.solver, np.inf)
+            continue
+        # keep the best time of a solver over seeds of the same case
+        times[result.solver] = min(
+            result.run_time, times.get(result.solver, np.inf)
+        )
+    sizes = sorted({n for n, _ in run_times})
+    table: List[SelectionRule] = []
+    for i, n in enumerate(sizes):
+        max_variables = (
+            float(np.sqrt(n * sizes[i + 1])) if i + 1 < len(sizes) else np.inf
+        )
+        sparse_density = min(nnz_per_row, n) / n
+        for matrix_format in ("dense", "sparse"):
+            times = run_times.get((n, matrix_format), {})
+            solvers = tuple(
+                solver
+                for solver in sorted(times, key=times.__getitem__)
+                if times[solver] < np.inf
+            )
+            if not solvers:
+                continue
+            table.append(
+                SelectionRule(
+                    solvers,
+                    max_variables=max_variables,
+                    min_density=float(np.sqrt(sparse_density))
+                    if matrix_format == "dense"
+                    else 0.0,
+                )
+            )
+    return table
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Scalable families of linear programs with known outcomes."""
+
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from ..problem import Problem
+
+families = ("feasible", "infeasible", "unbounded")
+"""Families of linear programs generated by :func:`generate_problem`."""
+
+formats = ("dense", "sparse")
+"""Formats of constraint matrices generated by :func:`generate_problem`."""
+
+
+@dataclass(frozen=True)
+class BenchmarkProblem:
+    """Linear program of a benchmark, along with its expected outcome.
+
+    Attributes
+    ----------
+    problem :
+        Linear program.
+    family :
+        Family of the linear program, in :data:`families`.
+    format :
+        Format of its constraint matrices, in :data:`formats`.
+    n :
+        Number of optimization variables.
+    seed :
+        Seed used to generate the linear program.
+    """
+
+    problem: Problem
+    family: str
+    format: str
+    n: int
+    seed: int
+
+    @property
+    def has_solution(self) -> bool:
+        """Check whether the linear program has an optimal solution.
+
+        Returns
+        -------
+        :
+            True for feasible linear programs, False for infeasible and
+            unbounded ones.
+        """
+        return self.family == "feasible"
+
+
+def __random_matrix(
+    rng: np.random.Generator, m: int, n: int, sparse: bool, nnz_per_row: int
+) -> Union[np.ndarray, spa.csc_matrix]:
+    """Generate a random matrix with standard normal entries.
+
+    Parameters
+    ----------
+    rng :
+        Random number generator.
+    m :
+        Number of rows.
+    n :
+        Number of columns.
+    sparse :
+        If set, generate a sparse matrix with about ``nnz_per_row`` nonzeros
+        per row, otherwise a dense matrix.
+    nnz_per_row :
+        Number of nonzeros per row of sparse matrices.
+
+    Returns
+    -------
+    :
+        Random matrix, in CSC format if sparse.
+    """
+    if not sparse:
+        return rng.standard_normal((m, n))
+    k = min(nnz_per_row, n)
+    rows = np.repeat(np.arange(m), k)
+    cols = rng.integers(0, n, size=m * k)
+    data = rng.standard_normal(m * k)
+    # duplicate entries are summed by the conversion to CSC
+    return spa.csc_matrix((data, (rows, cols)), shape=(m, n))
+
+
+def generate_problem(
+    family: str,
+    n: int,
+    format: str = "sparse",
+    seed: int = 0,
+    nnz_per_row: int = 5,
+) -> BenchmarkProblem:
+    r"""Generate a linear program of a given family and size.
+
+    All families have random inequality constraints :math:`G x \leq h`
+    with :math:`n` rows, and random equality constraints :math:`A x = b`
+    with :math:`n / 4` rows:
+
+    - ``"feasible"``: bounds :math:`-1 \leq x \leq 1` make the problem
+      bounded, and the right-hand sides are built around a point strictly
+      inside them, so that the problem has an optimal solution;
+    - ``"infeasible"``: the feasible problem with two more inequalities
+      :math:`a^T x \leq -1` and :math:`-a^T x \leq -1`, which contradict
+      each other;
+    - ``"unbounded"``: a feasible problem without bounds, where rows of
+      :math:`G` are flipped so that the cost decreases indefinitely along a
+      direction of the feasible set.
+
+    Parameters
+    ----------
+    family :
+        Family of the linear program, in :data:`families`.
+    n :
+        Number of optimization variables.
+    format :
+        Format of constraint matrices, in :data:`formats`.
+    seed :
+        Seed of the random number generator.
+    nnz_per_row :
+        Number of nonzeros per row of sparse constraint matrices.
+
+    Returns
+    -------
+    :
+        Linear program with its expected outcome.
+
+    Raises
+    ------
+    ValueError
+        If the family or format is unknown.
+    """
+    if family not in families:
+        raise ValueError(f"unknown family '{family}', not in {families}")
+    if format not in formats:
+        raise ValueError(f"unknown format '{format}', not in {formats}")
+    rng = np.random.default_rng(seed)
+    sparse = format == "sparse"
+    m, p = n, max(n // 4, 1)
+    G = __random_matrix(rng, m, n, sparse, nnz_per_row)
+    A = __random_matrix(rng, p, n, sparse, nnz_per_row)
+    x_feas = rng.uniform(-0.5, 0.5, n)
+    c = rng.standard_normal(n)
+    lb, ub = -np.ones(n), np.ones(n)
+    if family == "unbounded":
+        # Along the direction d = e_0, remove x_0 from equalities and flip
+        # inequalities so that A d = 0 and G d <= 0, while c^T d < 0
+        if sparse:
+            A = spa.csc_matrix(A)
+            A.data[A.indptr[0] : A.indptr[1]] = 0.0
+            A.eliminate_zeros()
+            first_column = G[:, [0]].toarray().ravel()
+        else:
+            A[:, 0] = 0.0
+            first_column = G[:, 0]
+        signs = np.where(first_column > 0.0, -1.0, 1.0)
+        if sparse:
+            G = spa.csc_matrix(spa.diags(signs) @ G)
+        else:
+            G = signs[:, np.newaxis] * G
+        c[0] = -1.0
+        lb, ub = None, None
+    h = G @ x_feas + rng.uniform(0.1, 1.0, m)
+    b = A @ x_feas
+    if family == "infeasible":
+        # The first row a of G gives a^T x <= -1 and a^T x >= 1
+        a = G[[0], :]
+        G = spa.vstack([G, a, -a], "csc") if sparse else np.vstack([G, a, -a])
+        h = np.hstack([h, [-1.0, -1.0]])
+    problem = Problem(c, G, h, A, b, lb, ub)
+    return BenchmarkProblem(problem, family, format, n, seed)
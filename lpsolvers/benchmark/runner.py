@@ -0,0 +1,339 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Run benchmarks and report their results."""
+
+import csv
+import dataclasses
+import gc
+import time
+import tracemalloc
+import warnings
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO
+
+import numpy as np
+
+from ..solve_problem import solve_problem
+from ..solvers import available_solvers
+from .problems import BenchmarkProblem, generate_problem
+
+dense_solvers = ("cdd",)
+"""Solvers that densify constraint matrices, whatever their format."""
+
+
+@dataclass(frozen=False)
+class BenchmarkResult:
+    """Outcome of a solver on a benchmark problem.
+
+    Attributes
+    ----------
+    solver :
+        Name of the LP solver.
+    family :
+        Family of the linear program.
+    format :
+        Format of its constraint matrices.
+    n :
+        Number of optimization variables.
+    seed :
+        Seed used to generate the linear program.
+    status :
+        Status returned by the solver, or the exception it raised.
+    found :
+        True if the solver returned a solution.
+    success :
+        True if the solver returned a solution for a problem that has one,
+        or no solution for an infeasible or unbounded problem.
+    run_time :
+        Best wall time over repeated solves, in seconds.
+    iterations :
+        Number of iterations, if the solver reports them.
+    peak_memory :
+        Peak memory allocated during a solve, in megabytes, as traced by
+        ``tracemalloc``. Allocations made by solvers outside of Python's
+        memory allocator are not counted.
+    primal_residual :
+        Primal residual of the solution, if found.
+    dual_residual :
+        Dual residual of the solution, if found.
+    """
+
+    solver: str
+    family: str
+    format: str
+    n: int
+    seed: int
+    status: str = ""
+    found: bool = False
+    success: bool = False
+    run_time: float = np.nan
+    iterations: Optional[int] = None
+    peak_memory: float = np.nan
+    primal_residual: float = np.nan
+    dual_residual: float = np.nan
+
+
+def __solve(benchmark: BenchmarkProblem, solver: str, kwargs: dict):
+    """Solve a benchmark problem, catching solver exceptions.
+
+    Parameters
+    ----------
+    benchmark :
+        Benchmark problem.
+    solver :
+        Name of the LP solver.
+    kwargs :
+        Keyword arguments forwarded to the solver.
+
+    Returns
+    -------
+    :
+        Pair ``(solution, status)`` where ``solution`` is ``None`` if the
+        solver raised an exception, described in ``status``.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            solution = solve_problem(benchmark.problem, solver, **kwargs)
+        except Exception as exn:  # solvers raise a variety of exceptions
+            return None, f"{type(exn).__name__}: {exn}".splitlines()[0]
+    return solution, str(solution.status)
+
+
+def run_case(
+    benchmark: BenchmarkProblem,
+    solver: str,
+    repeats: int = 1,
+    trace_memory: bool = True,
+    **kwargs,
+) -> BenchmarkResult:
+    """Run a solver on a benchmark problem.
+
+    Parameters
+    ----------
+    benchmark :
+        Benchmark problem.
+    solver :
+        Name of the LP solver.
+    repeats :
+        Number of timed solves, the best of which is reported.
+    trace_memory :
+        If set, solve once more while tracing memory allocations.
+
+    Returns
+    -------
+    :
+        Result of the solver on the problem.
+
+    Notes
+    -----
+    Extra keyword arguments are forwarded to :func:`lpsolvers.solve_problem`.
+    """
+    result = BenchmarkResult(
+        solver, benchmark.family, benchmark.format, benchmark.n, benchmark.seed
+    )
+    run_times: List[float] = []
+    solution = None
+    for _ in range(repeats):
+        gc.collect()
+        start_time = time.perf_counter()
+        solution, result.status = __solve(benchmark, solver, kwargs)
+        run_times.append(time.perf_counter() - start_time)
+    result.run_time = min(run_times)
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        __solve(benchmark, solver, kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result.peak_memory = peak / 2**20
+    if solution is None:
+        return result
+    result.found = bool(solution.found)
+    result.success = result.found == benchmark.has_solution
+    result.iterations = solution.iter
+    if solution.found:
+        result.primal_residual = solution.primal_residual()
+        result.dual_residual = solution.dual_residual()
+    return result
+
+
+def run_benchmark(
+    solvers: Optional[Iterable[str]] = None,
+    families: Iterable[str] = ("feasible", "infeasible", "unbounded"),
+    formats: Iterable[str] = ("dense", "sparse"),
+    sizes: Iterable[int] = (10, 100),
+    seeds: Iterable[int] = (0,),
+    repeats: int = 1,
+    trace_memory: bool = True,
+    max_dense_size: int = 1000,
+    solver_kwargs: Optional[Dict[str, dict]] = None,
+    verbose: bool = False,
+) -> List[BenchmarkResult]:
+    """Run solvers on families of generated linear programs.
+
+    Parameters
+    ----------
+    solvers :
+        Names of the LP solvers to benchmark. Defaults to all available
+        solvers.
+    families :
+        Families of linear programs, see
+        :func:`lpsolvers.benchmark.generate_problem`.
+    formats :
+        Formats of constraint matrices, ``"dense"`` and/or ``"sparse"``.
+    sizes :
+        Numbers of optimization variables.
+    seeds :
+        Seeds of the random linear programs of each family and size.
+    repeats :
+        Number of timed solves per case, the best of which is reported.
+    trace_memory :
+        If set, solve each case once more while tracing memory allocations.
+    max_dense_size :
+        Cases with more variables are skipped when constraint matrices are
+        dense, or when the solver densifies them.
+    solver_kwargs :
+        Keyword arguments for each solver, forwarded to
+        :func:`lpsolvers.solve_problem`.
+    verbose :
+        If set, print each result as it comes.
+
+    Returns
+    -------
+    :
+        Results of all cases that were not skipped.
+    """
+    solvers = list(solvers) if solvers is not None else available_solvers
+    solver_kwargs = solver_kwargs or {}
+    warm_up = generate_problem("feasible", 10, "sparse")
+    for solver in solvers:  # import backends before timing them
+        __solve(warm_up, solver, solver_kwargs.get(solver, {}))
+    results = []
+    for family in families:
+        for matrix_format in formats:
+            for n in sizes:
+                for seed in seeds:
+                    if matrix_format == "dense" and n > max_dense_size:
+                        continue
+                    benchmark = generate_problem(
+                        family, n, matrix_format, seed
+                    )
+                    for solver in solvers:
+                        if solver in dense_solvers and n > max_dense_size:
+                            continue
+                        result = run_case(
+                            benchmark,
+                            solver,
+                            repeats,
+                            trace_memory,
+                            **solver_kwargs.get(solver, {}),
+                        )
+                        if verbose:
+                            print(format_table([result], header=False))
+                        results.append(result)
+    return results
+
+
+fields = tuple(field.name for field in dataclasses.fields(BenchmarkResult))
+"""Names of the columns of benchmark results."""
+
+
+def write_csv(
+    results: Sequence[BenchmarkResult],
+    file: TextIO,
+    version: Optional[str] = None,
+) -> None:
+    """Write benchmark results in CSV format.
+
+    Parameters
+    ----------
+    results :
+        Benchmark results.
+    file :
+        Text file to write to.
+    version :
+        Version of lpsolvers added as first column, if any, to compare
+        results across releases.
+    """
+    writer = csv.writer(file)
+    version_column = ["version"] if version is not None else []
+    writer.writerow(version_column + list(fields))
+    for result in results:
+        row = dataclasses.astuple(result)
+        version_value = [version] if version is not None else []
+        writer.writerow(version_value + ["" if v is None else v for v in row])
+
+
+def format_table(
+    results: Sequence[BenchmarkResult], header: bool = True
+) -> str:
+    """Format benchmark results as a plain-text table.
+
+    Parameters
+    ----------
+    results :
+        Benchmark results.
+    header :
+        If set, start the table with column names.
+
+    Returns
+    -------
+    :
+        Table with one line per result.
+    """
+    lines = []
+    if header:
+        lines.append(
+            f"{'solver':>8} {'family':>10} {'format':>6} {'n':>8} "
+            f"{'success':>7} {'time (ms)':>10} {'iter':>7} "
+            f"{'mem (MB)':>9} {'primal res':>10} {'dual res':>10}  status"
+        )
+    for r in results:
+        iterations = "-" if r.iterations is None else str(r.iterations)
+        lines.append(
+            f"{r.solver:>8} {r.family:>10} {r.format:>6} {r.n:>8} "
+            f"{str(r.success):>7} {1e3 * r.run_time:10.2f} {iterations:>7} "
+            f"{r.peak_memory:9.2f} {r.primal_residual:10.1e} "
+            f"{r.dual_residual:10.1e}  {r.status}"
+        )
+    return "\n".join(lines)
+
+
+def format_summary(results: Sequence[BenchmarkResult]) -> str:
+    """Summarize benchmark results per solver.
+
+    Parameters
+    ----------
+    results :
+        Benchmark results.
+
+    Returns
+    -------
+    :
+        Table with the success rate of each solver, and its total and
+        geometric-mean run times over its successful cases.
+    """
+    lines = [
+        f"{'solver':>8} {'success rate':>12} {'total (s)':>10} "
+        f"{'geomean (ms)':>12}"
+    ]
+    solvers = sorted({r.solver for r in results})
+    for solver in solvers:
+        solver_results = [r for r in results if r.solver == solver]
+        successes = [r for r in solver_results if r.success]
+        rate = len(successes) / len(solver_results)
+        total = sum(r.run_time for r in solver_results)
+        geomean = (
+            1e3 * np.exp(np.mean(np.log([r.run_time for r in successes])))
+            if successes
+            else np.nan
+        )
+        lines.append(
+            f"{solver:>8} {100.0 * rate:11.1f}% {total:10.3f} {geomean:12.2f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Memoize solutions of linear programs that are solved repeatedly."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .exceptions import NoSolverSelected
+from .problem import Problem
+from .solution import Solution
+from .solve_problem import solve_problem
+from .solvers import available_solvers
+
+
+def __update_vector(
+    data_hash, structure_hash, v: Optional[np.ndarray]
+) -> None:
+    """Feed a vector to the data and structure hashes.
+
+    Parameters
+    ----------
+    data_hash :
+        Hash of all problem data.
+    structure_hash :
+        Hash of problem dimensions and sparsity patterns.
+    v :
+        Vector to hash, if any.
+    """
+    if v is None:
+        data_hash.update(b"none")
+        structure_hash.update(b"none")
+        return
+    header = f"{v.dtype.str}{v.shape}".encode()
+    data_hash.update(header)
+    structure_hash.update(header)
+    # hashlib reads the buffer of contiguous arrays without copying them
+    data_hash.update(np.ascontiguousarray(v))
+
+
+def __update_matrix(
+    data_hash,
+    structure_hash,
+    M: Optional[Union[np.ndarray, spa.spmatrix]],
+) -> None:
+    """Feed a dense or sparse matrix to the data and structure hashes.
+
+    Parameters
+    ----------
+    data_hash :
+        Hash of all problem data.
+    structure_hash :
+        Hash of problem dimensions and sparsity patterns.
+    M :
+        Matrix to hash, if any.
+    """
+    if not spa.issparse(M):
+        __update_vector(data_hash, structure_hash, M)
+        return
+    if M.format not in ("csc", "csr"):
+        M = spa.csc_matrix(M)
+    header = f"{M.format}{M.dtype.str}{M.shape}".encode()
+    for h in (data_hash, structure_hash):
+        h.update(header)
+        h.update(np.ascontiguousarray(M.indptr))
+        h.update(np.ascontiguousarray(M.indices))
+    data_hash.update(np.ascontiguousarray(M.data))
+
+
+def problem_fingerprint(problem: Problem) -> Tuple[bytes, bytes]:
+    """Compute fingerprints of a linear program.
+
+    Array buffers are hashed in place, so that fingerprinting is cheap
+    compared with solving the linear program.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to fingerprint.
+
+    Returns
+    -------
+    :
+        Pair ``(data_key, structure_key)``. The first one depends on all
+        values of the problem, while the second one only depends on its
+        dimensions and on the sparsity patterns of its sparse matrices.
+    """
+    data_hash = hashlib.blake2b(digest_size=16)
+    structure_hash = hashlib.blake2b(digest_size=16)
+    c, G, h, A, b, lb, ub = problem.unpack()
+    __update_vector(data_hash, structure_hash, c)
+    __update_matrix(data_hash, structure_hash, G)
+    __update_vector(data_hash, structure_hash, h)
+    __update_matrix(data_hash, structure_hash, A)
+    __update_vector(data_hash, structure_hash, b)
+    __update_vector(data_hash, structure_hash, lb)
+    __update_vector(data_hash, structure_hash, ub)
+    return data_hash.digest(), structure_hash.digest()
+
+
+class LPCache:
+    """Least-recently-used cache of solutions to linear programs.
+
+    Solutions are keyed by fingerprints of the problem data, the solver name
+    and its keyword arguments. When warm starting is enabled, the cache also
+    keeps the last solution found for each problem structure, *i.e.*
+    dimensions and sparsity patterns, and uses it as initial guess for
+    problems that have the same structure but different values.
+
+    Attributes
+    ----------
+    maxsize :
+        Maximum number of solutions kept in the cache.
+    warm_start :
+        If set, warm start cache misses from the last solution to a problem
+        with the same structure.
+    hits :
+        Number of solves answered from the cache.
+    misses :
+        Number of solves that called the solver.
+    warm_starts :
+        Number of cache misses that were warm started.
+
+    Notes
+    -----
+    Initial guesses passed by the caller are not part of cache keys, as they
+    do not change the linear program. Cached solutions are shared between
+    cache hits and should not be modified.
+
+    Examples
+    --------
+    .. code:: python
+
+        cache = LPCache(maxsize=64)
+        for c in costs:
+            x = cache.solve_lp(c, G, h, solver="proxqp")
+        print(f"{cache.hits} hits and {cache.misses} misses")
+    """
+
+    maxsize: int
+    warm_start: bool
+    hits: int
+    misses: int
+    warm_starts: int
+
+    def __init__(self, maxsize: int = 128, warm_start: bool = False) -> None:
+        if maxsize < 1:
+            raise ValueError(f"cache size should be positive, not {maxsize}")
+        self.maxsize = maxsize
+        self.warm_start = warm_start
+        self.hits = 0
+        self.misses = 0
+        self.warm_starts = 0
+        self.__lock = threading.Lock()
+        self.__solutions: OrderedDict = OrderedDict()
+        self.__guesses: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of solutions in the cache.
+
+        Returns
+        -------
+        :
+            Number of solutions in the cache.
+        """
+        return len(self.__solutions)
+
+    def clear(self) -> None:
+        """Remove all solutions from the cache and reset its counters."""
+        with self.__lock:
+            self.__solutions.clear()
+            self.__guesses.clear()
+            self.hits = 0
+            self.misses = 0
+            self.warm_starts = 0
+
+    def solve_problem(
+        self,
+        problem: Problem,
+        solver: Optional[str] = None,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> Solution:
+        """Solve a linear program, or return its cached solution.
+
+        Parameters
+        ----------
+        problem :
+            Linear program to solve.
+        solver :
+            Name of the LP solver to choose in
+            :data:`lpsolvers.available_solvers`.
+        initvals :
+            Primal initial guess, if any, used on cache misses.
+        dual_initvals :
+            Dual initial guess, if any, used on cache misses.
+
+        Returns
+        -------
+        :
+            Solution to the linear program, shared with other cache hits.
+
+        Notes
+        -----
+        Extra keyword arguments are forwarded to
+        :func:`lpsolvers.solve_problem`, and are part of the cache key.
+        """
+        if solver is None:
+            raise NoSolverSelected(
+                "Set the `solver` keyword argument to one of the "
+                f"available solvers in {available_solvers}"
+            )
+        data_key, structure_key = problem_fingerprint(problem)
+        options = (solver, repr(sorted(kwargs.items())))
+        key = (data_key, options)
+        with self.__lock:
+            solution = self.__solutions.get(key)
+            if solution is not None:
+                self.__solutions.move_to_end(key)
+                self.hits += 1
+                return solution
+            self.misses += 1
+            guess = (
+                self.__guesses.get((structure_key, options))
+                if self.warm_start
+                else None
+            )
+        if guess is not None:
+            if initvals is None and dual_initvals is None:
+                initvals, dual_initvals = guess
+                with self.__lock:
+                    self.warm_starts += 1
+        solution = solve_problem(
+            problem, solver, initvals, dual_initvals, **kwargs
+        )
+        with self.__lock:
+            self.__solutions[key] = solution
+            if len(self.__solutions) > self.maxsize:
+                self.__solutions.popitem(last=False)
+            if self.warm_start and solution.found:
+                self.__guesses[(structure_key, options)] = (
+                    solution.x,
+                    self.__stacked_duals(problem, solution),
+                )
+                self.__guesses.move_to_end((structure_key, options))
+                if len(self.__guesses) > self.maxsize:
+                    self.__guesses.popitem(last=False)
+        return solution
+
+    def solve_lp(
+        self,
+        c: np.ndarray,
+        G: Optional[Union[np.ndarray, spa.csc_matrix]],
+        h: Optional[np.ndarray],
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        solver: Optional[str] = None,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """Solve a linear program, or return its cached solution.
+
+        Parameters
+        ----------
+        c :
+            Linear cost vector.
+        G :
+            Linear inequality constraint matrix, dense or sparse.
+        h :
+            Linear inequality constraint vector.
+        A :
+            Linear equality constraint matrix, dense or sparse.
+        b :
+            Linear equality constraint vector.
+        solver :
+            Name of the LP solver to choose in
+            :data:`lpsolvers.available_solvers`.
+        initvals :
+            Primal initial guess, if any, used on cache misses.
+        dual_initvals :
+            Dual initial guess, if any, used on cache misses.
+        lb :
+            Lower bound constraint vector, if any.
+        ub :
+            Upper bound constraint vector, if any.
+
+        Returns
+        -------
+        :
+            Optimal solution of the linear program, as a new array.
+
+        Raises
+        ------
+        ValueError
+            If the LP is not feasible.
+
+        Notes
+        -----
+        Extra keyword arguments are forwarded as in
+        :func:`lpsolvers.solve_lp`, and are part of the cache key.
+        """
+        problem = Problem(c, G, h, A, b, lb, ub)
+        solution = self.solve_problem(
+            problem, solver, initvals, dual_initvals, **kwargs
+        )
+        if not solution.found:
+            raise ValueError(
+                f"Linear program is not feasible: {solution.status}"
+            )
+        return solution.x.copy()  # type: ignore
+
+    @staticmethod
+    def __stacked_duals(
+        problem: Problem, solution: Solution
+    ) -> Optional[np.ndarray]:
+        """Stack dual multipliers of a solution as a dual initial guess.
+
+        Parameters
+        ----------
+        problem :
+            Linear program of the solution.
+        solution :
+            Solution found by the solver.
+
+        Returns
+        -------
+        :
+            Multipliers of inequality then equality constraints, or ``None``
+            if the solution does not report all of them.
+        """
+        has_G = problem.h is not None
+        has_A = problem.b is not None
+        if (has_G and solution.z is None) or (has_A and solution.y is None):
+            return None
+        if not has_G and not has_A:
+            return None
+        return np.hstack(
+            [
+                solution.z if has_G else np.empty(0),
+                solution.y if has_A else np.empty(0),
+            ]
+        )
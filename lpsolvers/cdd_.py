@@ -6,18 +6,210 @@
 
 """Solver interface for cdd."""
 
-from typing import Optional
+import time
+import warnings
+from typing import Optional, Union
 
 import cdd
 import numpy as np
+import scipy.sparse as spa
+
+from .conversions import linear_from_box_inequalities, split_dual_linear_box
+from .lp_solver import LPSolver
+from .problem import Problem
+from .solution import Solution
+
+
+class CddSolver(LPSolver):
+    """Linear program solved by cdd, keeping its tableau between solves.
+
+    The tableau is allocated once, with equality constraints passed to cdd
+    as linearity rows rather than pairs of opposite inequalities. Vector
+    updates are written in place in the tableau, so that repeated solves
+    skip its construction. The simplex of cdd has no warm start.
+
+    Notes
+    -----
+    The tableau of cdd is a dense array, so that sparse constraint matrices
+    are densified in this interface. Finite variable bounds are appended to
+    the tableau as inequality rows.
+    """
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        G: Union[np.ndarray, spa.csc_matrix],
+        h: np.ndarray,
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+    ) -> None:
+        super().__init__(c, G, h, A, b, lb, ub)
+        start_time = time.perf_counter()
+        n = c.shape[0]
+        nb_inequalities = h.shape[0] if G is not None and h is not None else 0
+        G, h = linear_from_box_inequalities(G, h, lb, ub, n, use_sparse=False)
+        m = h.shape[0] if G is not None and h is not None else 0
+        p = b.shape[0] if A is not None and b is not None else 0
+
+        # Rows [h | -G] and [b | -A] of the tableau encode h - G x >= 0 and
+        # b - A x = 0, the latter being declared as linearity rows to cdd
+        tableau = np.empty((m + p, n + 1))
+        if m > 0:
+            tableau[:m, 0] = h
+            if spa.issparse(G):
+                tableau[:m, 1:] = -G.toarray()
+            else:
+                np.negative(G, out=tableau[:m, 1:])
+        if p > 0:
+            tableau[m:, 0] = b
+            if spa.issparse(A):
+                tableau[m:, 1:] = -A.toarray()
+            else:
+                np.negative(A, out=tableau[m:, 1:])
+        objective = np.empty(n + 1)
+        objective[0] = 0.0
+        objective[1:] = c
+        self.__tableau = tableau
+        self.__objective = objective
+        self.__nb_inequalities = nb_inequalities
+        self.__m = m
+        self.__p = p
+        self._conversion_time += time.perf_counter() - start_time
+
+    def update(
+        self,
+        c: Optional[np.ndarray] = None,
+        h: Optional[np.ndarray] = None,
+        b: Optional[np.ndarray] = None,
+    ) -> None:
+        """Update vectors of the linear program.
+
+        Parameters
+        ----------
+        c :
+            New linear cost vector, if any.
+        h :
+            New linear inequality constraint vector, if any.
+        b :
+            New linear equality constraint vector, if any.
+        """
+        super().update(c, h, b)
+        start_time = time.perf_counter()
+        if c is not None:
+            self.__objective[1:] = c
+        if h is not None:
+            self.__tableau[: self.__nb_inequalities, 0] = h
+        if b is not None:
+            self.__tableau[self.__m :, 0] = b
+        self._conversion_time += time.perf_counter() - start_time
+
+    def solve_problem(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> Solution:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, ignored as cdd does not support warm
+            starting.
+        dual_initvals :
+            Dual initial guess, ignored as well.
+
+        Returns
+        -------
+        :
+            Solution to the linear program. The simplex of cdd does not report
+            its number of iterations.
+        """
+        if initvals is not None or dual_initvals is not None:
+            warnings.warn(
+                "cdd does not support warm starting, initial guesses are "
+                "ignored"
+            )
+        m, p = self.__m, self.__p
+        start_time = time.perf_counter()
+        matrix = cdd.matrix_from_array(
+            self.__tableau,  # type: ignore
+            lin_set=range(m, m + p),
+            rep_type=cdd.RepType.INEQUALITY,
+            obj_type=cdd.LPObjType.MIN,
+            obj_func=self.__objective,  # type: ignore
+        )
+        lp = cdd.linprog_from_matrix(matrix)
+        self._setup_time += time.perf_counter() - start_time
+        solution = self._new_solution()
+        start_time = time.perf_counter()
+        cdd.linprog_solve(lp)
+        solution.solve_time = time.perf_counter() - start_time
+        solution.extras = {"lp": lp}
+        solution.status = lp.status.name
+        solution.found = lp.status == cdd.LPStatusType.OPTIMAL
+        if not solution.found:
+            return solution
+
+        # cdd splits each linearity row into two opposite inequalities, the
+        # second ones being appended after all rows of the tableau
+        multipliers = np.zeros(m + p)
+        for row, value in lp.dual_solution:
+            if row < m + p:
+                multipliers[row] -= value
+            else:  # opposite of linearity row (row - p)
+                multipliers[row - p] += value
+        self.x = np.array(lp.primal_solution)
+        solution.x = self.x
+        solution.obj = lp.obj_value
+        z, solution.z_box = split_dual_linear_box(
+            multipliers[:m], self.lb, self.ub, self.c.shape[0]
+        )
+        solution.z = z if self.h is not None else None
+        solution.y = multipliers[m:] if self.b is not None else None
+        return solution
+
+
+def cdd_solve_problem(
+    problem: Problem,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+) -> Solution:
+    """Solve a linear program using the LP solver from cdd.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    initvals :
+        Primal initial guess, ignored as cdd does not support warm starting.
+    dual_initvals :
+        Dual initial guess, ignored as well.
+
+    Returns
+    -------
+    :
+        Solution to the linear program returned by the solver.
+    """
+    c, G, h, A, b, lb, ub = problem.unpack()
+    solution = CddSolver(c, G, h, A, b, lb, ub).solve_problem(
+        initvals, dual_initvals
+    )
+    solution.problem = problem
+    return solution
 
 
 def cdd_solve_lp(
     c: np.ndarray,
-    G: np.ndarray,
+    G: Union[np.ndarray, spa.csc_matrix],
     h: np.ndarray,
-    A: Optional[np.ndarray] = None,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
     b: Optional[np.ndarray] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     r"""Solve a linear program using the LP solver from cdd.
 
@@ -30,10 +222,12 @@ def cdd_solve_lp(
                 c^T x \\\\
             \\mbox{subject to}
                 & G x \\leq h \\\\
-                & A x = b
+                & A x = b \\\\
+                & lb \\leq x \\leq ub
         \\end{array}\\end{split}
 
     It is solved using `cdd <https://github.com/mcmtroffaes/pycddlib>`_.
+    Sparse constraint matrices are densified, as cdd works on dense tableaus.
 
     Parameters
     ----------
@@ -49,6 +243,14 @@ def cdd_solve_lp(
         Linear equality constraint vector.
     solver :
         Solver to use, default is GLPK if available
+    initvals :
+        Primal initial guess, ignored as cdd does not support warm starting.
+    dual_initvals :
+        Dual initial guess, ignored as well.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
 
     Returns
     -------
@@ -60,20 +262,4 @@ def cdd_solve_lp(
     ValueError
         If the linear program is not feasible.
     """
-    if A is not None and b is not None:
-        v = np.hstack([h, b, -b])
-        U = np.vstack([G, A, -A])
-    else:  # no equality constraint
-        v = h
-        U = G
-    v = v.reshape((v.shape[0], 1))
-    constraints = np.hstack([v, -U])
-    objective = np.hstack([[0.0], c])
-    lp = cdd.linprog_from_array(
-        np.vstack([constraints, objective]),  # type: ignore
-        obj_type=cdd.LPObjType.MIN,
-    )
-    cdd.linprog_solve(lp)
-    if lp.status != cdd.LPStatusType.OPTIMAL:
-        raise ValueError(f"Linear program not feasible: {lp.status}")
-    return np.array(lp.primal_solution)
+    return CddSolver(c, G, h, A, b, lb, ub).solve(initvals, dual_initvals)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Convert variable bounds for solvers that lack native support."""
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+
+def __finite_bounds(
+    lb: Optional[np.ndarray], ub: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get indices of variables with finite lower and upper bounds.
+
+    Parameters
+    ----------
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+
+    Returns
+    -------
+    :
+        Pair ``(lower, upper)`` of indices of finite bounds.
+    """
+    lower = np.flatnonzero(np.isfinite(lb)) if lb is not None else []
+    upper = np.flatnonzero(np.isfinite(ub)) if ub is not None else []
+    return np.asarray(lower, dtype=int), np.asarray(upper, dtype=int)
+
+
+def linear_from_box_inequalities(
+    G: Optional[Union[np.ndarray, spa.csc_matrix]],
+    h: Optional[np.ndarray],
+    lb: Optional[np.ndarray],
+    ub: Optional[np.ndarray],
+    n: int,
+    use_sparse: bool,
+) -> Tuple[Optional[Union[np.ndarray, spa.csc_matrix]], Optional[np.ndarray]]:
+    """Append finite variable bounds to linear inequality constraints.
+
+    Only finite bounds are converted, so that bounded problems pay for one
+    row per finite bound rather than :math:`2 n` rows.
+
+    Parameters
+    ----------
+    G :
+        Linear inequality constraint matrix, if any.
+    h :
+        Linear inequality constraint vector, if any.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+    n :
+        Number of optimization variables.
+    use_sparse :
+        If set, build bound rows as a sparse matrix.
+
+    Returns
+    -------
+    :
+        Pair ``(G, h)`` of linear inequalities stacking ``G x <= h``, then
+        ``-x <= -lb`` and ``x <= ub`` for finite bounds.
+    """
+    lower, upper = __finite_bounds(lb, ub)
+    nb_rows = lower.size + upper.size
+    if nb_rows == 0:
+        return G, h
+    B = spa.csr_matrix(
+        (
+            np.hstack([-np.ones(lower.size), np.ones(upper.size)]),
+            np.hstack([lower, upper]),
+            np.arange(nb_rows + 1),
+        ),
+        shape=(nb_rows, n),
+    )
+    d = np.hstack(
+        [
+            -lb[lower] if lb is not None else [],
+            ub[upper] if ub is not None else [],
+        ]
+    )
+    if G is None or h is None:
+        return (B.tocsc() if use_sparse else B.toarray()), d
+    if use_sparse or spa.issparse(G):
+        return spa.vstack([G, B], format="csc"), np.hstack([h, d])
+    return np.vstack([G, B.toarray()]), np.hstack([h, d])
+
+
+def split_dual_linear_box(
+    z_stacked: np.ndarray,
+    lb: Optional[np.ndarray],
+    ub: Optional[np.ndarray],
+    n: int,
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """Separate multipliers of linear inequalities and of bounds.
+
+    This function undoes :func:`linear_from_box_inequalities` on dual
+    multipliers.
+
+    Parameters
+    ----------
+    z_stacked :
+        Multipliers of stacked linear inequalities and bound rows.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+    n :
+        Number of optimization variables.
+
+    Returns
+    -------
+    :
+        Pair ``(z, z_box)`` of multipliers of linear inequalities and of box
+        constraints. The latter are positive when an upper bound is active
+        and negative when a lower bound is active, and ``None`` when there
+        are no bounds.
+    """
+    if lb is None and ub is None:
+        return z_stacked, None
+    lower, upper = __finite_bounds(lb, ub)
+    m = z_stacked.shape[0] - lower.size - upper.size
+    z_box = np.zeros(n)
+    z_box[lower] -= z_stacked[m : m + lower.size]
+    z_box[upper] += z_stacked[m + lower.size :]
+    return z_stacked[:m], z_box
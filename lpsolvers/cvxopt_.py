@@ -7,14 +7,28 @@
 """Solver interface for CVXOPT."""
 
 import logging
-from typing import Optional
+import time
+import warnings
+from typing import Any, Dict, Optional, Union
 
 import cvxopt
 import cvxopt.solvers
 import numpy as np
+import scipy.sparse as spa
 from cvxopt.solvers import lp
 
-cvxopt.solvers.options["show_progress"] = False  # disable cvxopt output
+from .conversions import linear_from_box_inequalities, split_dual_linear_box
+from .lp_solver import LPSolver
+from .problem import Problem
+from .solution import Solution
+
+default_options: Dict[str, Any] = {"show_progress": False}
+"""Options passed to ``cvxopt.solvers.lp`` unless overridden by the caller.
+
+They are passed on each call rather than set in ``cvxopt.solvers.options``,
+so that the global options of CVXOPT are left untouched and that concurrent
+solves from several threads do not share mutable state.
+"""
 
 GLPK_IF_AVAILABLE: Optional[str] = None
 
@@ -22,40 +36,230 @@ try:
     import cvxopt.glpk
 
     GLPK_IF_AVAILABLE = "glpk"
-    cvxopt.solvers.options["glpk"] = {"msg_lev": "GLP_MSG_OFF"}  # cvxopt 1.1.8
-    cvxopt.solvers.options["msg_lev"] = "GLP_MSG_OFF"  # cvxopt 1.1.7
-    cvxopt.solvers.options["LPX_K_MSGLEV"] = 0  # previous versions
+    default_options["glpk"] = {"msg_lev": "GLP_MSG_OFF"}  # cvxopt 1.1.8
+    default_options["msg_lev"] = "GLP_MSG_OFF"  # cvxopt 1.1.7
+    default_options["LPX_K_MSGLEV"] = 0  # previous versions
 except ImportError:
     # issue a warning as GLPK is the best LP solver in practice
     logging.warning("CVXOPT import: GLPK solver not found")
 
 
-def cvxopt_matrix(M: np.ndarray) -> cvxopt.matrix:
+def cvxopt_options(**kwargs) -> Dict[str, Any]:
+    """Build the options of a call to ``cvxopt.solvers.lp``.
+
+    Returns
+    -------
+    :
+        New dictionary of options, starting from :data:`default_options`
+        then updated with options given in an ``options`` dictionary and as
+        keyword arguments, *e.g.* ``feastol=1e-9``. GLPK options given in a
+        ``glpk`` dictionary are merged with the default ones.
+    """
+    options = dict(default_options)
+    for key, value in {**kwargs.pop("options", {}), **kwargs}.items():
+        if key == "glpk" and isinstance(value, dict):
+            value = {**options.get("glpk", {}), **value}
+        options[key] = value
+    return options
+
+
+def cvxopt_matrix(
+    M: Union[np.ndarray, spa.spmatrix],
+) -> Union[cvxopt.matrix, cvxopt.spmatrix]:
     """
     Convert matrix M to CVXOPT format.
 
     Parameters
     ----------
     M :
-        Matrix to convert.
+        Matrix to convert, dense or sparse.
 
     Returns
     -------
     :
-        Same matrix in CVXOPT format.
+        Same matrix in CVXOPT format. Sparse matrices are converted to
+        ``cvxopt.spmatrix`` from their CSC index arrays, without densifying.
     """
-    if isinstance(M, cvxopt.matrix):
+    if isinstance(M, (cvxopt.matrix, cvxopt.spmatrix)):
         return M
+    if spa.issparse(M):
+        M = spa.csc_matrix(M)
+        col_counts = np.diff(M.indptr)
+        cols = np.repeat(np.arange(M.shape[1], dtype=np.int64), col_counts)
+        return cvxopt.spmatrix(
+            cvxopt.matrix(M.data.astype(float)),
+            cvxopt.matrix(M.indices.astype(np.int64)),
+            cvxopt.matrix(cols),
+            size=M.shape,
+        )
     return cvxopt.matrix(M)
 
 
+class CVXOPTSolver(LPSolver):
+    """Linear program solved by CVXOPT, keeping its matrices between solves.
+
+    Constraint matrices are converted to CVXOPT format once, so that repeated
+    solves only convert vectors. Neither GLPK nor the CVXOPT interior-point
+    solver benefit from warm starting at a previous (vertex) solution, so
+    every solve starts from scratch.
+
+    Notes
+    -----
+    The LP interface of CVXOPT has no variable bounds, so that finite bounds
+    are appended to inequality constraints as rows, one per finite bound.
+
+    Keyword arguments of the constructor are solver options, see
+    :func:`cvxopt_options`. They are passed to CVXOPT on each call without
+    modifying ``cvxopt.solvers.options``, so that instances can be solved
+    concurrently from several threads.
+    """
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        G: Union[np.ndarray, spa.csc_matrix],
+        h: np.ndarray,
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+        solver: Optional[str] = GLPK_IF_AVAILABLE,
+        **kwargs,
+    ) -> None:
+        super().__init__(c, G, h, A, b, lb, ub)
+        start_time = time.perf_counter()
+        n = c.shape[0]
+        use_sparse = spa.issparse(G) or spa.issparse(A)
+        G_box, h_box = linear_from_box_inequalities(
+            G, h, lb, ub, n, use_sparse
+        )
+        nb_inequalities = h.shape[0] if h is not None else 0
+        self.__G = cvxopt_matrix(G_box)
+        self.__h_bounds = h_box[nb_inequalities:]
+        self.__A = cvxopt_matrix(A) if A is not None else None
+        self._conversion_time += time.perf_counter() - start_time
+        self.__solver = solver
+        self.__kktsolver = kwargs.pop("kktsolver", None)
+        self.__options = cvxopt_options(**kwargs)
+
+    def solve_problem(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> Solution:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, ignored as neither GLPK nor the
+            interior-point solver of CVXOPT can warm start from the solution
+            of a linear program.
+        dual_initvals :
+            Dual initial guess, ignored as well.
+
+        Returns
+        -------
+        :
+            Solution to the linear program. GLPK does not report its number
+            of iterations.
+        """
+        if initvals is not None or dual_initvals is not None:
+            # GLPK has no warm start, while the interior-point solver of
+            # CVXOPT requires strictly feasible points, unlike LP solutions
+            warnings.warn(
+                "CVXOPT does not support warm starting from LP solutions, "
+                "initial guesses are ignored"
+            )
+        start_time = time.perf_counter()
+        h = (
+            np.hstack([self.h, self.__h_bounds])
+            if self.h is not None
+            else self.__h_bounds
+        )
+        args = [cvxopt_matrix(self.c), self.__G, cvxopt_matrix(h)]
+        if self.__A is not None and self.b is not None:
+            args.extend([self.__A, cvxopt_matrix(self.b)])
+        self._conversion_time += time.perf_counter() - start_time
+        solution = self._new_solution()
+        start_time = time.perf_counter()
+        sol = lp(
+            *args,
+            kktsolver=self.__kktsolver,
+            solver=self.__solver,
+            options=self.__options,
+        )
+        solution.solve_time = time.perf_counter() - start_time
+        solution.extras = sol
+        solution.status = sol["status"]
+        solution.iter = sol.get("iterations")
+        solution.found = "optimal" in sol["status"]
+        if not solution.found:
+            return solution
+
+        n = self.c.shape[0]
+        self.x = np.array(sol["x"]).reshape((n,))
+        solution.x = self.x
+        solution.obj = sol["primal objective"]
+        z, solution.z_box = split_dual_linear_box(
+            np.array(sol["z"]).reshape((h.shape[0],)), self.lb, self.ub, n
+        )
+        solution.z = z if self.h is not None else None
+        if self.__A is not None and self.b is not None:
+            solution.y = np.array(sol["y"]).reshape((self.b.shape[0],))
+        return solution
+
+
+def cvxopt_solve_problem(
+    problem: Problem,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    solver: Optional[str] = GLPK_IF_AVAILABLE,
+    **kwargs,
+) -> Solution:
+    """Solve a linear program using CVXOPT.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    initvals :
+        Primal initial guess, ignored as neither GLPK nor the interior-point
+        solver of CVXOPT can warm start from the solution of a linear program.
+    dual_initvals :
+        Dual initial guess, ignored as well.
+    solver :
+        Solver to use, default is GLPK if available
+
+    Returns
+    -------
+    :
+        Solution to the linear program returned by the solver.
+
+    Notes
+    -----
+    Extra keyword arguments are solver options passed on this call only,
+    see :func:`cvxopt_options`.
+    """
+    c, G, h, A, b, lb, ub = problem.unpack()
+    solution = CVXOPTSolver(
+        c, G, h, A, b, lb, ub, solver, **kwargs
+    ).solve_problem(initvals, dual_initvals)
+    solution.problem = problem
+    return solution
+
+
 def cvxopt_solve_lp(
     c: np.ndarray,
-    G: np.ndarray,
+    G: Union[np.ndarray, spa.csc_matrix],
     h: np.ndarray,
-    A: Optional[np.ndarray] = None,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
     b: Optional[np.ndarray] = None,
     solver: Optional[str] = GLPK_IF_AVAILABLE,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
     **kwargs,
 ) -> np.ndarray:
     r"""Solve a linear program using CVXOPT.
@@ -69,7 +273,8 @@ def cvxopt_solve_lp(
                 c^T x \\
             \mbox{subject to}
                 & G x \leq h \\
-                & A x = b
+                & A x = b \\
+                & lb \leq x \leq ub
         \end{array}\end{split}
 
     It is solved using the LP solver from `CVXOPT <http://cvxopt.org/>`_.
@@ -88,6 +293,15 @@ def cvxopt_solve_lp(
         Linear equality constraint vector.
     solver :
         Solver to use, default is GLPK if available
+    initvals :
+        Primal initial guess, ignored as neither GLPK nor the interior-point
+        solver of CVXOPT can warm start from the solution of a linear program.
+    dual_initvals :
+        Dual initial guess, ignored as well.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
 
     Returns
     -------
@@ -98,12 +312,15 @@ def cvxopt_solve_lp(
     ------
     ValueError
         If the LP is not feasible.
+
+    Notes
+    -----
+    Extra keyword arguments are solver options passed on this call only,
+    see :func:`cvxopt_options`, so that concurrent calls from several threads
+    are safe. For instance, ``cvxopt_solve_lp(c, G, h, solver=None,
+    feastol=1e-9)`` tightens the feasibility tolerance of the interior-point
+    solver without affecting other calls.
     """
-    args = [cvxopt_matrix(c), cvxopt_matrix(G), cvxopt_matrix(h)]
-    if A is not None and b is not None:
-        args.extend([cvxopt_matrix(A), cvxopt_matrix(b)])
-    sol = lp(*args, solver=solver, **kwargs)
-    if "optimal" not in sol["status"]:
-        raise ValueError(f"LP optimum not found: {sol['status']}")
-    n = c.shape[0]
-    return np.array(sol["x"]).reshape((n,))
+    return CVXOPTSolver(c, G, h, A, b, lb, ub, solver, **kwargs).solve(
+        initvals, dual_initvals
+    )
@@ -4,23 +4,671 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 # Copyright (C) 2016-2022 Stéphane Caron
 
-"""Solver interface for CVXPY."""
+"""Solver interface for CVXPY.
 
-from typing import Optional
+Problems are built with CVXPY parameters for their vectors and small dense
+constraint matrices, following the rules of disciplined parametrized
+programming (DPP), so that CVXPY only canonicalizes a problem once for a
+given structure. The one-shot solve functions of this module keep built
+problems in :data:`problem_cache`, keyed by their structure, and later calls
+with the same structure only assign parameter values before solving.
+Problems with sparse or large constraint matrices, which are constants of
+their problems rather than parameters, are not cached.
+"""
 
+import hashlib
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+import cvxpy
 import numpy as np
-from cvxpy import Minimize, Problem, Variable
+import scipy.sparse as spa
+from cvxpy import Minimize, Parameter, Variable
 from numpy import array
 
+from .lp_solver import LPSolver
+from .problem import Problem
+from .solution import Solution
+
+MAX_PARAMETER_ENTRIES = 5_000
+"""Largest number of entries of a dense constraint matrix handled as a
+parameter.
+
+Larger matrices, as well as sparse ones, are constants of their problems,
+which are then not cached. CVXPY maps parameter values to solver data with
+a tensor that has one column per parameter entry, and applying it on every
+solve ends up slower than canonicalizing a problem with constant matrices
+as matrices grow, see ``benchmarks/cvxpy_cache.py``.
+"""
+
+BYTES_PER_PARAMETER_ENTRY = 64
+"""Estimate of the memory held by a built problem per entry of its
+parameters, including the tensors that CVXPY keeps to map parameter values
+to solver data."""
+
+
+def _canonical_matrix(
+    M: Optional[Union[np.ndarray, spa.spmatrix]],
+) -> Optional[Union[np.ndarray, spa.csc_matrix]]:
+    """Convert a constraint matrix to a canonical form.
+
+    Parameters
+    ----------
+    M :
+        Dense or sparse matrix, if any.
+
+    Returns
+    -------
+    :
+        Two-dimensional array, or CSC matrix.
+    """
+    if M is None:
+        return None
+    if spa.issparse(M):
+        return spa.csc_matrix(M)
+    M = np.asarray(M)
+    return M.reshape((1, M.shape[0])) if M.ndim == 1 else M
+
+
+def _is_parametrized(M: Union[np.ndarray, spa.csc_matrix]) -> bool:
+    """Check whether a canonical constraint matrix is a CVXPY parameter.
+
+    Parameters
+    ----------
+    M :
+        Canonical dense or sparse matrix.
+
+    Returns
+    -------
+    :
+        True if the matrix is handled as a parameter.
+    """
+    return not spa.issparse(M) and 0 < M.size <= MAX_PARAMETER_ENTRIES
+
+
+def _is_cacheable(M: Optional[Union[np.ndarray, spa.csc_matrix]]) -> bool:
+    """Check whether a canonical constraint matrix allows caching problems.
+
+    Parameters
+    ----------
+    M :
+        Canonical dense or sparse matrix, if any.
+
+    Returns
+    -------
+    :
+        True if the matrix is absent, has no entries or is a parameter, so
+        that problems built with it only depend on its structure.
+    """
+    return M is None or M.size == 0 or _is_parametrized(M)
+
+
+def _structure_key(
+    n: int,
+    G: Optional[Union[np.ndarray, spa.csc_matrix]],
+    A: Optional[Union[np.ndarray, spa.csc_matrix]],
+    lb: Optional[np.ndarray],
+    ub: Optional[np.ndarray],
+) -> bytes:
+    """Compute the key of the structure of a linear program.
+
+    Parameters
+    ----------
+    n :
+        Number of optimization variables.
+    G :
+        Canonical inequality constraint matrix, if any, that satisfies
+        :func:`_is_cacheable`.
+    A :
+        Canonical equality constraint matrix, if any, that satisfies
+        :func:`_is_cacheable`.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+
+    Returns
+    -------
+    :
+        Digest of dimensions, matrix formats and finite bounds.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{n}".encode())
+    for M in (G, A):
+        if M is None:
+            digest.update(b"none")
+            continue
+        kind = "csc" if spa.issparse(M) else "dense"
+        digest.update(f"{kind}{M.shape}{M.dtype}".encode())
+    for v in (lb, ub):
+        if v is None:
+            digest.update(b"none")
+            continue
+        digest.update(np.packbits(np.isfinite(v)).tobytes())
+    return digest.digest()
+
+
+class _MatrixProduct:
+    """Product of a constraint matrix with the optimization variable.
+
+    Attributes
+    ----------
+    expression :
+        CVXPY expression of the product.
+    parameter :
+        Parameter holding the matrix, or ``None`` if the matrix is a
+        constant of the problem.
+
+    Notes
+    -----
+    Sparse matrices are not parameters, as CVXPY densifies sparse
+    parameters when it canonicalizes problems.
+    """
+
+    def __init__(
+        self, M: Union[np.ndarray, spa.csc_matrix], x: Variable
+    ) -> None:
+        self.parameter: Optional[Parameter] = None
+        if _is_parametrized(M):
+            self.parameter = Parameter(M.shape)
+            self.expression = self.parameter @ x
+        else:
+            self.expression = M @ x
+
+    def assign(self, M: Union[np.ndarray, spa.csc_matrix]) -> None:
+        """Assign the values of a matrix with the same structure.
+
+        Parameters
+        ----------
+        M :
+            Canonical matrix.
+        """
+        if self.parameter is not None:
+            self.parameter.value = M
+
+
+class CVXPYSolver(LPSolver):
+    """Linear program solved via CVXPY, keeping its problem between solves.
+
+    Vectors and constraint matrices of the linear program are CVXPY
+    parameters, so that repeated solves skip the construction and
+    canonicalization of the problem. The previous solution is used as
+    initial guess by solvers that support warm starting.
+    """
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        G: Union[np.ndarray, spa.csc_matrix],
+        h: np.ndarray,
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+        solver: Optional[str] = None,
+        verbose: bool = False,
+        **kwargs,
+    ) -> None:
+        super().__init__(c, G, h, A, b, lb, ub)
+        start_time = time.perf_counter()
+        n = c.shape[0]
+        G, A = _canonical_matrix(G), _canonical_matrix(A)
+        self.__x = Variable(n)
+        self.__c = Parameter(n)
+        self.__G = None
+        self.__h = None
+        self.__inequalities = None
+        constraints = []
+        if G is not None:
+            self.__G = _MatrixProduct(G, self.__x)
+            self.__h = Parameter(G.shape[0])
+            self.__inequalities = self.__G.expression <= self.__h
+            constraints.append(self.__inequalities)
+        self.__A = None
+        self.__b = None
+        self.__equalities = None
+        if A is not None:
+            self.__A = _MatrixProduct(A, self.__x)
+            self.__b = Parameter(A.shape[0])
+            self.__equalities = self.__A.expression == self.__b
+            constraints.append(self.__equalities)
+        self.__lower = (
+            np.flatnonzero(np.isfinite(lb)) if lb is not None else []
+        )
+        self.__upper = (
+            np.flatnonzero(np.isfinite(ub)) if ub is not None else []
+        )
+        self.__lb = None
+        self.__ub = None
+        self.__lower_bounds = None
+        self.__upper_bounds = None
+        if len(self.__lower) > 0:
+            self.__lb = Parameter(len(self.__lower))
+            self.__lower_bounds = self.__x[self.__lower] >= self.__lb
+            constraints.append(self.__lower_bounds)
+        if len(self.__upper) > 0:
+            self.__ub = Parameter(len(self.__upper))
+            self.__upper_bounds = self.__x[self.__upper] <= self.__ub
+            constraints.append(self.__upper_bounds)
+        self.__problem = cvxpy.Problem(
+            Minimize(self.__c @ self.__x), constraints
+        )
+        self.__nbytes = BYTES_PER_PARAMETER_ENTRY * sum(
+            parameter.size for parameter in self.__problem.parameters()
+        )
+        self.__assign(c, G, h, A, b, lb, ub)
+        self._setup_time += time.perf_counter() - start_time
+        self.__solver = solver
+        self.__verbose = verbose
+        self.__kwargs = kwargs
+
+    def __assign(
+        self,
+        c: np.ndarray,
+        G: Optional[Union[np.ndarray, spa.csc_matrix]],
+        h: Optional[np.ndarray],
+        A: Optional[Union[np.ndarray, spa.csc_matrix]],
+        b: Optional[np.ndarray],
+        lb: Optional[np.ndarray],
+        ub: Optional[np.ndarray],
+    ) -> None:
+        """Assign problem data to CVXPY parameters.
+
+        Parameters
+        ----------
+        c :
+            Linear cost vector.
+        G :
+            Canonical linear inequality constraint matrix, if any.
+        h :
+            Linear inequality constraint vector, if any.
+        A :
+            Canonical linear equality constraint matrix, if any.
+        b :
+            Linear equality constraint vector, if any.
+        lb :
+            Lower bound constraint vector, if any.
+        ub :
+            Upper bound constraint vector, if any.
+        """
+        self.__c.value = c
+        if self.__G is not None:
+            self.__G.assign(G)
+            self.__h.value = h
+        if self.__A is not None:
+            self.__A.assign(A)
+            self.__b.value = b
+        if self.__lb is not None:
+            self.__lb.value = lb[self.__lower]
+        if self.__ub is not None:
+            self.__ub.value = ub[self.__upper]
+
+    @property
+    def nbytes(self) -> int:
+        """Estimate of the memory held by the problem, in bytes."""
+        return self.__nbytes
+
+    def _load(
+        self,
+        c: np.ndarray,
+        G: Optional[Union[np.ndarray, spa.csc_matrix]],
+        h: Optional[np.ndarray],
+        A: Optional[Union[np.ndarray, spa.csc_matrix]],
+        b: Optional[np.ndarray],
+        lb: Optional[np.ndarray],
+        ub: Optional[np.ndarray],
+        solver: Optional[str] = None,
+        verbose: bool = False,
+        **kwargs,
+    ) -> None:
+        """Load a new linear program with the same structure.
+
+        Parameters
+        ----------
+        c :
+            Linear cost vector.
+        G :
+            Canonical linear inequality constraint matrix, if any.
+        h :
+            Linear inequality constraint vector, if any.
+        A :
+            Canonical linear equality constraint matrix, if any.
+        b :
+            Linear equality constraint vector, if any.
+        lb :
+            Lower bound constraint vector, if any.
+        ub :
+            Upper bound constraint vector, if any.
+        solver :
+            Solver name in ``cvxpy.installed_solvers()``.
+        verbose :
+            Set to `True` to print out extra information.
+
+        Notes
+        -----
+        The structure of the new linear program, as computed by
+        :func:`_structure_key`, should be that of the current one. Extra
+        keyword arguments are forwarded to the CVXPY solve function.
+        """
+        start_time = time.perf_counter()
+        self.__assign(c, G, h, A, b, lb, ub)
+        self.c, self.G, self.h, self.A, self.b = c, G, h, A, b
+        self.lb, self.ub = lb, ub
+        self.x = None
+        self._setup_time += time.perf_counter() - start_time
+        self.__solver = solver
+        self.__verbose = verbose
+        self.__kwargs = kwargs
+
+    def update(
+        self,
+        c: Optional[np.ndarray] = None,
+        h: Optional[np.ndarray] = None,
+        b: Optional[np.ndarray] = None,
+    ) -> None:
+        """Update vectors of the linear program.
+
+        Parameters
+        ----------
+        c :
+            New linear cost vector, if any.
+        h :
+            New linear inequality constraint vector, if any.
+        b :
+            New linear equality constraint vector, if any.
+        """
+        super().update(c, h, b)
+        if c is not None:
+            self.__c.value = c
+        if h is not None:
+            self.__h.value = h
+        if b is not None:
+            self.__b.value = b
+
+    def solve_problem(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> Solution:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, if any. Defaults to the previous solution
+            for solvers that support warm starting.
+        dual_initvals :
+            Dual initial guess, ignored as CVXPY does not support dual warm
+            starts.
+
+        Returns
+        -------
+        :
+            Solution to the linear program. Its setup time includes the
+            compilation of the problem by CVXPY, which is only done in full
+            on the first solve.
+        """
+        if initvals is not None:
+            self.__x.value = initvals
+        if dual_initvals is not None:
+            warnings.warn(
+                "CVXPY does not support dual warm starts, dual initial "
+                "guesses are ignored"
+            )
+        solution = self._new_solution()
+        start_time = time.perf_counter()
+        self.__problem.solve(
+            solver=self.__solver, verbose=self.__verbose, **self.__kwargs
+        )
+        run_time = time.perf_counter() - start_time
+        compilation_time = self.__problem.compilation_time or 0.0
+        solution.setup_time += compilation_time
+        solution.solve_time = max(run_time - compilation_time, 0.0)
+        solution.status = self.__problem.status
+        solution.iter = self.__problem.solver_stats.num_iters
+        solution.extras = {"solver_stats": self.__problem.solver_stats}
+        solution.found = self.__x.value is not None and solution.status in (
+            cvxpy.OPTIMAL,
+            cvxpy.OPTIMAL_INACCURATE,
+        )
+        if not solution.found:
+            return solution
+
+        n = self.c.shape[0]
+        self.x = array(self.__x.value).reshape((n,))
+        solution.x = self.x
+        solution.obj = self.__problem.value
+        if self.__inequalities is not None:
+            solution.z = array(self.__inequalities.dual_value).reshape(-1)
+        if self.__equalities is not None:
+            solution.y = array(self.__equalities.dual_value).reshape(-1)
+        if self.lb is not None or self.ub is not None:
+            solution.z_box = np.zeros(n)
+            if self.__lower_bounds is not None:
+                dual = array(self.__lower_bounds.dual_value).reshape(-1)
+                solution.z_box[self.__lower] -= dual
+            if self.__upper_bounds is not None:
+                dual = array(self.__upper_bounds.dual_value).reshape(-1)
+                solution.z_box[self.__upper] += dual
+        return solution
+
+
+class ProblemCache:
+    """Bounded cache of CVXPY problems, keyed by the structure of their LP.
+
+    Problems are taken out of the cache while they are being solved, so
+    that concurrent solves never share a problem: a concurrent solve with
+    the same structure misses and builds its own problem. Problems whose
+    constraint matrices are constants, see :data:`MAX_PARAMETER_ENTRIES`,
+    are never cached.
+
+    Attributes
+    ----------
+    maxsize :
+        Maximum number of cached problems. Least recently used problems are
+        evicted beyond this size, and a size of zero disables caching.
+    max_bytes :
+        Maximum estimated memory of cached problems, in bytes, see
+        :data:`BYTES_PER_PARAMETER_ENTRY`. Least recently used problems are
+        evicted beyond this budget.
+    hits :
+        Number of solves that reused a cached problem.
+    misses :
+        Number of solves that built a new problem.
+    """
+
+    maxsize: int
+    max_bytes: int
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int = 32, max_bytes: int = 2**28) -> None:
+        if maxsize < 0:
+            raise ValueError(f"cache size should be nonnegative: {maxsize}")
+        if max_bytes < 0:
+            raise ValueError(
+                f"cache memory should be nonnegative: {max_bytes}"
+            )
+        self.__lock = threading.Lock()
+        self.__nbytes = 0
+        self.__problems: "OrderedDict[bytes, CVXPYSolver]" = OrderedDict()
+        self.hits = 0
+        self.max_bytes = max_bytes
+        self.maxsize = maxsize
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached problems."""
+        return len(self.__problems)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory of cached problems, in bytes."""
+        return self.__nbytes
+
+    def clear(self) -> None:
+        """Remove all cached problems and reset counters."""
+        with self.__lock:
+            self.__problems.clear()
+            self.__nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def acquire(
+        self,
+        c: np.ndarray,
+        G: Optional[Union[np.ndarray, spa.csc_matrix]],
+        h: Optional[np.ndarray],
+        A: Optional[Union[np.ndarray, spa.csc_matrix]],
+        b: Optional[np.ndarray],
+        lb: Optional[np.ndarray],
+        ub: Optional[np.ndarray],
+        solver: Optional[str] = None,
+        verbose: bool = False,
+        **kwargs,
+    ) -> Tuple[Optional[bytes], CVXPYSolver]:
+        """Take a problem for a linear program out of the cache.
+
+        Parameters
+        ----------
+        c :
+            Linear cost vector.
+        G :
+            Linear inequality constraint matrix, if any.
+        h :
+            Linear inequality constraint vector, if any.
+        A :
+            Linear equality constraint matrix, if any.
+        b :
+            Linear equality constraint vector, if any.
+        lb :
+            Lower bound constraint vector, if any.
+        ub :
+            Upper bound constraint vector, if any.
+        solver :
+            Solver name in ``cvxpy.installed_solvers()``.
+        verbose :
+            Set to `True` to print out extra information.
+
+        Returns
+        -------
+        :
+            Pair ``(key, lp)`` of the structure key of the linear program,
+            or ``None`` if its problem is not cacheable, and a solver loaded
+            with it, to be handed back with :meth:`release` after solving.
+        """
+        G, A = _canonical_matrix(G), _canonical_matrix(A)
+        key = None
+        if _is_cacheable(G) and _is_cacheable(A):
+            key = _structure_key(c.shape[0], G, A, lb, ub)
+        with self.__lock:
+            lp = self.__problems.pop(key, None) if key is not None else None
+            if lp is None:
+                self.misses += 1
+            else:
+                self.__nbytes -= lp.nbytes
+                self.hits += 1
+        if lp is None:
+            lp = CVXPYSolver(c, G, h, A, b, lb, ub, solver, verbose, **kwargs)
+        else:
+            lp._load(c, G, h, A, b, lb, ub, solver, verbose, **kwargs)
+        return key, lp
+
+    def release(self, key: Optional[bytes], lp: CVXPYSolver) -> None:
+        """Hand a problem back to the cache.
+
+        Parameters
+        ----------
+        key :
+            Structure key returned by :meth:`acquire`.
+        lp :
+            Solver returned by :meth:`acquire`.
+        """
+        if key is None:
+            return
+        with self.__lock:
+            previous = self.__problems.pop(key, None)
+            if previous is not None:
+                self.__nbytes -= previous.nbytes
+            self.__problems[key] = lp
+            self.__nbytes += lp.nbytes
+            while self.__problems and (
+                len(self.__problems) > self.maxsize
+                or self.__nbytes > self.max_bytes
+            ):
+                _, evicted = self.__problems.popitem(last=False)
+                self.__nbytes -= evicted.nbytes
+
+
+problem_cache = ProblemCache()
+"""Cache of problems used by :func:`cvxpy_solve_problem` and
+:func:`cvxpy_solve_lp`."""
+
+
+def cvxpy_solve_problem(
+    problem: Problem,
+    solver: Optional[str] = None,
+    verbose: bool = False,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    **kwargs,
+) -> Solution:
+    """Solve a linear program using CVXPY.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    solver :
+        Solver name in ``cvxpy.installed_solvers()``.
+    verbose :
+        Set to `True` to print out extra information.
+    initvals :
+        Primal initial guess, used if the underlying solver supports warm
+        starting.
+    dual_initvals :
+        Dual initial guess, ignored as CVXPY does not support dual warm
+        starts.
+
+    Returns
+    -------
+    :
+        Solution to the linear program returned by the solver.
+
+    Notes
+    -----
+    Problems with small dense constraint matrices, see
+    :data:`MAX_PARAMETER_ENTRIES`, are kept in :data:`problem_cache`, so
+    that solving a linear program with the same structure as a previous one
+    skips its canonicalization by CVXPY.
+    """
+    c, G, h, A, b, lb, ub = problem.unpack()
+    key, lp = problem_cache.acquire(
+        c, G, h, A, b, lb, ub, solver, verbose, **kwargs
+    )
+    try:
+        solution = lp.solve_problem(initvals, dual_initvals)
+    finally:
+        problem_cache.release(key, lp)
+    solution.problem = problem
+    return solution
+
 
 def cvxpy_solve_lp(
     c: np.ndarray,
-    G: np.ndarray,
+    G: Union[np.ndarray, spa.csc_matrix],
     h: np.ndarray,
-    A: Optional[np.ndarray] = None,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
     b: Optional[np.ndarray] = None,
     solver: Optional[str] = None,
     verbose: bool = False,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
     **kwargs,
 ) -> np.ndarray:
     r"""Solve a linear program using CVXPY.
@@ -34,11 +682,16 @@ def cvxpy_solve_lp(
             & c^T x \\
         \mbox{subject to}
             & G x \leq h \\
-            & A x = b
+            & A x = b \\
+            & lb \leq x \leq ub
         \end{array}\end{split}
 
     It is solved using a solver wrapped by `CVXPY <http://www.cvxpy.org/>`_.
     The underlying solver is selected via the corresponding keyword argument.
+    Problems with small dense constraint matrices, see
+    :data:`MAX_PARAMETER_ENTRIES`, are kept in :data:`problem_cache`, so
+    that solving a linear program with the same structure as a previous one
+    skips its canonicalization by CVXPY.
 
     Parameters
     ----------
@@ -56,6 +709,16 @@ def cvxpy_solve_lp(
         Solver name in ``cvxpy.installed_solvers()``.
     verbose :
         Set to `True` to print out extra information.
+    initvals :
+        Primal initial guess, used if the underlying solver supports warm
+        starting.
+    dual_initvals :
+        Dual initial guess, ignored as CVXPY does not support dual warm
+        starts.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
 
     Returns
     -------
@@ -67,16 +730,10 @@ def cvxpy_solve_lp(
     ValueError
         If the LP is not feasible.
     """
-    n = c.shape[0]
-    x = Variable(n)
-    objective = Minimize(c @ x)
-    constraints = []
-    if G is not None:
-        constraints.append(G @ x <= h)
-    if A is not None:
-        constraints.append(A @ x == b)
-    prob = Problem(objective, constraints)
-    prob.solve(solver=solver, verbose=verbose, **kwargs)
-    if x.value is None:
-        raise ValueError("Linear program is not feasible")
-    return array(x.value).reshape((n,))
+    key, lp = problem_cache.acquire(
+        c, G, h, A, b, lb, ub, solver, verbose, **kwargs
+    )
+    try:
+        return lp.solve(initvals, dual_initvals)
+    finally:
+        problem_cache.release(key, lp)
@@ -17,3 +17,43 @@ class SolverNotFound(LPSolverException):
 
 class NoSolverSelected(LPSolverException):
     """Exception raised when the `solver` keyword argument is not set."""
+
+
+class ProblemError(LPSolverException):
+    """Exception raised when a linear program is not correctly defined."""
+
+
+class InfeasibleProblem(ProblemError, ValueError):
+    """Exception raised when a solver proves a linear program infeasible.
+
+    It is also a ``ValueError``, which solve functions raise when a linear
+    program is not feasible.
+    """
+
+
+class UnboundedProblem(ProblemError, ValueError):
+    """Exception raised when a solver proves a linear program unbounded.
+
+    It is also a ``ValueError``, which solve functions raise when a linear
+    program has no optimal solution.
+    """
+
+
+class MPSError(LPSolverException):
+    """Exception raised when an MPS file cannot be parsed."""
+
+
+class SolverTimeout(LPSolverException):
+    """Exception raised when a solver exceeds its time limit.
+
+    Attributes
+    ----------
+    solution :
+        Solution returned by the solver when it stopped, if any. It is not
+        found, but its ``"iterate"`` extra holds the last primal iterate for
+        solvers that report it.
+    """
+
+    def __init__(self, message: str, solution=None) -> None:
+        super().__init__(message)
+        self.solution = solution
@@ -0,0 +1,394 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Solver interface for `HiGHS`_ through SciPy.
+
+.. _HiGHS: https://highs.dev/
+
+HiGHS is an open source solver for large-scale sparse linear programs, with
+dual simplex and interior-point methods. It ships with SciPy as
+``scipy.optimize.linprog``, so that this interface is available without
+optional dependencies.
+"""
+
+import time
+import warnings
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import scipy.sparse as spa
+from scipy.optimize import OptimizeResult, linprog
+
+from .exceptions import InfeasibleProblem, SolverTimeout, UnboundedProblem
+from .lp_solver import LPSolver
+from .problem import Problem
+from .solution import Solution
+
+statuses: Dict[int, str] = {
+    0: "optimal",
+    1: "iteration limit reached",
+    2: "infeasible",
+    3: "unbounded",
+    4: "numerical difficulties",
+}
+"""Status of the solution for each status code of ``linprog``."""
+
+TIME_LIMIT_STATUS = "time limit reached"
+
+
+def highs_status(result: OptimizeResult) -> str:
+    """Get the status of a ``linprog`` result.
+
+    Parameters
+    ----------
+    result :
+        Result returned by ``scipy.optimize.linprog``.
+
+    Returns
+    -------
+    :
+        Status in :data:`statuses`, or :data:`TIME_LIMIT_STATUS` when the
+        iteration limit is actually the time limit.
+    """
+    if result.status == 1 and "time limit" in result.message.lower():
+        return TIME_LIMIT_STATUS
+    return statuses.get(result.status, f"status {result.status}")
+
+
+class HiGHSSolver(LPSolver):
+    """Linear program solved by HiGHS, keeping its matrices between solves.
+
+    Constraint matrices are passed to ``linprog`` as given, so that sparse
+    matrices are not densified. HiGHS does not warm start from initial
+    guesses through SciPy, so every solve starts from scratch.
+    """
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        G: Union[np.ndarray, spa.csc_matrix],
+        h: np.ndarray,
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+        method: str = "highs",
+        verbose: bool = False,
+        time_limit: Optional[float] = None,
+        primal_feasibility_tolerance: Optional[float] = None,
+        dual_feasibility_tolerance: Optional[float] = None,
+        ipm_optimality_tolerance: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(c, G, h, A, b, lb, ub)
+        if method not in ("highs", "highs-ds", "highs-ipm"):
+            raise ValueError(
+                "method should be 'highs', 'highs-ds' or 'highs-ipm', "
+                f"got '{method}'"
+            )
+        start_time = time.perf_counter()
+        n = c.shape[0]
+        bounds = np.empty((n, 2))
+        bounds[:, 0] = lb if lb is not None else -np.inf
+        bounds[:, 1] = ub if ub is not None else np.inf
+        self.__bounds = bounds
+        self._conversion_time += time.perf_counter() - start_time
+        options: Dict[str, Any] = {"disp": verbose}
+        for option, value in (
+            ("time_limit", time_limit),
+            ("primal_feasibility_tolerance", primal_feasibility_tolerance),
+            ("dual_feasibility_tolerance", dual_feasibility_tolerance),
+            ("ipm_optimality_tolerance", ipm_optimality_tolerance),
+        ):
+            if value is not None:
+                options[option] = value
+        options.update(kwargs)
+        self.__method = method
+        self.__options = options
+
+    def solve_problem(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> Solution:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, ignored as ``linprog`` does not pass it to
+            HiGHS.
+        dual_initvals :
+            Dual initial guess, ignored as well.
+
+        Returns
+        -------
+        :
+            Solution to the linear program.
+        """
+        if initvals is not None or dual_initvals is not None:
+            warnings.warn(
+                "HiGHS does not support warm starting through SciPy, "
+                "initial guesses are ignored"
+            )
+        has_inequalities = self.G is not None and self.h is not None
+        has_equalities = self.A is not None and self.b is not None
+        solution = self._new_solution()
+        start_time = time.perf_counter()
+        result = linprog(
+            self.c,
+            A_ub=self.G if has_inequalities else None,
+            b_ub=self.h if has_inequalities else None,
+            A_eq=self.A if has_equalities else None,
+            b_eq=self.b if has_equalities else None,
+            bounds=self.__bounds,
+            method=self.__method,
+            options=self.__options,
+        )
+        solution.solve_time = time.perf_counter() - start_time
+        solution.extras = {"result": result}
+        solution.status = highs_status(result)
+        solution.iter = result.get("nit")
+        solution.found = result.status == 0
+        if not solution.found:
+            if result.get("x") is not None:
+                solution.extras["iterate"] = result.x
+            return solution
+
+        # linprog marginals are sensitivities of the objective to
+        # right-hand sides, of opposite signs to our multipliers
+        self.x = result.x
+        solution.x = self.x
+        solution.obj = result.fun
+        if has_inequalities:
+            solution.z = -result.ineqlin.marginals
+        if has_equalities:
+            solution.y = -result.eqlin.marginals
+        if self.lb is not None or self.ub is not None:
+            solution.z_box = -result.lower.marginals - result.upper.marginals
+        return solution
+
+    def solve(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, ignored.
+        dual_initvals :
+            Dual initial guess, ignored.
+
+        Returns
+        -------
+        :
+            Optimal (primal) solution of the linear program.
+
+        Raises
+        ------
+        InfeasibleProblem
+            If HiGHS proves the linear program infeasible.
+        UnboundedProblem
+            If HiGHS proves the linear program unbounded.
+        SolverTimeout
+            If HiGHS reaches its time limit. The solution returned by HiGHS
+            is attached to the exception.
+        ValueError
+            If HiGHS stops for another reason, such as its iteration limit.
+        """
+        solution = self.solve_problem(initvals, dual_initvals)
+        if solution.found:
+            return solution.x  # type: ignore
+        if solution.status == "infeasible":
+            raise InfeasibleProblem("Linear program is infeasible")
+        if solution.status == "unbounded":
+            raise UnboundedProblem("Linear program is unbounded")
+        if solution.status == TIME_LIMIT_STATUS:
+            raise SolverTimeout(
+                "highs found no solution within "
+                f"{self.__options['time_limit']} s",
+                solution,
+            )
+        raise ValueError(f"Linear program is not feasible: {solution.status}")
+
+
+def highs_solve_problem(
+    problem: Problem,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    method: str = "highs",
+    verbose: bool = False,
+    time_limit: Optional[float] = None,
+    primal_feasibility_tolerance: Optional[float] = None,
+    dual_feasibility_tolerance: Optional[float] = None,
+    ipm_optimality_tolerance: Optional[float] = None,
+    **kwargs,
+) -> Solution:
+    """Solve a linear program using HiGHS.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    initvals :
+        Primal initial guess, ignored.
+    dual_initvals :
+        Dual initial guess, ignored.
+    method :
+        HiGHS method in ``["highs", "highs-ds", "highs-ipm"]``, that is,
+        automatic choice, dual simplex or interior point.
+    verbose :
+        Set to `True` to print out extra information.
+    time_limit :
+        Maximum computation time the solver is allowed, in seconds.
+    primal_feasibility_tolerance :
+        Primal feasibility tolerance.
+    dual_feasibility_tolerance :
+        Dual feasibility tolerance.
+    ipm_optimality_tolerance :
+        Optimality tolerance of the interior-point method.
+
+    Returns
+    -------
+    :
+        Solution to the linear program returned by the solver.
+
+    Notes
+    -----
+    Extra keyword arguments are forwarded as options to ``linprog``.
+    """
+    c, G, h, A, b, lb, ub = problem.unpack()
+    solution = HiGHSSolver(
+        c,
+        G,
+        h,
+        A,
+        b,
+        lb,
+        ub,
+        method,
+        verbose,
+        time_limit,
+        primal_feasibility_tolerance,
+        dual_feasibility_tolerance,
+        ipm_optimality_tolerance,
+        **kwargs,
+    ).solve_problem(initvals, dual_initvals)
+    solution.problem = problem
+    return solution
+
+
+def highs_solve_lp(
+    c: np.ndarray,
+    G: Union[np.ndarray, spa.csc_matrix],
+    h: np.ndarray,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+    b: Optional[np.ndarray] = None,
+    method: str = "highs",
+    verbose: bool = False,
+    time_limit: Optional[float] = None,
+    primal_feasibility_tolerance: Optional[float] = None,
+    dual_feasibility_tolerance: Optional[float] = None,
+    ipm_optimality_tolerance: Optional[float] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    **kwargs,
+) -> np.ndarray:
+    r"""Solve a linear program using HiGHS.
+
+    The linear program is defined by:
+
+    .. math::
+
+        \begin{split}\begin{array}{ll}
+            \mbox{minimize} &
+                c^T x \\
+            \mbox{subject to}
+                & G x \leq h \\
+                & A x = b \\
+                & lb \leq x \leq ub
+        \end{array}\end{split}
+
+    It is solved using `HiGHS <https://highs.dev/>`_ as shipped with SciPy.
+
+    Parameters
+    ----------
+    c :
+        Linear cost vector.
+    G :
+        Linear inequality constraint matrix, dense or sparse.
+    h :
+        Linear inequality constraint vector.
+    A :
+        Linear equality constraint matrix, dense or sparse.
+    b :
+        Linear equality constraint vector.
+    method :
+        HiGHS method in ``["highs", "highs-ds", "highs-ipm"]``, that is,
+        automatic choice, dual simplex or interior point.
+    verbose :
+        Set to `True` to print out extra information.
+    time_limit :
+        Maximum computation time the solver is allowed, in seconds.
+    primal_feasibility_tolerance :
+        Primal feasibility tolerance.
+    dual_feasibility_tolerance :
+        Dual feasibility tolerance.
+    ipm_optimality_tolerance :
+        Optimality tolerance of the interior-point method.
+    initvals :
+        Primal initial guess, ignored.
+    dual_initvals :
+        Dual initial guess, ignored.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+
+    Returns
+    -------
+    :
+        Optimal (primal) solution of the linear program, if it exists.
+
+    Raises
+    ------
+    InfeasibleProblem
+        If HiGHS proves the LP infeasible.
+    UnboundedProblem
+        If HiGHS proves the LP unbounded.
+    SolverTimeout
+        If HiGHS reaches its time limit.
+    ValueError
+        If HiGHS stops for another reason, such as its iteration limit.
+
+    Notes
+    -----
+    Extra keyword arguments are forwarded as options to ``linprog``, see
+    the `SciPy documentation
+    <https://docs.scipy.org/doc/scipy/reference/optimize.linprog-highs.html>`__
+    for the list of options, *e.g.* ``presolve=False``.
+    """
+    return HiGHSSolver(
+        c,
+        G,
+        h,
+        A,
+        b,
+        lb,
+        ub,
+        method,
+        verbose,
+        time_limit,
+        primal_feasibility_tolerance,
+        dual_feasibility_tolerance,
+        ipm_optimality_tolerance,
+        **kwargs,
+    ).solve(initvals, dual_initvals)
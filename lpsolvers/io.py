@@ -0,0 +1,503 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Read and write linear programs in MPS format."""
+
+import gzip
+import os
+from array import array
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .exceptions import MPSError
+from .problem import Problem
+
+PathOrFile = Union[str, "os.PathLike[str]", IO[str]]
+
+__sections = (
+    "NAME",
+    "OBJSENSE",
+    "ROWS",
+    "COLUMNS",
+    "RHS",
+    "RANGES",
+    "BOUNDS",
+    "ENDATA",
+)
+
+
+def __open_text(file: PathOrFile, mode: str) -> Tuple[IO[str], bool]:
+    """Open a text file, decompressing or compressing it with gzip.
+
+    Parameters
+    ----------
+    file :
+        Path to a file, or text file object.
+    mode :
+        Either ``"r"`` or ``"w"``.
+
+    Returns
+    -------
+    :
+        Pair ``(stream, owned)`` where ``owned`` is true when the stream was
+        opened here and should be closed by the caller.
+    """
+    if not isinstance(file, (str, os.PathLike)):
+        return file, False
+    path = os.fspath(file)
+    if mode == "w":
+        if path.endswith(".gz"):
+            return gzip.open(path, "wt", compresslevel=6), True
+        return open(path, "w"), True
+    with open(path, "rb") as raw:
+        is_gzip = raw.read(2) == b"\x1f\x8b"
+    if is_gzip:
+        return gzip.open(path, "rt"), True
+    return open(path, "r"), True
+
+
+def __tokenize(stream: IO[str]) -> Iterator[Tuple[bool, List[str]]]:
+    """Split lines of an MPS file into tokens, skipping comments.
+
+    Parameters
+    ----------
+    stream :
+        Text stream of the MPS file.
+
+    Yields
+    ------
+    :
+        Pairs ``(is_header, tokens)`` where ``is_header`` is true for section
+        headers, which start on the first column.
+    """
+    for line in stream:
+        if not line.strip() or line[0] == "*":
+            continue
+        yield not line[0].isspace(), line.split()
+
+
+def read_mps(file: PathOrFile) -> Problem:
+    r"""Read a linear program from a file in free or fixed MPS format.
+
+    The file is streamed line by line: constraint coefficients are gathered
+    as COO triplets and converted to CSC matrices, so that dense matrices are
+    never built. Files compressed with gzip are detected and decompressed on
+    the fly.
+
+    Parameters
+    ----------
+    file :
+        Path to the MPS file, or text file object.
+
+    Returns
+    -------
+    :
+        Linear program, with ``L`` and ``G`` rows as inequality constraints
+        :math:`G x \leq h`, ``E`` rows as equality constraints :math:`A x =
+        b` and ranged rows as pairs of inequality constraints. Constraint
+        matrices are in CSC format, or ``None`` if there is no such row.
+
+    Raises
+    ------
+    MPSError
+        If the file is not a valid MPS file.
+
+    Notes
+    -----
+    Names are split on whitespace, so that names containing spaces in fixed
+    MPS files are not supported. Integrality markers are ignored, and the
+    constant term of the objective is dropped. Maximization problems, marked
+    by ``OBJSENSE MAX``, are converted to minimization by negating the cost
+    vector.
+    """
+    stream, owned = __open_text(file, "r")
+    try:
+        return __read_stream(stream)
+    finally:
+        if owned:
+            stream.close()
+
+
+def __read_stream(stream: IO[str]) -> Problem:
+    """Read a linear program from a text stream in MPS format.
+
+    Parameters
+    ----------
+    stream :
+        Text stream of the MPS file.
+
+    Returns
+    -------
+    :
+        Linear program read from the stream.
+
+    Raises
+    ------
+    MPSError
+        If the stream is not a valid MPS file.
+    """
+    section: Optional[str] = None
+    objective: Optional[str] = None
+    maximize = False
+    rows: Dict[str, int] = {}
+    free_rows = set()
+    row_types: List[str] = []
+    columns: Dict[str, int] = {}
+    cost = array("d")
+    entry_rows, entry_cols, entry_values = array("q"), array("q"), array("d")
+    rhs: Dict[int, float] = {}
+    ranges: Dict[int, float] = {}
+    bounds: List[Tuple[str, int, float]] = []
+
+    def column_index(name: str) -> int:
+        if name not in columns:
+            raise MPSError(f"unknown column '{name}'")
+        return columns[name]
+
+    def row_values(tokens: List[str]) -> Iterator[Tuple[str, float]]:
+        # Vector sections may omit their set name in free MPS
+        start = len(tokens) % 2
+        for k in range(start, len(tokens) - 1, 2):
+            yield tokens[k], float(tokens[k + 1])
+
+    for is_header, tokens in __tokenize(stream):
+        try:
+            if is_header:
+                section = tokens[0].upper()
+                if section == "OBJSENSE" and len(tokens) > 1:
+                    maximize = tokens[1].upper().startswith("MAX")
+                elif section == "ENDATA":
+                    break
+                elif section not in __sections:
+                    raise MPSError(f"unknown section '{tokens[0]}'")
+            elif section == "OBJSENSE":
+                maximize = tokens[0].upper().startswith("MAX")
+            elif section == "ROWS":
+                row_type, name = tokens[0].upper(), tokens[1]
+                if row_type == "N":
+                    if objective is None:
+                        objective = name
+                    free_rows.add(name)  # other free rows are ignored
+                    continue
+                if row_type not in ("L", "G", "E"):
+                    raise MPSError(f"unknown row type '{tokens[0]}'")
+                rows[name] = len(row_types)
+                row_types.append(row_type)
+            elif section == "COLUMNS":
+                if len(tokens) > 1 and "'MARKER'" in tokens[1].upper():
+                    continue  # integrality markers
+                name = tokens[0]
+                if name not in columns:
+                    columns[name] = len(cost)
+                    cost.append(0.0)
+                j = columns[name]
+                for k in range(1, len(tokens) - 1, 2):
+                    row_name, value = tokens[k], float(tokens[k + 1])
+                    if row_name == objective:
+                        cost[j] = value
+                    elif row_name in rows:
+                        entry_rows.append(rows[row_name])
+                        entry_cols.append(j)
+                        entry_values.append(value)
+                    elif row_name not in free_rows:
+                        raise MPSError(f"unknown row '{row_name}'")
+            elif section == "RHS":
+                for row_name, value in row_values(tokens):
+                    if row_name in rows:
+                        rhs[rows[row_name]] = value
+            elif section == "RANGES":
+                for row_name, value in row_values(tokens):
+                    if row_name not in rows:
+                        raise MPSError(f"unknown row '{row_name}'")
+                    ranges[rows[row_name]] = value
+            elif section == "BOUNDS":
+                bound_type = tokens[0].upper()
+                if bound_type in ("FR", "MI", "PL", "BV") and len(tokens) < 4:
+                    j = column_index(tokens[-1])
+                    bounds.append((bound_type, j, 0.0))
+                else:
+                    j = column_index(tokens[-2])
+                    bounds.append((bound_type, j, float(tokens[-1])))
+            else:
+                raise MPSError(f"unexpected line {' '.join(tokens)}")
+        except (IndexError, ValueError) as exn:
+            raise MPSError(
+                f"invalid line '{' '.join(tokens)}' in section {section}"
+            ) from exn
+
+    n = len(cost)
+    c = np.frombuffer(cost, dtype=float).copy()
+    if maximize:
+        c = -c
+    lb, ub = __read_bounds(bounds, n)
+    G, h, A, b = __split_rows(
+        row_types,
+        np.frombuffer(entry_rows, dtype=np.int64),
+        np.frombuffer(entry_cols, dtype=np.int64),
+        np.frombuffer(entry_values, dtype=float),
+        rhs,
+        ranges,
+        n,
+    )
+    return Problem(c, G, h, A, b, lb, ub)
+
+
+def __read_bounds(
+    bounds: List[Tuple[str, int, float]], n: int
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """Build bound vectors from the BOUNDS section of an MPS file.
+
+    Parameters
+    ----------
+    bounds :
+        List of ``(type, column, value)`` bounds in file order.
+    n :
+        Number of variables.
+
+    Returns
+    -------
+    :
+        Pair ``(lb, ub)`` of bound vectors, each of them ``None`` if all its
+        entries are infinite.
+
+    Raises
+    ------
+    MPSError
+        If a bound type is unknown.
+    """
+    lb, ub = np.zeros(n), np.full(n, np.inf)
+    lb_set = np.zeros(n, dtype=bool)
+    for bound_type, j, value in bounds:
+        if bound_type in ("UP", "UI"):
+            ub[j] = value
+            if value < 0.0 and not lb_set[j] and lb[j] == 0.0:
+                lb[j] = -np.inf  # convention of most MPS readers
+        elif bound_type in ("LO", "LI"):
+            lb[j] = value
+            lb_set[j] = True
+        elif bound_type == "FX":
+            lb[j] = ub[j] = value
+            lb_set[j] = True
+        elif bound_type == "FR":
+            lb[j], ub[j] = -np.inf, np.inf
+            lb_set[j] = True
+        elif bound_type == "MI":
+            lb[j] = -np.inf
+            lb_set[j] = True
+        elif bound_type == "PL":
+            ub[j] = np.inf
+        elif bound_type == "BV":
+            lb[j], ub[j] = 0.0, 1.0
+            lb_set[j] = True
+        else:
+            raise MPSError(f"unsupported bound type '{bound_type}'")
+    return (
+        lb if np.isfinite(lb).any() else None,
+        ub if np.isfinite(ub).any() else None,
+    )
+
+
+def __split_rows(
+    row_types: List[str],
+    rows: np.ndarray,
+    cols: np.ndarray,
+    values: np.ndarray,
+    rhs: Dict[int, float],
+    ranges: Dict[int, float],
+    n: int,
+) -> Tuple[
+    Optional[spa.csc_matrix],
+    Optional[np.ndarray],
+    Optional[spa.csc_matrix],
+    Optional[np.ndarray],
+]:
+    """Split MPS rows into inequality and equality constraints.
+
+    Parameters
+    ----------
+    row_types :
+        Type ``"L"``, ``"G"`` or ``"E"`` of each row.
+    rows :
+        Row indices of COO triplets.
+    cols :
+        Column indices of COO triplets.
+    values :
+        Values of COO triplets.
+    rhs :
+        Right-hand side of each row, zero if absent.
+    ranges :
+        Range of each ranged row.
+    n :
+        Number of variables.
+
+    Returns
+    -------
+    :
+        Tuple ``(G, h, A, b)`` with constraint matrices in CSC format.
+    """
+    nb_rows = len(row_types)
+    # Each row maps to at most two inequalities or one equality
+    upper = np.full(nb_rows, -1)  # row of a^T x <= u in G
+    lower = np.full(nb_rows, -1)  # row of -a^T x <= -l in G
+    equal = np.full(nb_rows, -1)  # row of a^T x = b in A
+    h_list: List[float] = []
+    b_list: List[float] = []
+    for i, row_type in enumerate(row_types):
+        value = rhs.get(i, 0.0)
+        low, up = -np.inf, np.inf
+        if row_type == "L":
+            up = value
+            if i in ranges:
+                low = value - abs(ranges[i])
+        elif row_type == "G":
+            low = value
+            if i in ranges:
+                up = value + abs(ranges[i])
+        elif i not in ranges:
+            equal[i] = len(b_list)
+            b_list.append(value)
+            continue
+        elif ranges[i] >= 0.0:
+            low, up = value, value + ranges[i]
+        else:
+            low, up = value + ranges[i], value
+        if up < np.inf:
+            upper[i] = len(h_list)
+            h_list.append(up)
+        if low > -np.inf:
+            lower[i] = len(h_list)
+            h_list.append(-low)
+
+    G_rows, G_cols, G_values = [], [], []
+    for targets, sign in ((upper, 1.0), (lower, -1.0)):
+        mask = targets[rows] >= 0
+        G_rows.append(targets[rows[mask]])
+        G_cols.append(cols[mask])
+        G_values.append(sign * values[mask])
+    mask = equal[rows] >= 0
+    G = h = A = b = None
+    if h_list:
+        G = spa.csc_matrix(
+            (
+                np.concatenate(G_values),
+                (np.concatenate(G_rows), np.concatenate(G_cols)),
+            ),
+            shape=(len(h_list), n),
+        )
+        h = np.array(h_list)
+    if b_list:
+        A = spa.csc_matrix(
+            (values[mask], (equal[rows[mask]], cols[mask])),
+            shape=(len(b_list), n),
+        )
+        b = np.array(b_list)
+    return G, h, A, b
+
+
+def __format_value(value: float) -> str:
+    """Format a number so that it is read back exactly.
+
+    Parameters
+    ----------
+    value :
+        Number to format.
+
+    Returns
+    -------
+    :
+        Shortest representation of the number.
+    """
+    return repr(float(value))
+
+
+def write_mps(
+    problem: Problem, file: PathOrFile, name: str = "LPSOLVERS"
+) -> None:
+    """Write a linear program to a file in free MPS format.
+
+    Variables are named ``x0``, ``x1``, ..., inequality constraints ``g0``,
+    ``g1``, ... and equality constraints ``a0``, ``a1``, ... Coefficients are
+    written column by column from CSC matrices, and numbers are written with
+    enough digits to be read back exactly. Paths ending with ``.gz`` are
+    compressed with gzip.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to write.
+    file :
+        Path to the MPS file, or text file object.
+    name :
+        Name of the problem written in the file.
+    """
+    stream, owned = __open_text(file, "w")
+    try:
+        __write_stream(problem, stream, name)
+    finally:
+        if owned:
+            stream.close()
+
+
+def __write_stream(problem: Problem, stream: IO[str], name: str) -> None:
+    """Write a linear program to a text stream in free MPS format.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to write.
+    stream :
+        Text stream to write to.
+    name :
+        Name of the problem written in the file.
+    """
+    c, G, h, A, b, lb, ub = problem.unpack()
+    n = c.shape[0]
+    G = spa.csc_matrix(G) if G is not None else spa.csc_matrix((0, n))
+    A = spa.csc_matrix(A) if A is not None else spa.csc_matrix((0, n))
+    write = stream.write
+    write(f"NAME {name}\nROWS\n N obj\n")
+    for i in range(G.shape[0]):
+        write(f" L g{i}\n")
+    for i in range(A.shape[0]):
+        write(f" E a{i}\n")
+    write("COLUMNS\n")
+    for j in range(n):
+        write(f" x{j} obj {__format_value(c[j])}\n")
+        for prefix, M in (("g", G), ("a", A)):
+            for k in range(M.indptr[j], M.indptr[j + 1]):
+                value = __format_value(M.data[k])
+                write(f" x{j} {prefix}{M.indices[k]} {value}\n")
+    write("RHS\n")
+    for prefix, v in (("g", h), ("a", b)):
+        if v is None:
+            continue
+        for i in np.flatnonzero(v):
+            write(f" rhs {prefix}{i} {__format_value(v[i])}\n")
+    write("BOUNDS\n")
+    lb = lb if lb is not None else np.full(n, -np.inf)
+    ub = ub if ub is not None else np.full(n, np.inf)
+    for j in range(n):
+        if lb[j] == ub[j]:
+            write(f" FX bnd x{j} {__format_value(lb[j])}\n")
+            continue
+        if lb[j] == -np.inf and ub[j] == np.inf:
+            write(f" FR bnd x{j}\n")
+            continue
+        if lb[j] == -np.inf:
+            write(f" MI bnd x{j}\n")
+        elif lb[j] != 0.0 or ub[j] < 0.0:
+            write(f" LO bnd x{j} {__format_value(lb[j])}\n")
+        if ub[j] < np.inf:
+            write(f" UP bnd x{j} {__format_value(ub[j])}\n")
+    write("ENDATA\n")
+
+
+__all__ = [
+    "read_mps",
+    "write_mps",
+]
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Linear programs kept alive between solves."""
+
+import abc
+from typing import Optional, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .exceptions import NoSolverSelected
+from .problem import Problem
+from .selection import select_solver
+from .solution import Solution
+from .solvers import available_solvers, get_solver_class
+
+
+class LPSolver(abc.ABC):
+    r"""Linear program whose vectors can be updated between solves.
+
+    The linear program is defined as:
+
+    .. math::
+
+        \begin{split}\begin{array}{ll}
+            \mbox{minimize} &
+                c^T x \\
+            \mbox{subject to}
+                & G x \leq h \\
+                & A x = b \\
+                & lb \leq x \leq ub
+        \end{array}\end{split}
+
+    Solver interfaces derive from this class to keep their backend model
+    alive between calls to :func:`solve`. Repeated solves then skip the setup
+    phase, and start from the previous solution if the backend supports warm
+    starting.
+
+    Attributes
+    ----------
+    c :
+        Linear cost vector.
+    G :
+        Linear inequality constraint matrix.
+    h :
+        Linear inequality constraint vector.
+    A :
+        Linear equality constraint matrix.
+    b :
+        Linear equality constraint vector.
+    lb :
+        Lower bound constraint vector.
+    ub :
+        Upper bound constraint vector.
+    x :
+        Last primal solution found, or ``None`` before the first one.
+
+    Notes
+    -----
+    Solver interfaces accumulate in ``_conversion_time`` and ``_setup_time``
+    the time spent converting and setting up data since the last solve, which
+    is then reported in the next :class:`Solution`.
+    """
+
+    c: np.ndarray
+    G: Optional[Union[np.ndarray, spa.csc_matrix]]
+    h: Optional[np.ndarray]
+    A: Optional[Union[np.ndarray, spa.csc_matrix]]
+    b: Optional[np.ndarray]
+    lb: Optional[np.ndarray]
+    ub: Optional[np.ndarray]
+    x: Optional[np.ndarray]
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        G: Optional[Union[np.ndarray, spa.csc_matrix]],
+        h: Optional[np.ndarray],
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+    ) -> None:
+        self.c = c
+        self.G = G
+        self.h = h
+        self.A = A
+        self.b = b
+        self.lb = lb
+        self.ub = ub
+        self.x = None
+        self._conversion_time = 0.0
+        self._setup_time = 0.0
+
+    def update(
+        self,
+        c: Optional[np.ndarray] = None,
+        h: Optional[np.ndarray] = None,
+        b: Optional[np.ndarray] = None,
+    ) -> None:
+        """Update vectors of the linear program.
+
+        Parameters
+        ----------
+        c :
+            New linear cost vector, if any.
+        h :
+            New linear inequality constraint vector, if any.
+        b :
+            New linear equality constraint vector, if any.
+
+        Raises
+        ------
+        ValueError
+            If a new vector does not have the same shape as the current one.
+        """
+        for name, value in (("c", c), ("h", h), ("b", b)):
+            if value is None:
+                continue
+            current = getattr(self, name)
+            if current is None or value.shape != current.shape:
+                raise ValueError(
+                    f"cannot update {name} with a vector of shape "
+                    f"{value.shape} in a linear program where {name} is "
+                    f"{None if current is None else current.shape}"
+                )
+            setattr(self, name, value)
+
+    @abc.abstractmethod
+    def solve_problem(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> Solution:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, if any. Defaults to the previous solution
+            for solvers that support warm starting.
+        dual_initvals :
+            Dual initial guess, if any, stacking multipliers of inequality
+            then equality constraints.
+
+        Returns
+        -------
+        :
+            Solution to the linear program, including duals and timings.
+        """
+
+    def solve(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, if any. Defaults to the previous solution
+            for solvers that support warm starting.
+        dual_initvals :
+            Dual initial guess, if any, stacking multipliers of inequality
+            then equality constraints.
+
+        Returns
+        -------
+        :
+            Optimal (primal) solution of the linear program, if it exists.
+
+        Raises
+        ------
+        ValueError
+            If the linear program is not feasible.
+        """
+        solution = self.solve_problem(initvals, dual_initvals)
+        if not solution.found:
+            raise ValueError(
+                f"Linear program is not feasible: {solution.status}"
+            )
+        return solution.x  # type: ignore
+
+    def _new_solution(self) -> Solution:
+        """Start a solution, reporting conversion and setup times.
+
+        Returns
+        -------
+        :
+            Solution to the current linear program, yet to be filled.
+        """
+        solution = Solution(
+            Problem(self.c, self.G, self.h, self.A, self.b, self.lb, self.ub)
+        )
+        solution.conversion_time = self._conversion_time
+        solution.setup_time = self._setup_time
+        self._conversion_time = 0.0
+        self._setup_time = 0.0
+        return solution
+
+
+def make_lp_solver(
+    c: np.ndarray,
+    G: Optional[Union[np.ndarray, spa.csc_matrix]],
+    h: Optional[np.ndarray],
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+    b: Optional[np.ndarray] = None,
+    solver: Optional[str] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    **kwargs,
+) -> LPSolver:
+    """Set up a linear program to solve repeatedly with one of the solvers.
+
+    Parameters
+    ----------
+    c :
+        Linear cost vector.
+    G :
+        Linear inequality constraint matrix.
+    h :
+        Linear inequality constraint vector.
+    A :
+        Linear equality constraint matrix.
+    b :
+        Linear equality constraint vector.
+    solver :
+        Name of the LP solver to choose in :data:`lpsolvers.available_solvers`,
+        or ``"auto"`` to select one from the features of the problem with
+        :func:`lpsolvers.selection.select_solver`.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+
+    Returns
+    -------
+    :
+        Linear program ready to be solved and updated.
+
+    Raises
+    ------
+    SolverNotFound
+        If the requested LP solver is not found.
+
+    Notes
+    -----
+    Extra keyword arguments given to this function are forwarded to the
+    underlying solver, as in :func:`lpsolvers.solve_lp`.
+
+    Examples
+    --------
+    In a loop where only the cost vector changes:
+
+    .. code:: python
+
+        lp = make_lp_solver(c, G, h, solver="proxqp")
+        for c_next in costs:
+            lp.update(c=c_next)
+            x = lp.solve()
+    """
+    if solver is None:
+        raise NoSolverSelected(
+            "Set the `solver` keyword argument to one of the "
+            f"available solvers in {available_solvers}"
+        )
+    if isinstance(G, np.ndarray) and G.ndim == 1:
+        G = G.reshape((1, G.shape[0]))
+    if solver == "auto":
+        solver = select_solver(Problem(c, G, h, A, b, lb, ub))
+    solver_class = get_solver_class(solver)
+    if solver == "cdd":
+        return solver_class(c, G, h, A, b, lb, ub)
+    return solver_class(c, G, h, A, b, lb, ub, **kwargs)
@@ -0,0 +1,670 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Batched primal-dual hybrid gradient for many linear programs at once.
+
+This engine advances a whole batch of linear programs with the same
+dimensions together. Primal and dual iterates are stored as arrays of shape
+``(k, n)`` and ``(k, m + p)``, so that an iteration over the batch is two
+products with the constraint matrices and a few vectorized operations,
+rather than ``k`` separate solver calls. It follows the restarted
+primal-dual hybrid gradient of PDLP:
+
+- Ruiz then Pock-Chambolle equilibration of the constraint matrices,
+- adaptive step sizes and primal weights, set per instance,
+- restarts to the current or average iterate based on KKT errors,
+- termination on relative KKT errors, checked per instance, after which
+  converged instances are removed from the batch.
+
+Infeasible and unbounded problems are not detected: they are reported as
+not found once the iteration limit is reached.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .solve_lps import _split_batch
+
+
+class _ConstraintOperator:
+    """Constraint matrix :math:`K = [G; A]` of a batch, after scaling.
+
+    The matrix is either shared by all instances, dense or sparse, or
+    stacked as a dense array of shape ``(k, m + p, n)``.
+
+    Attributes
+    ----------
+    K :
+        Scaled constraint matrix :math:`E K_0 D`.
+    KT :
+        Transpose of the scaled constraint matrix.
+    E :
+        Row scaling factors, of shape ``(m + p,)`` or ``(k, m + p)``.
+    D :
+        Column scaling factors, of shape ``(n,)`` or ``(k, n)``.
+    stacked :
+        True if the constraint matrix differs between instances.
+    """
+
+    def __init__(
+        self,
+        K: Union[np.ndarray, spa.csr_matrix],
+        E: np.ndarray,
+        D: np.ndarray,
+    ) -> None:
+        self.stacked = isinstance(K, np.ndarray) and K.ndim == 3
+        self.K = K
+        self.KT = self.__transpose(K)
+        self.E = E
+        self.D = D
+
+    def __transpose(
+        self, K: Union[np.ndarray, spa.csr_matrix]
+    ) -> Union[np.ndarray, spa.csr_matrix]:
+        """Transpose a shared or stacked matrix, without copy if dense."""
+        if self.stacked:
+            return K.transpose((0, 2, 1))
+        return K.T.tocsr() if spa.issparse(K) else K.T
+
+    def __product(
+        self, M: Union[np.ndarray, spa.csr_matrix], X: np.ndarray
+    ) -> np.ndarray:
+        """Multiply each row of a stack of vectors by a matrix."""
+        if self.stacked:
+            return np.matmul(M, X[:, :, np.newaxis])[:, :, 0]
+        if spa.issparse(M):
+            return (M @ X.T).T
+        return X @ M.T
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """Multiply each row of a stack of primal vectors by :math:`K`.
+
+        Parameters
+        ----------
+        X :
+            Stack of primal vectors, of shape ``(k, n)``.
+
+        Returns
+        -------
+        :
+            Stack of products, of shape ``(k, m + p)``.
+        """
+        return self.__product(self.K, X)
+
+    def apply_transpose(self, Y: np.ndarray) -> np.ndarray:
+        """Multiply each row of a stack of dual vectors by :math:`K^T`.
+
+        Parameters
+        ----------
+        Y :
+            Stack of dual vectors, of shape ``(k, m + p)``.
+
+        Returns
+        -------
+        :
+            Stack of products, of shape ``(k, n)``.
+        """
+        return self.__product(self.KT, Y)
+
+    def max_abs(self, batch_size: int) -> np.ndarray:
+        """Get the largest absolute entry of the matrix of each instance.
+
+        Parameters
+        ----------
+        batch_size :
+            Number of instances in the batch.
+
+        Returns
+        -------
+        :
+            Largest absolute entries, of shape ``(k,)``.
+        """
+        if spa.issparse(self.K):
+            largest = abs(self.K).max() if self.K.nnz > 0 else 0.0
+        else:
+            largest = np.abs(self.K).max(axis=(-2, -1), initial=0.0)
+        return np.broadcast_to(largest, (batch_size,)).astype(self.D.dtype)
+
+    def restrict(self, mask: np.ndarray) -> None:
+        """Keep only some instances of a stacked matrix.
+
+        Parameters
+        ----------
+        mask :
+            Boolean mask of the instances to keep.
+        """
+        if self.stacked:
+            self.K = self.K[mask]
+            self.KT = self.__transpose(self.K)
+            self.E = self.E[mask]
+            self.D = self.D[mask]
+
+
+@dataclass
+class _BatchState:
+    r"""Per-instance arrays of the batch, indexed along their first axis.
+
+    Vectors of the problems are scaled, so that the original primal
+    solution of an instance is :math:`D \tilde{x}`.
+    """
+
+    index: np.ndarray
+    c: np.ndarray
+    q: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    has_lower: np.ndarray
+    has_upper: np.ndarray
+    c_norm: np.ndarray
+    q_norm: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    Kx: np.ndarray
+    KTy: np.ndarray
+    x_sum: np.ndarray
+    y_sum: np.ndarray
+    weight: np.ndarray
+    eta: np.ndarray
+    omega: np.ndarray
+    x_last: np.ndarray
+    y_last: np.ndarray
+    kkt_last: np.ndarray
+    kkt_candidate: np.ndarray
+    restart_iter: np.ndarray
+
+    def restrict(self, mask: np.ndarray) -> None:
+        """Keep only some instances of the batch.
+
+        Parameters
+        ----------
+        mask :
+            Boolean mask of the instances to keep.
+        """
+        for field in fields(self):
+            setattr(self, field.name, getattr(self, field.name)[mask])
+
+
+def __stack_constraints(
+    G: Optional[Union[np.ndarray, spa.spmatrix]],
+    A: Optional[Union[np.ndarray, spa.spmatrix]],
+    batch_size: int,
+    n: int,
+    dtype: np.dtype,
+) -> Union[np.ndarray, spa.csr_matrix]:
+    """Stack inequality and equality constraint matrices.
+
+    Parameters
+    ----------
+    G :
+        Shared or stacked inequality constraint matrix, if any.
+    A :
+        Shared or stacked equality constraint matrix, if any.
+    batch_size :
+        Number of instances in the batch.
+    n :
+        Number of optimization variables.
+    dtype :
+        Floating-point type of the result.
+
+    Returns
+    -------
+    :
+        Shared matrix :math:`[G; A]`, in CSR format if either matrix is
+        sparse, or stacked dense array if either matrix is stacked.
+    """
+    matrices = [M for M in (G, A) if M is not None]
+    if not matrices:
+        return np.zeros((0, n), dtype=dtype)
+    if any(isinstance(M, np.ndarray) and M.ndim == 3 for M in matrices):
+        return np.concatenate(
+            [
+                np.broadcast_to(
+                    M.toarray() if spa.issparse(M) else M,
+                    (batch_size,) + M.shape[-2:],
+                )
+                for M in matrices
+            ],
+            axis=1,
+        ).astype(dtype, copy=False)
+    if any(spa.issparse(M) for M in matrices):
+        return spa.vstack(matrices, format="csr", dtype=dtype)
+    return np.vstack(matrices).astype(dtype, copy=False)
+
+
+def __abs_norms(
+    K: Union[np.ndarray, spa.csr_matrix], axis: int, l1: bool
+) -> np.ndarray:
+    r"""Compute norms of the rows or columns of a matrix.
+
+    Parameters
+    ----------
+    K :
+        Shared or stacked matrix.
+    axis :
+        Axis to reduce, -1 for row norms and -2 for column norms.
+    l1 :
+        If set, compute :math:`\ell_1` norms, otherwise infinity norms.
+
+    Returns
+    -------
+    :
+        Norms, where zero norms of empty rows or columns are set to one.
+    """
+    if spa.issparse(K):
+        abs_K = abs(K)
+        sparse_axis = 1 if axis == -1 else 0
+        if l1:
+            norms = abs_K.sum(axis=sparse_axis)
+        else:
+            norms = abs_K.max(axis=sparse_axis).toarray()
+        norms = np.asarray(norms, dtype=K.dtype).ravel()
+    else:
+        abs_K = np.abs(K)
+        norms = abs_K.sum(axis=axis) if l1 else abs_K.max(axis, initial=0.0)
+    norms[norms == 0.0] = 1.0
+    return norms
+
+
+def __scale(
+    K: Union[np.ndarray, spa.csr_matrix], e: np.ndarray, d: np.ndarray
+) -> Union[np.ndarray, spa.csr_matrix]:
+    r"""Scale the rows and columns of a shared or stacked matrix.
+
+    Parameters
+    ----------
+    K :
+        Shared or stacked matrix.
+    e :
+        Row scaling factors.
+    d :
+        Column scaling factors.
+
+    Returns
+    -------
+    :
+        Scaled matrix :math:`\mathrm{diag}(e) K \mathrm{diag}(d)`.
+    """
+    if spa.issparse(K):
+        return spa.csr_matrix(spa.diags(e) @ K @ spa.diags(d))
+    return K * e[..., :, np.newaxis] * d[..., np.newaxis, :]
+
+
+def __equilibrate(
+    K: Union[np.ndarray, spa.csr_matrix], iterations: int
+) -> Tuple[Union[np.ndarray, spa.csr_matrix], np.ndarray, np.ndarray]:
+    """Equilibrate a constraint matrix with Ruiz then Pock-Chambolle steps.
+
+    Parameters
+    ----------
+    K :
+        Shared or stacked constraint matrix.
+    iterations :
+        Number of Ruiz iterations.
+
+    Returns
+    -------
+    :
+        Tuple ``(K, E, D)`` of the scaled matrix and of its row and column
+        scaling factors.
+    """
+    E = np.ones(K.shape[:-1], dtype=K.dtype)
+    D = np.ones(K.shape[:-2] + K.shape[-1:], dtype=K.dtype)
+    for i in range(iterations + 1):
+        l1 = i == iterations  # last step: Pock-Chambolle with alpha = 1
+        e = 1.0 / np.sqrt(__abs_norms(K, -1, l1))
+        d = 1.0 / np.sqrt(__abs_norms(K, -2, l1))
+        K = __scale(K, e, d)
+        E *= e
+        D *= d
+    return K, E, D
+
+
+def __kkt_errors(
+    state: _BatchState,
+    operator: _ConstraintOperator,
+    m: int,
+    x: np.ndarray,
+    y: np.ndarray,
+    Kx: np.ndarray,
+    KTy: np.ndarray,
+    eps_abs: float,
+    eps_rel: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute KKT errors of primal-dual points of the batch.
+
+    Parameters
+    ----------
+    state :
+        State of the batch.
+    operator :
+        Scaled constraint matrix.
+    m :
+        Number of inequality constraints.
+    x :
+        Stack of scaled primal points.
+    y :
+        Stack of scaled dual points.
+    Kx :
+        Products of primal points by the constraint matrix.
+    KTy :
+        Products of dual points by the transposed constraint matrix.
+    eps_abs :
+        Absolute tolerance on residuals and duality gaps.
+    eps_rel :
+        Relative tolerance on residuals and duality gaps.
+
+    Returns
+    -------
+    :
+        Pair ``(kkt, converged)`` of KKT errors of the original problems,
+        and of the mask of points satisfying termination criteria.
+    """
+    primal = (Kx - state.q) / operator.E
+    np.maximum(primal[:, :m], 0.0, out=primal[:, :m])
+    primal_res = np.linalg.norm(primal, axis=1)
+
+    # reduced costs are multipliers of bounds where they have the right sign
+    reduced = state.c + KTy
+    z_lower = np.where(state.has_lower, np.maximum(reduced, 0.0), 0.0)
+    z_upper = np.where(state.has_upper, np.minimum(reduced, 0.0), 0.0)
+    dual_res = np.linalg.norm(
+        (reduced - z_lower - z_upper) / operator.D, axis=1
+    )
+
+    primal_obj = np.sum(state.c * x, axis=1)
+    dual_obj = (
+        np.sum(np.where(state.has_lower, state.lower, 0.0) * z_lower, axis=1)
+        + np.sum(np.where(state.has_upper, state.upper, 0.0) * z_upper, axis=1)
+        - np.sum(state.q * y, axis=1)
+    )
+    gap = np.abs(primal_obj - dual_obj)
+    converged = (
+        (primal_res <= eps_abs + eps_rel * state.q_norm)
+        & (dual_res <= eps_abs + eps_rel * state.c_norm)
+        & (gap <= eps_abs + eps_rel * (np.abs(primal_obj) + np.abs(dual_obj)))
+    )
+    kkt = np.sqrt(primal_res**2 + dual_res**2 + gap**2)
+    return kkt, converged
+
+
+def pdhg_solve_lps(
+    C: np.ndarray,
+    G: Optional[Union[np.ndarray, spa.spmatrix]],
+    H: Optional[np.ndarray],
+    A: Optional[Union[np.ndarray, spa.spmatrix]] = None,
+    B: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    dtype: Union[type, np.dtype] = np.float64,
+    eps_abs: Optional[float] = None,
+    eps_rel: Optional[float] = None,
+    max_iter: int = 20000,
+    check_every: int = 64,
+    scaling_iter: int = 10,
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Solve a batch of linear programs with a vectorized PDHG.
+
+    Each linear program :math:`i` in the batch is defined as:
+
+    .. math::
+
+        \begin{split}\begin{array}{ll}
+            \mbox{minimize} &
+                c_i^T x \\
+            \mbox{subject to}
+                & G_i x \leq h_i \\
+                & A_i x = b_i \\
+                & lb_i \leq x \leq ub_i
+        \end{array}\end{split}
+
+    Arguments follow the conventions of :func:`lpsolvers.solve_lps`: vectors
+    are stacked along their first axis, and any argument can be shared by
+    all problems in the batch by giving it with one less dimension. Shared
+    matrices can be sparse.
+
+    Parameters
+    ----------
+    C :
+        Stack of linear cost vectors, of shape ``(k, n)``.
+    G :
+        Stack of linear inequality constraint matrices, of shape ``(k, m,
+        n)``, or shared matrix of shape ``(m, n)``.
+    H :
+        Stack of linear inequality constraint vectors, of shape ``(k, m)``.
+    A :
+        Stack of linear equality constraint matrices, of shape ``(k, p,
+        n)``, or shared matrix of shape ``(p, n)``.
+    B :
+        Stack of linear equality constraint vectors, of shape ``(k, p)``.
+    lb :
+        Stack of lower bound vectors, of shape ``(k, n)``, or shared vector
+        of shape ``(n,)``, if any.
+    ub :
+        Stack of upper bound vectors, of shape ``(k, n)``, or shared vector
+        of shape ``(n,)``, if any.
+    dtype :
+        Floating-point type of the iterates, ``np.float64`` or
+        ``np.float32``.
+    eps_abs :
+        Absolute tolerance on primal and dual residuals and duality gaps.
+        Defaults to :math:`10^{-6}` in double precision and :math:`10^{-4}`
+        in single precision.
+    eps_rel :
+        Relative tolerance on primal and dual residuals and duality gaps,
+        with the same defaults as ``eps_abs``.
+    max_iter :
+        Maximum number of iterations.
+    check_every :
+        Number of iterations between checks of termination and restart
+        criteria.
+    scaling_iter :
+        Number of Ruiz equilibration iterations.
+
+    Returns
+    -------
+    :
+        Pair ``(X, found)`` where ``X`` is the stack of optimal solutions, of
+        shape ``(k, n)`` and type ``dtype``, and ``found`` is a boolean array
+        of shape ``(k,)`` that is ``True`` where a solution was found. Rows
+        of ``X`` where no solution was found are filled with NaNs.
+
+    Raises
+    ------
+    ValueError
+        If argument shapes are inconsistent or the type is not supported.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype should be float32 or float64, got {dtype}")
+    default_eps = 1e-6 if dtype == np.float64 else 1e-4
+    eps_abs = eps_abs if eps_abs is not None else default_eps
+    eps_rel = eps_rel if eps_rel is not None else default_eps
+    ((C, G, H, A, B),) = _split_batch(C, G, H, A, B, 1)
+    batch_size, n = C.shape
+    m = H.shape[1] if H is not None else 0
+    Q = np.hstack(
+        [V for V in (H, B) if V is not None] or [np.empty((batch_size, 0))]
+    ).astype(dtype)
+    lower = np.broadcast_to(
+        np.asarray(lb if lb is not None else -np.inf, dtype=dtype),
+        (batch_size, n),
+    )
+    upper = np.broadcast_to(
+        np.asarray(ub if ub is not None else np.inf, dtype=dtype),
+        (batch_size, n),
+    )
+
+    K = __stack_constraints(G, A, batch_size, n, dtype)
+    operator = _ConstraintOperator(*__equilibrate(K, scaling_iter))
+    E, D = operator.E, operator.D
+    c = C.astype(dtype) * D
+    q = Q * E
+    x = np.clip(np.zeros((batch_size, n), dtype=dtype), lower / D, upper / D)
+    y = np.zeros_like(q)
+    Kx = operator.apply(x)
+    c_norm = np.linalg.norm(c, axis=1)
+    q_norm = np.linalg.norm(q, axis=1)
+    omega = np.ones(batch_size, dtype=dtype)
+    balanced = (c_norm > 1e-10) & (q_norm > 1e-10)
+    omega[balanced] = c_norm[balanced] / q_norm[balanced]
+    max_abs = operator.max_abs(batch_size)
+    state = _BatchState(
+        index=np.arange(batch_size),
+        c=c,
+        q=q,
+        lower=lower / D,
+        upper=upper / D,
+        has_lower=np.isfinite(lower),
+        has_upper=np.isfinite(upper),
+        c_norm=np.linalg.norm(C, axis=1),
+        q_norm=np.linalg.norm(Q, axis=1),
+        x=x,
+        y=y,
+        Kx=Kx,
+        KTy=operator.apply_transpose(y),
+        x_sum=np.zeros_like(x),
+        y_sum=np.zeros_like(y),
+        weight=np.zeros(batch_size, dtype=dtype),
+        eta=np.where(max_abs > 0.0, 1.0 / np.maximum(max_abs, 1e-30), 1.0),
+        omega=omega,
+        x_last=x.copy(),
+        y_last=y.copy(),
+        kkt_last=np.zeros(batch_size, dtype=dtype),
+        kkt_candidate=np.full(batch_size, np.inf, dtype=dtype),
+        restart_iter=np.zeros(batch_size, dtype=int),
+    )
+    state.kkt_last, _ = __kkt_errors(
+        state, operator, m, x, y, Kx, state.KTy, eps_abs, eps_rel
+    )
+
+    X = np.full((batch_size, n), np.nan, dtype=dtype)
+    found = np.zeros(batch_size, dtype=bool)
+    for k in range(max_iter):
+        # primal step, then dual step at the extrapolated primal point
+        eta = state.eta
+        tau = (eta / state.omega)[:, np.newaxis]
+        sigma = (eta * state.omega)[:, np.newaxis]
+        x_new = state.c + state.KTy
+        x_new *= -tau
+        x_new += state.x
+        np.clip(x_new, state.lower, state.upper, out=x_new)
+        Kx_new = operator.apply(x_new)
+        dKx = Kx_new - state.Kx
+        y_new = dKx + Kx_new  # K (2 x_new - x)
+        y_new -= state.q
+        y_new *= sigma
+        y_new += state.y
+        np.maximum(y_new[:, :m], 0.0, out=y_new[:, :m])
+        KTy_new = operator.apply_transpose(y_new)
+
+        # adaptive step size: accept the step if it was below the limit
+        # given by the local curvature of the saddle-point problem
+        dx = x_new - state.x
+        dy = y_new - state.y
+        interaction = np.abs(np.einsum("ij,ij->i", dy, dKx))
+        movement = 0.5 * (
+            state.omega * np.einsum("ij,ij->i", dx, dx)
+            + np.einsum("ij,ij->i", dy, dy) / state.omega
+        )
+        eta_limit = np.full_like(eta, np.inf)
+        np.divide(movement, interaction, out=eta_limit, where=interaction > 0)
+        accept = eta <= eta_limit
+        state.eta = np.minimum(
+            (1.0 - (k + 2) ** -0.3) * eta_limit, (1.0 + (k + 2) ** -0.6) * eta
+        )
+        if accept.all():
+            state.x, state.y = x_new, y_new
+            state.Kx, state.KTy = Kx_new, KTy_new
+        else:
+            step = accept[:, np.newaxis]
+            state.x = np.where(step, x_new, state.x)
+            state.y = np.where(step, y_new, state.y)
+            state.Kx = np.where(step, Kx_new, state.Kx)
+            state.KTy = np.where(step, KTy_new, state.KTy)
+        weight = np.where(accept, eta, 0.0)
+        state.x_sum += weight[:, np.newaxis] * state.x
+        state.y_sum += weight[:, np.newaxis] * state.y
+        state.weight += weight
+        if (k + 1) % check_every != 0 and k + 1 < max_iter:
+            continue
+
+        # candidates are the current or average iterates
+        averaged = state.weight > 0.0
+        scale = 1.0 / np.where(averaged, state.weight, 1.0)[:, np.newaxis]
+        x_avg = np.where(averaged[:, np.newaxis], state.x_sum * scale, state.x)
+        y_avg = np.where(averaged[:, np.newaxis], state.y_sum * scale, state.y)
+        Kx_avg = operator.apply(x_avg)
+        KTy_avg = operator.apply_transpose(y_avg)
+        kkt_cur, converged_cur = __kkt_errors(
+            state,
+            operator,
+            m,
+            state.x,
+            state.y,
+            state.Kx,
+            state.KTy,
+            eps_abs,
+            eps_rel,
+        )
+        kkt_avg, converged_avg = __kkt_errors(
+            state, operator, m, x_avg, y_avg, Kx_avg, KTy_avg, eps_abs, eps_rel
+        )
+        use_avg = (kkt_avg < kkt_cur)[:, np.newaxis]
+        x_c = np.where(use_avg, x_avg, state.x)
+        y_c = np.where(use_avg, y_avg, state.y)
+        kkt_c = np.minimum(kkt_avg, kkt_cur)
+
+        done = converged_cur | converged_avg
+        if done.any():
+            pick_avg = converged_avg & (~converged_cur | use_avg[:, 0])
+            x_done = np.where(pick_avg[:, np.newaxis], x_avg, state.x) * D
+            X[state.index[done]] = x_done[done]
+            found[state.index[done]] = True
+
+        restart = (
+            (kkt_c <= 0.2 * state.kkt_last)
+            | ((kkt_c <= 0.8 * state.kkt_last) & (kkt_c > state.kkt_candidate))
+            | (k + 1 - state.restart_iter >= 0.36 * (k + 1))
+        )
+        state.kkt_candidate = np.where(restart, np.inf, kkt_c)
+        if restart.any():
+            # primal weight balances the distances travelled since the last
+            # restart in the primal and dual spaces
+            dx_norm = np.linalg.norm(x_c - state.x_last, axis=1)
+            dy_norm = np.linalg.norm(y_c - state.y_last, axis=1)
+            update = restart & (dx_norm > 1e-10) & (dy_norm > 1e-10)
+            ratio = np.ones_like(dx_norm)
+            np.divide(dy_norm, dx_norm, out=ratio, where=update)
+            state.omega = np.where(
+                update, np.sqrt(ratio * state.omega), state.omega
+            )
+            mask = restart[:, np.newaxis]
+            state.x = np.where(mask, x_c, state.x)
+            state.y = np.where(mask, y_c, state.y)
+            state.Kx = np.where(
+                mask, np.where(use_avg, Kx_avg, state.Kx), state.Kx
+            )
+            state.KTy = np.where(
+                mask, np.where(use_avg, KTy_avg, state.KTy), state.KTy
+            )
+            state.x_last = np.where(mask, x_c, state.x_last)
+            state.y_last = np.where(mask, y_c, state.y_last)
+            state.kkt_last = np.where(restart, kkt_c, state.kkt_last)
+            state.x_sum[restart] = 0.0
+            state.y_sum[restart] = 0.0
+            state.weight[restart] = 0.0
+            state.restart_iter[restart] = k + 1
+
+        if done.any():
+            state.restrict(~done)
+            operator.restrict(~done)
+            D = operator.D
+            if state.index.size == 0:
+                break
+    return X, found
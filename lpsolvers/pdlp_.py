@@ -13,24 +13,345 @@ high-accuracy solutions and scaling to large problems. If you use PDLP in your
 academic works, consider citing the corresponding paper [Applegate2021]_.
 """
 
-from typing import Optional
+import time
+from typing import Optional, Union
 
 import numpy as np
 import scipy.sparse as spa
 from ortools.pdlp import solve_log_pb2, solvers_pb2
 from ortools.pdlp.python import pdlp
 
+from .lp_solver import LPSolver
+from .problem import Problem
+from .solution import Solution
+
+
+def stack_constraint_matrices(
+    G: Optional[Union[np.ndarray, spa.spmatrix]],
+    A: Optional[Union[np.ndarray, spa.spmatrix]],
+) -> Optional[spa.csc_matrix]:
+    """Stack inequality and equality constraint matrices for PDLP.
+
+    Each block is converted to CSC format at most once, which is free for
+    blocks that are already CSC. Entries of both blocks are then written
+    column by column into the preallocated arrays of the stacked matrix,
+    without the intermediate COO copies of ``scipy.sparse.vstack``.
+
+    Parameters
+    ----------
+    G :
+        Linear inequality constraint matrix, dense or sparse.
+    A :
+        Linear equality constraint matrix, dense or sparse.
+
+    Returns
+    -------
+    :
+        CSC matrix stacking ``G`` on top of ``A``, or ``None`` if there is
+        no constraint.
+    """
+    blocks = [
+        M if isinstance(M, spa.csc_matrix) else spa.csc_matrix(M)
+        for M in (G, A)
+        if M is not None
+    ]
+    if not blocks:
+        return None
+    if len(blocks) == 1:
+        return blocks[0]
+    top, bottom = blocks
+    n = top.shape[1]
+    nnz = top.nnz + bottom.nnz
+    index_dtype = np.int32 if nnz <= np.iinfo(np.int32).max else np.int64
+    indptr = top.indptr.astype(index_dtype) + bottom.indptr
+    data = np.empty(nnz, dtype=np.result_type(top.dtype, bottom.dtype))
+    indices = np.empty(nnz, dtype=index_dtype)
+
+    # In column j, entries of the top block are shifted by the number of
+    # bottom entries in previous columns, and entries of the bottom block by
+    # the number of top entries up to and including column j
+    top_dest = np.arange(top.nnz, dtype=index_dtype)
+    top_dest += np.repeat(bottom.indptr[:n], np.diff(top.indptr))
+    data[top_dest] = top.data
+    indices[top_dest] = top.indices
+    del top_dest
+    bottom_dest = np.arange(bottom.nnz, dtype=index_dtype)
+    bottom_dest += np.repeat(top.indptr[1:], np.diff(bottom.indptr))
+    data[bottom_dest] = bottom.data
+    indices[bottom_dest] = bottom.indices
+    indices[bottom_dest] += top.shape[0]
+    return spa.csc_matrix(
+        (data, indices, indptr), shape=(top.shape[0] + bottom.shape[0], n)
+    )
+
+
+class PDLPSolver(LPSolver):
+    """Linear program solved by PDLP, keeping its model between solves.
+
+    The quadratic program and parameters of PDLP are built once, and vector
+    updates only replace the corresponding fields. Each solve starts from the
+    previous primal-dual solution.
+    """
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        G: Union[np.ndarray, spa.csc_matrix],
+        h: np.ndarray,
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+        verbose: bool = False,
+        eps_optimal_absolute: Optional[float] = None,
+        eps_optimal_relative: Optional[float] = None,
+        time_sec_limits: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(c, G, h, A, b, lb, ub)
+        start_time = time.perf_counter()
+        n = c.shape[0]
+
+        m = h.shape[0] if G is not None and h is not None else 0
+        p = b.shape[0] if A is not None and b is not None else 0
+        A_pdlp = stack_constraint_matrices(
+            G if m > 0 else None, A if p > 0 else None
+        )
+        if m > 0 and p > 0:  # bounds of stacked rows, written in place later
+            lc_pdlp = np.empty(m + p)
+            uc_pdlp = np.empty(m + p)
+            lc_pdlp[:m] = -np.inf
+            lc_pdlp[m:] = b
+            uc_pdlp[:m] = h
+            uc_pdlp[m:] = b
+        elif m > 0:
+            lc_pdlp = np.broadcast_to(-np.inf, (m,))
+            uc_pdlp = h
+        elif p > 0:
+            lc_pdlp = b
+            uc_pdlp = b
+        else:  # PDLP needs a constraint matrix even without rows
+            A_pdlp = spa.csc_matrix((0, n))
+            lc_pdlp = np.empty(0)
+            uc_pdlp = np.empty(0)
+        lv_pdlp = lb if lb is not None else np.broadcast_to(-np.inf, (n,))
+        uv_pdlp = ub if ub is not None else np.broadcast_to(+np.inf, (n,))
+        self._conversion_time += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        qp = pdlp.QuadraticProgram()
+        # qp.objective_matrix = np.diag(...)
+        qp.objective_vector = c
+        qp.constraint_matrix = A_pdlp
+        qp.constraint_lower_bounds = lc_pdlp
+        qp.constraint_upper_bounds = uc_pdlp
+        qp.variable_lower_bounds = lv_pdlp
+        qp.variable_upper_bounds = uv_pdlp
+
+        params = solvers_pb2.PrimalDualHybridGradientParams()
+        optimality = params.termination_criteria.simple_optimality_criteria
+        if eps_optimal_absolute is not None:
+            optimality.eps_optimal_absolute = eps_optimal_absolute
+        if eps_optimal_relative is not None:
+            optimality.eps_optimal_relative = eps_optimal_relative
+        if time_sec_limits is not None:
+            params.termination_criteria.time_sec_limit = time_sec_limits
+        if verbose and "verbosity_level" not in kwargs:
+            params.verbosity_level = 1 if verbose else 0
+        for param, value in kwargs.items():
+            setattr(params, param, value)
+
+        self.__qp = qp
+        self.__params = params
+        self.__lc_pdlp = lc_pdlp
+        self.__uc_pdlp = uc_pdlp
+        self._setup_time += time.perf_counter() - start_time
+        self.__primal_start: Optional[np.ndarray] = None
+        self.__dual_start: Optional[np.ndarray] = None
+
+    def update(
+        self,
+        c: Optional[np.ndarray] = None,
+        h: Optional[np.ndarray] = None,
+        b: Optional[np.ndarray] = None,
+    ) -> None:
+        """Update vectors of the linear program.
+
+        Parameters
+        ----------
+        c :
+            New linear cost vector, if any.
+        h :
+            New linear inequality constraint vector, if any.
+        b :
+            New linear equality constraint vector, if any.
+        """
+        super().update(c, h, b)
+        if c is not None:
+            self.__qp.objective_vector = c
+        if h is None and b is None:
+            return
+        m = self.h.shape[0] if self.h is not None else 0
+        if self.h is None or self.b is None:  # single block, no buffer
+            self.__qp.constraint_upper_bounds = h if h is not None else b
+            if b is not None:
+                self.__qp.constraint_lower_bounds = b
+            return
+        if h is not None:
+            self.__uc_pdlp[:m] = h
+        if b is not None:
+            self.__lc_pdlp[m:] = b
+            self.__uc_pdlp[m:] = b
+            self.__qp.constraint_lower_bounds = self.__lc_pdlp
+        self.__qp.constraint_upper_bounds = self.__uc_pdlp
+
+    def solve_problem(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> Solution:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, if any. Defaults to the previous solution.
+        dual_initvals :
+            Dual initial guess, if any, stacking multipliers of inequality
+            then equality constraints. Defaults to the previous solution.
+
+        Returns
+        -------
+        :
+            Solution to the linear program.
+        """
+        primal_start = self.__primal_start
+        dual_start = self.__dual_start
+        if initvals is not None:
+            primal_start = initvals
+        if dual_initvals is not None:
+            dual_start = -dual_initvals  # PDLP multipliers have opposite signs
+        initial_solution = None
+        if primal_start is not None or dual_start is not None:
+            n = self.c.shape[0]
+            n_rows = len(self.__qp.constraint_lower_bounds)
+            initial_solution = pdlp.PrimalAndDualSolution()
+            initial_solution.primal_solution = (
+                primal_start if primal_start is not None else np.zeros(n)
+            )
+            initial_solution.dual_solution = (
+                dual_start if dual_start is not None else np.zeros(n_rows)
+            )
+        solution = self._new_solution()
+        start_time = time.perf_counter()
+        result = pdlp.primal_dual_hybrid_gradient(
+            self.__qp, self.__params, initial_solution
+        )
+        solution.solve_time = time.perf_counter() - start_time
+        log = result.solve_log
+        solution.extras = {"solve_log": log}
+        solution.status = solve_log_pb2.TerminationReason.Name(
+            log.termination_reason
+        )
+        solution.iter = log.iteration_count
+        solution.found = (
+            log.termination_reason == solve_log_pb2.TERMINATION_REASON_OPTIMAL
+        )
+        if not solution.found:
+            if log.termination_reason in (
+                solve_log_pb2.TERMINATION_REASON_TIME_LIMIT,
+                solve_log_pb2.TERMINATION_REASON_ITERATION_LIMIT,
+            ):
+                solution.extras["iterate"] = result.primal_solution
+            return solution
+
+        self.__primal_start = result.primal_solution
+        self.__dual_start = result.dual_solution
+        self.x = result.primal_solution
+        m = self.h.shape[0] if self.h is not None else 0
+        multipliers = -result.dual_solution
+        solution.x = self.x
+        solution.obj = float(self.c.dot(self.x))
+        solution.z = multipliers[:m] if self.h is not None else None
+        solution.y = multipliers[m:] if self.b is not None else None
+        if self.lb is not None or self.ub is not None:
+            solution.z_box = -result.reduced_costs
+        return solution
+
+
+def pdlp_solve_problem(
+    problem: Problem,
+    verbose: bool = False,
+    eps_optimal_absolute: Optional[float] = None,
+    eps_optimal_relative: Optional[float] = None,
+    time_sec_limits: Optional[float] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    **kwargs,
+) -> Solution:
+    """Solve a linear program using PDLP.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    verbose :
+        Set to `True` to print out extra information.
+    eps_optimal_absolute :
+        Absolute tolerance on the primal-dual residuals and duality gap.
+    eps_optimal_relative :
+        Relative tolerance on the primal-dual residuals and duality gap.
+    time_sec_limits :
+        Maximum computation time the solver is allowed, in seconds.
+    initvals :
+        Primal initial guess.
+    dual_initvals :
+        Dual initial guess, stacking multipliers of inequality then equality
+        constraints.
+
+    Returns
+    -------
+    :
+        Solution to the linear program returned by the solver.
+
+    Notes
+    -----
+    Extra keyword arguments are set as fields of the
+    ``PrimalDualHybridGradientParams`` message of PDLP.
+    """
+    c, G, h, A, b, lb, ub = problem.unpack()
+    solution = PDLPSolver(
+        c,
+        G,
+        h,
+        A,
+        b,
+        lb,
+        ub,
+        verbose,
+        eps_optimal_absolute,
+        eps_optimal_relative,
+        time_sec_limits,
+        **kwargs,
+    ).solve_problem(initvals, dual_initvals)
+    solution.problem = problem
+    return solution
+
 
 def pdlp_solve_lp(
     c: np.ndarray,
-    G: np.ndarray,
+    G: Union[np.ndarray, spa.csc_matrix],
     h: np.ndarray,
-    A: Optional[np.ndarray] = None,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
     b: Optional[np.ndarray] = None,
     verbose: bool = False,
     eps_optimal_absolute: Optional[float] = None,
     eps_optimal_relative: Optional[float] = None,
     time_sec_limits: Optional[float] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
     **kwargs,
 ) -> np.ndarray:
     """Solve a quadratic program using PDLP.
@@ -59,6 +380,15 @@ def pdlp_solve_lp(
         *e.g.* [tolerances]_ for an overview of solver tolerances.
     time_sec_limits :
         Maximum computation time the solver is allowed, in seconds.
+    initvals :
+        Primal initial guess, if any.
+    dual_initvals :
+        Dual initial guess, if any, stacking multipliers of inequality then
+        equality constraints.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
 
     Returns
     -------
@@ -96,47 +426,17 @@ def pdlp_solve_lp(
     for more. See also the `Mathematical background for PDLP
     <https://developers.google.com/optimization/lp/pdlp_math>`__.
     """
-    n = c.shape[0]
-
-    A_pdlp = None
-    lc_pdlp = None
-    uc_pdlp = None
-    if G is not None and h is not None:
-        A_pdlp = G
-        lc_pdlp = np.full(h.shape, -np.inf)
-        uc_pdlp = h
-    if A is not None and b is not None:
-        A_pdlp = A if A_pdlp is None else spa.vstack([A_pdlp, A], format="csc")
-        lc_pdlp = b if lc_pdlp is None else np.hstack([lc_pdlp, b])
-        uc_pdlp = b if uc_pdlp is None else np.hstack([uc_pdlp, b])
-    lv_pdlp = np.full((n,), -np.inf)  # custom lb vector can go here
-    uv_pdlp = np.full((n,), +np.inf)  # custom ub vector can go here
-
-    qp = pdlp.QuadraticProgram()
-    # qp.objective_matrix = np.diag(...)
-    qp.objective_vector = c
-    if A_pdlp is not None:
-        qp.constraint_matrix = A_pdlp
-        qp.constraint_lower_bounds = lc_pdlp
-        qp.constraint_upper_bounds = uc_pdlp
-    qp.variable_lower_bounds = lv_pdlp
-    qp.variable_upper_bounds = uv_pdlp
-
-    params = solvers_pb2.PrimalDualHybridGradientParams()
-    optimality = params.termination_criteria.simple_optimality_criteria
-    if eps_optimal_absolute is not None:
-        optimality.eps_optimal_absolute = eps_optimal_absolute
-    if eps_optimal_relative is not None:
-        optimality.eps_optimal_relative = eps_optimal_relative
-    if time_sec_limits is not None:
-        params.termination_criteria.time_sec_limits = time_sec_limits
-    if verbose and "verbosity_level" not in kwargs:
-        params.verbosity_level = 1 if verbose else 0
-    for param, value in kwargs.items():
-        setattr(params, param, value)
-
-    result = pdlp.primal_dual_hybrid_gradient(qp, params)
-    log = result.solve_log
-    if log.termination_reason != solve_log_pb2.TERMINATION_REASON_OPTIMAL:
-        raise ValueError("Linear program is not feasible")
-    return result.primal_solution
+    return PDLPSolver(
+        c,
+        G,
+        h,
+        A,
+        b,
+        lb,
+        ub,
+        verbose,
+        eps_optimal_absolute,
+        eps_optimal_relative,
+        time_sec_limits,
+        **kwargs,
+    ).solve(initvals, dual_initvals)
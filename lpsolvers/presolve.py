@@ -0,0 +1,342 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Presolve linear programs before handing them to a solver.
+
+Linear programs generated by modeling code often contain duplicate rows,
+all-zero rows, singleton rows that are actually variable bounds, and fixed
+variables. The presolve stage removes them with vectorized passes over
+sparse matrices, and its postsolve step maps the solution of the reduced
+problem back to the original variables.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import scipy.sparse as spa
+
+from .problem import Problem
+
+
+@dataclass(frozen=False)
+class PresolveInfo:
+    """Information needed to map a presolved solution back.
+
+    Attributes
+    ----------
+    n :
+        Number of variables of the original linear program.
+    columns :
+        Indices of original variables kept in the reduced problem.
+    x_fixed :
+        Values of original variables removed by presolve. Entries of kept
+        variables are not used.
+    lb :
+        Lower bounds on original variables found by presolve.
+    ub :
+        Upper bounds on original variables found by presolve.
+    status :
+        ``"infeasible"`` if presolve found the linear program to be
+        infeasible, ``"unbounded"`` if it found a variable absent from all
+        constraints whose cost decreases toward an infinite bound, in which
+        case the linear program is unbounded if the reduced problem is
+        feasible, ``None`` otherwise.
+    """
+
+    n: int
+    columns: np.ndarray
+    x_fixed: np.ndarray
+    lb: np.ndarray
+    ub: np.ndarray
+    status: Optional[str] = None
+
+    def postsolve(self, x_reduced: np.ndarray) -> np.ndarray:
+        """Map a solution of the reduced problem to the original variables.
+
+        Parameters
+        ----------
+        x_reduced :
+            Primal solution of the reduced linear program.
+
+        Returns
+        -------
+        :
+            Primal solution of the original linear program.
+        """
+        x = self.x_fixed.copy()
+        x[self.columns] = x_reduced
+        return x
+
+
+def __row_counts(M: spa.csr_matrix) -> np.ndarray:
+    """Count nonzeros in each row of a CSR matrix.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix in CSR format, without explicit zeros.
+
+    Returns
+    -------
+    :
+        Number of nonzeros in each row.
+    """
+    return np.diff(M.indptr)
+
+
+def __singleton_entries(
+    M: spa.csr_matrix, rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get column indices and values of singleton rows.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix in CSR format, without explicit zeros.
+    rows :
+        Indices of rows with a single nonzero.
+
+    Returns
+    -------
+    :
+        Pair ``(cols, vals)`` of column indices and values of the nonzeros.
+    """
+    positions = M.indptr[rows]
+    return M.indices[positions], M.data[positions]
+
+
+def __normalize_rows(
+    M: spa.csr_matrix, v: np.ndarray, signed: bool
+) -> Tuple[spa.csr_matrix, np.ndarray]:
+    """Scale rows of a constraint so that their largest entry is one.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix in CSR format, without empty rows.
+    v :
+        Right-hand side vector of the constraint.
+    signed :
+        If set, scale by the signed entry of largest magnitude, which is
+        allowed for equalities but not for inequalities.
+
+    Returns
+    -------
+    :
+        Pair ``(M, v)`` of scaled matrix and vector.
+    """
+    scale = spa.csr_matrix(abs(M)).max(axis=1).toarray().ravel()
+    if signed:
+        first = M.data[M.indptr[:-1]]
+        scale *= np.sign(first)
+    return spa.csr_matrix(spa.diags(1.0 / scale) @ M), v / scale
+
+
+def __duplicate_groups(M: spa.csr_matrix, tol: float) -> np.ndarray:
+    """Find the representative of each row among identical rows.
+
+    Rows are hashed by two random projections, then candidates are checked
+    entry by entry, so that hash collisions never merge distinct rows.
+
+    Parameters
+    ----------
+    M :
+        Sparse matrix in CSR format with normalized rows.
+    tol :
+        Tolerance on entries for rows to be considered identical.
+
+    Returns
+    -------
+    :
+        Index of the representative row of each row, which is the row itself
+        if it has no duplicate.
+    """
+    rng = np.random.default_rng(0)
+    keys = M @ rng.uniform(1.0, 2.0, (M.shape[1], 2))
+    keys = np.round(keys, 10)
+    _, first, inverse = np.unique(
+        keys, axis=0, return_index=True, return_inverse=True
+    )
+    representative = first[inverse.ravel()]
+    candidates = np.flatnonzero(representative != np.arange(M.shape[0]))
+    if candidates.size > 0:
+        diff = M[candidates] - M[representative[candidates]]
+        max_diff = spa.csr_matrix(abs(diff)).max(axis=1).toarray().ravel()
+        representative[candidates[max_diff > tol]] = candidates[max_diff > tol]
+    return representative
+
+
+def presolve_problem(
+    problem: Problem, tol: float = 1e-9, max_passes: int = 10
+) -> Tuple[Problem, PresolveInfo]:
+    """Reduce a linear program before solving it.
+
+    The following passes are repeated until the problem does not change:
+
+    - remove all-zero rows, checking that they are feasible;
+    - turn singleton inequality rows into variable bounds;
+    - fix variables of singleton equality rows;
+    - substitute fixed variables, *i.e.* with equal lower and upper bounds;
+    - fix variables absent from all constraints to their best bound, or
+      report the problem as unbounded if that bound is infinite;
+    - merge duplicate rows, up to a positive scaling for inequalities and
+      any scaling for equalities, keeping the tightest inequality.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to presolve.
+    tol :
+        Tolerance on values, used to decide whether entries are equal.
+    max_passes :
+        Maximum number of repetitions of the presolve passes.
+
+    Returns
+    -------
+    :
+        Pair ``(reduced, info)`` of the reduced linear program and
+        information to map its solution back to the original variables.
+        Variable bounds found by presolve are merged into the box constraints
+        of the reduced problem. Its constraint matrices are sparse if those
+        of the original problem are.
+    """
+    c, G, h, A, b, lb_in, ub_in = problem.unpack()
+    n = c.shape[0]
+    use_sparse = problem.has_sparse
+    G = spa.csr_matrix(G if G is not None else (0, n), dtype=float, copy=True)
+    A = spa.csr_matrix(A if A is not None else (0, n), dtype=float, copy=True)
+    h = np.array(h if h is not None else np.empty(0), dtype=float)
+    b = np.array(b if b is not None else np.empty(0), dtype=float)
+    G.eliminate_zeros()
+    A.eliminate_zeros()
+    columns = np.arange(n)
+    x_fixed = np.zeros(n)
+    lb = np.array(lb_in if lb_in is not None else np.full(n, -np.inf))
+    ub = np.array(ub_in if ub_in is not None else np.full(n, +np.inf))
+    info = PresolveInfo(n, columns, x_fixed, lb, ub)
+    unbounded = False
+
+    def infeasible() -> Tuple[Problem, PresolveInfo]:
+        info.status = "infeasible"
+        return problem, info
+
+    for _ in range(max_passes):
+        nb_rows_before = (G.shape[0], A.shape[0], columns.size)
+
+        # Zero rows
+        G_counts = __row_counts(G)
+        A_counts = __row_counts(A)
+        if np.any(h[G_counts == 0] < -tol):
+            return infeasible()
+        if np.any(np.abs(b[A_counts == 0]) > tol):
+            return infeasible()
+
+        # Singleton inequality rows become bounds
+        singles = np.flatnonzero(G_counts == 1)
+        cols, vals = __singleton_entries(G, singles)
+        bounds = h[singles] / vals
+        upper = vals > 0.0
+        np.minimum.at(ub, columns[cols[upper]], bounds[upper])
+        np.maximum.at(lb, columns[cols[~upper]], bounds[~upper])
+
+        # Singleton equality rows fix their variable
+        singles_eq = np.flatnonzero(A_counts == 1)
+        cols, vals = __singleton_entries(A, singles_eq)
+        values = b[singles_eq] / vals
+        np.maximum.at(lb, columns[cols], values)
+        np.minimum.at(ub, columns[cols], values)
+        fixed_at = np.full(n, np.nan)
+        fixed_at[columns[cols]] = values
+
+        keep_G = G_counts > 1
+        keep_A = A_counts > 1
+        G, h = G[keep_G], h[keep_G]
+        A, b = A[keep_A], b[keep_A]
+        if np.any(lb[columns] > ub[columns] + tol):
+            return infeasible()
+
+        # Variables absent from all constraints go to their best bound
+        col_counts = np.bincount(G.indices, minlength=columns.size)
+        col_counts += np.bincount(A.indices, minlength=columns.size)
+        empty = np.flatnonzero(col_counts == 0)
+        c_empty = c[columns[empty]]
+        lb_empty, ub_empty = lb[columns[empty]], ub[columns[empty]]
+        best = np.where(
+            c_empty > tol,
+            lb_empty,
+            np.where(
+                c_empty < -tol, ub_empty, np.clip(0.0, lb_empty, ub_empty)
+            ),
+        )
+        fixable = np.isnan(fixed_at[columns[empty]])
+        if np.any(np.isinf(best[fixable])):
+            # the cost decreases without bound along these variables, which
+            # are fixed to a feasible value to keep reducing the problem
+            unbounded = True
+            best = np.where(
+                np.isinf(best), np.clip(0.0, lb_empty, ub_empty), best
+            )
+        fixed_at[columns[empty[fixable]]] = best[fixable]
+
+        # Substitute fixed variables
+        span = ub[columns] - lb[columns]
+        fixed = ~np.isnan(fixed_at[columns]) | (span <= 2.0 * tol)
+        if np.any(fixed):
+            fixed_cols = columns[fixed]
+            values = np.where(
+                np.isnan(fixed_at[fixed_cols]),
+                lb[fixed_cols],
+                fixed_at[fixed_cols],
+            )
+            x_fixed[fixed_cols] = values
+            h = h - G[:, fixed] @ values
+            b = b - A[:, fixed] @ values
+            G, A = G[:, ~fixed], A[:, ~fixed]
+            columns = columns[~fixed]
+            G.eliminate_zeros()
+            A.eliminate_zeros()
+
+        # Duplicate rows, keeping the tightest inequality
+        if G.shape[0] > 1 and G.nnz > 0 and np.all(__row_counts(G) > 0):
+            G, h = __normalize_rows(G, h, signed=False)
+            representative = __duplicate_groups(G, tol)
+            h_min = np.full(G.shape[0], np.inf)
+            np.minimum.at(h_min, representative, h)
+            keep = representative == np.arange(G.shape[0])
+            G, h = G[keep], h_min[keep]
+        if A.shape[0] > 1 and A.nnz > 0 and np.all(__row_counts(A) > 0):
+            A, b = __normalize_rows(A, b, signed=True)
+            representative = __duplicate_groups(A, tol)
+            if np.any(np.abs(b - b[representative]) > tol):
+                return infeasible()
+            keep = representative == np.arange(A.shape[0])
+            A, b = A[keep], b[keep]
+
+        if (G.shape[0], A.shape[0], columns.size) == nb_rows_before:
+            break
+
+    info.columns = columns
+    if unbounded:
+        info.status = "unbounded"
+    G_red = spa.csc_matrix(G) if G.shape[0] > 0 else None
+    h_red = h if G.shape[0] > 0 else None
+    A_red = spa.csc_matrix(A) if A.shape[0] > 0 else None
+    b_red = b if A.shape[0] > 0 else None
+    if not use_sparse:
+        G_red = G_red.toarray() if G_red is not None else None
+        A_red = A_red.toarray() if A_red is not None else None
+    lb_red, ub_red = lb[columns], ub[columns]
+    reduced = Problem(
+        c[columns],
+        G_red,
+        h_red,
+        A_red,
+        b_red,
+        lb_red if np.any(np.isfinite(lb_red)) else None,
+        ub_red if np.any(np.isfinite(ub_red)) else None,
+    )
+    return reduced, info
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Model for a linear program."""
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .exceptions import ProblemError
+
+
+class Problem:
+    r"""Data structure describing a linear program.
+
+    The linear program is defined as:
+
+    .. math::
+
+        \begin{split}\begin{array}{ll}
+            \mbox{minimize} &
+                c^T x \\
+            \mbox{subject to}
+                & G x \leq h \\
+                & A x = b \\
+                & lb \leq x \leq ub
+        \end{array}\end{split}
+
+    Attributes
+    ----------
+    c :
+        Linear cost vector.
+    G :
+        Linear inequality constraint matrix.
+    h :
+        Linear inequality constraint vector.
+    A :
+        Linear equality constraint matrix.
+    b :
+        Linear equality constraint vector.
+    lb :
+        Lower bound constraint vector, with ``-np.inf`` entries for
+        unbounded variables.
+    ub :
+        Upper bound constraint vector, with ``+np.inf`` entries for
+        unbounded variables.
+    """
+
+    c: np.ndarray
+    G: Optional[Union[np.ndarray, spa.csc_matrix]] = None
+    h: Optional[np.ndarray] = None
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None
+    b: Optional[np.ndarray] = None
+    lb: Optional[np.ndarray] = None
+    ub: Optional[np.ndarray] = None
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        G: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        h: Optional[np.ndarray] = None,
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+    ) -> None:
+        if isinstance(G, np.ndarray) and G.ndim == 1:
+            G = G.reshape((1, G.shape[0]))
+        if isinstance(A, np.ndarray) and A.ndim == 1:
+            A = A.reshape((1, A.shape[0]))
+        self.c = c
+        self.G = G
+        self.h = h
+        self.A = A
+        self.b = b
+        self.lb = lb
+        self.ub = ub
+
+    @property
+    def has_sparse(self) -> bool:
+        """Check whether the problem has sparse matrices.
+
+        Returns
+        -------
+        :
+            True if at least one of the :math:`G` or :math:`A` matrices is
+            sparse.
+        """
+        return spa.issparse(self.G) or spa.issparse(self.A)
+
+    def unpack(
+        self,
+    ) -> Tuple[
+        np.ndarray,
+        Optional[Union[np.ndarray, spa.csc_matrix]],
+        Optional[np.ndarray],
+        Optional[Union[np.ndarray, spa.csc_matrix]],
+        Optional[np.ndarray],
+        Optional[np.ndarray],
+        Optional[np.ndarray],
+    ]:
+        """Get problem matrices as a tuple.
+
+        Returns
+        -------
+        :
+            Tuple ``(c, G, h, A, b, lb, ub)`` of problem matrices.
+        """
+        return self.c, self.G, self.h, self.A, self.b, self.lb, self.ub
+
+    def check_constraints(self):
+        """Check that problem constraints are properly specified.
+
+        Raises
+        ------
+        ProblemError
+            If the constraints are not properly defined.
+        """
+        if self.G is None and self.h is not None:
+            raise ProblemError("incomplete inequality constraint (missing G)")
+        if self.G is not None and self.h is None:
+            raise ProblemError("incomplete inequality constraint (missing h)")
+        if self.A is None and self.b is not None:
+            raise ProblemError("incomplete equality constraint (missing A)")
+        if self.A is not None and self.b is None:
+            raise ProblemError("incomplete equality constraint (missing b)")
+        n = self.c.shape[0]
+        for name in ("lb", "ub"):
+            bound = getattr(self, name)
+            if bound is not None and bound.shape != (n,):
+                raise ProblemError(
+                    f"{name} should have shape ({n},) "
+                    f"but has shape {bound.shape}"
+                )
@@ -14,50 +14,279 @@ rooted in revisited primal-dual proximal algorithms. If you use ProxQP in some
 academic work, consider citing the corresponding paper [Bambade2022]_.
 """
 
-from typing import Optional
+import time
+import warnings
+from typing import Optional, Union
 
 import numpy as np
+import scipy.sparse as spa
 from proxsuite import proxqp
 
+from .conversions import linear_from_box_inequalities, split_dual_linear_box
+from .lp_solver import LPSolver
+from .problem import Problem
+from .solution import Solution
 
-def __select_backend(backend: Optional[str], use_csc: bool):
-    """Select backend function for ProxQP.
+_INFEASIBLE_STATUSES = (
+    proxqp.PROXQP_PRIMAL_INFEASIBLE,
+    proxqp.PROXQP_DUAL_INFEASIBLE,
+)
+
+
+def _check_backend(backend: Optional[str]) -> None:
+    """Check that a ProxQP backend can solve linear programs.
+
+    The sparse backend reports false primal infeasibility on linear programs,
+    as they have a zero Hessian. It is deprecated: asking for it emits a
+    warning and linear programs are solved by the dense backend instead.
+
+    Parameters
+    ----------
+    backend :
+        ProxQP backend to use in ``[None, "dense", "sparse"]``.
+
+    Raises
+    ------
+    ValueError
+        If the backend is not a valid ProxQP backend.
+    """
+    if backend is None or backend == "dense":
+        return
+    if backend == "sparse":
+        warnings.warn(
+            "The sparse backend of ProxQP reports false primal "
+            "infeasibility on linear programs and is deprecated, falling "
+            "back to the dense backend (sparse matrices are densified)",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        return
+    raise ValueError(f'Unknown ProxQP backend "{backend}"')
+
+
+class ProxQPSolver(LPSolver):
+    """Linear program solved by ProxQP, keeping its model between solves.
+
+    The ProxQP model is initialized once, and vector updates go through its
+    ``update`` function. Each solve after the first one is warm-started from
+    the previous primal-dual solution.
+
+    Notes
+    -----
+    Linear programs are solved by the dense backend of ProxQP, so that
+    sparse constraint matrices are densified. Finite variable bounds are
+    appended to linear inequality constraints rather than passed as box
+    constraints, with which ProxQP fails on many feasible linear programs.
+    Solves that report an infeasible problem are retried from no initial
+    guess and with a tighter infeasibility threshold, as warm starts and the
+    equality-constrained initial guess of ProxQP can trigger false
+    infeasibility detections on linear programs.
+    """
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        G: Union[np.ndarray, spa.csc_matrix],
+        h: np.ndarray,
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+        verbose: bool = False,
+        backend: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(c, G, h, A, b, lb, ub)
+        _check_backend(backend)
+        n = c.shape[0]
+        start_time = time.perf_counter()
+        G = G.toarray() if spa.issparse(G) else G
+        A = A.toarray() if spa.issparse(A) else A
+        G_box, h_box = linear_from_box_inequalities(
+            G, h, lb, ub, n, use_sparse=False
+        )
+        nb_inequalities = h.shape[0] if h is not None else 0
+        self.__h_bounds = (
+            h_box[nb_inequalities:] if h_box is not None else np.empty(0)
+        )
+        self._conversion_time += time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        problem = proxqp.dense.QP(
+            n=n,
+            n_eq=b.shape[0] if b is not None else 0,
+            n_in=h_box.shape[0] if h_box is not None else 0,
+            hessian_type=proxqp.dense.HessianType.Zero,
+        )
+        # without a Hessian, residuals alone may stop the solver early at
+        # non-optimal points, and the default infeasibility threshold
+        # reports feasible linear programs as infeasible
+        problem.settings.check_duality_gap = True
+        problem.settings.eps_primal_inf = 1e-6
+        for key, value in kwargs.items():
+            setattr(problem.settings, key, value)
+        problem.settings.verbose = verbose
+        problem.init(None, c, A, b, G_box, None, h_box)
+        self._setup_time += time.perf_counter() - start_time
+        self.__cold_start = problem.settings.initial_guess
+        self.__problem = problem
+
+    def update(
+        self,
+        c: Optional[np.ndarray] = None,
+        h: Optional[np.ndarray] = None,
+        b: Optional[np.ndarray] = None,
+    ) -> None:
+        """Update vectors of the linear program.
+
+        Parameters
+        ----------
+        c :
+            New linear cost vector, if any.
+        h :
+            New linear inequality constraint vector, if any.
+        b :
+            New linear equality constraint vector, if any.
+        """
+        super().update(c, h, b)
+        start_time = time.perf_counter()
+        if h is not None:
+            h = np.hstack([h, self.__h_bounds])
+        self.__problem.update(g=c, b=b, u=h)
+        self._setup_time += time.perf_counter() - start_time
+
+    def solve_problem(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> Solution:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, if any. Defaults to the previous solution.
+        dual_initvals :
+            Dual initial guess, if any, stacking multipliers of inequality
+            then equality constraints. Defaults to the previous solution.
+
+        Returns
+        -------
+        :
+            Solution to the linear program.
+        """
+        problem = self.__problem
+        warm_start = (
+            problem.settings.initial_guess
+            == proxqp.WARM_START_WITH_PREVIOUS_RESULT
+        )
+        solution = self._new_solution()
+        start_time = time.perf_counter()
+        if initvals is not None or dual_initvals is not None:
+            m = self.h.shape[0] if self.h is not None else 0
+            y = dual_initvals[m:] if dual_initvals is not None else None
+            z = dual_initvals[:m] if dual_initvals is not None else None
+            if z is not None:
+                z = np.hstack([z, np.zeros(self.__h_bounds.size)])
+            problem.settings.initial_guess = proxqp.WARM_START
+            problem.solve(initvals, y, z)
+            warm_start = True
+        else:
+            problem.solve()
+        iterations = problem.results.info.iter
+        status = problem.results.info.status
+        if status != proxqp.PROXQP_SOLVED and (
+            warm_start or status in _INFEASIBLE_STATUSES
+        ):
+            # Warm starts, as well as the equality-constrained initial guess
+            # which is ill-posed without a Hessian, may trigger spurious
+            # infeasibility detections on linear programs, in which case we
+            # retry from no initial guess with a tighter infeasibility
+            # threshold
+            eps_primal_inf = problem.settings.eps_primal_inf
+            problem.settings.eps_primal_inf = min(eps_primal_inf, 1e-8)
+            problem.settings.initial_guess = proxqp.NO_INITIAL_GUESS
+            problem.solve()
+            iterations += problem.results.info.iter
+            problem.settings.eps_primal_inf = eps_primal_inf
+            problem.settings.initial_guess = self.__cold_start
+        solution.solve_time = time.perf_counter() - start_time
+        results = problem.results
+        solution.extras = {"info": results.info}
+        solution.status = str(results.info.status)
+        solution.iter = iterations
+        solution.found = results.info.status == proxqp.PROXQP_SOLVED
+        if not solution.found:
+            return solution
+
+        problem.settings.initial_guess = proxqp.WARM_START_WITH_PREVIOUS_RESULT
+        # results are overwritten in place by the next solve
+        self.x = results.x.copy()
+        solution.x = self.x
+        solution.obj = float(self.c.dot(self.x))
+        z, solution.z_box = split_dual_linear_box(
+            results.z.copy(), self.lb, self.ub, self.c.shape[0]
+        )
+        solution.z = z if self.h is not None else None
+        solution.y = results.y.copy() if self.b is not None else None
+        return solution
+
+
+def proxqp_solve_problem(
+    problem: Problem,
+    verbose: bool = False,
+    backend: Optional[str] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    **kwargs,
+) -> Solution:
+    """Solve a linear program using ProxQP.
 
     Parameters
     ----------
+    problem :
+        Linear program to solve.
+    verbose :
+        Set to `True` to print out extra information.
     backend :
-        ProxQP backend to use in ``[None, "dense", "sparse"]``. If ``None``
-        (default), the backend is selected based on the type of ``P``.
-    use_csc :
-        If ``True``, use sparse matrices if the backend is not specified.
+        ProxQP backend to use in ``[None, "dense", "sparse"]``. Linear
+        programs are always solved by the dense backend, as the sparse
+        backend reports false primal infeasibility on them. Asking for the
+        sparse backend is deprecated and emits a ``DeprecationWarning``.
+    initvals :
+        Primal initial guess.
+    dual_initvals :
+        Dual initial guess, stacking multipliers of inequality then equality
+        constraints.
 
     Returns
     -------
     :
-        Backend solve function.
+        Solution to the linear program returned by the solver.
 
-    Raises
-    ------
-    ParamError
-        If the required backend is not a valid ProxQP backend.
+    Notes
+    -----
+    All other keyword arguments are forwarded as solver settings to ProxQP.
     """
-    if backend is None:
-        return proxqp.sparse if use_csc else proxqp.dense
-    if backend == "dense":
-        return proxqp.dense
-    if backend == "sparse":
-        return proxqp.sparse
-    raise ValueError(f'Unknown ProxQP backend "{backend}')
+    c, G, h, A, b, lb, ub = problem.unpack()
+    solution = ProxQPSolver(
+        c, G, h, A, b, lb, ub, verbose, backend, **kwargs
+    ).solve_problem(initvals, dual_initvals)
+    solution.problem = problem
+    return solution
 
 
 def proxqp_solve_lp(
     c: np.ndarray,
-    G: np.ndarray,
+    G: Union[np.ndarray, spa.csc_matrix],
     h: np.ndarray,
-    A: Optional[np.ndarray] = None,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
     b: Optional[np.ndarray] = None,
     verbose: bool = False,
     backend: Optional[str] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
     **kwargs,
 ) -> np.ndarray:
     """Solve a quadratic program using ProxQP.
@@ -75,10 +304,21 @@ def proxqp_solve_lp(
     b :
         Linear equality constraint vector.
     backend :
-        ProxQP backend to use in ``[None, "dense", "sparse"]``. If ``None``
-        (default), the backend is selected based on the type of ``P``.
+        ProxQP backend to use in ``[None, "dense", "sparse"]``. Linear
+        programs are always solved by the dense backend, as the sparse
+        backend reports false primal infeasibility on them. Asking for the
+        sparse backend is deprecated and emits a ``DeprecationWarning``.
     verbose :
         Set to `True` to print out extra information.
+    initvals :
+        Primal initial guess, if any.
+    dual_initvals :
+        Dual initial guess, if any, stacking multipliers of inequality then
+        equality constraints.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
 
     Returns
     -------
@@ -92,21 +332,6 @@ def proxqp_solve_lp(
     out the `solver documentation
     <https://simple-robotics.github.io/proxsuite/>`__ for details.
     """
-    use_csc: bool = (G is not None and not isinstance(G, np.ndarray)) or (
-        A is not None and not isinstance(A, np.ndarray)
-    )
-    proxqp_backend = __select_backend(backend, use_csc)
-    problem = proxqp_backend.QP(
-        n=c.shape[0],
-        n_eq=b.shape[0] if b is not None else 0,
-        n_in=h.shape[0] if h is not None else 0,
-        hessian_type=proxqp_backend.HessianType.Zero,
-    )
-    for key, value in kwargs.items():
-        setattr(problem.settings, key, value)
-    problem.settings.verbose = verbose
-    problem.init(None, c, None, None, G, None, h)
-    problem.solve()
-    if problem.results.info.status != proxqp.PROXQP_SOLVED:
-        raise ValueError("Linear program is not feasible")
-    return problem.results.x
+    return ProxQPSolver(
+        c, G, h, A, b, lb, ub, verbose, backend, **kwargs
+    ).solve(initvals, dual_initvals)
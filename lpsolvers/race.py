@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Race several solvers on the same linear program."""
+
+import multiprocessing
+import multiprocessing.connection
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .exceptions import SolverTimeout
+from .problem import Problem
+from .solution import Solution
+from .solve_problem import solve_problem
+from .solvers import get_solve_problem_function
+
+__result_fields = (
+    "found",
+    "obj",
+    "x",
+    "y",
+    "z",
+    "z_box",
+    "iter",
+    "conversion_time",
+    "setup_time",
+    "solve_time",
+)
+
+
+def _solve_to_dict(
+    problem: Problem,
+    solver: Union[str, Sequence[str]],
+    initvals: Optional[np.ndarray],
+    dual_initvals: Optional[np.ndarray],
+    kwargs: dict,
+) -> Dict[str, Any]:
+    """Solve a linear program and return its result in a picklable form.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    solver :
+        Name of the LP solver, or list of solvers of a race.
+    initvals :
+        Primal initial guess, if any.
+    dual_initvals :
+        Dual initial guess, if any.
+    kwargs :
+        Keyword arguments forwarded to :func:`lpsolvers.solve_problem`.
+
+    Returns
+    -------
+    :
+        Fields of the solution, without its problem and extras except for
+        those of races, or a failed result whose status describes the
+        exception raised by the solver.
+    """
+    try:
+        solution = solve_problem(
+            problem, solver, initvals, dual_initvals, **kwargs
+        )
+        # statuses and extras may hold objects that do not pickle
+        result = {key: getattr(solution, key) for key in __result_fields}
+        result["status"] = str(solution.status)
+        if kwargs.get("race"):  # extras are solver names and statuses
+            result["extras"] = solution.extras
+    except Exception as exn:  # report failures of solvers to the parent
+        result = {"found": False, "status": f"{type(exn).__name__}: {exn}"}
+    return result
+
+
+def _solution_from_dict(
+    problem: Problem, result: Dict[str, Any], extras: dict
+) -> Solution:
+    """Build a solution from a result returned by :func:`_solve_to_dict`.
+
+    Parameters
+    ----------
+    problem :
+        Linear program that was solved.
+    result :
+        Fields of the solution.
+    extras :
+        Extras of the solution.
+
+    Returns
+    -------
+    :
+        Solution to the linear program.
+    """
+    solution = Solution(problem, extras=extras, status=result["status"])
+    for key in __result_fields:
+        setattr(solution, key, result.get(key))
+    return solution
+
+
+def _race_worker(
+    connection: multiprocessing.connection.Connection,
+    problem: Problem,
+    solver: str,
+    initvals: Optional[np.ndarray],
+    dual_initvals: Optional[np.ndarray],
+    kwargs: dict,
+) -> None:
+    """Solve a linear program in a worker process and send back its result.
+
+    Parameters
+    ----------
+    connection :
+        End of the pipe to send the result to.
+    problem :
+        Linear program to solve.
+    solver :
+        Name of the LP solver.
+    initvals :
+        Primal initial guess, if any.
+    dual_initvals :
+        Dual initial guess, if any.
+    kwargs :
+        Keyword arguments forwarded to :func:`lpsolvers.solve_problem`.
+    """
+    result = _solve_to_dict(problem, solver, initvals, dual_initvals, kwargs)
+    connection.send(result)
+    connection.close()
+
+
+def _get_context():
+    """Get the multiprocessing context of worker processes.
+
+    Returns
+    -------
+    :
+        Fork server context where available, spawn context elsewhere.
+
+    Notes
+    -----
+    Worker processes are not forked from the calling process, whose other
+    threads, such as those of asyncio executors or of solver backends, may
+    hold locks that would stay locked in forked children. The fork server
+    imports lpsolvers when it starts, so that its workers do not import it
+    again. As with any of these contexts, scripts that start workers should
+    do so from an ``if __name__ == "__main__"`` block.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(["lpsolvers"])
+    return context
+
+
+def race_problem(
+    problem: Problem,
+    solvers: Sequence[str],
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    solver_kwargs: Optional[Dict[str, dict]] = None,
+    time_limit: Optional[float] = None,
+    **kwargs,
+) -> Solution:
+    """Solve a linear program with several solvers in parallel processes.
+
+    Each solver runs in its own worker process. The first solution found is
+    returned, and the other workers are terminated.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    solvers :
+        Names of the LP solvers to race.
+    initvals :
+        Primal initial guess, if any, given to all solvers.
+    dual_initvals :
+        Dual initial guess, if any, given to all solvers.
+    solver_kwargs :
+        Keyword arguments of each solver, indexed by solver name, that are
+        added to the common ones.
+    time_limit :
+        Wall-clock time limit in seconds, if any, after which all workers
+        are terminated.
+
+    Returns
+    -------
+    :
+        First solution found. Its ``"solver"`` extra is the name of the
+        winning solver, and its ``"statuses"`` extra gives the statuses of
+        the solvers that failed before it. If no solver finds a solution,
+        the solution is not found and its status lists all statuses, or is
+        the status of the only solver.
+
+    Raises
+    ------
+    ValueError
+        If no solver is given.
+    SolverTimeout
+        If no solver finds a solution within the time limit.
+    SolverNotFound
+        If one of the solvers is not found.
+    ImportError
+        If the backend of one of the solvers is not installed.
+
+    Notes
+    -----
+    Extra keyword arguments are forwarded to :func:`lpsolvers.solve_problem`
+    for all solvers, and should therefore be understood by all of them.
+    """
+    if not solvers:
+        raise ValueError("race needs at least one solver")
+    solver_kwargs = solver_kwargs or {}
+    for solver in solvers:
+        # fail early if an interface is missing
+        get_solve_problem_function(solver)
+    context = _get_context()
+    workers: Dict[Any, Any] = {}
+    for solver in solvers:
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_race_worker,
+            args=(
+                sender,
+                problem,
+                solver,
+                initvals,
+                dual_initvals,
+                {**kwargs, **solver_kwargs.get(solver, {})},
+            ),
+            daemon=True,
+        )
+        process.start()
+        sender.close()
+        workers[receiver] = (solver, process)
+    statuses: Dict[str, str] = {}
+    deadline = (
+        time.perf_counter() + time_limit if time_limit is not None else None
+    )
+    try:
+        pending: List[Any] = list(workers)
+        while pending:
+            timeout = (
+                max(deadline - time.perf_counter(), 0.0)
+                if deadline is not None
+                else None
+            )
+            ready = multiprocessing.connection.wait(pending, timeout)
+            if not ready and timeout is not None:
+                for receiver in pending:
+                    statuses[workers[receiver][0]] = "time limit reached"
+                raise SolverTimeout(
+                    f"{', '.join(solvers)} found no solution within "
+                    f"{time_limit} s",
+                    Solution(
+                        problem,
+                        extras={"solver": None, "statuses": statuses},
+                        found=False,
+                        status="time limit reached",
+                    ),
+                )
+            for receiver in ready:
+                pending.remove(receiver)
+                solver, _ = workers[receiver]
+                try:
+                    result = receiver.recv()
+                except EOFError:  # the worker died without a result
+                    statuses[solver] = "worker process exited"
+                    continue
+                if not result["found"]:
+                    statuses[solver] = result["status"]
+                    continue
+                return _solution_from_dict(
+                    problem,
+                    result,
+                    extras={"solver": solver, "statuses": statuses},
+                )
+    finally:
+        for receiver, (_, process) in workers.items():
+            if process.is_alive():
+                process.terminate()
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.kill()
+                process.join()
+            receiver.close()
+    return Solution(
+        problem,
+        extras={"solver": None, "statuses": statuses},
+        found=False,
+        status=statuses[solvers[0]]
+        if len(solvers) == 1
+        else "; ".join(f"{s}: {status}" for s, status in statuses.items()),
+    )
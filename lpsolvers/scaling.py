@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Equilibrate badly scaled linear programs before handing them to a solver.
+
+Constraint coefficients ranging over many orders of magnitude slow down
+first-order solvers, or make them fail. The scaling stage rescales rows and
+columns of the constraint matrices so that their entries are close to one,
+then rescales the cost vector. Solutions of the scaled problem are mapped
+back exactly to the original one.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .problem import Problem
+
+
+@dataclass(frozen=False)
+class ScalingInfo:
+    r"""Scaling factors of an equilibrated linear program.
+
+    The scaled linear program is defined by:
+
+    .. math::
+
+        \begin{split}\begin{array}{ll}
+            \mbox{minimize} &
+                \sigma c^T D \tilde{x} \\
+            \mbox{subject to}
+                & E_G G D \tilde{x} \leq E_G h \\
+                & E_A A D \tilde{x} = E_A b \\
+                & D^{-1} lb \leq \tilde{x} \leq D^{-1} ub
+        \end{array}\end{split}
+
+    where :math:`D`, :math:`E_G` and :math:`E_A` are positive diagonal
+    matrices, so that :math:`x = D \tilde{x}`.
+
+    Attributes
+    ----------
+    D :
+        Diagonal of the column scaling matrix.
+    E_G :
+        Diagonal of the row scaling matrix of inequality constraints.
+    E_A :
+        Diagonal of the row scaling matrix of equality constraints.
+    sigma :
+        Cost scaling factor.
+    """
+
+    D: np.ndarray
+    E_G: np.ndarray
+    E_A: np.ndarray
+    sigma: float
+
+    def unscale_primal(self, x_scaled: np.ndarray) -> np.ndarray:
+        """Map a primal solution of the scaled problem to the original one.
+
+        Parameters
+        ----------
+        x_scaled :
+            Primal solution of the scaled linear program.
+
+        Returns
+        -------
+        :
+            Primal solution of the original linear program.
+        """
+        return self.D * x_scaled
+
+    def unscale_dual(
+        self,
+        z_scaled: Optional[np.ndarray],
+        y_scaled: Optional[np.ndarray],
+        z_box_scaled: Optional[np.ndarray],
+    ) -> Tuple[
+        Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]
+    ]:
+        """Map dual multipliers of the scaled problem to the original one.
+
+        Parameters
+        ----------
+        z_scaled :
+            Multipliers of inequality constraints, if any.
+        y_scaled :
+            Multipliers of equality constraints, if any.
+        z_box_scaled :
+            Multipliers of box constraints, if any.
+
+        Returns
+        -------
+        :
+            Tuple ``(z, y, z_box)`` of multipliers of the original problem.
+        """
+        z = self.E_G * z_scaled / self.sigma if z_scaled is not None else None
+        y = self.E_A * y_scaled / self.sigma if y_scaled is not None else None
+        z_box = (
+            z_box_scaled / (self.sigma * self.D)
+            if z_box_scaled is not None
+            else None
+        )
+        return z, y, z_box
+
+    def scale_primal(self, x: np.ndarray) -> np.ndarray:
+        """Map a primal vector of the original problem to the scaled one.
+
+        Parameters
+        ----------
+        x :
+            Primal vector of the original linear program.
+
+        Returns
+        -------
+        :
+            Primal vector of the scaled linear program.
+        """
+        return x / self.D
+
+    def scale_dual(self, dual: np.ndarray) -> np.ndarray:
+        """Map dual multipliers of the original problem to the scaled one.
+
+        Parameters
+        ----------
+        dual :
+            Multipliers of inequality then equality constraints.
+
+        Returns
+        -------
+        :
+            Multipliers of the scaled linear program, in the same order.
+        """
+        return self.sigma * dual / np.hstack([self.E_G, self.E_A])
+
+
+def __abs_entries(
+    G: Optional[Union[np.ndarray, spa.spmatrix]],
+    A: Optional[Union[np.ndarray, spa.spmatrix]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """List absolute values of nonzero entries of stacked constraints.
+
+    Parameters
+    ----------
+    G :
+        Linear inequality constraint matrix, if any.
+    A :
+        Linear equality constraint matrix, if any.
+
+    Returns
+    -------
+    :
+        Tuple ``(rows, cols, values, nb_rows)`` of row and column indices and
+        absolute values of nonzero entries in ``[G; A]``, with ``nb_rows``
+        its number of rows.
+    """
+    rows, cols, values = [], [], []
+    offset = 0
+    for M in (G, A):
+        if M is None:
+            continue
+        if spa.issparse(M):
+            M = spa.coo_matrix(M)
+            mask = M.data != 0.0
+            rows.append(M.row[mask] + offset)
+            cols.append(M.col[mask])
+            values.append(np.abs(M.data[mask]))
+        else:
+            i, j = np.nonzero(M)
+            rows.append(i + offset)
+            cols.append(j)
+            values.append(np.abs(M[i, j]))
+        offset += M.shape[0]
+    if not rows:
+        empty = np.empty(0, dtype=int)
+        return empty, empty, np.empty(0), 0
+    return np.hstack(rows), np.hstack(cols), np.hstack(values), offset
+
+
+def __scale_matrix(
+    M: Optional[Union[np.ndarray, spa.spmatrix]],
+    E: np.ndarray,
+    D: np.ndarray,
+) -> Optional[Union[np.ndarray, spa.csc_matrix]]:
+    """Scale rows and columns of a matrix.
+
+    Parameters
+    ----------
+    M :
+        Dense or sparse matrix, if any.
+    E :
+        Row scaling factors.
+    D :
+        Column scaling factors.
+
+    Returns
+    -------
+    :
+        Matrix ``diag(E) M diag(D)``, in CSC format if ``M`` is sparse.
+    """
+    if M is None:
+        return None
+    if spa.issparse(M):
+        return spa.csc_matrix(spa.diags(E) @ M @ spa.diags(D))
+    return E[:, np.newaxis] * M * D
+
+
+def __update_factors(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    values: np.ndarray,
+    E: np.ndarray,
+    D: np.ndarray,
+    geometric: bool,
+    iterations: int,
+    tol: float,
+) -> None:
+    """Iterate on row and column scaling factors, updating them in place.
+
+    Parameters
+    ----------
+    rows :
+        Row indices of nonzero entries.
+    cols :
+        Column indices of nonzero entries.
+    values :
+        Absolute values of nonzero entries.
+    E :
+        Row scaling factors, updated in place.
+    D :
+        Column scaling factors, updated in place.
+    geometric :
+        If set, use the geometric mean of the largest and smallest entries
+        of each row and column as its norm, otherwise its largest entry.
+    iterations :
+        Maximum number of iterations.
+    tol :
+        Stop iterating when all factors of an iteration are within this
+        tolerance of one.
+    """
+    nb_rows, n = E.shape[0], D.shape[0]
+    for _ in range(iterations):
+        scaled = values * E[rows] * D[cols]
+        row_norm = np.zeros(nb_rows)
+        col_norm = np.zeros(n)
+        np.maximum.at(row_norm, rows, scaled)
+        np.maximum.at(col_norm, cols, scaled)
+        if geometric:
+            row_min = np.full(nb_rows, np.inf)
+            col_min = np.full(n, np.inf)
+            np.minimum.at(row_min, rows, scaled)
+            np.minimum.at(col_min, cols, scaled)
+            row_norm = np.sqrt(row_norm * row_min)
+            col_norm = np.sqrt(col_norm * col_min)
+        # empty rows and columns are left as they are
+        row_norm[~np.isfinite(row_norm) | (row_norm == 0.0)] = 1.0
+        col_norm[~np.isfinite(col_norm) | (col_norm == 0.0)] = 1.0
+        row_factor = 1.0 / np.sqrt(row_norm)
+        col_factor = 1.0 / np.sqrt(col_norm)
+        E *= row_factor
+        D *= col_factor
+        if (
+            np.max(np.abs(1.0 - row_factor), initial=0.0) < tol
+            and np.max(np.abs(1.0 - col_factor), initial=0.0) < tol
+        ):
+            break
+
+
+def scale_problem(
+    problem: Problem,
+    geometric_iterations: int = 10,
+    ruiz_iterations: int = 10,
+    tol: float = 1e-3,
+) -> Tuple[Problem, ScalingInfo]:
+    """Equilibrate the constraint matrices and cost of a linear program.
+
+    Rows and columns of the stacked constraint matrix :math:`[G; A]` are
+    scaled iteratively in two stages:
+
+    - geometric-mean iterations divide each row and column by the square root
+      of the geometric mean of its largest and smallest absolute nonzero
+      entries, which reduces the spread of magnitudes within each of them;
+    - Ruiz iterations then divide each row and column by the square root of
+      its largest absolute entry, so that these entries converge to one.
+
+    The cost vector is finally scaled so that its largest entry is one.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to scale.
+    geometric_iterations :
+        Maximum number of geometric-mean iterations.
+    ruiz_iterations :
+        Maximum number of Ruiz iterations.
+    tol :
+        Stop iterating in a stage when all row and column factors of an
+        iteration are within this tolerance of one.
+
+    Returns
+    -------
+    :
+        Pair ``(scaled, info)`` of the scaled linear program and scaling
+        factors to map its solution back to the original problem. Matrices
+        of the scaled problem are sparse if those of the original problem
+        are.
+    """
+    c, G, h, A, b, lb, ub = problem.unpack()
+    rows, cols, values, nb_rows = __abs_entries(G, A)
+    D = np.ones(c.shape[0])
+    E = np.ones(nb_rows)
+    __update_factors(rows, cols, values, E, D, True, geometric_iterations, tol)
+    __update_factors(rows, cols, values, E, D, False, ruiz_iterations, tol)
+
+    c_norm = np.max(np.abs(D * c), initial=0.0)
+    sigma = 1.0 / c_norm if c_norm > 0.0 else 1.0
+    m = G.shape[0] if G is not None else 0
+    E_G, E_A = E[:m], E[m:]
+    scaled_problem = Problem(
+        sigma * D * c,
+        __scale_matrix(G, E_G, D),
+        E_G * h if h is not None else None,
+        __scale_matrix(A, E_A, D),
+        E_A * b if b is not None else None,
+        lb / D if lb is not None else None,
+        ub / D if ub is not None else None,
+    )
+    return scaled_problem, ScalingInfo(D, E_G, E_A, sigma)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Select a solver automatically from the features of a linear program.
+
+Solvers are selected by a decision table: a list of rules, each of them
+matching linear programs by their dimensions, number of nonzeros and density,
+and listing solvers by order of preference. The first rule that matches a
+problem, and lists an available solver, decides. A default table ships with
+the library, and can be replaced by one calibrated from local benchmark
+timings with ``python -m lpsolvers.benchmark --calibrate``.
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .exceptions import SolverNotFound
+from .problem import Problem
+from .solvers import available_solvers
+
+
+@dataclass(frozen=True)
+class SelectionRule:
+    """Rule of a decision table selecting solvers for some linear programs.
+
+    A rule matches linear programs whose features are within all its limits.
+
+    Attributes
+    ----------
+    solvers :
+        Names of the solvers to select, by order of preference.
+    max_variables :
+        Maximum number of optimization variables.
+    max_constraints :
+        Maximum number of inequality and equality constraints.
+    max_equalities :
+        Maximum number of equality constraints.
+    max_nonzeros :
+        Maximum number of nonzeros in constraint matrices.
+    min_density :
+        Minimum density of constraint matrices, between 0 and 1.
+    """
+
+    solvers: Tuple[str, ...]
+    max_variables: float = np.inf
+    max_constraints: float = np.inf
+    max_equalities: float = np.inf
+    max_nonzeros: float = np.inf
+    min_density: float = 0.0
+
+    def matches(self, features: Dict[str, float]) -> bool:
+        """Check whether the rule applies to a linear program.
+
+        Parameters
+        ----------
+        features :
+            Features of the linear program, see :func:`problem_features`.
+
+        Returns
+        -------
+        :
+            True if all features are within the limits of the rule.
+        """
+        return (
+            features["n"] <= self.max_variables
+            and features["m"] + features["n_eq"] <= self.max_constraints
+            and features["n_eq"] <= self.max_equalities
+            and features["nnz"] <= self.max_nonzeros
+            and features["density"] >= self.min_density
+        )
+
+
+default_decision_table: List[SelectionRule] = [
+    # tiny dense problems: exact arithmetic is cheap and robust, and the
+    # built-in simplex has less call overhead than HiGHS
+    SelectionRule(
+        ("cdd", "cvxopt", "simplex", "highs", "cvxpy", "proxqp", "pdlp"),
+        max_variables=20,
+        max_constraints=100,
+        min_density=0.2,
+    ),
+    # medium problems: simplex and interior-point methods
+    SelectionRule(
+        ("highs", "cvxopt", "cvxpy", "proxqp", "pdlp", "cdd"),
+        max_variables=5000,
+        max_nonzeros=1e6,
+    ),
+    # large sparse problems: first-order methods
+    SelectionRule(("pdlp", "highs", "cvxpy", "proxqp", "cvxopt")),
+]
+"""Decision table used when no calibrated table is found."""
+
+
+def problem_features(problem: Problem) -> Dict[str, float]:
+    """Compute the features of a linear program used to select solvers.
+
+    Parameters
+    ----------
+    problem :
+        Linear program.
+
+    Returns
+    -------
+    :
+        Dictionary with the number of variables ``n``, of inequality rows
+        ``m``, of equality rows ``n_eq``, of nonzeros ``nnz`` in constraint
+        matrices and their ``density``, between 0 and 1.
+    """
+    n = problem.c.shape[0]
+    m = problem.G.shape[0] if problem.G is not None else 0
+    n_eq = problem.A.shape[0] if problem.A is not None else 0
+    nnz = 0
+    for M in (problem.G, problem.A):
+        if M is None:
+            continue
+        nnz += M.count_nonzero() if spa.issparse(M) else np.count_nonzero(M)
+    nb_entries = n * (m + n_eq)
+    return {
+        "n": n,
+        "m": m,
+        "n_eq": n_eq,
+        "nnz": nnz,
+        "density": nnz / nb_entries if nb_entries > 0 else 0.0,
+    }
+
+
+def decision_table_path() -> str:
+    """Get the path to the calibrated decision table.
+
+    Returns
+    -------
+    :
+        Value of the ``LPSOLVERS_DECISION_TABLE`` environment variable if
+        set, otherwise ``decision_table.json`` in the ``lpsolvers``
+        subdirectory of the user configuration directory.
+    """
+    path = os.environ.get("LPSOLVERS_DECISION_TABLE")
+    if path:
+        return path
+    config_dir = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+        os.path.expanduser("~"), ".config"
+    )
+    return os.path.join(config_dir, "lpsolvers", "decision_table.json")
+
+
+__loaded_tables: Dict[str, List[SelectionRule]] = {}
+__loaded_tables_lock = threading.Lock()
+
+
+def load_decision_table(
+    path: Optional[str] = None,
+) -> List[SelectionRule]:
+    """Load the decision table, falling back to the default one.
+
+    Parameters
+    ----------
+    path :
+        Path to a decision table saved by :func:`save_decision_table`.
+        Defaults to :func:`decision_table_path`.
+
+    Returns
+    -------
+    :
+        Calibrated decision table if the file exists, otherwise
+        :data:`default_decision_table`.
+    """
+    path = path if path is not None else decision_table_path()
+    with __loaded_tables_lock:
+        if path in __loaded_tables:
+            return __loaded_tables[path]
+        if not os.path.isfile(path):
+            table = default_decision_table
+        else:
+            with open(path) as file:
+                table = [
+                    SelectionRule(
+                        **{
+                            **rule,
+                            "solvers": tuple(rule["solvers"]),
+                        }
+                    )
+                    for rule in json.load(file)["rules"]
+                ]
+        __loaded_tables[path] = table
+        return table
+
+
+def save_decision_table(
+    table: Sequence[SelectionRule], path: Optional[str] = None
+) -> str:
+    """Save a decision table to a JSON file.
+
+    Parameters
+    ----------
+    table :
+        Decision table to save.
+    path :
+        Path to the file, defaults to :func:`decision_table_path`.
+
+    Returns
+    -------
+    :
+        Path to the saved file.
+    """
+    path = path if path is not None else decision_table_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    rules = []
+    for rule in table:
+        fields: Dict[str, Union[float, List[str], None]] = {}
+        for key, value in asdict(rule).items():
+            if key == "solvers":
+                fields[key] = list(value)
+            elif np.isfinite(value):  # JSON has no infinity
+                fields[key] = value
+        rules.append(fields)
+    with open(path, "w") as file:
+        json.dump({"rules": rules}, file, indent=4)
+    with __loaded_tables_lock:
+        __loaded_tables.pop(path, None)
+    return path
+
+
+def select_solver(
+    problem: Problem,
+    table: Optional[Sequence[SelectionRule]] = None,
+) -> str:
+    """Select an available solver for a linear program.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    table :
+        Decision table, defaults to the one returned by
+        :func:`load_decision_table`.
+
+    Returns
+    -------
+    :
+        Name of the first available solver of the first matching rule, or
+        the first available solver if no rule matches.
+
+    Raises
+    ------
+    SolverNotFound
+        If no solver is available.
+    """
+    if not available_solvers:
+        raise SolverNotFound("no LP solver is installed")
+    table = table if table is not None else load_decision_table()
+    features = problem_features(problem)
+    for rule in table:
+        if not rule.matches(features):
+            continue
+        for solver in rule.solvers:
+            if solver in available_solvers:
+                return solver
+    return available_solvers[0]
@@ -0,0 +1,528 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Built-in bounded simplex for tiny linear programs.
+
+This solver only depends on NumPy. It implements a two-phase primal simplex
+on a dense tableau, where variable bounds are handled natively rather than
+as constraint rows, and is meant for linear programs with a few dozen
+variables and constraints, whose solve time with other solvers is dominated
+by the conversion of their data.
+
+The tableau gathers the columns of the optimization variables, one slack
+variable per inequality and one artificial variable per constraint row. The
+entering variable is chosen by Dantzig's rule, and the solver falls back to
+Bland's rule, which cannot cycle, after a series of degenerate pivots.
+"""
+
+import time
+import warnings
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .lp_solver import LPSolver
+from .problem import Problem
+from .solution import Solution
+
+
+def _pivot(T: np.ndarray, d: np.ndarray, row: int, col: int) -> None:
+    """Pivot the tableau and reduced costs in place.
+
+    Parameters
+    ----------
+    T :
+        Tableau to update.
+    d :
+        Reduced costs to update.
+    row :
+        Pivot row.
+    col :
+        Pivot column.
+    """
+    pivot_row = T[row] / T[row, col]
+    T -= np.multiply.outer(T[:, col], pivot_row)
+    T[row] = pivot_row
+    d -= d[col] * pivot_row
+
+
+def _iterate(
+    T: np.ndarray,
+    d: np.ndarray,
+    x: np.ndarray,
+    basis: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    max_iter: int,
+    tol: float,
+    bland: bool,
+) -> Tuple[str, int]:
+    """Run simplex iterations until optimality.
+
+    Parameters
+    ----------
+    T :
+        Tableau :math:`B^{-1} M` of the current basis, updated in place.
+    d :
+        Reduced costs of all variables, updated in place.
+    x :
+        Values of all variables, updated in place. Nonbasic variables are at
+        one of their bounds, or at zero if they are free.
+    basis :
+        Index of the basic variable of each row, updated in place.
+    lower :
+        Lower bounds of all variables.
+    upper :
+        Upper bounds of all variables.
+    max_iter :
+        Maximum number of iterations.
+    tol :
+        Tolerance on reduced costs and pivot elements.
+    bland :
+        If set, use Bland's rule from the start.
+
+    Returns
+    -------
+    :
+        Pair of the status, in ``["optimal", "unbounded", "iteration limit
+        reached"]``, and of the number of iterations.
+
+    Notes
+    -----
+    Iterations of tiny problems are dominated by the overhead of NumPy
+    calls rather than by arithmetic, so that basic values and bounds are
+    kept in row order and updated by scalar writes, and all work arrays
+    are allocated before the loop.
+    """
+    nb_rows = T.shape[0]
+    x_basis = x[basis]
+    lower_basis = lower[basis]
+    upper_basis = upper[basis]
+    can_increase = (x < upper).astype(float)  # 1.0 where a move is allowed
+    can_decrease = (x > lower).astype(float)
+    can_increase[basis] = 0.0
+    can_decrease[basis] = 0.0
+    gains = np.empty(d.shape)
+    losses = np.empty(d.shape)
+    alpha = np.empty(nb_rows)
+    ratios = np.empty(nb_rows)
+    slack = np.empty(nb_rows)
+    positive = np.empty(nb_rows, dtype=bool)
+    negative = np.empty(nb_rows, dtype=bool)
+    nb_degenerate = 0
+    max_degenerate = max(10, nb_rows)
+    status, iteration = "iteration limit reached", max_iter
+    for i in range(max_iter):
+        # rate of decrease of the cost when moving each nonbasic variable
+        np.multiply(d, can_decrease, out=gains)
+        np.multiply(d, can_increase, out=losses)
+        np.maximum(gains, np.negative(losses, out=losses), out=gains)
+        if bland:
+            candidates = np.flatnonzero(gains > tol)
+            if candidates.size == 0:
+                status, iteration = "optimal", i
+                break
+            col = int(candidates[0])
+        else:
+            col = int(gains.argmax())
+            if gains[col] <= tol:
+                status, iteration = "optimal", i
+                break
+        direction = 1.0 if d[col] < 0.0 else -1.0
+
+        # ratio test: basic variables move by -step * alpha
+        np.multiply(T[:, col], direction, out=alpha)
+        ratios.fill(np.inf)
+        np.greater(alpha, tol, out=positive)
+        np.subtract(x_basis, lower_basis, out=slack)
+        np.divide(slack, alpha, out=ratios, where=positive)
+        np.less(alpha, -tol, out=negative)
+        np.subtract(x_basis, upper_basis, out=slack)
+        np.divide(slack, alpha, out=ratios, where=negative)
+        # bound flip: the entering variable reaches its other bound
+        target = upper[col] if direction > 0.0 else lower[col]
+        step = direction * (target - x[col])
+        row = -1
+        if nb_rows > 0:
+            if bland:
+                ties = np.flatnonzero(ratios <= max(ratios.min(), 0.0) + tol)
+                if ties.size > 0:
+                    row = int(ties[basis[ties].argmin()])
+            else:
+                row = int(ratios.argmin())
+            if row >= 0 and ratios[row] < step:
+                step = max(ratios[row], 0.0)
+            else:
+                row = -1
+        if step == np.inf:
+            status, iteration = "unbounded", i
+            break
+
+        x_basis -= step * alpha
+        if row < 0:  # set exactly to its bound, which rounding may miss
+            x[col] = target
+            can_increase[col] = float(x[col] < upper[col])
+            can_decrease[col] = float(x[col] > lower[col])
+            continue
+        x[col] += direction * step
+        leaving = basis[row]
+        x[leaving] = lower_basis[row] if alpha[row] > 0.0 else upper_basis[row]
+        _pivot(T, d, row, col)
+        basis[row] = col
+        x_basis[row] = x[col]
+        lower_basis[row] = lower[col]
+        upper_basis[row] = upper[col]
+        can_increase[col] = can_decrease[col] = 0.0
+        can_increase[leaving] = float(x[leaving] < upper[leaving])
+        can_decrease[leaving] = float(x[leaving] > lower[leaving])
+        if step > tol:
+            nb_degenerate = 0
+        else:
+            nb_degenerate += 1
+            bland = bland or nb_degenerate > max_degenerate
+    x[basis] = x_basis
+    return status, iteration
+
+
+class SimplexSolver(LPSolver):
+    """Linear program solved by the built-in bounded simplex.
+
+    The constraint matrix and work arrays are allocated once, so that
+    repeated solves after vector updates only refill them. When only the
+    cost vector changes, solves restart from the previous feasible basis and
+    skip the first phase of the simplex. The tableau is updated by pivots,
+    and recomputed from a factorization of the basis at the end of long
+    phases to clear accumulated rounding errors.
+
+    Notes
+    -----
+    The tableau is dense, so that sparse constraint matrices are densified.
+    Variable bounds are handled natively by the simplex.
+    """
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        G: Union[np.ndarray, spa.csc_matrix],
+        h: np.ndarray,
+        A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+        b: Optional[np.ndarray] = None,
+        lb: Optional[np.ndarray] = None,
+        ub: Optional[np.ndarray] = None,
+        max_iter: Optional[int] = None,
+        tol: float = 1e-9,
+        bland: bool = False,
+    ) -> None:
+        super().__init__(c, G, h, A, b, lb, ub)
+        start_time = time.perf_counter()
+        n = c.shape[0]
+        m = h.shape[0] if G is not None and h is not None else 0
+        p = b.shape[0] if A is not None and b is not None else 0
+        nb_rows = m + p
+        nb_cols = n + m + nb_rows
+
+        # Columns of the constraint matrix: variables, slacks, then
+        # artificials, whose signs are set at each solve
+        M = np.zeros((nb_rows, nb_cols))
+        if m > 0:
+            M[:m, :n] = G.toarray() if spa.issparse(G) else G
+            M[:m, n : n + m] = np.eye(m)
+        if p > 0:
+            M[m:, :n] = A.toarray() if spa.issparse(A) else A
+        lower = np.zeros(nb_cols)
+        upper = np.full(nb_cols, np.inf)
+        lower[:n] = lb if lb is not None else -np.inf
+        upper[:n] = ub if ub is not None else np.inf
+        self.__M = M
+        self.__T = np.empty_like(M)
+        self.__lower = lower
+        self.__upper = upper
+        self.__x = np.empty(nb_cols)
+        self.__cost = np.zeros(nb_cols)
+        self.__rhs = np.empty(nb_rows)
+        self.__basis: Optional[np.ndarray] = None  # primal feasible basis
+        self.__signs = np.ones(nb_rows)
+        self.__feasible_rhs = np.empty(nb_rows)
+        self._conversion_time += time.perf_counter() - start_time
+        self.__max_iter = (
+            max_iter
+            if max_iter is not None
+            else 10 * (nb_rows + nb_cols) + 100
+        )
+        self.__tol = tol
+        self.__bland = bland
+
+    def __refactor(self, basis: np.ndarray) -> None:
+        """Recompute the tableau and basic variables from the basis.
+
+        Parameters
+        ----------
+        basis :
+            Index of the basic variable of each row.
+        """
+        M, x = self.__M, self.__x
+        B_inv = np.linalg.inv(M[:, basis])
+        np.matmul(B_inv, M, out=self.__T)
+        nonbasic = np.ones(x.shape[0], dtype=bool)
+        nonbasic[basis] = False
+        x[basis] = B_inv @ (self.__rhs - M[:, nonbasic] @ x[nonbasic])
+
+    def __run_phase(self, basis: np.ndarray, nb_iter: int) -> Tuple[str, int]:
+        """Run a phase of the simplex on the current cost vector.
+
+        Parameters
+        ----------
+        basis :
+            Index of the basic variable of each row, updated in place.
+        nb_iter :
+            Number of iterations of previous phases.
+
+        Returns
+        -------
+        :
+            Pair of the status of the phase and of the total number of
+            iterations. After more pivots than rows, the basis is refactored
+            and iterations resume if rounding errors hid improving
+            directions.
+        """
+        T, cost = self.__T, self.__cost
+        for _ in range(2):
+            d = cost - cost[basis] @ T
+            status, nb_phase_iter = _iterate(
+                T, d, self.__x, basis, self.__lower, self.__upper,
+                self.__max_iter - nb_iter, self.__tol, self.__bland,
+            )  # fmt: skip
+            nb_iter += nb_phase_iter
+            if nb_phase_iter <= T.shape[0] or status != "optimal":
+                break
+            self.__refactor(basis)
+        return status, nb_iter
+
+    def solve_problem(
+        self,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+    ) -> Solution:
+        """Solve the linear program from its current vectors.
+
+        Parameters
+        ----------
+        initvals :
+            Primal initial guess, ignored as the simplex starts from a basis
+            rather than from a point.
+        dual_initvals :
+            Dual initial guess, ignored as well.
+
+        Returns
+        -------
+        :
+            Solution to the linear program.
+        """
+        if initvals is not None or dual_initvals is not None:
+            warnings.warn(
+                "The built-in simplex does not support warm starting, "
+                "initial guesses are ignored"
+            )
+        start_time = time.perf_counter()
+        n = self.c.shape[0]
+        m = self.h.shape[0] if self.G is not None and self.h is not None else 0
+        nb_rows = self.__rhs.shape[0]
+        nb_basic = n + m  # index of the first artificial variable
+        T, x, lower, upper = self.__T, self.__x, self.__lower, self.__upper
+        rhs, cost = self.__rhs, self.__cost
+        if m > 0:
+            rhs[:m] = self.h
+        if nb_rows > m:
+            rhs[m:] = self.b
+
+        # Restart from the previous primal feasible basis when only the cost
+        # vector changed. Otherwise, start from variables at a finite bound,
+        # or at zero if free, and from slack variables where feasible and
+        # artificial ones elsewhere.
+        warm_start = self.__basis is not None and np.array_equal(
+            rhs, self.__feasible_rhs
+        )
+        if warm_start:
+            basis, signs = self.__basis, self.__signs
+            use_slack = np.ones(nb_rows, dtype=bool)
+        else:
+            x[:n] = np.where(
+                np.isfinite(lower[:n]),
+                lower[:n],
+                np.where(np.isfinite(upper[:n]), upper[:n], 0.0),
+            )
+            x[n:] = 0.0
+            residual = rhs - self.__M[:, :n] @ x[:n]
+            use_slack = np.zeros(nb_rows, dtype=bool)
+            use_slack[:m] = residual[:m] >= 0.0
+            signs = np.where(use_slack | (residual >= 0.0), 1.0, -1.0)
+            basis = np.where(
+                use_slack,
+                n + np.arange(nb_rows),
+                nb_basic + np.arange(nb_rows),
+            )
+            x[basis] = np.abs(residual)
+            self.__M[:, nb_basic:] = np.diag(signs)
+            np.multiply(self.__M, signs[:, None], out=T)  # diagonal inverse
+            upper[nb_basic:] = np.where(use_slack, 0.0, np.inf)
+        self._conversion_time += time.perf_counter() - start_time
+
+        solution = self._new_solution()
+        start_time = time.perf_counter()
+        nb_iter = 0
+        status = "optimal"
+        if not use_slack.all():  # phase 1: minimize artificial variables
+            cost[:] = 0.0
+            cost[nb_basic:] = np.where(use_slack, 0.0, 1.0)
+            status, nb_iter = self.__run_phase(basis, nb_iter)
+            infeasibility = x[nb_basic:].sum()
+            if status == "optimal" and infeasibility > self.__tol * max(
+                1.0, np.abs(rhs).max()
+            ):
+                status = "infeasible"
+            upper[nb_basic:] = 0.0
+        if status == "optimal":  # the basis stays feasible in phase 2
+            self.__basis, self.__signs = basis, signs
+            self.__feasible_rhs[:] = rhs
+        else:
+            self.__basis = None
+        if status == "optimal":  # phase 2: minimize the linear cost
+            cost[:n] = self.c
+            cost[n:] = 0.0
+            status, nb_iter = self.__run_phase(basis, nb_iter)
+        solution.solve_time = time.perf_counter() - start_time
+        solution.status = status
+        solution.iter = nb_iter
+        solution.found = status == "optimal"
+        if not solution.found:
+            return solution
+
+        # reduced costs of artificial columns are opposite to row duals, up
+        # to the signs of these columns
+        d = cost - cost[basis] @ T
+        multipliers = d[nb_basic:] * signs
+
+        self.x = x[:n].copy()
+        solution.x = self.x
+        solution.obj = float(self.c @ self.x)
+        solution.z = multipliers[:m] if m > 0 else None
+        solution.y = multipliers[m:] if nb_rows > m else None
+        if self.lb is not None or self.ub is not None:
+            solution.z_box = -d[:n]
+        return solution
+
+
+def simplex_solve_problem(
+    problem: Problem,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    max_iter: Optional[int] = None,
+    tol: float = 1e-9,
+    bland: bool = False,
+) -> Solution:
+    """Solve a linear program using the built-in simplex.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    initvals :
+        Primal initial guess, ignored.
+    dual_initvals :
+        Dual initial guess, ignored.
+    max_iter :
+        Maximum number of simplex iterations.
+    tol :
+        Tolerance on reduced costs, pivot elements and infeasibility.
+    bland :
+        If set, use Bland's rule from the start rather than as a fallback.
+
+    Returns
+    -------
+    :
+        Solution to the linear program returned by the solver.
+    """
+    c, G, h, A, b, lb, ub = problem.unpack()
+    solution = SimplexSolver(
+        c, G, h, A, b, lb, ub, max_iter, tol, bland
+    ).solve_problem(initvals, dual_initvals)
+    solution.problem = problem
+    return solution
+
+
+def simplex_solve_lp(
+    c: np.ndarray,
+    G: Union[np.ndarray, spa.csc_matrix],
+    h: np.ndarray,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+    b: Optional[np.ndarray] = None,
+    max_iter: Optional[int] = None,
+    tol: float = 1e-9,
+    bland: bool = False,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    r"""Solve a linear program using the built-in simplex.
+
+    The linear program is defined by:
+
+    .. math::
+
+        \begin{split}\begin{array}{ll}
+            \mbox{minimize} &
+                c^T x \\
+            \mbox{subject to}
+                & G x \leq h \\
+                & A x = b \\
+                & lb \leq x \leq ub
+        \end{array}\end{split}
+
+    It is solved by a two-phase bounded simplex written in NumPy, which is
+    suited to tiny linear programs.
+
+    Parameters
+    ----------
+    c :
+        Linear cost vector.
+    G :
+        Linear inequality constraint matrix.
+    h :
+        Linear inequality constraint vector.
+    A :
+        Linear equality constraint matrix.
+    b :
+        Linear equality constraint vector.
+    max_iter :
+        Maximum number of simplex iterations.
+    tol :
+        Tolerance on reduced costs, pivot elements and infeasibility.
+    bland :
+        If set, use Bland's rule from the start rather than as a fallback.
+    initvals :
+        Primal initial guess, ignored.
+    dual_initvals :
+        Dual initial guess, ignored.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+
+    Returns
+    -------
+    :
+        Optimal (primal) solution of the linear program, if it exists.
+
+    Raises
+    ------
+    ValueError
+        If the LP is not feasible.
+    """
+    return SimplexSolver(c, G, h, A, b, lb, ub, max_iter, tol, bland).solve(
+        initvals, dual_initvals
+    )
@@ -0,0 +1,379 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Save linear programs to binary snapshots and replay them later.
+
+A snapshot file starts with a magic string and the length of a JSON header,
+followed by the header itself and the raw buffers of all arrays. Buffers are
+aligned on 64 bytes, so that they are memory-mapped in place when loading
+the snapshot. Sparse matrices are stored as their data, index and pointer
+arrays.
+"""
+
+import importlib.metadata
+import json
+import os
+import struct
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .exceptions import ProblemError
+from .problem import Problem
+from .solution import Solution
+from .solve_problem import solve_problem
+from .solvers import solver_packages
+
+magic = b"LPSNAP\x00\x01"
+"""Magic string at the beginning of snapshot files."""
+
+format_version = 1
+"""Version of the snapshot format written by :func:`save_problem`."""
+
+__alignment = 64
+
+
+@dataclass(frozen=False)
+class Snapshot:
+    """Linear program saved along with the solver call to replay.
+
+    Attributes
+    ----------
+    problem :
+        Linear program, whose arrays are memory-mapped if the snapshot was
+        loaded with ``mmap=True``.
+    solver :
+        Name of the LP solver, if any.
+    kwargs :
+        Keyword arguments of the solver.
+    initvals :
+        Primal initial guess, if any.
+    dual_initvals :
+        Dual initial guess, if any.
+    metadata :
+        Other fields of the snapshot header, such as the version of
+        lpsolvers and of the solver backend that saved it.
+    """
+
+    problem: Problem
+    solver: Optional[str] = None
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    initvals: Optional[np.ndarray] = None
+    dual_initvals: Optional[np.ndarray] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def solve(self, solver: Optional[str] = None, **kwargs) -> Solution:
+        """Replay the solver call saved in the snapshot.
+
+        Parameters
+        ----------
+        solver :
+            Name of the LP solver, defaults to the saved one.
+
+        Returns
+        -------
+        :
+            Solution found by the solver.
+
+        Notes
+        -----
+        Extra keyword arguments are forwarded to
+        :func:`lpsolvers.solve_problem` and override the saved ones.
+        """
+        return solve_problem(
+            self.problem,
+            solver if solver is not None else self.solver,
+            self.initvals,
+            self.dual_initvals,
+            **{**self.kwargs, **kwargs},
+        )
+
+
+def __backend_version(solver: Optional[str]) -> Optional[str]:
+    """Get the version of the backend package of a solver.
+
+    Parameters
+    ----------
+    solver :
+        Name of the solver, if any.
+
+    Returns
+    -------
+    :
+        Version of the backend package, or ``None`` if it is unknown.
+    """
+    if solver not in solver_packages:
+        return None
+    package = solver_packages[solver].split(".")[0]
+    module = sys.modules.get(package)
+    version = getattr(module, "__version__", None)
+    if version is not None:
+        return str(version)
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def __json_default(value: Any) -> Any:
+    """Convert NumPy values of solver keyword arguments to JSON.
+
+    Parameters
+    ----------
+    value :
+        Value that the JSON encoder cannot serialize.
+
+    Returns
+    -------
+    :
+        Equivalent Python value.
+
+    Raises
+    ------
+    TypeError
+        If the value cannot be converted.
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(
+        f"solver argument of type {type(value).__name__} cannot be saved"
+    )
+
+
+def __gather_arrays(
+    problem: Problem,
+    initvals: Optional[np.ndarray],
+    dual_initvals: Optional[np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Gather the arrays of a snapshot, flattening sparse matrices.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to save.
+    initvals :
+        Primal initial guess, if any.
+    dual_initvals :
+        Dual initial guess, if any.
+
+    Returns
+    -------
+    :
+        Contiguous arrays indexed by name. Sparse matrices ``M`` are stored
+        as ``M.data``, ``M.indices`` and ``M.indptr``.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    c, G, h, A, b, lb, ub = problem.unpack()
+    vectors = {
+        "c": c,
+        "h": h,
+        "b": b,
+        "lb": lb,
+        "ub": ub,
+        "initvals": initvals,
+        "dual_initvals": dual_initvals,
+    }
+    for name, v in vectors.items():
+        if v is not None:
+            arrays[name] = np.ascontiguousarray(v)
+    for name, M in (("G", G), ("A", A)):
+        if M is None:
+            continue
+        if not spa.issparse(M):
+            arrays[name] = np.ascontiguousarray(M)
+            continue
+        if M.format not in ("csc", "csr"):
+            M = spa.csc_matrix(M)
+        arrays[f"{name}.data"] = np.ascontiguousarray(M.data)
+        arrays[f"{name}.indices"] = np.ascontiguousarray(M.indices)
+        arrays[f"{name}.indptr"] = np.ascontiguousarray(M.indptr)
+    return arrays
+
+
+def __lpsolvers_version() -> str:
+    """Get the version of lpsolvers.
+
+    Returns
+    -------
+    :
+        Version string of the package.
+    """
+    from . import __version__  # the package imports this module
+
+    return __version__
+
+
+def save_problem(
+    problem: Problem,
+    path: Union[str, "os.PathLike[str]"],
+    solver: Optional[str] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    **kwargs,
+) -> None:
+    """Save a linear program and its solver call to a snapshot file.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to save.
+    path :
+        Path to the snapshot file.
+    solver :
+        Name of the LP solver, if any.
+    initvals :
+        Primal initial guess, if any.
+    dual_initvals :
+        Dual initial guess, if any.
+
+    Raises
+    ------
+    TypeError
+        If a solver keyword argument cannot be saved.
+
+    Notes
+    -----
+    Extra keyword arguments are the solver arguments to replay. They are
+    saved in the JSON header, and should be numbers, strings, booleans or
+    lists thereof.
+    """
+    arrays = __gather_arrays(problem, initvals, dual_initvals)
+    header: Dict[str, Any] = {
+        "format_version": format_version,
+        "lpsolvers_version": __lpsolvers_version(),
+        "solver": solver,
+        "backend_version": __backend_version(solver),
+        "kwargs": kwargs,
+        "matrices": {},
+        "arrays": {},
+    }
+    for name, M in (("G", problem.G), ("A", problem.A)):
+        if M is not None:
+            matrix_format = M.format if spa.issparse(M) else "dense"
+            if matrix_format not in ("dense", "csc", "csr"):
+                matrix_format = "csc"  # converted by __gather_arrays
+            header["matrices"][name] = {
+                "format": matrix_format,
+                "shape": list(M.shape),
+            }
+    offset = 0
+    for name, array in arrays.items():
+        offset = -(-offset // __alignment) * __alignment
+        header["arrays"][name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset += array.nbytes
+    encoded = json.dumps(header, default=__json_default).encode()
+    start = len(magic) + 8 + len(encoded)
+    start = -(-start // __alignment) * __alignment
+    with open(path, "wb") as file:
+        file.write(magic)
+        file.write(struct.pack("<Q", start - len(magic) - 8))
+        file.write(encoded.ljust(start - len(magic) - 8))
+        for name, array in arrays.items():
+            file.seek(start + header["arrays"][name]["offset"])
+            file.write(array.data)  # raw buffer, without copy
+
+
+def load_problem(
+    path: Union[str, "os.PathLike[str]"], mmap: bool = True
+) -> Snapshot:
+    """Load a snapshot saved by :func:`save_problem`.
+
+    Parameters
+    ----------
+    path :
+        Path to the snapshot file.
+    mmap :
+        If set, memory-map arrays from the file in read-only mode rather
+        than reading them into memory, so that large linear programs are
+        loaded without copies.
+
+    Returns
+    -------
+    :
+        Snapshot of the linear program and of its solver call.
+
+    Raises
+    ------
+    ProblemError
+        If the file is not a snapshot, or if its format is not supported.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(magic)) != magic:
+            raise ProblemError(f"'{path}' is not an lpsolvers snapshot")
+        (header_size,) = struct.unpack("<Q", file.read(8))
+        header = json.loads(file.read(header_size).decode())
+        if header.get("format_version", 0) > format_version:
+            raise ProblemError(
+                f"snapshot format {header['format_version']} is newer than "
+                f"the supported format {format_version}"
+            )
+        start = len(magic) + 8 + header_size
+        arrays: Dict[str, np.ndarray] = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            shape = tuple(spec["shape"])
+            if mmap and int(np.prod(shape)) > 0:
+                arrays[name] = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=start + spec["offset"],
+                    shape=shape,
+                ).view(np.ndarray)
+            else:
+                file.seek(start + spec["offset"])
+                count = int(np.prod(shape))
+                arrays[name] = np.fromfile(
+                    file, dtype=dtype, count=count
+                ).reshape(shape)
+    matrices: Dict[str, Any] = {"G": None, "A": None}
+    for name, spec in header["matrices"].items():
+        if spec["format"] == "dense":
+            matrices[name] = arrays[name]
+            continue
+        matrix_class = (
+            spa.csc_matrix if spec["format"] == "csc" else spa.csr_matrix
+        )
+        matrices[name] = matrix_class(
+            (
+                arrays[f"{name}.data"],
+                arrays[f"{name}.indices"],
+                arrays[f"{name}.indptr"],
+            ),
+            shape=tuple(spec["shape"]),
+            copy=False,
+        )
+    problem = Problem(
+        arrays["c"],
+        matrices["G"],
+        arrays.get("h"),
+        matrices["A"],
+        arrays.get("b"),
+        arrays.get("lb"),
+        arrays.get("ub"),
+    )
+    metadata = {
+        key: value
+        for key, value in header.items()
+        if key not in ("solver", "kwargs", "matrices", "arrays")
+    }
+    return Snapshot(
+        problem,
+        header["solver"],
+        header["kwargs"],
+        arrays.get("initvals"),
+        arrays.get("dual_initvals"),
+        metadata,
+    )
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Output from linear programming solvers."""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from .problem import Problem
+
+
+@dataclass(frozen=False)
+class Solution:
+    r"""Solution returned by a linear programming solver for a given problem.
+
+    In addition to the primal solution :math:`x`, the solution includes the
+    dual multipliers :math:`z` of inequality constraints, :math:`y` of
+    equality constraints and :math:`z_{box}` of box constraints. They satisfy
+    :math:`c + G^T z + A^T y + z_{box} = 0` and :math:`z \geq 0` at the
+    optimum. Entries of :math:`z_{box}` are positive at active upper bounds
+    and negative at active lower bounds.
+
+    Attributes
+    ----------
+    problem :
+        Linear program the solution corresponds to.
+    extras :
+        Other outputs, specific to each solver.
+    found :
+        True if the solution is valid, False if no solution was found.
+    status :
+        Status returned by the solver, in its own terms.
+    obj :
+        Value of the primal objective at the solution (``None`` if no solution
+        was found).
+    x :
+        Solution vector for the primal linear program (``None`` if no solution
+        was found).
+    y :
+        Dual multipliers for equality constraints (``None`` if no solution was
+        found, or if there is no equality constraint).
+    z :
+        Dual multipliers for linear inequality constraints (``None`` if no
+        solution was found, or if there is no inequality constraint).
+    z_box :
+        Dual multipliers for box constraints (``None`` if no solution was
+        found, or if there is no box constraint).
+    iter :
+        Number of iterations of the solver, if it reports them.
+    conversion_time :
+        Time spent converting input matrices to the solver format, in
+        seconds.
+    setup_time :
+        Time spent setting up the solver model, in seconds.
+    solve_time :
+        Time spent by the solver itself, in seconds.
+    """
+
+    problem: Problem
+    extras: dict = field(default_factory=dict)
+    found: Optional[bool] = None
+    status: Optional[str] = None
+    obj: Optional[float] = None
+    x: Optional[np.ndarray] = None
+    y: Optional[np.ndarray] = None
+    z: Optional[np.ndarray] = None
+    z_box: Optional[np.ndarray] = None
+    iter: Optional[int] = None
+    conversion_time: Optional[float] = None
+    setup_time: Optional[float] = None
+    solve_time: Optional[float] = None
+
+    @property
+    def run_time(self) -> Optional[float]:
+        """Total time spent in conversion, setup and solve, in seconds.
+
+        Returns
+        -------
+        :
+            Sum of the three timings, or ``None`` if one of them is unknown.
+        """
+        times = (self.conversion_time, self.setup_time, self.solve_time)
+        if any(t is None for t in times):
+            return None
+        return sum(times)  # type: ignore
+
+    def primal_residual(self) -> float:
+        r"""Compute the primal residual of the solution.
+
+        The primal residual is:
+
+        .. math::
+
+            r_p := \max(\| A x - b \|_\infty, [G x - h]^+, [lb - x]^+,
+            [x - ub]^+)
+
+        where :math:`v^+ = \max(v, 0)`.
+
+        Returns
+        -------
+        :
+            Primal residual if it is defined, ``np.inf`` otherwise.
+        """
+        _, G, h, A, b, lb, ub = self.problem.unpack()
+        if not self.found or self.x is None:
+            return np.inf
+        x = self.x
+        residual = 0.0
+        if G is not None and h is not None and h.shape[0] > 0:
+            residual = max(residual, float(np.max(G @ x - h)))
+        if A is not None and b is not None and b.shape[0] > 0:
+            residual = max(residual, float(np.max(np.abs(A @ x - b))))
+        if lb is not None:
+            residual = max(residual, float(np.max(lb - x, initial=0.0)))
+        if ub is not None:
+            residual = max(residual, float(np.max(x - ub, initial=0.0)))
+        return residual
+
+    def dual_residual(self) -> float:
+        r"""Compute the dual residual of the solution.
+
+        The dual residual is:
+
+        .. math::
+
+            r_d := \| c + G^T z + A^T y + z_{box} \|_\infty
+
+        Returns
+        -------
+        :
+            Dual residual if it is defined, ``np.inf`` otherwise.
+        """
+        c, G, _, A, _, _, _ = self.problem.unpack()
+        if not self.found:
+            return np.inf
+        zeros = np.zeros(c.shape[0])
+        Gz = G.T @ self.z if G is not None and self.z is not None else zeros
+        Ay = A.T @ self.y if A is not None and self.y is not None else zeros
+        z_box = self.z_box if self.z_box is not None else zeros
+        return float(np.max(np.abs(c + Gz + Ay + z_box), initial=0.0))
+
+    def duality_gap(self) -> float:
+        r"""Compute the duality gap of the solution.
+
+        The duality gap is:
+
+        .. math::
+
+            r_g := | c^T x + h^T z + b^T y + ub^T z_{box}^+ - lb^T z_{box}^- |
+
+        where :math:`z_{box}^+ = \max(z_{box}, 0)` and :math:`z_{box}^- =
+        \max(-z_{box}, 0)`, restricted to finite bounds.
+
+        Returns
+        -------
+        :
+            Duality gap if it is defined, ``np.inf`` otherwise.
+        """
+        c, _, h, _, b, lb, ub = self.problem.unpack()
+        if not self.found or self.x is None:
+            return np.inf
+        hz = h.dot(self.z) if h is not None and self.z is not None else 0.0
+        by = b.dot(self.y) if b is not None and self.y is not None else 0.0
+        box = 0.0
+        if self.z_box is not None:
+            # solvers may report tiny multipliers on infinite bounds
+            if ub is not None:
+                upper = (self.z_box > 0.0) & np.isfinite(ub)
+                box += ub[upper].dot(self.z_box[upper])
+            if lb is not None:
+                lower = (self.z_box < 0.0) & np.isfinite(lb)
+                box += lb[lower].dot(self.z_box[lower])
+        return abs(float(c.dot(self.x) + hz + by + box))
+
+    def is_optimal(self, eps_abs: float) -> bool:
+        """Check whether the solution is indeed optimal.
+
+        Parameters
+        ----------
+        eps_abs :
+            Absolute tolerance for the primal residual, dual residual and
+            duality gap.
+
+        Returns
+        -------
+        :
+            True if and only if the solution is optimal up to the tolerance.
+        """
+        return (
+            self.primal_residual() < eps_abs
+            and self.dual_residual() < eps_abs
+            and self.duality_gap() < eps_abs
+        )
@@ -0,0 +1,513 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Solve linear programs from asyncio code.
+
+Solvers listed in :data:`lpsolvers.solvers.thread_safe_solvers` release the
+GIL while solving and run on a bounded pool of threads. Other solvers hold
+the GIL or mutate global state, and run on a bounded pool of worker
+processes that is reused across solves. Cancelling a solve only has effect
+if it has not started yet: solves that are already running complete in the
+background, and their results are discarded. Use the ``time_limit`` keyword
+argument to bound the duration of solves instead.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .exceptions import NoSolverSelected
+from .problem import Problem
+from .race import _get_context, _solution_from_dict, _solve_to_dict
+from .selection import select_solver
+from .solution import Solution
+from .solve_lps import _merge_chunks, _solve_chunk, _split_batch
+from .solve_problem import solve_problem
+from .solvers import (
+    available_solvers,
+    get_solve_problem_function,
+    thread_safe_solvers,
+)
+
+__limits = {
+    "max_threads": os.cpu_count() or 1,
+    "max_processes": os.cpu_count() or 1,
+}
+__executors: Dict[str, Executor] = {}
+__lock = threading.Lock()
+
+
+def configure_async(
+    max_threads: Optional[int] = None, max_processes: Optional[int] = None
+) -> None:
+    """Set the concurrency limits of asynchronous solve functions.
+
+    Both limits default to the number of CPUs. Solves that are already
+    running are not affected by new limits.
+
+    Parameters
+    ----------
+    max_threads :
+        Maximum number of solves running at the same time on threads.
+    max_processes :
+        Maximum number of solves running at the same time in worker
+        processes.
+
+    Raises
+    ------
+    ValueError
+        If a limit is not positive.
+    """
+    for name, limit in (
+        ("max_threads", max_threads),
+        ("max_processes", max_processes),
+    ):
+        if limit is not None and limit < 1:
+            raise ValueError(f"{name} should be positive, got {limit}")
+    with __lock:
+        if max_threads is not None:
+            __limits["max_threads"] = max_threads
+            executor = __executors.pop("threads", None)
+            if executor is not None:
+                executor.shutdown(wait=False)
+        if max_processes is not None:
+            __limits["max_processes"] = max_processes
+            executor = __executors.pop("processes", None)
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
+def __get_executor(name: str, max_workers: int) -> Executor:
+    """Get a thread pool of the module, creating it on first use.
+
+    Parameters
+    ----------
+    name :
+        Name of the thread pool.
+    max_workers :
+        Number of threads of the pool, if it is created.
+
+    Returns
+    -------
+    :
+        Thread pool.
+    """
+    with __lock:
+        if name not in __executors:
+            __executors[name] = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f"lpsolvers-{name}",
+            )
+        return __executors[name]
+
+
+def __get_process_pool() -> Executor:
+    """Get the process pool of the module, creating it on first use.
+
+    Returns
+    -------
+    :
+        Pool of worker processes, started from the context of race workers
+        so that they are not forked from the calling process.
+    """
+    with __lock:
+        if "processes" not in __executors:
+            __executors["processes"] = ProcessPoolExecutor(
+                max_workers=__limits["max_processes"],
+                mp_context=_get_context(),
+            )
+        return __executors["processes"]
+
+
+async def __run_in_process(function: Callable, args: tuple) -> Any:
+    """Call a function in the pool of worker processes.
+
+    Parameters
+    ----------
+    function :
+        Function to call, that should be picklable.
+    args :
+        Positional arguments of the function.
+
+    Returns
+    -------
+    :
+        Value returned by the function.
+
+    Raises
+    ------
+    BrokenProcessPool
+        If a worker process exits without returning, in which case the pool
+        is replaced for the next calls.
+
+    Notes
+    -----
+    Exceptions raised by the function are raised again in the caller.
+    """
+    loop = asyncio.get_running_loop()
+    pool = __get_process_pool()
+    try:
+        return await loop.run_in_executor(pool, function, *args)
+    except BrokenProcessPool:
+        with __lock:
+            if __executors.get("processes") is pool:
+                del __executors["processes"]
+        raise
+
+
+async def __run(
+    function: Callable,
+    args: tuple,
+    use_processes: bool,
+    executor: Optional[Executor],
+) -> Any:
+    """Call a function on a thread or in a worker process.
+
+    Parameters
+    ----------
+    function :
+        Function to call, that should be picklable if it runs in a process.
+    args :
+        Positional arguments of the function.
+    use_processes :
+        If set, call the function in the pool of worker processes of the
+        module, otherwise on its thread pool.
+    executor :
+        Executor to submit the function to instead, if any.
+
+    Returns
+    -------
+    :
+        Value returned by the function.
+    """
+    loop = asyncio.get_running_loop()
+    if executor is not None:
+        return await loop.run_in_executor(executor, function, *args)
+    if use_processes:
+        return await __run_in_process(function, args)
+    threads = __get_executor("threads", __limits["max_threads"])
+    return await loop.run_in_executor(threads, function, *args)
+
+
+def __use_processes(solver: str, pool: Optional[str]) -> bool:
+    """Decide whether a solver runs in worker processes.
+
+    Parameters
+    ----------
+    solver :
+        Name of the LP solver.
+    pool :
+        Kind of worker in ``["thread", "process"]``, or ``None`` to decide
+        from :data:`lpsolvers.solvers.thread_safe_solvers`.
+
+    Returns
+    -------
+    :
+        True if the solver runs in worker processes.
+
+    Raises
+    ------
+    ValueError
+        If the kind of worker is unknown.
+    """
+    if pool is None:
+        return solver not in thread_safe_solvers
+    if pool not in ("thread", "process"):
+        raise ValueError(f"pool should be 'thread' or 'process', got '{pool}'")
+    return pool == "process"
+
+
+def __check_solver(solver: Optional[str]) -> None:
+    """Check that a solver is selected, importing its interface.
+
+    Parameters
+    ----------
+    solver :
+        Name of the LP solver.
+
+    Raises
+    ------
+    NoSolverSelected
+        If no solver is selected.
+    SolverNotFound
+        If the LP solver is not found.
+    """
+    if solver is None:
+        raise NoSolverSelected(
+            "Set the `solver` keyword argument to one of the "
+            f"available solvers in {available_solvers}"
+        )
+    # import the interface to fail early if it is missing
+    get_solve_problem_function(solver)
+
+
+async def solve_problem_async(
+    problem: Problem,
+    solver: Optional[Union[str, Sequence[str]]] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    pool: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> Solution:
+    """Solve a linear program without blocking the event loop.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    solver :
+        Name of the LP solver to choose in :data:`lpsolvers.available_solvers`,
+        or ``"auto"`` to select one from the features of the problem. List
+        of solvers when racing them.
+    initvals :
+        Primal initial guess, if any.
+    dual_initvals :
+        Dual initial guess, if any.
+    pool :
+        Kind of worker in ``["thread", "process"]``, ignored by races. By
+        default, solvers in
+        :data:`lpsolvers.solvers.thread_safe_solvers` run on threads and
+        other solvers in worker processes.
+    executor :
+        Executor to run the solver in, if any, bypassing the concurrency
+        limits set by :func:`configure_async`.
+
+    Returns
+    -------
+    :
+        Solution to the linear program. When the solver runs in a worker
+        process, its extras are not reported, except for the ``"solver"``
+        and ``"statuses"`` extras of races, and exceptions raised by the
+        solver are reported as its status.
+
+    Raises
+    ------
+    NoSolverSelected
+        If no solver is selected.
+    SolverNotFound
+        If the requested LP solver is not found.
+    ImportError
+        If the backend of the requested LP solver is not installed.
+    ValueError
+        If a list of solvers is given without racing them.
+
+    Notes
+    -----
+    Extra keyword arguments are forwarded to :func:`lpsolvers.solve_problem`.
+    Races run in a worker process, from which they start one process per
+    solver, and ``solver`` is then a list of solvers. Other solves with a
+    time limit supervise their own worker process, and thus run on threads.
+    """
+    if kwargs.get("race"):
+        if solver is None or isinstance(solver, str):
+            __check_solver(solver)
+        else:
+            for name in solver:
+                __check_solver(name)
+        use_processes = True
+    elif solver is not None and not isinstance(solver, str):
+        raise ValueError("a list of solvers can only be used with race=True")
+    else:
+        if solver == "auto":
+            solver = select_solver(problem)
+        __check_solver(solver)
+        supervised = kwargs.get("time_limit") is not None
+        use_processes = not supervised and __use_processes(solver, pool)
+    if use_processes or isinstance(executor, ProcessPoolExecutor):
+        result = await __run(
+            _solve_to_dict,
+            (problem, solver, initvals, dual_initvals, kwargs),
+            use_processes,
+            executor,
+        )
+        return _solution_from_dict(
+            problem, result, extras=result.get("extras", {})
+        )
+
+    def solve() -> Solution:
+        return solve_problem(
+            problem, solver, initvals, dual_initvals, **kwargs
+        )
+
+    return await __run(solve, (), False, executor)
+
+
+async def solve_lp_async(
+    c: np.ndarray,
+    G: Union[np.ndarray, spa.csc_matrix],
+    h: np.ndarray,
+    A: Optional[Union[np.ndarray, spa.csc_matrix]] = None,
+    b: Optional[np.ndarray] = None,
+    solver: Optional[Union[str, Sequence[str]]] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    pool: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> np.ndarray:
+    """Solve a linear program without blocking the event loop.
+
+    This is the asynchronous counterpart of :func:`lpsolvers.solve_lp`.
+
+    Parameters
+    ----------
+    c :
+        Linear cost vector.
+    G :
+        Linear inequality constraint matrix, dense or sparse.
+    h :
+        Linear inequality constraint vector.
+    A :
+        Linear equality constraint matrix, dense or sparse.
+    b :
+        Linear equality constraint vector.
+    solver :
+        Name of the LP solver to choose in :data:`lpsolvers.available_solvers`,
+        or ``"auto"`` to select one from the features of the problem.
+    initvals :
+        Primal initial guess, if any.
+    dual_initvals :
+        Dual initial guess, if any.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+    pool :
+        Kind of worker in ``["thread", "process"]``, see
+        :func:`solve_problem_async`.
+    executor :
+        Executor to run the solver in, if any.
+
+    Returns
+    -------
+    :
+        Optimal solution.
+
+    Raises
+    ------
+    ValueError
+        If the LP is not feasible.
+    NoSolverSelected
+        If no solver is selected.
+    SolverNotFound
+        If the requested LP solver is not found.
+
+    Notes
+    -----
+    Extra keyword arguments are forwarded to :func:`lpsolvers.solve_problem`.
+    """
+    if isinstance(G, np.ndarray) and G.ndim == 1:
+        G = G.reshape((1, G.shape[0]))
+    solution = await solve_problem_async(
+        Problem(c, G, h, A, b, lb, ub),
+        solver,
+        initvals,
+        dual_initvals,
+        pool=pool,
+        executor=executor,
+        **kwargs,
+    )
+    if not solution.found:
+        raise ValueError(f"Linear program is not feasible: {solution.status}")
+    return solution.x
+
+
+async def solve_lps_async(
+    C: np.ndarray,
+    G: Union[np.ndarray, spa.spmatrix],
+    H: np.ndarray,
+    A: Optional[Union[np.ndarray, spa.spmatrix]] = None,
+    B: Optional[np.ndarray] = None,
+    solver: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+    pool: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    **kwargs,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve a batch of linear programs without blocking the event loop.
+
+    This is the asynchronous counterpart of :func:`lpsolvers.solve_lps`. The
+    batch is split into consecutive chunks that are solved concurrently.
+
+    Parameters
+    ----------
+    C :
+        Stack of linear cost vectors, of shape ``(k, n)``.
+    G :
+        Stack of linear inequality constraint matrices, or shared matrix.
+    H :
+        Stack of linear inequality constraint vectors, of shape ``(k, m)``.
+    A :
+        Stack of linear equality constraint matrices, or shared matrix.
+    B :
+        Stack of linear equality constraint vectors, of shape ``(k, p)``.
+    solver :
+        Name of the LP solver to choose in :data:`lpsolvers.available_solvers`.
+    n_jobs :
+        Number of chunks, defaulting to the concurrency limit of the kind of
+        worker the solver runs in.
+    pool :
+        Kind of worker in ``["thread", "process"]``, see
+        :func:`solve_problem_async`.
+    executor :
+        Executor to run the chunks in, if any.
+
+    Returns
+    -------
+    :
+        Pair ``(X, found)`` as returned by :func:`lpsolvers.solve_lps`.
+
+    Raises
+    ------
+    ValueError
+        If argument shapes are inconsistent.
+    NoSolverSelected
+        If no solver is selected.
+    SolverNotFound
+        If the requested LP solver is not found.
+
+    Notes
+    -----
+    Cancelling the batch, or an error in one of its chunks, cancels all
+    its chunks.
+    """
+    __check_solver(solver)
+    use_processes = __use_processes(solver, pool)
+    if n_jobs is None:
+        n_jobs = __limits["max_processes" if use_processes else "max_threads"]
+    chunks = _split_batch(C, G, H, A, B, n_jobs)
+    tasks = [
+        asyncio.ensure_future(
+            __run(
+                _solve_chunk,
+                (solver, *chunk, kwargs),
+                use_processes,
+                executor,
+            )
+        )
+        for chunk in chunks
+    ]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:  # don't leave other chunks running
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return _merge_chunks(list(results))
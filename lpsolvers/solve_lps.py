@@ -0,0 +1,479 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Solve batches of linear programs with identical dimensions."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as spa
+
+from .exceptions import NoSolverSelected
+from .lp_solver import make_lp_solver
+from .solvers import available_solvers, get_solve_function
+
+
+def __stack_vectors(
+    name: str, V: Optional[np.ndarray], batch_size: int
+) -> Optional[np.ndarray]:
+    """Broadcast a stack of vectors to the batch size without copying.
+
+    Parameters
+    ----------
+    name :
+        Name of the argument, for error messages.
+    V :
+        Stack of vectors of shape ``(k, m)``, or shared vector of shape
+        ``(m,)``.
+    batch_size :
+        Number ``k`` of problems in the batch.
+
+    Returns
+    -------
+    :
+        Array of shape ``(k, m)``, possibly a read-only view.
+    """
+    if V is None:
+        return None
+    if V.ndim == 1:
+        return np.broadcast_to(V, (batch_size, V.shape[0]))
+    if V.ndim != 2 or V.shape[0] != batch_size:
+        raise ValueError(
+            f"{name} should have shape (m,) or ({batch_size}, m), "
+            f"but has shape {V.shape}"
+        )
+    return V
+
+
+def __check_matrix(
+    name: str,
+    M: Optional[Union[np.ndarray, spa.spmatrix]],
+    batch_size: int,
+    n: int,
+) -> Optional[Union[np.ndarray, spa.spmatrix]]:
+    """Check the shape of a shared or stacked constraint matrix.
+
+    Parameters
+    ----------
+    name :
+        Name of the argument, for error messages.
+    M :
+        Stack of matrices of shape ``(k, m, n)``, or shared matrix of shape
+        ``(m, n)``, which can be sparse.
+    batch_size :
+        Number ``k`` of problems in the batch.
+    n :
+        Number of optimization variables.
+
+    Returns
+    -------
+    :
+        Matrix or stack of matrices, with single-row matrices reshaped.
+    """
+    if M is None:
+        return None
+    if isinstance(M, np.ndarray) and M.ndim == 1:
+        M = M.reshape((1, M.shape[0]))
+    if isinstance(M, np.ndarray) and M.ndim == 3:
+        if M.shape[0] != batch_size or M.shape[2] != n:
+            raise ValueError(
+                f"{name} should have shape ({batch_size}, m, {n}), "
+                f"but has shape {M.shape}"
+            )
+    elif M.ndim != 2 or M.shape[1] != n:
+        raise ValueError(
+            f"{name} should have shape (m, {n}), but has shape {M.shape}"
+        )
+    return M
+
+
+def __get_batch_size(*args) -> int:
+    """Get the number of problems in a batch from its stacked arguments.
+
+    Parameters
+    ----------
+    args :
+        Pairs ``(value, ndim)`` where ``value`` is stacked if its number of
+        dimensions equals ``ndim``.
+
+    Returns
+    -------
+    :
+        Number of problems in the batch, one if no argument is stacked.
+
+    Raises
+    ------
+    ValueError
+        If stacked arguments have different batch sizes.
+    """
+    sizes = {
+        value.shape[0]
+        for value, ndim in args
+        if isinstance(value, np.ndarray) and value.ndim == ndim
+    }
+    if len(sizes) > 1:
+        raise ValueError(f"inconsistent batch sizes {sorted(sizes)}")
+    return sizes.pop() if sizes else 1
+
+
+def _split_batch(
+    C: np.ndarray,
+    G: Optional[Union[np.ndarray, spa.spmatrix]],
+    H: Optional[np.ndarray],
+    A: Optional[Union[np.ndarray, spa.spmatrix]],
+    B: Optional[np.ndarray],
+    nb_chunks: int,
+) -> List[tuple]:
+    """Check the arguments of a batch of linear programs and split it.
+
+    Parameters
+    ----------
+    C :
+        Stack of linear cost vectors.
+    G :
+        Stack of linear inequality constraint matrices, or shared matrix.
+    H :
+        Stack of linear inequality constraint vectors.
+    A :
+        Stack of linear equality constraint matrices, or shared matrix.
+    B :
+        Stack of linear equality constraint vectors.
+    nb_chunks :
+        Maximum number of chunks.
+
+    Returns
+    -------
+    :
+        List of ``(C, G, H, A, B)`` arguments of consecutive chunks, where
+        shared matrices are not copied.
+
+    Raises
+    ------
+    ValueError
+        If argument shapes are inconsistent.
+    """
+    C, G, H, A, B = (
+        M if M is None or spa.issparse(M) else np.asarray(M, dtype=float)
+        for M in (C, G, H, A, B)
+    )
+    batch_size = __get_batch_size((C, 2), (G, 3), (H, 2), (A, 3), (B, 2))
+    n = C.shape[-1]
+    C = __stack_vectors("C", C, batch_size)
+    H = __stack_vectors("H", H, batch_size)
+    B = __stack_vectors("B", B, batch_size)
+    G = __check_matrix("G", G, batch_size, n)
+    A = __check_matrix("A", A, batch_size, n)
+    for name, V, M in (("H", H, G), ("B", B, A)):
+        if V is not None and M is not None and V.shape[1] != M.shape[-2]:
+            raise ValueError(
+                f"{name} should have {M.shape[-2]} columns, one per "
+                f"constraint row, but has shape {V.shape}"
+            )
+    if nb_chunks <= 1 or batch_size <= 1:
+        return [(C, G, H, A, B)]
+
+    def rows(M, indices: np.ndarray):
+        stacked = isinstance(M, np.ndarray) and M.ndim == 3
+        return M[indices] if stacked else M
+
+    return [
+        (
+            C[indices],
+            rows(G, indices),
+            H[indices] if H is not None else None,
+            rows(A, indices),
+            B[indices] if B is not None else None,
+        )
+        for indices in np.array_split(
+            np.arange(batch_size), min(nb_chunks, batch_size)
+        )
+    ]
+
+
+def _merge_chunks(
+    results: List[Tuple[np.ndarray, np.ndarray]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge the results of consecutive chunks of a batch.
+
+    Parameters
+    ----------
+    results :
+        Pairs ``(X, found)`` returned by :func:`_solve_chunk`.
+
+    Returns
+    -------
+    :
+        Pair ``(X, found)`` for the whole batch.
+    """
+    X = np.vstack([X_chunk for X_chunk, _ in results])
+    found = np.hstack([found_chunk for _, found_chunk in results])
+    return X, found
+
+
+def _solve_chunk(
+    solver: str,
+    C: np.ndarray,
+    G: Optional[Union[np.ndarray, spa.spmatrix]],
+    H: Optional[np.ndarray],
+    A: Optional[Union[np.ndarray, spa.spmatrix]],
+    B: Optional[np.ndarray],
+    kwargs: dict,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve a chunk of a batch of linear programs sequentially.
+
+    Parameters
+    ----------
+    solver :
+        Name of the LP solver.
+    C :
+        Stack of cost vectors of shape ``(k, n)``.
+    G :
+        Stack of inequality matrices, or shared inequality matrix.
+    H :
+        Stack of inequality vectors of shape ``(k, m)``.
+    A :
+        Stack of equality matrices, or shared equality matrix.
+    B :
+        Stack of equality vectors.
+    kwargs :
+        Keyword arguments forwarded to the solver.
+
+    Returns
+    -------
+    :
+        Pair ``(X, found)`` of stacked solutions and solution-found mask.
+
+    Notes
+    -----
+    When constraint matrices are shared, they are converted and set up once
+    in a linear program whose vectors are then updated for each problem of
+    the chunk, warm starting from the previous solution.
+    """
+    G_stacked = isinstance(G, np.ndarray) and G.ndim == 3
+    A_stacked = isinstance(A, np.ndarray) and A.ndim == 3
+    X = np.full(C.shape, np.nan)
+    found = np.zeros(C.shape[0], dtype=bool)
+    lp = None
+    for i in range(C.shape[0]):
+        h = H[i] if H is not None else None
+        b = B[i] if B is not None else None
+        if lp is None or G_stacked or A_stacked:
+            lp = make_lp_solver(
+                C[i],
+                G[i] if G_stacked else G,
+                h,
+                A[i] if A_stacked else A,
+                b,
+                solver=solver,
+                **kwargs,
+            )
+        else:
+            lp.update(c=C[i], h=h, b=b)
+        solution = lp.solve_problem()
+        if solution.found:
+            X[i] = solution.x
+            found[i] = True
+    return X, found
+
+
+def solve_lps(
+    C: np.ndarray,
+    G: Union[np.ndarray, spa.spmatrix],
+    H: np.ndarray,
+    A: Optional[Union[np.ndarray, spa.spmatrix]] = None,
+    B: Optional[np.ndarray] = None,
+    solver: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+    pool: str = "thread",
+    **kwargs,
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Solve a batch of linear programs with identical dimensions.
+
+    Each linear program :math:`i` in the batch is defined as:
+
+    .. math::
+
+        \begin{split}\begin{array}{ll}
+            \mbox{minimize} &
+                c_i^T x \\
+            \mbox{subject to}
+                & G_i x \leq h_i \\
+                & A_i x = b_i
+        \end{array}\end{split}
+
+    Vectors are stacked along the first axis of ``C``, ``H`` and ``B``, and
+    matrices along the first axis of ``G`` and ``A``. Any of these arguments
+    can also be shared by all problems in the batch, in which case it is
+    given with one less dimension. Shared matrices can be sparse.
+
+    Parameters
+    ----------
+    C :
+        Stack of linear cost vectors, of shape ``(k, n)``.
+    G :
+        Stack of linear inequality constraint matrices, of shape ``(k, m,
+        n)``, or shared matrix of shape ``(m, n)``.
+    H :
+        Stack of linear inequality constraint vectors, of shape ``(k, m)``.
+    A :
+        Stack of linear equality constraint matrices, of shape ``(k, p,
+        n)``, or shared matrix of shape ``(p, n)``.
+    B :
+        Stack of linear equality constraint vectors, of shape ``(k, p)``.
+    solver :
+        Name of the LP solver to choose in :data:`lpsolvers.available_solvers`,
+        or ``"pdhg"`` to advance the whole batch together with the
+        vectorized engine of :func:`lpsolvers.pdhg_solve_lps`.
+    n_jobs :
+        Number of parallel workers. If ``None`` or one (default), problems are
+        solved sequentially in the calling thread. Negative values count back
+        from the number of CPUs, *e.g.* -1 to use all of them.
+    pool :
+        Kind of worker pool in ``["thread", "process"]``. Threads are cheaper
+        to start, but only run in parallel for solvers that release the GIL.
+
+    Returns
+    -------
+    :
+        Pair ``(X, found)`` where ``X`` is the stack of optimal solutions, of
+        shape ``(k, n)``, and ``found`` is a boolean array of shape ``(k,)``
+        that is ``True`` where a solution was found. Rows of ``X`` where no
+        solution was found are filled with NaNs.
+
+    Raises
+    ------
+    ValueError
+        If argument shapes are inconsistent.
+    SolverNotFound
+        If the requested LP solver is not found.
+
+    Notes
+    -----
+    Extra keyword arguments given to this function are forwarded to the
+    underlying solver, as in :func:`lpsolvers.solve_lp`.
+    """
+    if solver is None:
+        raise NoSolverSelected(
+            "Set the `solver` keyword argument to one of the "
+            f"available solvers in {available_solvers}"
+        )
+    if pool not in ("thread", "process"):
+        raise ValueError(f"unknown pool '{pool}'")
+    if solver == "pdhg":  # vectorized over the batch, no workers needed
+        from .pdhg_ import pdhg_solve_lps
+
+        return pdhg_solve_lps(C, G, H, A, B, **kwargs)
+    get_solve_function(solver)  # raise SolverNotFound before dispatching
+    if n_jobs is not None and n_jobs < 0:
+        n_jobs = max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    if n_jobs is None or n_jobs <= 1:
+        (chunk,) = _split_batch(C, G, H, A, B, 1)
+        return _solve_chunk(solver, *chunk, kwargs)
+    chunks = _split_batch(C, G, H, A, B, n_jobs)
+    if len(chunks) == 1:
+        return _solve_chunk(solver, *chunks[0], kwargs)
+    Executor = ThreadPoolExecutor if pool == "thread" else ProcessPoolExecutor
+    with Executor(max_workers=n_jobs) as executor:
+        futures = [
+            executor.submit(_solve_chunk, solver, *chunk, kwargs)
+            for chunk in chunks
+        ]
+        results = [future.result() for future in futures]
+    return _merge_chunks(results)
+
+
+def solve_lp_multi_cost(
+    C: np.ndarray,
+    G: Optional[Union[np.ndarray, spa.spmatrix]],
+    h: Optional[np.ndarray],
+    A: Optional[Union[np.ndarray, spa.spmatrix]] = None,
+    b: Optional[np.ndarray] = None,
+    solver: Optional[str] = None,
+    lb: Optional[np.ndarray] = None,
+    ub: Optional[np.ndarray] = None,
+    **kwargs,
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Solve linear programs with many cost vectors and shared constraints.
+
+    Each linear program :math:`i` is defined as:
+
+    .. math::
+
+        \begin{split}\begin{array}{ll}
+            \mbox{minimize} &
+                c_i^T x \\
+            \mbox{subject to}
+                & G x \leq h \\
+                & A x = b \\
+                & lb \leq x \leq ub
+        \end{array}\end{split}
+
+    Constraints are converted and set up once in the solver, then each cost
+    vector is solved in turn by updating the cost of the same linear
+    program, as in support function evaluations or polytope projections.
+    Solvers that support warm starting start each solve from the previous
+    solution, and the built-in simplex restarts from the previous optimal
+    basis.
+
+    Parameters
+    ----------
+    C :
+        Stack of linear cost vectors, of shape ``(k, n)``.
+    G :
+        Linear inequality constraint matrix.
+    h :
+        Linear inequality constraint vector.
+    A :
+        Linear equality constraint matrix.
+    b :
+        Linear equality constraint vector.
+    solver :
+        Name of the LP solver to choose in :data:`lpsolvers.available_solvers`,
+        or ``"auto"`` to select one from the features of the problem.
+    lb :
+        Lower bound constraint vector, if any.
+    ub :
+        Upper bound constraint vector, if any.
+
+    Returns
+    -------
+    :
+        Pair ``(X, found)`` where ``X`` is the stack of optimal solutions, of
+        shape ``(k, n)``, and ``found`` is a boolean array of shape ``(k,)``
+        that is ``True`` where a solution was found. Rows of ``X`` where no
+        solution was found are filled with NaNs.
+
+    Raises
+    ------
+    ValueError
+        If the cost vectors are not stacked in a two-dimensional array.
+    SolverNotFound
+        If the requested LP solver is not found.
+
+    Notes
+    -----
+    Extra keyword arguments given to this function are forwarded to the
+    underlying solver, as in :func:`lpsolvers.solve_lp`.
+    """
+    C = np.asarray(C, dtype=float)
+    if C.ndim != 2 or C.shape[0] == 0:
+        raise ValueError(
+            f"C should have shape (k, n) with k > 0, but has shape {C.shape}"
+        )
+    lp = make_lp_solver(
+        C[0], G, h, A, b, solver=solver, lb=lb, ub=ub, **kwargs
+    )
+    X = np.full(C.shape, np.nan)
+    found = np.zeros(C.shape[0], dtype=bool)
+    for i, c in enumerate(C):
+        lp.update(c=c)
+        solution = lp.solve_problem()
+        if solution.found:
+            X[i] = solution.x
+            found[i] = True
+    return X, found
@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Solve linear programs and return their full solutions."""
+
+import time
+import warnings
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .exceptions import NoSolverSelected, SolverTimeout
+from .presolve import presolve_problem
+from .problem import Problem
+from .scaling import scale_problem
+from .selection import select_solver
+from .solution import Solution
+from .solvers import (
+    available_solvers,
+    get_solve_problem_function,
+    native_time_limits,
+)
+
+
+def __solve_presolved(
+    problem: Problem,
+    solve_function,
+    initvals: Optional[np.ndarray],
+    dual_initvals: Optional[np.ndarray],
+    kwargs: dict,
+) -> Solution:
+    """Presolve a linear program, solve it and postsolve its solution.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    solve_function :
+        Function of the solver interface returning a full solution.
+    initvals :
+        Primal initial guess, if any, restricted to kept variables.
+    dual_initvals :
+        Dual initial guess, ignored as presolve changes constraint rows.
+    kwargs :
+        Keyword arguments forwarded to the solver.
+
+    Returns
+    -------
+    :
+        Solution to the original linear program, without dual multipliers.
+        The solution to the reduced problem is reported in its extras. When
+        presolve finds an unbounded variable, the reduced problem is still
+        solved, and the linear program is reported unbounded if it is
+        feasible.
+    """
+    if dual_initvals is not None:
+        warnings.warn(
+            "Dual initial guesses are ignored with presolve, as it changes "
+            "the constraints of the linear program"
+        )
+    start_time = time.perf_counter()
+    reduced, info = presolve_problem(problem)
+    presolve_time = time.perf_counter() - start_time
+    solution = Solution(problem, extras={"presolve": info})
+    if info.status == "infeasible":
+        solution.found = False
+        solution.status = f"presolve: {info.status}"
+        return solution
+    if info.columns.size == 0:  # all variables fixed by presolve
+        reduced_solution = Solution(reduced, found=True, status="presolved")
+        reduced_solution.x = np.empty(0)
+        reduced_solution.conversion_time = 0.0
+        reduced_solution.setup_time = 0.0
+        reduced_solution.solve_time = 0.0
+    else:
+        reduced_solution = solve_function(
+            reduced,
+            initvals=initvals[info.columns] if initvals is not None else None,
+            **kwargs,
+        )
+    solution.extras["reduced_solution"] = reduced_solution
+    solution.found = reduced_solution.found
+    solution.status = reduced_solution.status
+    solution.iter = reduced_solution.iter
+    solution.conversion_time = reduced_solution.conversion_time
+    if solution.conversion_time is not None:
+        solution.conversion_time += presolve_time
+    solution.setup_time = reduced_solution.setup_time
+    solution.solve_time = reduced_solution.solve_time
+    if solution.found and info.status == "unbounded":
+        solution.found = False
+        solution.status = f"presolve: {info.status}"
+    if solution.found:
+        solution.x = info.postsolve(reduced_solution.x)
+        solution.obj = float(problem.c.dot(solution.x))
+    return solution
+
+
+def __scaled(solve_function):
+    """Wrap a solve function to equilibrate problems before solving them.
+
+    Parameters
+    ----------
+    solve_function :
+        Function of the solver interface returning a full solution.
+
+    Returns
+    -------
+    :
+        Function with the same signature, solving the scaled problem with the
+        solver interface and unscaling its solution, including duals.
+    """
+
+    def solve_scaled(
+        problem: Problem,
+        initvals: Optional[np.ndarray] = None,
+        dual_initvals: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> Solution:
+        start_time = time.perf_counter()
+        scaled, info = scale_problem(problem)
+        scaling_time = time.perf_counter() - start_time
+        scaled_solution = solve_function(
+            scaled,
+            initvals=info.scale_primal(initvals)
+            if initvals is not None
+            else None,
+            dual_initvals=info.scale_dual(dual_initvals)
+            if dual_initvals is not None
+            else None,
+            **kwargs,
+        )
+        solution = Solution(
+            problem,
+            extras={"scaling": info, "scaled_solution": scaled_solution},
+            found=scaled_solution.found,
+            status=scaled_solution.status,
+            iter=scaled_solution.iter,
+            conversion_time=scaled_solution.conversion_time,
+            setup_time=scaled_solution.setup_time,
+            solve_time=scaled_solution.solve_time,
+        )
+        if solution.conversion_time is not None:
+            solution.conversion_time += scaling_time
+        if solution.found:
+            solution.x = info.unscale_primal(scaled_solution.x)
+            solution.obj = float(problem.c.dot(solution.x))
+            solution.z, solution.y, solution.z_box = info.unscale_dual(
+                scaled_solution.z, scaled_solution.y, scaled_solution.z_box
+            )
+        return solution
+
+    return solve_scaled
+
+
+def solve_problem(
+    problem: Problem,
+    solver: Optional[Union[str, Sequence[str]]] = None,
+    initvals: Optional[np.ndarray] = None,
+    dual_initvals: Optional[np.ndarray] = None,
+    presolve: bool = False,
+    scale: bool = False,
+    race: bool = False,
+    time_limit: Optional[float] = None,
+    **kwargs,
+) -> Solution:
+    r"""Solve a linear program using one of the available LP solvers.
+
+    Contrary to :func:`lpsolvers.solve_lp`, this function does not raise an
+    exception when no solution is found, and returns along with the primal
+    solution the dual multipliers, the solver status, its number of
+    iterations and timings of its conversion, setup and solve phases.
+
+    Parameters
+    ----------
+    problem :
+        Linear program to solve.
+    solver :
+        Name of the LP solver to choose in :data:`lpsolvers.available_solvers`,
+        or ``"auto"`` to select one from the features of the problem with
+        :func:`lpsolvers.selection.select_solver`.
+    initvals :
+        Primal initial guess, if any, for solvers that support warm starting.
+    dual_initvals :
+        Dual initial guess, if any, stacking multipliers of inequality then
+        equality constraints.
+    presolve :
+        If set, reduce the linear program with
+        :func:`lpsolvers.presolve.presolve_problem` before solving it, and
+        map the solution back to the original variables. Dual multipliers
+        are then not reported, and dual initial guesses are ignored.
+    scale :
+        If set, equilibrate the linear program with
+        :func:`lpsolvers.scaling.scale_problem` before solving it, after
+        presolve if both are enabled, and unscale its solution exactly.
+    race :
+        If set, ``solver`` is a list of solvers that are run in parallel
+        worker processes, see :func:`lpsolvers.race.race_problem`. The first
+        solution found is returned, with the name of the winning solver in
+        its ``"solver"`` extra, and the other solvers are terminated.
+    time_limit :
+        Wall-clock time limit in seconds, if any. Solvers listed in
+        :data:`lpsolvers.solvers.native_time_limits` enforce it natively,
+        while other solvers run in a subprocess that is terminated when the
+        time limit is reached.
+
+    Returns
+    -------
+    :
+        Solution to the linear program returned by the solver.
+
+    Raises
+    ------
+    ProblemError
+        If the linear program is not correctly defined.
+    ValueError
+        If several solvers are given without racing them.
+    SolverTimeout
+        If the solver does not finish within the time limit.
+    SolverNotFound
+        If the requested LP solver is not found.
+    ImportError
+        If the backend of the requested LP solver is not installed.
+
+    Notes
+    -----
+    Extra keyword arguments given to this function are forwarded to the
+    underlying solver, as in :func:`lpsolvers.solve_lp`. When the solver is
+    selected automatically, its name is reported in the ``"solver"`` entry
+    of the solution extras.
+    """
+    if solver is None:
+        raise NoSolverSelected(
+            "Set the `solver` keyword argument to one of the "
+            f"available solvers in {available_solvers}"
+        )
+    problem.check_constraints()
+    if not isinstance(solver, str) and not race:
+        raise ValueError("a list of solvers can only be used with race=True")
+    selected = solver == "auto"
+    if selected:
+        solver = select_solver(problem)
+    supervised = time_limit is not None and solver not in native_time_limits
+    if race or supervised:
+        from .race import race_problem  # which imports this module
+
+        return race_problem(
+            problem,
+            [solver] if isinstance(solver, str) else list(solver),
+            initvals,
+            dual_initvals,
+            time_limit=time_limit,
+            presolve=presolve,
+            scale=scale,
+            **kwargs,
+        )
+    if time_limit is not None:
+        option, timeout_status = native_time_limits[solver]
+        kwargs[option] = time_limit
+    solve_function = get_solve_problem_function(solver)
+    if solver == "cdd":
+        kwargs = {}
+    if scale:
+        solve_function = __scaled(solve_function)
+    if presolve:
+        solution = __solve_presolved(
+            problem, solve_function, initvals, dual_initvals, kwargs
+        )
+    else:
+        solution = solve_function(
+            problem, initvals=initvals, dual_initvals=dual_initvals, **kwargs
+        )
+    if selected:
+        solution.extras["solver"] = solver
+    if time_limit is not None and solution.status == timeout_status:
+        raise SolverTimeout(
+            f"{solver} found no solution within {time_limit} s", solution
+        )
+    return solution
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""Registry of solver interfaces, imported lazily on first use.
+
+Importing a solver interface pulls in its backend library (CVXPY, OR-Tools,
+ProxSuite, ...), which can take seconds. We only check here whether backend
+packages are installed, and import the corresponding interface the first
+time its solve function is requested.
+"""
+
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Callable, Dict, List, Tuple
+
+from .exceptions import SolverNotFound
+
+solver_packages: Dict[str, str] = {
+    "cdd": "cdd",
+    "cvxopt": "cvxopt",
+    "cvxpy": "cvxpy",
+    "highs": "scipy.optimize",
+    "pdlp": "ortools.pdlp",
+    "proxqp": "proxsuite",
+    "simplex": "numpy",
+}
+"""Package required by each solver interface, indexed by solver name."""
+
+solver_class_names: Dict[str, str] = {
+    "cdd": "CddSolver",
+    "cvxopt": "CVXOPTSolver",
+    "cvxpy": "CVXPYSolver",
+    "highs": "HiGHSSolver",
+    "pdlp": "PDLPSolver",
+    "proxqp": "ProxQPSolver",
+    "simplex": "SimplexSolver",
+}
+"""Name of the :class:`LPSolver` class of each solver interface."""
+
+native_time_limits: Dict[str, Tuple[str, str]] = {
+    "highs": ("time_limit", "time limit reached"),
+    "pdlp": ("time_sec_limits", "TERMINATION_REASON_TIME_LIMIT"),
+}
+"""Keyword argument and timeout status of solvers with native time limits.
+
+Other solvers are run in a supervised subprocess when given a time limit.
+"""
+
+thread_safe_solvers: Tuple[str, ...] = ("cvxopt", "pdlp", "proxqp")
+"""Solvers that release the GIL and keep no global state while solving.
+
+Asynchronous solve functions run these solvers on threads, and other solvers
+in worker processes.
+"""
+
+
+def is_installed(package: str) -> bool:
+    """Check whether a package is installed without importing it.
+
+    Parameters
+    ----------
+    package :
+        Name of the package, possibly dotted, *e.g.* ``"ortools.pdlp"``.
+
+    Returns
+    -------
+    :
+        ``True`` if and only if the package can be found.
+    """
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):  # missing parent package
+        return False
+
+
+available_solvers: List[str] = [
+    solver
+    for solver, package in solver_packages.items()
+    if is_installed(package)
+]
+
+solve_function: Dict[str, Callable] = {}
+
+solve_problem_function: Dict[str, Callable] = {}
+
+
+def import_interface(solver: str) -> ModuleType:
+    """Import the interface module of a solver.
+
+    Parameters
+    ----------
+    solver :
+        Name of the solver, *e.g.* ``"cvxopt"``.
+
+    Returns
+    -------
+    :
+        Interface module, *e.g.* ``lpsolvers.cvxopt_``.
+
+    Raises
+    ------
+    SolverNotFound
+        If there is no interface for this solver.
+    ImportError
+        If the backend of the solver is not installed.
+    """
+    if solver not in solver_packages:
+        raise SolverNotFound(f"solver '{solver}' is not available")
+    return importlib.import_module(f".{solver}_", __package__)
+
+
+def get_solve_function(solver: str) -> Callable:
+    """Get the solve function of a solver, importing its interface if needed.
+
+    Parameters
+    ----------
+    solver :
+        Name of the solver, *e.g.* ``"cvxopt"``.
+
+    Returns
+    -------
+    :
+        Function ``{solver}_solve_lp`` of the solver interface.
+
+    Raises
+    ------
+    SolverNotFound
+        If there is no interface for this solver.
+    ImportError
+        If the backend of the solver is not installed.
+    """
+    try:
+        return solve_function[solver]
+    except KeyError:
+        pass
+    module = import_interface(solver)
+    function = getattr(module, f"{solver}_solve_lp")
+    solve_function[solver] = function
+    return function
+
+
+def get_solve_problem_function(solver: str) -> Callable:
+    """Get the function of a solver returning a full :class:`Solution`.
+
+    Parameters
+    ----------
+    solver :
+        Name of the solver, *e.g.* ``"cvxopt"``.
+
+    Returns
+    -------
+    :
+        Function ``{solver}_solve_problem`` of the solver interface.
+
+    Raises
+    ------
+    SolverNotFound
+        If there is no interface for this solver.
+    ImportError
+        If the backend of the solver is not installed.
+    """
+    try:
+        return solve_problem_function[solver]
+    except KeyError:
+        pass
+    module = import_interface(solver)
+    function = getattr(module, f"{solver}_solve_problem")
+    solve_problem_function[solver] = function
+    return function
+
+
+def get_solver_class(solver: str) -> type:
+    """Get the :class:`LPSolver` class of a solver interface.
+
+    Parameters
+    ----------
+    solver :
+        Name of the solver, *e.g.* ``"cvxopt"``.
+
+    Returns
+    -------
+    :
+        Class keeping linear programs alive between solves with this solver.
+
+    Raises
+    ------
+    SolverNotFound
+        If there is no interface for this solver.
+    ImportError
+        If the backend of the solver is not installed.
+    """
+    module = import_interface(solver)
+    return getattr(module, solver_class_names[solver])
+
+
+def get_missing_solve_function(solver: str, error: ImportError) -> Callable:
+    """Get a placeholder for a solve function whose backend is missing.
+
+    Parameters
+    ----------
+    solver :
+        Name of the solver, *e.g.* ``"cvxopt"``.
+    error :
+        Error raised when importing the solver interface.
+
+    Returns
+    -------
+    :
+        Function raising an ``ImportError`` when called.
+    """
+
+    def solve_lp(*args, **kwargs):
+        """Error function defined when the solver is not available."""
+        raise ImportError(f"{solver} not found") from error
+
+    solve_lp.__name__ = f"{solver}_solve_lp"
+    return solve_lp
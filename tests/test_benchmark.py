@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for the benchmark suite.
+"""
+
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import available_solvers
+from lpsolvers.benchmark import (
+    BenchmarkResult,
+    families,
+    format_summary,
+    format_table,
+    generate_problem,
+    run_benchmark,
+    run_case,
+    write_csv,
+)
+from lpsolvers.benchmark.__main__ import main
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Test fixture for the benchmark suite.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+
+    def test_generate_problem(self):
+        """
+        Generated problems have the requested sizes and formats.
+        """
+        for family in families:
+            dense = generate_problem(family, 20, "dense")
+            sparse = generate_problem(family, 20, "sparse")
+            self.assertEqual(dense.problem.c.shape, (20,))
+            self.assertIsInstance(dense.problem.G, np.ndarray)
+            self.assertTrue(spa.issparse(sparse.problem.G))
+            self.assertEqual(dense.problem.A.shape, (5, 20))
+            self.assertEqual(dense.has_solution, family == "feasible")
+
+    def test_generate_problem_seed(self):
+        """
+        Generated problems only depend on their seed.
+        """
+        first = generate_problem("feasible", 10, "dense", seed=1)
+        second = generate_problem("feasible", 10, "dense", seed=1)
+        third = generate_problem("feasible", 10, "dense", seed=2)
+        self.assertTrue(np.allclose(first.problem.G, second.problem.G))
+        self.assertFalse(np.allclose(first.problem.G, third.problem.G))
+
+    def test_generate_problem_errors(self):
+        """
+        Unknown families or formats raise a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            generate_problem("unknown", 10)
+        with self.assertRaises(ValueError):
+            generate_problem("feasible", 10, "unknown")
+
+    def test_feasible_point(self):
+        """
+        Feasible problems have an interior point within their bounds.
+        """
+        problem = generate_problem("feasible", 50, "sparse").problem
+        self.assertTrue(np.all(problem.lb < 0.0))
+        self.assertTrue(np.all(problem.ub > 0.0))
+
+    def test_write_csv(self):
+        """
+        CSV output has one row per result, after a header.
+        """
+        results = [
+            BenchmarkResult("cvxopt", "feasible", "dense", 10, 0),
+            BenchmarkResult("cvxopt", "feasible", "sparse", 10, 0),
+        ]
+        output = io.StringIO()
+        write_csv(results, output, version="1.2.3")
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0][:3], ["version", "solver", "family"])
+        self.assertEqual(rows[1][:3], ["1.2.3", "cvxopt", "feasible"])
+
+    def test_format(self):
+        """
+        Tables and summaries have one line per result or solver.
+        """
+        results = [
+            BenchmarkResult("cvxopt", "feasible", "dense", 10, 0),
+            BenchmarkResult(
+                "cvxopt", "feasible", "sparse", 10, 0, success=True
+            ),
+        ]
+        results[0].run_time = results[1].run_time = 1e-3
+        self.assertEqual(len(format_table(results).splitlines()), 3)
+        summary = format_summary(results).splitlines()
+        self.assertEqual(len(summary), 2)
+        self.assertIn("50.0%", summary[1])
+
+    def test_main(self):
+        """
+        Run the command-line interface on a tiny benchmark.
+        """
+        if not available_solvers:
+            return
+        solver = available_solvers[0]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "results.csv")
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                main(
+                    [
+                        "--solvers",
+                        solver,
+                        "--families",
+                        "feasible",
+                        "--formats",
+                        "dense",
+                        "--sizes",
+                        "5",
+                        "--no-memory",
+                        "--quiet",
+                        "--csv",
+                        path,
+                    ]
+                )
+            with open(path) as file:
+                rows = list(csv.DictReader(file))
+        self.assertIn(solver, stdout.getvalue())
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["solver"], solver)
+        self.assertEqual(rows[0]["n"], "5")
+
+    @staticmethod
+    def get_test_run_case(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            benchmark = generate_problem("feasible", 10, "sparse")
+            kwargs = {"eps_primal_inf": 1e-12} if solver == "proxqp" else {}
+            result = run_case(benchmark, solver, repeats=2, **kwargs)
+            self.assertTrue(result.found, result.status)
+            self.assertTrue(result.success)
+            self.assertGreater(result.run_time, 0.0)
+            self.assertGreater(result.peak_memory, 0.0)
+            self.assertLess(result.primal_residual, 1e-3)
+
+        return test
+
+    @staticmethod
+    def get_test_infeasible(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            results = run_benchmark(
+                [solver],
+                families=["infeasible"],
+                formats=["dense"],
+                sizes=[10],
+                trace_memory=False,
+            )
+            self.assertEqual(len(results), 1)
+            self.assertFalse(results[0].found)
+            self.assertTrue(results[0].success)
+
+        return test
+
+
+for solver in available_solvers:
+    setattr(
+        TestBenchmark,
+        f"test_run_case_{solver}",
+        TestBenchmark.get_test_run_case(solver),
+    )
+    setattr(
+        TestBenchmark,
+        f"test_infeasible_{solver}",
+        TestBenchmark.get_test_infeasible(solver),
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()
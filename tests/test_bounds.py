@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for lower and upper bounds on optimization variables.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import (
+    Problem,
+    ProblemError,
+    Solution,
+    available_solvers,
+    solve_lp,
+    solve_problem,
+)
+from lpsolvers.conversions import (
+    linear_from_box_inequalities,
+    split_dual_linear_box,
+)
+
+
+class TestBounds(unittest.TestCase):
+    """
+    Test fixture for linear programs with variable bounds.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, -2.0, 1.0])
+        self.G = np.array([[1.0, 1.0, 1.0], [-1.0, 2.0, 0.0]])
+        self.h = np.array([4.0, 3.0])
+        self.A = np.array([[1.0, 0.0, -1.0]])
+        self.b = np.array([0.0])
+        self.lb = np.array([-0.5, -np.inf, -0.5])
+        self.ub = np.array([np.inf, 1.0, 3.0])
+
+    def test_problem_check_bounds(self):
+        """
+        Bounds of the wrong shape are reported by the problem check.
+        """
+        problem = Problem(self.c, self.G, self.h, lb=np.zeros(2))
+        with self.assertRaises(ProblemError):
+            problem.check_constraints()
+
+    def test_linear_from_box_inequalities(self):
+        """
+        Only finite bounds are converted to inequality rows.
+        """
+        G, h = linear_from_box_inequalities(
+            self.G, self.h, self.lb, self.ub, 3, use_sparse=False
+        )
+        self.assertEqual(G.shape, (6, 3))
+        self.assertTrue(np.allclose(h[2:], [0.5, 0.5, 1.0, 3.0]))
+        G_sparse, _ = linear_from_box_inequalities(
+            self.G, self.h, self.lb, self.ub, 3, use_sparse=True
+        )
+        self.assertTrue(spa.issparse(G_sparse))
+        self.assertTrue(np.allclose(G_sparse.toarray(), G))
+        z, z_box = split_dual_linear_box(
+            np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]), self.lb, self.ub, 3
+        )
+        self.assertTrue(np.allclose(z, [1.0, 2.0]))
+        self.assertTrue(np.allclose(z_box, [-3.0, 5.0, 2.0]))
+
+    def test_duality_gap_infinite_bounds(self):
+        """
+        Multipliers on infinite bounds do not make the duality gap infinite.
+        """
+        problem = Problem(
+            np.array([1.0, -1.0, 0.0]),
+            None,
+            None,
+            lb=np.array([0.0, -np.inf, -np.inf]),
+            ub=np.array([np.inf, 1.0, 2.0]),
+        )
+        solution = Solution(problem, found=True)
+        solution.x = np.array([0.0, 1.0, 0.0])
+        solution.z_box = np.array([-1.0, 1.0, -1e-12])
+        self.assertAlmostEqual(solution.duality_gap(), 0.0)
+        self.assertTrue(solution.is_optimal(1e-9))
+
+    @staticmethod
+    def get_test_bounds(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            G, h = linear_from_box_inequalities(
+                self.G, self.h, self.lb, self.ub, 3, use_sparse=False
+            )
+            x_rows = solve_lp(self.c, G, h, self.A, self.b, solver=solver)
+            x = solve_lp(
+                self.c,
+                self.G,
+                self.h,
+                self.A,
+                self.b,
+                solver=solver,
+                lb=self.lb,
+                ub=self.ub,
+            )
+            self.assertTrue(np.allclose(x, x_rows, atol=1e-4))
+            self.assertTrue(np.allclose(x, [-0.5, 1.0, -0.5], atol=1e-4))
+
+        return test
+
+    @staticmethod
+    def get_test_duals(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            problem = Problem(
+                self.c, self.G, self.h, self.A, self.b, self.lb, self.ub
+            )
+            solution = solve_problem(problem, solver=solver)
+            self.assertTrue(solution.found)
+            self.assertIsNotNone(solution.z_box)
+            self.assertEqual(solution.z.shape, (2,))
+            self.assertLess(solution.z_box[0] + solution.z_box[2], 0.0)
+            self.assertGreater(solution.z_box[1], 0.0)
+            self.assertTrue(solution.is_optimal(1e-4))
+
+        return test
+
+    @staticmethod
+    def get_test_bounds_only(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            x = solve_lp(
+                self.c,
+                None,
+                None,
+                solver=solver,
+                lb=np.zeros(3),
+                ub=np.full(3, 2.0),
+            )
+            self.assertTrue(np.allclose(x, [0.0, 2.0, 0.0], atol=1e-4))
+
+        return test
+
+    @staticmethod
+    def get_test_sparse(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            x = solve_lp(
+                self.c,
+                spa.csc_matrix(self.G),
+                self.h,
+                spa.csc_matrix(self.A),
+                self.b,
+                solver=solver,
+                lb=self.lb,
+                ub=self.ub,
+            )
+            self.assertTrue(np.allclose(x, [-0.5, 1.0, -0.5], atol=1e-4))
+
+        return test
+
+    @staticmethod
+    def get_test_random(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            rng = np.random.default_rng(42)
+            for _ in range(20):
+                n, m, p = 8, 6, rng.integers(3)
+                c = rng.standard_normal(n)
+                lb = rng.uniform(-3.0, 0.0, n)
+                ub = rng.uniform(0.0, 3.0, n)
+                lb[rng.random(n) < 0.3] = -np.inf
+                ub[rng.random(n) < 0.3] = np.inf
+                x0 = np.clip(rng.uniform(-1.0, 1.0, n), lb, ub)
+                G = rng.standard_normal((m, n))
+                h = G @ x0 + rng.uniform(0.0, 1.0, m)
+                A = rng.standard_normal((p, n)) if p > 0 else None
+                b = A @ x0 if p > 0 else None
+                problem = Problem(c, G, h, A, b, lb, ub)
+                reference = solve_problem(problem, solver="highs")
+                if not reference.found:  # unbounded
+                    continue
+                solution = solve_problem(problem, solver=solver)
+                self.assertTrue(solution.found)
+                self.assertAlmostEqual(
+                    solution.obj,
+                    reference.obj,
+                    delta=1e-4 * max(1.0, abs(reference.obj)),
+                )
+
+        return test
+
+
+for solver in available_solvers:
+    setattr(
+        TestBounds,
+        f"test_bounds_{solver}",
+        TestBounds.get_test_bounds(solver),
+    )
+    setattr(
+        TestBounds,
+        f"test_duals_{solver}",
+        TestBounds.get_test_duals(solver),
+    )
+    setattr(
+        TestBounds,
+        f"test_bounds_only_{solver}",
+        TestBounds.get_test_bounds_only(solver),
+    )
+    setattr(
+        TestBounds,
+        f"test_sparse_{solver}",
+        TestBounds.get_test_sparse(solver),
+    )
+    if solver != "highs" and "highs" in available_solvers:
+        setattr(
+            TestBounds,
+            f"test_random_{solver}",
+            TestBounds.get_test_random(solver),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
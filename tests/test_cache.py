@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for the cache of linear program solutions.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import LPCache, NoSolverSelected, Problem, available_solvers
+from lpsolvers.cache import problem_fingerprint
+
+
+class TestCache(unittest.TestCase):
+    """
+    Test fixture for the cache of linear program solutions.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+
+    def test_fingerprint(self):
+        """
+        Data keys depend on values, structure keys only on dimensions and
+        sparsity patterns.
+        """
+        problem = Problem(self.c, self.G, self.h)
+        data_key, structure_key = problem_fingerprint(problem)
+        same_key, _ = problem_fingerprint(
+            Problem(self.c.copy(), self.G.copy(), self.h.copy())
+        )
+        self.assertEqual(data_key, same_key)
+        other_key, other_structure = problem_fingerprint(
+            Problem(self.c + 1.0, self.G, self.h)
+        )
+        self.assertNotEqual(data_key, other_key)
+        self.assertEqual(structure_key, other_structure)
+        _, bounded_structure = problem_fingerprint(
+            Problem(self.c, self.G, self.h, lb=np.zeros(3))
+        )
+        self.assertNotEqual(structure_key, bounded_structure)
+
+    def test_fingerprint_sparse(self):
+        """
+        Sparse index arrays are part of the structure key.
+        """
+        G = spa.csc_matrix(self.G)
+        _, structure_key = problem_fingerprint(Problem(self.c, G, self.h))
+        G_other = G.copy()
+        G_other.data[0] = 0.0
+        G_other.eliminate_zeros()
+        _, other_structure = problem_fingerprint(
+            Problem(self.c, G_other, self.h)
+        )
+        self.assertNotEqual(structure_key, other_structure)
+        _, scaled_structure = problem_fingerprint(
+            Problem(self.c, 2.0 * G, self.h)
+        )
+        self.assertEqual(structure_key, scaled_structure)
+
+    def test_no_solver(self):
+        """
+        Raise an exception when no solver is selected.
+        """
+        with self.assertRaises(NoSolverSelected):
+            LPCache().solve_lp(self.c, self.G, self.h)
+
+    def test_invalid_size(self):
+        """
+        Cache sizes should be positive.
+        """
+        with self.assertRaises(ValueError):
+            LPCache(maxsize=0)
+
+    @staticmethod
+    def get_test_hits(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            cache = LPCache()
+            x = cache.solve_lp(self.c, self.G, self.h, solver=solver)
+            x[:] = 0.0  # returned arrays are not shared with the cache
+            x = cache.solve_lp(self.c, self.G, self.h, solver=solver)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-4))
+            cache.solve_lp(self.c, self.G, self.h.copy(), solver=solver)
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+            cache.solve_lp(self.c + 0.1, self.G, self.h, solver=solver)
+            self.assertEqual((cache.hits, cache.misses), (2, 2))
+            self.assertEqual(len(cache), 2)
+
+        return test
+
+    @staticmethod
+    def get_test_eviction(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            cache = LPCache(maxsize=2)
+            costs = [self.c, self.c + 0.1, self.c + 0.2]
+            cache.solve_lp(costs[0], self.G, self.h, solver=solver)
+            cache.solve_lp(costs[1], self.G, self.h, solver=solver)
+            cache.solve_lp(costs[0], self.G, self.h, solver=solver)  # hit
+            cache.solve_lp(costs[2], self.G, self.h, solver=solver)
+            self.assertEqual(len(cache), 2)
+            cache.solve_lp(costs[0], self.G, self.h, solver=solver)  # hit
+            cache.solve_lp(costs[1], self.G, self.h, solver=solver)  # evicted
+            self.assertEqual((cache.hits, cache.misses), (2, 4))
+            cache.clear()
+            self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+        return test
+
+    @staticmethod
+    def get_test_warm_start(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            cache = LPCache(warm_start=True)
+            cache.solve_lp(self.c, self.G, self.h, solver=solver)
+            self.assertEqual(cache.warm_starts, 0)
+            x = cache.solve_lp(self.c + 0.01, self.G, self.h, solver=solver)
+            self.assertEqual(cache.warm_starts, 1)
+            self.assertEqual(cache.misses, 2)
+            self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-4))
+
+        return test
+
+    @staticmethod
+    def get_test_kwargs(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            cache = LPCache()
+            problem = Problem(self.c, self.G, self.h)
+            cache.solve_problem(problem, solver)
+            cache.solve_problem(problem, solver, presolve=True)
+            self.assertEqual((cache.hits, cache.misses), (0, 2))
+            solution = cache.solve_problem(problem, solver, presolve=True)
+            self.assertIn("presolve", solution.extras)
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        return test
+
+
+for solver in available_solvers:
+    setattr(TestCache, f"test_hits_{solver}", TestCache.get_test_hits(solver))
+    setattr(
+        TestCache,
+        f"test_eviction_{solver}",
+        TestCache.get_test_eviction(solver),
+    )
+    setattr(
+        TestCache,
+        f"test_warm_start_{solver}",
+        TestCache.get_test_warm_start(solver),
+    )
+    setattr(
+        TestCache,
+        f"test_kwargs_{solver}",
+        TestCache.get_test_kwargs(solver),
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests specific to the CVXOPT solver interface.
+"""
+
+import unittest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from lpsolvers import available_solvers, solve_lp
+
+
+@unittest.skipIf("cvxopt" not in available_solvers, "CVXOPT is not installed")
+class TestCVXOPT(unittest.TestCase):
+    """
+    Test fixture for the CVXOPT solver interface.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+
+    def test_global_options_untouched(self):
+        """
+        Solver options are passed per call, leaving global options as is.
+        """
+        import cvxopt.solvers
+
+        options = dict(cvxopt.solvers.options)
+        x = solve_lp(
+            self.c, self.G, self.h, solver="cvxopt", maxiters=50, glpk={}
+        )
+        self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-4))
+        self.assertEqual(cvxopt.solvers.options, options)
+
+    def test_per_call_options(self):
+        """
+        Options of one call do not leak into the next one.
+        """
+        from lpsolvers.cvxopt_ import cvxopt_solve_problem
+        from lpsolvers.problem import Problem
+
+        problem = Problem(self.c, self.G, self.h)
+        solution = cvxopt_solve_problem(problem, solver=None, maxiters=1)
+        self.assertFalse(solution.found)
+        self.assertEqual(solution.iter, 1)
+        solution = cvxopt_solve_problem(problem, solver=None)
+        self.assertTrue(solution.found)
+        self.assertGreater(solution.iter, 1)
+
+    def test_options(self):
+        """
+        Options are merged over the defaults, including GLPK options.
+        """
+        from lpsolvers.cvxopt_ import cvxopt_options, default_options
+
+        options = cvxopt_options(
+            options={"abstol": 1e-9, "show_progress": True}, reltol=1e-8
+        )
+        self.assertEqual(options["abstol"], 1e-9)
+        self.assertEqual(options["reltol"], 1e-8)
+        self.assertTrue(options["show_progress"])
+        self.assertFalse(default_options["show_progress"])
+        if "glpk" in default_options:
+            options = cvxopt_options(glpk={"tm_lim": 1000})
+            self.assertEqual(options["glpk"]["tm_lim"], 1000)
+            self.assertEqual(options["glpk"]["msg_lev"], "GLP_MSG_OFF")
+
+    def test_concurrent_threads(self):
+        """
+        Concurrent calls with different options from many threads return the
+        same solutions as sequential calls.
+        """
+        from lpsolvers.cvxopt_ import cvxopt_solve_lp
+
+        rng = np.random.default_rng(42)
+        n, m = 20, 40
+        problems = []
+        for _ in range(32):
+            G = rng.standard_normal((m, n))
+            h = G @ rng.standard_normal(n) + rng.uniform(0.1, 1.0, m)
+            c = -G.T @ rng.uniform(0.1, 1.0, m)  # bounded below
+            problems.append((c, G, h))
+
+        def solve(i: int) -> np.ndarray:
+            c, G, h = problems[i]
+            if i % 2 == 0:  # default solver, GLPK if available
+                return cvxopt_solve_lp(c, G, h)
+            return cvxopt_solve_lp(
+                c, G, h, solver=None, feastol=1e-8, abstol=1e-8, reltol=1e-8
+            )
+
+        expected = [solve(i) for i in range(len(problems))]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(solve, range(len(problems))))
+        for x, x_expected in zip(results, expected):
+            self.assertTrue(np.allclose(x, x_expected, atol=1e-6))
+
+
+if __name__ == "__main__":
+    unittest.main()
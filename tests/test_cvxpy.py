@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests specific to the CVXPY solver interface.
+"""
+
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import Problem, available_solvers, solve_lp, solve_problem
+
+
+@unittest.skipIf("cvxpy" not in available_solvers, "CVXPY is not installed")
+class TestCVXPY(unittest.TestCase):
+    """
+    Test fixture for the CVXPY solver interface.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        from lpsolvers.cvxpy_ import problem_cache
+
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.cache = problem_cache
+        self.cache.clear()
+        self.c = np.array([1.0, 2.0, 3.0])
+        G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.G = np.vstack([G, np.eye(3), -np.eye(3)])
+        self.h = np.hstack([[4.0, 1.0, 3.0, 2.0], 5.0 * np.ones(6)])
+
+    def tearDown(self):
+        """
+        Restore the default cache.
+        """
+        self.cache.max_bytes = 2**28
+        self.cache.maxsize = 32
+        self.cache.clear()
+
+    def assert_solves(self, c, G, h, A=None, b=None, lb=None, ub=None):
+        """
+        Check that CVXPY finds the same optimum as HiGHS.
+        """
+        x = solve_lp(c, G, h, A, b, solver="cvxpy", lb=lb, ub=ub)
+        x_ref = solve_lp(c, G, h, A, b, solver="highs", lb=lb, ub=ub)
+        self.assertAlmostEqual(c @ x, c @ x_ref, places=5)
+
+    def test_same_structure(self):
+        """
+        Linear programs with the same structure reuse a cached problem,
+        including when values of dense constraint matrices change.
+        """
+        rng = np.random.default_rng(42)
+        A = np.array([[1.0, 1.0, 1.0]])
+        lb = np.array([-4.0, -np.inf, -4.0])
+        ub = np.array([np.inf, 1.0, np.inf])
+        for _ in range(3):
+            G = self.G + 0.1 * rng.standard_normal(self.G.shape)
+            c = self.c + rng.standard_normal(3)
+            self.assert_solves(c, G, self.h, A, np.array([-2.0]), lb, ub)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 2)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_different_structures(self):
+        """
+        Changes in dimensions, matrix formats or finite bounds build new
+        problems.
+        """
+        lb = np.array([-1.0, -np.inf, -np.inf])
+        for G, h, kwargs in (
+            (self.G, self.h, {}),
+            (self.G[1:], self.h[1:], {"lb": lb}),
+            (self.G.astype(np.float32), self.h, {}),
+            (self.G, self.h, {"lb": lb}),
+        ):
+            self.assert_solves(self.c, G, h, **kwargs)
+        self.assertEqual(self.cache.misses, 4)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(len(self.cache), 4)
+
+    def test_constant_matrices(self):
+        """
+        Problems with sparse or large constraint matrices, which are
+        constants of their problems, are not cached.
+        """
+        G_sparse = spa.csc_matrix(self.G)
+        for G in (G_sparse, G_sparse, 2.0 * G_sparse):
+            self.assert_solves(self.c, G, self.h)
+        with mock.patch("lpsolvers.cvxpy_.MAX_PARAMETER_ENTRIES", 10):
+            self.assert_solves(self.c, self.G, self.h)
+        self.assertEqual(self.cache.misses, 4)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.nbytes, 0)
+
+    def test_eviction(self):
+        """
+        The cache keeps its most recently used problems up to its maximum
+        size, and a size of zero disables it.
+        """
+        self.cache.maxsize = 2
+        for k in (0, 1, 2):
+            solve_lp(self.c, self.G[k:], self.h[k:], solver="cvxpy")
+        self.assertEqual(len(self.cache), 2)
+        solve_lp(self.c, self.G, self.h, solver="cvxpy")
+        self.assertEqual(self.cache.misses, 4)
+        self.cache.maxsize = 0
+        solve_lp(self.c, self.G[2:], self.h[2:], solver="cvxpy")
+        self.assertEqual(len(self.cache), 0)
+        self.cache.clear()
+        self.assertEqual(self.cache.hits + self.cache.misses, 0)
+        with self.assertRaises(ValueError):
+            type(self.cache)(maxsize=-1)
+
+    def test_memory_bound(self):
+        """
+        The cache evicts its least recently used problems beyond its memory
+        budget.
+        """
+        solve_lp(self.c, self.G, self.h, solver="cvxpy")
+        nbytes = self.cache.nbytes
+        self.assertGreater(nbytes, 0)
+        self.cache.max_bytes = nbytes
+        solve_lp(self.c, self.G[1:], self.h[1:], solver="cvxpy")
+        self.assertEqual(len(self.cache), 1)
+        self.assertLessEqual(self.cache.nbytes, self.cache.max_bytes)
+        solve_lp(self.c, self.G, self.h, solver="cvxpy")
+        self.assertEqual(self.cache.misses, 3)
+        self.cache.max_bytes = 0
+        solve_lp(self.c, self.G, self.h, solver="cvxpy")
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.nbytes, 0)
+        with self.assertRaises(ValueError):
+            type(self.cache)(max_bytes=-1)
+
+    def test_solution_problem(self):
+        """
+        Solutions from cached problems refer to the problem they solve.
+        """
+        first = Problem(self.c, self.G, self.h)
+        second = Problem(-self.c, self.G, self.h + 1.0)
+        solve_problem(first, solver="cvxpy")
+        solution = solve_problem(second, solver="cvxpy")
+        self.assertIs(solution.problem, second)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertLess(solution.primal_residual(), 1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
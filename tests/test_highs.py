@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests specific to the HiGHS solver interface.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import (
+    InfeasibleProblem,
+    Problem,
+    ProblemError,
+    UnboundedProblem,
+    available_solvers,
+    highs_solve_lp,
+    solve_lp,
+    solve_problem,
+)
+from lpsolvers.exceptions import SolverTimeout
+
+
+@unittest.skipIf("highs" not in available_solvers, "HiGHS is not installed")
+class TestHiGHS(unittest.TestCase):
+    """
+    Test fixture for the HiGHS solver interface.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+        self.A = np.array([[1.0, 1.0, 1.0]])
+        self.b = np.array([-2.0])
+
+    def test_methods(self):
+        """
+        All HiGHS methods find the same solution, with dense or sparse
+        matrices.
+        """
+        for method in ("highs", "highs-ds", "highs-ipm"):
+            for G in (self.G, spa.csc_matrix(self.G)):
+                x = solve_lp(self.c, G, self.h, solver="highs", method=method)
+                self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-6))
+        with self.assertRaises(ValueError):
+            solve_lp(self.c, self.G, self.h, solver="highs", method="simplex")
+
+    def test_duals(self):
+        """
+        Dual multipliers follow the sign conventions of lpsolvers.
+        """
+        lb = np.array([-np.inf, -0.5, -np.inf])
+        ub = np.array([1.9, np.inf, np.inf])
+        problem = Problem(self.c, self.G, self.h, self.A, self.b, lb, ub)
+        solution = solve_problem(problem, solver="highs")
+        self.assertTrue(solution.found)
+        self.assertEqual(solution.status, "optimal")
+        self.assertTrue(np.allclose(solution.x, [1.75, -0.5, -3.25]))
+        self.assertTrue(np.all(solution.z >= -1e-9))
+        self.assertGreater(np.abs(solution.z_box).max(), 1e-6)
+        self.assertTrue(
+            np.allclose(
+                self.c
+                + self.G.T @ solution.z
+                + self.A.T @ solution.y
+                + solution.z_box,
+                0.0,
+                atol=1e-8,
+            )
+        )
+
+    def test_statuses(self):
+        """
+        Infeasible and unbounded problems are reported as such.
+        """
+        infeasible = Problem(
+            self.c,
+            np.vstack([self.G, -self.G[:1]]),
+            np.hstack([self.h, [-5.0]]),
+        )
+        unbounded = Problem(-self.c, self.G[:1], self.h[:1])
+        for problem, status in (
+            (infeasible, "infeasible"),
+            (unbounded, "unbounded"),
+        ):
+            solution = solve_problem(problem, solver="highs")
+            self.assertFalse(solution.found)
+            self.assertEqual(solution.status, status)
+        with self.assertRaises(ValueError):
+            solve_lp(*infeasible.unpack()[:3], solver="highs")
+
+    def test_exceptions(self):
+        """
+        Statuses of HiGHS are raised as lpsolvers exceptions.
+        """
+        G = np.vstack([self.G, -self.G[:1]])
+        h = np.hstack([self.h, [-5.0]])
+        with self.assertRaises(InfeasibleProblem):
+            highs_solve_lp(self.c, G, h)
+        with self.assertRaises(UnboundedProblem):
+            highs_solve_lp(-self.c, self.G[:1], self.h[:1])
+        with self.assertRaises(ProblemError):
+            highs_solve_lp(-self.c, self.G[:1], self.h[:1])
+        c, G, h, _, _, lb, ub = self.large_problem().unpack()
+        with self.assertRaises(SolverTimeout) as context:
+            highs_solve_lp(c, G, h, lb=lb, ub=ub, time_limit=1e-4)
+        self.assertEqual(
+            context.exception.solution.status, "time limit reached"
+        )
+        with self.assertRaises(ValueError) as context:
+            highs_solve_lp(c, G, h, lb=lb, ub=ub, maxiter=1)
+        self.assertIn("iteration limit reached", str(context.exception))
+
+    def large_problem(self) -> Problem:
+        """
+        Build a problem that HiGHS does not solve within a tiny time limit.
+        """
+        rng = np.random.default_rng(0)
+        n = 2000
+        G = spa.random(n, n, density=0.01, random_state=rng, format="csc")
+        return Problem(
+            rng.standard_normal(n),
+            G,
+            np.ones(n),
+            lb=-np.ones(n),
+            ub=np.ones(n),
+        )
+
+    def test_time_limit(self):
+        """
+        Time limits are enforced natively by HiGHS.
+        """
+        with self.assertRaises(SolverTimeout) as context:
+            solve_problem(self.large_problem(), "highs", time_limit=1e-4)
+        self.assertEqual(
+            context.exception.solution.status, "time limit reached"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for reading and writing linear programs in MPS format.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import Problem, available_solvers, solve_problem
+from lpsolvers.exceptions import MPSError
+from lpsolvers.io import read_mps, write_mps
+
+FREE_MPS = """* Test problem in free MPS format
+NAME TEST
+OBJSENSE
+    MAX
+ROWS
+ N cost
+ L lim1
+ G lim2
+ E myeqn
+ L ranged
+ N other
+COLUMNS
+ x cost -1 lim1 1
+ x lim2 1 other 3.0
+ y cost -2 lim1 1
+ y myeqn -1 ranged 2
+ z cost 1 myeqn 1
+RHS
+ rhs lim1 4 lim2 1
+ rhs myeqn 7 ranged 3
+ rhs cost 10
+RANGES
+ rng ranged 2.5
+BOUNDS
+ UP bnd x 4
+ MI bnd y
+ UP bnd y 1
+ FR bnd z
+ENDATA
+"""
+
+FIXED_MPS = """NAME          FIXED
+ROWS
+ N  COST
+ L  LIM1
+ E  EQN
+COLUMNS
+    X         COST         1.0   LIM1         1.0
+    X         EQN          1.0
+    Y         COST         2.0   LIM1         1.0
+RHS
+    RHS       LIM1         4.0   EQN          1.0
+BOUNDS
+ UP BND       X           -1.0
+ENDATA
+"""
+
+
+class TestIO(unittest.TestCase):
+    """
+    Test fixture for MPS files.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        rng = np.random.default_rng(42)
+        n = 20
+        G = spa.random(15, n, density=0.3, format="csc", random_state=rng)
+        A = spa.random(4, n, density=0.3, format="csc", random_state=rng)
+        x = rng.uniform(-0.5, 0.5, n)
+        lb, ub = -np.ones(n), np.ones(n)
+        lb[:3] = -np.inf
+        ub[3:6] = np.inf
+        lb[6] = ub[6] = 0.25
+        self.problem = Problem(
+            rng.standard_normal(n),
+            G,
+            G @ x + rng.uniform(0.1, 1.0, 15),
+            A,
+            A @ x,
+            lb,
+            ub,
+        )
+
+    def test_read_free(self):
+        """
+        Read a free MPS file with all row and bound types.
+        """
+        problem = read_mps(io.StringIO(FREE_MPS))
+        c, G, h, A, b, lb, ub = problem.unpack()
+        self.assertTrue(np.allclose(c, [1.0, 2.0, -1.0]))
+        self.assertTrue(spa.isspmatrix_csc(G))
+        self.assertTrue(spa.isspmatrix_csc(A))
+        self.assertTrue(
+            np.allclose(
+                G.toarray(),
+                [
+                    [1.0, 1.0, 0.0],
+                    [-1.0, 0.0, 0.0],
+                    [0.0, 2.0, 0.0],
+                    [0.0, -2.0, 0.0],
+                ],
+            )
+        )
+        self.assertTrue(np.allclose(h, [4.0, -1.0, 3.0, -0.5]))
+        self.assertTrue(np.allclose(A.toarray(), [[0.0, -1.0, 1.0]]))
+        self.assertTrue(np.allclose(b, [7.0]))
+        self.assertTrue(np.allclose(lb, [0.0, -np.inf, -np.inf]))
+        self.assertTrue(np.allclose(ub, [4.0, 1.0, np.inf]))
+
+    def test_read_fixed(self):
+        """
+        Read a fixed MPS file, with a negative upper bound.
+        """
+        problem = read_mps(io.StringIO(FIXED_MPS))
+        c, G, h, A, b, lb, ub = problem.unpack()
+        self.assertTrue(np.allclose(c, [1.0, 2.0]))
+        self.assertTrue(np.allclose(G.toarray(), [[1.0, 1.0]]))
+        self.assertTrue(np.allclose(h, [4.0]))
+        self.assertTrue(np.allclose(A.toarray(), [[1.0, 0.0]]))
+        self.assertTrue(np.allclose(b, [1.0]))
+        self.assertTrue(np.allclose(lb, [-np.inf, 0.0]))  # since UP < 0
+        self.assertTrue(np.allclose(ub, [-1.0, np.inf]))
+
+    def test_read_errors(self):
+        """
+        Invalid MPS files raise an MPSError.
+        """
+        invalid_files = [
+            "NAME\nFOO\nENDATA\n",
+            "ROWS\n N cost\nCOLUMNS\n x unknown 1\nENDATA\n",
+            "ROWS\n N cost\nCOLUMNS\n x cost one\nENDATA\n",
+            "ROWS\n N cost\nCOLUMNS\n x cost 1\nBOUNDS\n UP bnd y 1\n",
+            "ROWS\n N cost\nCOLUMNS\n x cost 1\nBOUNDS\n SC bnd x 1\n",
+            "ROWS\n X lim\nENDATA\n",
+        ]
+        for contents in invalid_files:
+            with self.assertRaises(MPSError):
+                read_mps(io.StringIO(contents))
+
+    def test_round_trip(self):
+        """
+        Writing then reading a problem gives back the same problem.
+        """
+        stream = io.StringIO()
+        write_mps(self.problem, stream)
+        problem = read_mps(io.StringIO(stream.getvalue()))
+        for expected, actual in zip(self.problem.unpack(), problem.unpack()):
+            if spa.issparse(expected):
+                expected, actual = expected.toarray(), actual.toarray()
+            self.assertTrue(np.array_equal(expected, actual))
+
+    def test_round_trip_dense(self):
+        """
+        Dense problems without bounds are written as free variables.
+        """
+        c = np.array([1.0, -2.0])
+        G = np.array([[1.0, 0.0], [0.0, 1.0]])
+        h = np.array([1.0, 1.0])
+        stream = io.StringIO()
+        write_mps(Problem(c, G, h), stream)
+        problem = read_mps(io.StringIO(stream.getvalue()))
+        self.assertTrue(np.array_equal(problem.G.toarray(), G))
+        self.assertIsNone(problem.A)
+        self.assertIsNone(problem.lb)
+        self.assertIsNone(problem.ub)
+
+    def test_gzip(self):
+        """
+        Compressed files are written and read back transparently.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "problem.mps.gz")
+            write_mps(self.problem, path)
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(2), b"\x1f\x8b")
+            problem = read_mps(path)
+        self.assertTrue(np.array_equal(problem.c, self.problem.c))
+        self.assertTrue(np.array_equal(problem.h, self.problem.h))
+
+    @staticmethod
+    def get_test_solve(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            problem = read_mps(io.StringIO(FREE_MPS))
+            solution = solve_problem(problem, solver)
+            self.assertTrue(solution.found)
+            self.assertTrue(
+                np.allclose(solution.x, [1.0, 0.25, 7.25], atol=1e-4)
+            )
+
+        return test
+
+
+for solver in available_solvers:
+    setattr(TestIO, f"test_solve_{solver}", TestIO.get_test_solve(solver))
+
+
+if __name__ == "__main__":
+    unittest.main()
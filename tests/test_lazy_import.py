@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for the lazy import of solver interfaces.
+"""
+
+import subprocess
+import sys
+import unittest
+
+import lpsolvers
+from lpsolvers import available_solvers
+
+
+class TestLazyImport(unittest.TestCase):
+    """
+    Check that solver backends are only imported when first used.
+    """
+
+    def run_python(self, code):
+        """
+        Run Python code in a fresh interpreter.
+
+        Parameters
+        ----------
+        code : string
+            Code to run.
+
+        Returns
+        -------
+        output : string
+            Standard output of the interpreter.
+        """
+        return subprocess.check_output(
+            [sys.executable, "-c", code], text=True
+        ).strip()
+
+    def test_import_skips_backends(self):
+        """
+        Importing lpsolvers does not import any solver backend.
+        """
+        output = self.run_python(
+            "import sys, lpsolvers; "
+            "print(sorted(name for name in sys.modules if name.split('.')[0] "
+            "in ('cdd', 'cvxopt', 'cvxpy', 'proxsuite') "
+            "or name.startswith('ortools.pdlp.python')))"
+        )
+        self.assertEqual(output, "[]")
+
+    def test_solve_imports_one_backend(self):
+        """
+        Solving with one solver only imports the corresponding interface.
+        """
+        if not available_solvers:
+            self.skipTest("no solver available")
+        solver = available_solvers[0]
+        output = self.run_python(
+            "import sys, numpy as np, lpsolvers; "
+            "lpsolvers.solve_lp(np.ones(1), np.array([[-1.0]]), "
+            f"np.zeros(1), solver='{solver}'); "
+            "print(sorted(name for name in sys.modules "
+            "if name.startswith('lpsolvers.') and name.endswith('_')))"
+        )
+        self.assertEqual(output, f"['lpsolvers.{solver}_']")
+
+    def test_solve_functions_importable(self):
+        """
+        Solve functions of all interfaces remain importable.
+        """
+        for solver in (
+            "cdd",
+            "cvxopt",
+            "cvxpy",
+            "highs",
+            "pdlp",
+            "proxqp",
+            "simplex",
+        ):
+            function = getattr(lpsolvers, f"{solver}_solve_lp")
+            self.assertTrue(callable(function))
+            self.assertEqual(function.__name__, f"{solver}_solve_lp")
+
+    def test_unknown_attribute(self):
+        """
+        Unknown module attributes still raise an AttributeError.
+        """
+        with self.assertRaises(AttributeError):
+            lpsolvers.ideal_solve_lp  # noqa: B018
+
+
+if __name__ == "__main__":
+    unittest.main()
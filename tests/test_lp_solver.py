@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for linear programs kept alive between solves.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+
+from lpsolvers import LPSolver, available_solvers, make_lp_solver, solve_lp
+from lpsolvers.exceptions import NoSolverSelected, SolverNotFound
+
+
+class TestLPSolver(unittest.TestCase):
+    """
+    Test fixture for linear programs updated between solves.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+        self.A = np.array([[2.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        self.b = np.array([1.0, 0.0])
+
+    def test_no_solver_selected(self):
+        """
+        Check that NoSolverSelected is raised when the solver is not set.
+        """
+        with self.assertRaises(NoSolverSelected):
+            make_lp_solver(self.c, self.G, self.h)
+
+    def test_abstract_solve(self):
+        """
+        Check that subclasses without a solve function cannot be created.
+        """
+
+        class IncompleteSolver(LPSolver):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteSolver(self.c, self.G, self.h)
+
+    def test_solver_not_found(self):
+        """
+        Check that SolverNotFound is raised when the solver does not exist.
+        """
+        with self.assertRaises(SolverNotFound):
+            make_lp_solver(self.c, self.G, self.h, solver="ideal")
+
+    @staticmethod
+    def get_test_update(solver):
+        """
+        Get test function for a given solver, where the cost and inequality
+        vectors are updated between solves.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            kwargs = {"eps_abs": 1e-8} if solver == "proxqp" else {}
+            tolerance = 1e-5 if solver in ("cvxpy", "pdlp", "proxqp") else 1e-7
+            lp = make_lp_solver(
+                self.c, self.G, self.h, solver=solver, **kwargs
+            )
+            x = lp.solve()
+            self.assertLess(
+                np.linalg.norm(x - np.array([2.2, -0.8, -3.4])), tolerance
+            )
+            for c, h in (
+                (self.c + 0.1, self.h),
+                (self.c, self.h + 0.5),
+                (2.0 * self.c - 0.1, 1.1 * self.h),
+            ):
+                lp.update(c=c, h=h)
+                x = lp.solve()
+                x_ref = solve_lp(c, self.G, h, solver=solver, **kwargs)
+                self.assertLess(np.linalg.norm(x - x_ref), tolerance)
+                self.assertIs(lp.x, x)
+
+        return test
+
+    @staticmethod
+    def get_test_update_equality(solver):
+        """
+        Get test function for a given solver, where the equality vector is
+        updated between solves.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            kwargs = {"eps_abs": 1e-8} if solver == "proxqp" else {}
+            tolerance = 1e-5 if solver in ("cvxpy", "pdlp", "proxqp") else 1e-7
+            lp = make_lp_solver(
+                self.c, self.G, self.h, self.A, self.b, solver=solver, **kwargs
+            )
+            lp.solve()
+            b = np.array([0.5, 0.2])
+            lp.update(b=b)
+            x = lp.solve()
+            x_ref = solve_lp(
+                self.c, self.G, self.h, self.A, b, solver=solver, **kwargs
+            )
+            self.assertLess(np.linalg.norm(x - x_ref), tolerance)
+            self.assertLess(np.linalg.norm(self.A @ x - b), tolerance)
+
+        return test
+
+    @staticmethod
+    def get_test_update_shapes(solver):
+        """
+        Get test function for a given solver, checking that updates keep the
+        dimensions of the linear program.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            lp = make_lp_solver(self.c, self.G, self.h, solver=solver)
+            with self.assertRaises(ValueError):
+                lp.update(c=np.ones(4))
+            with self.assertRaises(ValueError):
+                lp.update(b=np.ones(2))
+
+        return test
+
+    @staticmethod
+    def get_test_unfeasible(solver):
+        """
+        Get test function for a given solver, where an update makes the
+        linear program unfeasible.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            lp = make_lp_solver(
+                self.c, self.G, self.h, self.A, self.b, solver=solver
+            )
+            lp.solve()
+            lp.update(b=np.array([1.0, 10.0]))  # x[2] = 10 violates G x <= h
+            with self.assertRaises(ValueError):
+                lp.solve()
+
+        return test
+
+
+for solver in available_solvers:
+    for name in ("update", "update_equality", "update_shapes", "unfeasible"):
+        setattr(
+            TestLPSolver,
+            f"test_{name}_{solver}",
+            getattr(TestLPSolver, f"get_test_{name}")(solver),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for the batched PDHG engine.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import pdhg_solve_lps, solve_lp, solve_lps
+
+
+class TestPDHG(unittest.TestCase):
+    """
+    Test fixture for the batched PDHG engine.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=UserWarning)
+        rng = np.random.default_rng(42)
+        k, n, m = 16, 6, 12
+        G = rng.standard_normal((m, n))
+        self.G = np.vstack([G, np.eye(n), -np.eye(n)])
+        self.x0 = rng.uniform(-0.5, 0.5, (k, n))
+        self.H = self.x0 @ self.G.T + rng.uniform(0.1, 1.0, (k, m + 2 * n))
+        self.C = rng.standard_normal((k, n))
+
+    def assert_optimal(self, X, found, C, G, H, A=None, B=None, **kwargs):
+        """
+        Check that solutions of a batch match those of a reference solver.
+        """
+        self.assertTrue(found.all())
+        for i in range(C.shape[0]):
+            x = solve_lp(
+                C[i],
+                G[i] if G.ndim == 3 else G,
+                H[i],
+                A,
+                B[i] if B is not None else None,
+                solver="highs",
+                **kwargs,
+            )
+            self.assertAlmostEqual(C[i] @ X[i], C[i] @ x, delta=1e-4)
+
+    def test_shared(self):
+        """
+        Batches with a shared constraint matrix, dense or sparse, are solved
+        in double precision.
+        """
+        for G in (self.G, spa.csc_matrix(self.G)):
+            X, found = pdhg_solve_lps(self.C, G, self.H)
+            self.assertEqual(X.dtype, np.float64)
+            self.assert_optimal(X, found, self.C, self.G, self.H)
+
+    def test_stacked(self):
+        """
+        Batches with stacked constraint matrices, equalities and bounds are
+        solved.
+        """
+        rng = np.random.default_rng(0)
+        G = self.G + 0.1 * rng.standard_normal((16,) + self.G.shape)
+        H = np.einsum("kmn,kn->km", G, self.x0) + 0.5
+        A = rng.standard_normal((2, 6))
+        B = self.x0 @ A.T
+        lb = -np.ones(6)
+        ub = 0.8 * np.ones(6)
+        X, found = pdhg_solve_lps(self.C, G, H, A, B, lb=lb, ub=ub)
+        self.assertTrue(np.all(X >= lb - 1e-5) and np.all(X <= ub + 1e-5))
+        self.assert_optimal(X, found, self.C, G, H, A, B, lb=lb, ub=ub)
+
+    def test_single_precision(self):
+        """
+        Iterates are stored in single precision on request.
+        """
+        X, found = pdhg_solve_lps(self.C, self.G, self.H, dtype=np.float32)
+        self.assertEqual(X.dtype, np.float32)
+        self.assertTrue(found.all())
+        self.assertLess(np.max(X @ self.G.T - self.H), 1e-3)
+        with self.assertRaises(ValueError):
+            pdhg_solve_lps(self.C, self.G, self.H, dtype=np.int64)
+
+    def test_infeasible_instance(self):
+        """
+        Instances that do not converge are masked out of the batch.
+        """
+        H = self.H.copy()
+        H[3, -12:] = -1.0  # empty box for the fourth instance
+        X, found = pdhg_solve_lps(self.C, self.G, H, max_iter=2000)
+        self.assertFalse(found[3])
+        self.assertTrue(np.isnan(X[3]).all())
+        self.assertEqual(found.sum(), self.C.shape[0] - 1)
+
+    def test_solve_lps(self):
+        """
+        The engine is available from solve_lps.
+        """
+        X, found = solve_lps(self.C, self.G, self.H, solver="pdhg")
+        self.assert_optimal(X, found, self.C, self.G, self.H)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright 2023 Inria
+
+"""
+Tests specific to the PDLP solver interface.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import available_solvers, make_lp_solver
+
+
+@unittest.skipIf("pdlp" not in available_solvers, "PDLP is not installed")
+class TestPDLP(unittest.TestCase):
+    """
+    Test fixture for the PDLP solver interface.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+        self.A = np.array([[2.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        self.b = np.array([1.0, 0.0])
+
+    def test_stack_constraint_matrices(self):
+        """
+        Stacked matrices match ``scipy.sparse.vstack`` for dense, CSC and CSR
+        blocks, including empty columns.
+        """
+        from lpsolvers.pdlp_ import stack_constraint_matrices
+
+        rng = np.random.default_rng(0)
+        G = spa.csc_matrix(spa.random(50, 30, density=0.1, random_state=rng))
+        A = spa.csr_matrix(spa.random(20, 30, density=0.1, random_state=rng))
+        for G_block, A_block in (
+            (G, A),
+            (G.toarray(), A),
+            (G, A.toarray()),
+            (G.toarray(), A.toarray()),
+        ):
+            stacked = stack_constraint_matrices(G_block, A_block)
+            self.assertIsInstance(stacked, spa.csc_matrix)
+            self.assertTrue(stacked.has_sorted_indices)
+            expected = spa.vstack([G, A]).toarray()
+            self.assertTrue(np.array_equal(stacked.toarray(), expected))
+        self.assertIsNone(stack_constraint_matrices(None, None))
+        self.assertIs(stack_constraint_matrices(G, None), G)
+
+    def test_caller_arrays_untouched(self):
+        """
+        Solves and updates leave the arrays of the caller untouched.
+        """
+        arrays = (self.c, self.G, self.h, self.A, self.b)
+        copies = [array.copy() for array in arrays]
+        for A, b in ((None, None), (self.A, self.b)):
+            lp = make_lp_solver(self.c, self.G, self.h, A, b, solver="pdlp")
+            lp.solve()
+            lp.update(c=2.0 * self.c, h=self.h + 1.0)
+            if b is not None:
+                lp.update(b=0.5 * self.b)
+            x = lp.solve()
+            self.assertLess(np.max(self.G @ x - (self.h + 1.0)), 1e-5)
+            if A is not None:
+                self.assertLess(np.max(np.abs(A @ x - 0.5 * b)), 1e-5)
+        for array, copy in zip(arrays, copies):
+            self.assertTrue(np.array_equal(array, copy))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for the presolve stage.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import Problem, available_solvers, solve_lp, solve_problem
+from lpsolvers.presolve import presolve_problem
+
+
+class TestPresolve(unittest.TestCase):
+    """
+    Test fixture for a linear program with redundant rows and columns.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0, 4.0, 0.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0, 0.0, 0.0],
+                [2.0, 0.0, 1.0, 0.0, 0.0],
+                [2.0, 4.0, -2.0, 0.0, 0.0],  # duplicate of first row
+                [0.0, 0.0, 0.0, 0.0, 0.0],  # zero row
+                [-1.0, 0.0, 0.0, 0.0, 0.0],  # lower bound on x[0]
+                [0.0, 0.0, 0.0, 1.0, 0.0],  # upper bound on x[3]
+                [-1.0, -1.0, -1.0, 0.0, 0.0],
+                [1.0, 0.0, 0.0, 0.0, 0.0],  # upper bound on x[0]
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 9.0, 0.0, 1.0, 5.0, 2.0, 3.0])
+        self.A = np.array(
+            [
+                [0.0, 0.0, 0.0, 1.0, 0.0],  # fixes x[3]
+                [0.0, 0.0, 0.0, 2.0, 0.0],  # duplicate of first row
+                [1.0, 1.0, 1.0, 0.0, 0.0],
+            ]
+        )
+        self.b = np.array([0.5, 1.0, -1.0])
+        self.problem = Problem(self.c, self.G, self.h, self.A, self.b)
+
+    def test_reduction(self):
+        """
+        Check the reduced problem and presolve information.
+        """
+        reduced, info = presolve_problem(self.problem)
+        self.assertIsNone(info.status)
+        self.assertTrue(np.array_equal(info.columns, [0, 1, 2]))
+        self.assertEqual(info.x_fixed[3], 0.5)  # fixed by equality
+        self.assertEqual(info.x_fixed[4], 0.0)  # absent from constraints
+        self.assertEqual(info.lb[0], -1.0)
+        self.assertEqual(info.ub[0], 3.0)
+        self.assertIsInstance(reduced.G, np.ndarray)
+        self.assertEqual(reduced.G.shape, (3, 3))  # bounds are native
+        self.assertTrue(np.array_equal(reduced.lb, [-1.0, -np.inf, -np.inf]))
+        self.assertTrue(np.array_equal(reduced.ub, [3.0, np.inf, np.inf]))
+        self.assertEqual(reduced.A.shape, (1, 3))
+        self.assertTrue(np.allclose(reduced.h[:2], [2.0, 0.5]))
+
+    def test_sparse(self):
+        """
+        Sparse problems give the same reduction with sparse matrices.
+        """
+        problem = Problem(
+            self.c,
+            spa.csr_matrix(self.G),
+            self.h,
+            spa.csc_matrix(self.A),
+            self.b,
+        )
+        reduced, _ = presolve_problem(problem)
+        dense_reduced, _ = presolve_problem(self.problem)
+        self.assertTrue(spa.issparse(reduced.G))
+        self.assertTrue(np.allclose(reduced.G.toarray(), dense_reduced.G))
+        self.assertTrue(np.allclose(reduced.h, dense_reduced.h))
+
+    def test_input_untouched(self):
+        """
+        Presolve does not modify the matrices of the original problem.
+        """
+        G = spa.csr_matrix(self.G)
+        G.data[0] = 0.0  # explicit zero
+        nnz = G.nnz
+        presolve_problem(Problem(self.c, G, self.h, self.A, self.b))
+        self.assertEqual(G.nnz, nnz)
+
+    def test_infeasible_zero_row(self):
+        """
+        A zero row with negative right-hand side is infeasible.
+        """
+        h = self.h.copy()
+        h[3] = -1.0
+        _, info = presolve_problem(Problem(self.c, self.G, h))
+        self.assertEqual(info.status, "infeasible")
+
+    def test_infeasible_bounds(self):
+        """
+        Conflicting bounds from singleton rows are infeasible.
+        """
+        h = self.h.copy()
+        h[4] = -4.0  # x[0] >= 4 while x[0] <= 3
+        _, info = presolve_problem(Problem(self.c, self.G, h))
+        self.assertEqual(info.status, "infeasible")
+
+    def test_infeasible_duplicate_equalities(self):
+        """
+        Duplicate equalities with different right-hand sides are infeasible.
+        """
+        A = np.array([[1.0, 1.0, 0.0, 0.0, 0.0], [2.0, 2.0, 0.0, 0.0, 0.0]])
+        b = np.array([1.0, 1.0])
+        _, info = presolve_problem(Problem(self.c, self.G, self.h, A, b))
+        self.assertEqual(info.status, "infeasible")
+
+    def test_unbounded_free_column(self):
+        """
+        A variable absent from all constraints whose cost decreases toward
+        an infinite bound makes the problem unbounded.
+        """
+        problem = Problem(
+            np.array([1.0, -1.0]), np.array([[0.0, 1.0]]), np.array([1.0])
+        )
+        reduced, info = presolve_problem(problem)
+        self.assertEqual(info.status, "unbounded")
+        self.assertEqual(info.columns.size, 0)
+        self.assertEqual(reduced.c.shape, (0,))
+
+    @staticmethod
+    def get_test_unbounded(solver):
+        """
+        Get test function checking that unbounded variables found by
+        presolve are reported, unless the rest of the problem is infeasible.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            c = np.array([1.0, 1.0, 1.0])
+            G = np.array([[0.0, 1.0, 1.0], [0.0, -1.0, -1.0]])
+            solution = solve_problem(
+                Problem(c, G, np.array([1.0, 0.0])), solver, presolve=True
+            )
+            self.assertFalse(solution.found)
+            self.assertEqual(solution.status, "presolve: unbounded")
+            solution = solve_problem(
+                Problem(c, G, np.array([1.0, -2.0])), solver, presolve=True
+            )
+            self.assertFalse(solution.found)
+            self.assertNotEqual(solution.status, "presolve: unbounded")
+
+        return test
+
+    @staticmethod
+    def get_test_solve(solver):
+        """
+        Get test function checking that presolved solutions match those of
+        the original problem.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            tolerance = 1e-5 if solver in ("cvxpy", "pdlp", "proxqp") else 1e-7
+            x = solve_lp(self.c, self.G, self.h, self.A, self.b, solver=solver)
+            x_presolved = solve_lp(
+                self.c,
+                self.G,
+                self.h,
+                self.A,
+                self.b,
+                solver=solver,
+                presolve=True,
+            )
+            self.assertLess(np.linalg.norm(x - x_presolved), tolerance)
+            solution = solve_problem(self.problem, solver, presolve=True)
+            self.assertTrue(solution.found)
+            self.assertLess(solution.primal_residual(), tolerance)
+            self.assertEqual(solution.extras["presolve"].columns.size, 3)
+            h = self.h.copy()
+            h[4] = -4.0  # x[0] >= 4 while x[0] <= 3
+            solution = solve_problem(
+                Problem(self.c, self.G, h), solver, presolve=True
+            )
+            self.assertFalse(solution.found)
+            with self.assertRaises(ValueError):
+                solve_lp(self.c, self.G, h, solver=solver, presolve=True)
+
+        return test
+
+
+for solver in available_solvers:
+    setattr(
+        TestPresolve,
+        f"test_solve_{solver}",
+        TestPresolve.get_test_solve(solver),
+    )
+    setattr(
+        TestPresolve,
+        f"test_unbounded_{solver}",
+        TestPresolve.get_test_unbounded(solver),
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()
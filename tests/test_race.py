@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for races between solvers.
+"""
+
+import multiprocessing
+import unittest
+import warnings
+
+import numpy as np
+
+from lpsolvers import Problem, available_solvers, solve_lp, solve_problem
+from lpsolvers.exceptions import SolverNotFound
+from lpsolvers.race import _get_context, race_problem
+
+
+class TestRace(unittest.TestCase):
+    """
+    Test fixture for races between solvers.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        if not available_solvers:
+            self.skipTest("no solver available")
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+
+    def test_race(self):
+        """
+        The first solution found is returned along with its solver.
+        """
+        children = set(multiprocessing.active_children())
+        solution = solve_problem(
+            Problem(self.c, self.G, self.h), available_solvers, race=True
+        )
+        self.assertTrue(solution.found)
+        self.assertIn(solution.extras["solver"], available_solvers)
+        self.assertTrue(np.allclose(solution.x, [2.2, -0.8, -3.4], atol=1e-4))
+        self.assertEqual(set(multiprocessing.active_children()), children)
+
+    def test_solve_lp(self):
+        """
+        Race solvers from the solve_lp function.
+        """
+        x = solve_lp(
+            self.c, self.G, self.h, solver=available_solvers, race=True
+        )
+        self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-4))
+        with self.assertRaises(ValueError):
+            solve_lp(
+                self.c,
+                np.vstack([self.G, -self.G[:1]]),
+                np.hstack([self.h, [-5.0]]),
+                solver=available_solvers,
+                race=True,
+            )
+
+    def test_infeasible(self):
+        """
+        All statuses are reported when no solver finds a solution.
+        """
+        G = np.vstack([self.G, -self.G[:1]])
+        h = np.hstack([self.h, [-5.0]])
+        solution = race_problem(Problem(self.c, G, h), available_solvers)
+        self.assertFalse(solution.found)
+        self.assertIsNone(solution.extras["solver"])
+        self.assertEqual(
+            set(solution.extras["statuses"]), set(available_solvers)
+        )
+
+    def test_solver_kwargs(self):
+        """
+        Solvers receive their own keyword arguments.
+        """
+        solver = available_solvers[0]
+        solution = race_problem(
+            Problem(self.c, self.G, self.h),
+            [solver],
+            solver_kwargs={solver: {"unknown_argument": 1.0}},
+        )
+        if solver != "cdd":  # which ignores keyword arguments
+            self.assertFalse(solution.found)
+            self.assertIn("unknown_argument", solution.status)
+
+    def test_errors(self):
+        """
+        Lists of solvers require racing, and unknown solvers raise.
+        """
+        children = set(multiprocessing.active_children())
+        problem = Problem(self.c, self.G, self.h)
+        with self.assertRaises(ValueError):
+            solve_problem(problem, available_solvers)
+        with self.assertRaises(ValueError):
+            race_problem(problem, [])
+        with self.assertRaises(SolverNotFound):
+            race_problem(problem, [available_solvers[0], "unknown"])
+        self.assertEqual(set(multiprocessing.active_children()), children)
+
+    def test_start_method(self):
+        """
+        Worker processes are not forked from the calling process.
+        """
+        self.assertIn(
+            _get_context().get_start_method(), ("forkserver", "spawn")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
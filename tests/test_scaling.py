@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for the scaling stage of linear programs.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import Problem, available_solvers, solve_lp, solve_problem
+from lpsolvers.scaling import scale_problem
+
+
+class TestScaling(unittest.TestCase):
+    """
+    Test fixture for a badly scaled linear program.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+
+        The linear program of the other tests, whose solution is
+        ``[0.5, -2.5, 0.0]``, is rescaled by row and column factors ranging
+        from ``1e-4`` to ``1e4``.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        c = np.array([1.0, 2.0, 3.0])
+        G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        h = np.array([4.0, 1.0, 3.0, 2.0])
+        A = np.array([[2.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        b = np.array([1.0, 0.0])
+        column_scale = np.array([1e-4, 1e2, 1e3])
+        G_scale = np.array([1e4, 1e-3, 1.0, 1e2])
+        A_scale = np.array([1e-2, 1e3])
+        self.c = c * column_scale
+        self.G = G_scale[:, np.newaxis] * G * column_scale
+        self.h = G_scale * h
+        self.A = A_scale[:, np.newaxis] * A * column_scale
+        self.b = A_scale * b
+        self.column_scale = column_scale
+        self.x = np.array([0.5, -2.5, 0.0]) / column_scale
+
+    def test_ruiz_equilibrates(self):
+        """
+        Ruiz scaling brings row and column norms close to one.
+        """
+        problem = Problem(self.c, self.G, self.h, self.A, self.b)
+        scaled, info = scale_problem(
+            problem, geometric_iterations=0, ruiz_iterations=20
+        )
+        M = np.abs(np.vstack([scaled.G, scaled.A]))
+        self.assertTrue(np.allclose(M.max(axis=1), 1.0, atol=1e-2))
+        self.assertTrue(np.allclose(M.max(axis=0), 1.0, atol=1e-2))
+        self.assertAlmostEqual(np.max(np.abs(scaled.c)), 1.0)
+        self.assertTrue(
+            np.allclose(info.scale_primal(self.x) * info.D, self.x)
+        )
+
+    def test_geometric_reduces_spread(self):
+        """
+        Geometric scaling reduces the ratio between extreme coefficients.
+        """
+        problem = Problem(self.c, self.G, self.h, self.A, self.b)
+        scaled, _ = scale_problem(problem, ruiz_iterations=0)
+        M = np.abs(np.vstack([self.G, self.A]))
+        M_scaled = np.abs(np.vstack([scaled.G, scaled.A]))
+        spread = M[M > 0].max() / M[M > 0].min()
+        spread_scaled = M_scaled[M_scaled > 0].max() / M_scaled[M > 0].min()
+        self.assertLess(spread_scaled, 1e-6 * spread)
+
+    def test_sparse(self):
+        """
+        Sparse matrices stay sparse and are scaled like dense ones.
+        """
+        problem = Problem(
+            self.c, self.G, self.h, spa.csr_matrix(self.A), self.b
+        )
+        scaled, _ = scale_problem(problem)
+        dense, _ = scale_problem(
+            Problem(self.c, self.G, self.h, self.A, self.b)
+        )
+        self.assertIsInstance(scaled.A, spa.csc_matrix)
+        self.assertTrue(np.allclose(scaled.A.toarray(), dense.A))
+
+    def test_bounds(self):
+        """
+        Bounds are scaled along with their variables.
+        """
+        problem = Problem(
+            self.c, self.G, self.h, lb=-self.x, ub=np.full(3, np.inf)
+        )
+        scaled, info = scale_problem(problem)
+        self.assertTrue(np.allclose(info.D * scaled.lb, -self.x))
+        self.assertTrue(np.all(np.isinf(scaled.ub)))
+
+    @staticmethod
+    def get_test(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            x = solve_lp(
+                self.c, self.G, self.h, self.A, self.b, solver, scale=True
+            )
+            self.assertTrue(
+                np.allclose(x * self.column_scale, [0.5, -2.5, 0.0], atol=1e-4)
+            )
+
+        return test
+
+    @staticmethod
+    def get_test_duals(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            problem = Problem(self.c, self.G, self.h, self.A, self.b)
+            solution = solve_problem(problem, solver, scale=True)
+            self.assertTrue(solution.found)
+            self.assertIn("scaling", solution.extras)
+            self.assertIsNotNone(solution.z)
+            self.assertIsNotNone(solution.y)
+            scaled = solution.extras["scaled_solution"]
+            info = solution.extras["scaling"]
+            self.assertTrue(scaled.is_optimal(1e-4))
+
+            # Unscaling is exact: dual residuals match up to scaling
+            c, G, _, A, _, _, _ = scaled.problem.unpack()
+            residual = c + G.T @ scaled.z + A.T @ scaled.y
+            residual_unscaled = (
+                self.c + self.G.T @ solution.z + self.A.T @ solution.y
+            )
+            self.assertTrue(
+                np.allclose(
+                    residual_unscaled * info.sigma * info.D,
+                    residual,
+                    atol=1e-9,
+                )
+            )
+            self.assertTrue(np.all(solution.z >= -1e-6 * info.E_G))
+
+        return test
+
+
+for solver in available_solvers:
+    setattr(TestScaling, f"test_{solver}", TestScaling.get_test(solver))
+    setattr(
+        TestScaling,
+        f"test_duals_{solver}",
+        TestScaling.get_test_duals(solver),
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()
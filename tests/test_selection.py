@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for the automatic selection of solvers.
+"""
+
+import os
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import (
+    Problem,
+    available_solvers,
+    make_lp_solver,
+    select_solver,
+    solve_lp,
+    solve_problem,
+)
+from lpsolvers.benchmark import BenchmarkResult, calibrate_decision_table
+from lpsolvers.selection import (
+    SelectionRule,
+    decision_table_path,
+    default_decision_table,
+    load_decision_table,
+    problem_features,
+    save_decision_table,
+)
+
+
+class TestSelection(unittest.TestCase):
+    """
+    Test fixture for the automatic selection of solvers.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+
+    def test_features(self):
+        """
+        Features count rows and nonzeros of dense and sparse matrices.
+        """
+        A = spa.csc_matrix(np.array([[1.0, 0.0, 0.0]]))
+        features = problem_features(
+            Problem(self.c, self.G, self.h, A, np.zeros(1))
+        )
+        self.assertEqual(features["n"], 3)
+        self.assertEqual(features["m"], 4)
+        self.assertEqual(features["n_eq"], 1)
+        self.assertEqual(features["nnz"], 12)
+        self.assertAlmostEqual(features["density"], 12.0 / 15.0)
+        self.assertEqual(problem_features(Problem(self.c))["density"], 0.0)
+
+    def test_rules(self):
+        """
+        The first matching rule with an available solver decides.
+        """
+        if not available_solvers:
+            self.skipTest("no solver available")
+        problem = Problem(self.c, self.G, self.h)
+        solver = available_solvers[-1]
+        table = [
+            SelectionRule(("unknown", solver)),
+            SelectionRule((available_solvers[0],)),
+        ]
+        self.assertEqual(select_solver(problem, table), solver)
+        table = [
+            SelectionRule(("unknown",)),
+            SelectionRule((solver,), max_variables=2),
+            SelectionRule((solver,), min_density=0.95),
+            SelectionRule((solver,), max_constraints=3),
+            SelectionRule((solver,), max_nonzeros=10),
+        ]
+        self.assertEqual(select_solver(problem, table), available_solvers[0])
+
+    def test_default_table(self):
+        """
+        Tiny dense problems go to cdd, large sparse ones to PDLP.
+        """
+        tiny = {"n": 3, "m": 4, "n_eq": 0, "nnz": 11, "density": 0.9}
+        large = {"n": 10**6, "m": 10**6, "n_eq": 0, "nnz": 5e6, "density": 0}
+        first_match = [
+            next(r for r in default_decision_table if r.matches(features))
+            for features in (tiny, large)
+        ]
+        self.assertEqual(first_match[0].solvers[0], "cdd")
+        self.assertEqual(first_match[1].solvers[0], "pdlp")
+
+    def test_save_load(self):
+        """
+        Decision tables are saved to and loaded from JSON files.
+        """
+        table = [
+            SelectionRule(("cdd", "cvxopt"), max_variables=10.0),
+            SelectionRule(("pdlp",), min_density=0.1),
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "sub", "table.json")
+            self.assertEqual(save_decision_table(table, path), path)
+            self.assertEqual(load_decision_table(path), table)
+            missing = os.path.join(tmpdir, "missing.json")
+            self.assertIs(load_decision_table(missing), default_decision_table)
+
+    def test_path(self):
+        """
+        The path to the decision table can be set from the environment.
+        """
+        with mock.patch.dict(os.environ, {"LPSOLVERS_DECISION_TABLE": "t"}):
+            self.assertEqual(decision_table_path(), "t")
+        with mock.patch.dict(
+            os.environ,
+            {"LPSOLVERS_DECISION_TABLE": "", "XDG_CONFIG_HOME": "/config"},
+        ):
+            self.assertEqual(
+                decision_table_path(),
+                os.path.join("/config", "lpsolvers", "decision_table.json"),
+            )
+
+    def test_calibrate(self):
+        """
+        Calibrated rules rank successful solvers by run time.
+        """
+
+        def result(solver, n, fmt, run_time, success=True):
+            outcome = BenchmarkResult(solver, "feasible", fmt, n, 0)
+            outcome.run_time, outcome.success = run_time, success
+            return outcome
+
+        results = [
+            result("cdd", 10, "dense", 1e-3),
+            result("pdlp", 10, "dense", 2e-3),
+            result("cdd", 10, "sparse", 5e-3),
+            result("pdlp", 10, "sparse", 1e-3),
+            result("cdd", 1000, "sparse", 1.0, success=False),
+            result("pdlp", 1000, "sparse", 0.1),
+            BenchmarkResult("cdd", "infeasible", "dense", 10, 0),
+        ]
+        table = calibrate_decision_table(results)
+        self.assertEqual(
+            [rule.solvers for rule in table],
+            [("cdd", "pdlp"), ("pdlp", "cdd"), ("pdlp",)],
+        )
+        self.assertAlmostEqual(table[0].max_variables, 100.0)
+        self.assertAlmostEqual(table[0].min_density, np.sqrt(0.5))
+        self.assertEqual(table[1].min_density, 0.0)
+        self.assertEqual(table[2].max_variables, np.inf)
+
+    def test_auto(self):
+        """
+        Solve a linear program with an automatically selected solver.
+        """
+        if not available_solvers:
+            self.skipTest("no solver available")
+        x = solve_lp(self.c, self.G, self.h, solver="auto")
+        self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-4))
+        solution = solve_problem(Problem(self.c, self.G, self.h), "auto")
+        self.assertIn(solution.extras["solver"], available_solvers)
+        self.assertTrue(solution.found)
+        lp = make_lp_solver(self.c, self.G, self.h, solver="auto")
+        self.assertTrue(np.allclose(lp.solve(), x, atol=1e-4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests specific to the built-in simplex.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import Problem, make_lp_solver, solve_lp, solve_problem
+
+
+class TestSimplex(unittest.TestCase):
+    """
+    Test fixture for the built-in simplex.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+        self.A = np.array([[1.0, 1.0, 1.0]])
+        self.b = np.array([-2.0])
+
+    def test_rules(self):
+        """
+        Dantzig's and Bland's rules find the same solution, with dense or
+        sparse matrices.
+        """
+        for bland in (False, True):
+            for G in (self.G, spa.csc_matrix(self.G)):
+                x = solve_lp(self.c, G, self.h, solver="simplex", bland=bland)
+                self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-9))
+
+    def test_duals(self):
+        """
+        Dual multipliers follow the sign conventions of lpsolvers.
+        """
+        lb = np.array([-np.inf, -0.5, -np.inf])
+        ub = np.array([1.9, np.inf, np.inf])
+        problem = Problem(self.c, self.G, self.h, self.A, self.b, lb, ub)
+        solution = solve_problem(problem, solver="simplex")
+        self.assertTrue(solution.found)
+        self.assertEqual(solution.status, "optimal")
+        self.assertTrue(np.allclose(solution.x, [1.75, -0.5, -3.25]))
+        self.assertTrue(np.all(solution.z >= -1e-9))
+        self.assertGreater(np.abs(solution.z_box).max(), 1e-6)
+        self.assertTrue(
+            np.allclose(
+                self.c
+                + self.G.T @ solution.z
+                + self.A.T @ solution.y
+                + solution.z_box,
+                0.0,
+                atol=1e-9,
+            )
+        )
+
+    def test_statuses(self):
+        """
+        Infeasible, unbounded and unfinished problems are reported as such.
+        """
+        infeasible = Problem(
+            self.c,
+            np.vstack([self.G, -self.G[:1]]),
+            np.hstack([self.h, [-5.0]]),
+        )
+        unbounded = Problem(-self.c, self.G[:1], self.h[:1])
+        for problem, status in (
+            (infeasible, "infeasible"),
+            (unbounded, "unbounded"),
+        ):
+            solution = solve_problem(problem, solver="simplex")
+            self.assertFalse(solution.found)
+            self.assertEqual(solution.status, status)
+        solution = solve_problem(
+            Problem(self.c, self.G, self.h), solver="simplex", max_iter=1
+        )
+        self.assertEqual(solution.status, "iteration limit reached")
+        with self.assertRaises(ValueError):
+            solve_lp(*infeasible.unpack()[:3], solver="simplex")
+
+    def test_degenerate(self):
+        """
+        Degenerate vertices, where many constraints are active, are solved
+        without cycling.
+        """
+        n = 4
+        angles = np.linspace(0.0, 2.0 * np.pi, 40, endpoint=False)
+        G = np.zeros((angles.size, n))
+        G[:, 0] = np.cos(angles)
+        G[:, 1] = np.sin(angles)
+        G[:, 2] = 1.0
+        G[:, 3] = -1.0
+        h = np.zeros(angles.size)
+        c = np.array([0.0, 0.0, -1.0, 1.0])
+        lb = -np.ones(n)
+        ub = np.ones(n)
+        for bland in (False, True):
+            solution = solve_problem(
+                Problem(c, G, h, lb=lb, ub=ub), "simplex", bland=bland
+            )
+            self.assertTrue(solution.found)
+            self.assertAlmostEqual(solution.obj, 0.0)
+
+    def test_bounds(self):
+        """
+        Variable bounds are handled natively, including fixed variables.
+        """
+        lb = np.array([0.0, 0.0, 1.0])
+        ub = np.array([2.0, 3.0, 1.0])
+        c = np.array([-1.0, -1.0, 1.0])
+        x = solve_lp(c, None, None, solver="simplex", lb=lb, ub=ub)
+        self.assertTrue(np.allclose(x, [2.0, 3.0, 1.0]))
+
+    def test_bound_flips(self):
+        """
+        Entering variables that flip to their other bound stay within their
+        bounds, including on random box-bounded problems.
+        """
+        c = np.array([-2.0798, 0.3192])
+        G = np.array([[1.0, 1.0]])
+        A = np.array([[1.0, 1.0]])
+        lb = np.array([-3.0, -3.0])
+        ub = np.array([0.9132, np.inf])
+        h = np.array([1.2556])
+        b = np.array([0.8845])
+        x = solve_lp(c, G, h, A, b, solver="simplex", lb=lb, ub=ub)
+        self.assertTrue(np.allclose(x, [0.9132, -0.0287]))
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            n, m, p = rng.integers(1, 5), rng.integers(0, 4), rng.integers(2)
+            c = rng.standard_normal(n)
+            lb = rng.uniform(-3.0, 0.0, n)
+            ub = rng.uniform(0.0, 3.0, n)
+            lb[rng.random(n) < 0.2] = -np.inf
+            ub[rng.random(n) < 0.3] = np.inf
+            G = rng.standard_normal((m, n)) if m > 0 else None
+            h = rng.uniform(0.0, 2.0, m) if m > 0 else None
+            A = rng.standard_normal((p, n)) if p > 0 else None
+            x0 = np.clip(rng.uniform(-1.0, 1.0, n), lb, ub)
+            b = A @ x0 if p > 0 else None
+            reference = solve_problem(
+                Problem(c, G, h, A, b, lb, ub), solver="highs"
+            )
+            solution = solve_problem(
+                Problem(c, G, h, A, b, lb, ub), solver="simplex"
+            )
+            self.assertEqual(solution.found, reference.found)
+            if reference.found:
+                self.assertTrue(np.all(solution.x >= lb - 1e-9))
+                self.assertTrue(np.all(solution.x <= ub + 1e-9))
+                self.assertLess(solution.primal_residual(), 1e-9)
+                self.assertAlmostEqual(solution.obj, reference.obj)
+
+    def test_cost_updates(self):
+        """
+        Solves after cost updates restart from the previous optimal basis,
+        while other updates start over.
+        """
+        lp = make_lp_solver(self.c, self.G, self.h, solver="simplex")
+        first = lp.solve_problem()
+        self.assertGreater(first.iter, 0)
+        lp.update(c=1.01 * self.c)
+        second = lp.solve_problem()
+        self.assertEqual(second.iter, 0)
+        self.assertTrue(np.allclose(second.x, first.x))
+        lp.update(h=self.h + 0.5)
+        third = lp.solve_problem()
+        self.assertGreater(third.iter, 0)
+        x = solve_lp(1.01 * self.c, self.G, self.h + 0.5, solver="simplex")
+        self.assertTrue(np.allclose(third.x, x))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for snapshots of linear programs.
+"""
+
+import os
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import (
+    Problem,
+    ProblemError,
+    __version__,
+    available_solvers,
+    load_problem,
+    save_problem,
+)
+
+
+class TestSnapshot(unittest.TestCase):
+    """
+    Test fixture for snapshots of linear programs.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "problem.lpsnap")
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+        self.A = np.array([[1.0, 1.0, 1.0]])
+        self.b = np.array([-2.0])
+
+    def tearDown(self):
+        """
+        Remove temporary files.
+        """
+        self.tmpdir.cleanup()
+
+    def assert_same_problem(self, expected: Problem, actual: Problem):
+        """
+        Check that two problems have the same matrices.
+        """
+        for M, N in zip(expected.unpack(), actual.unpack()):
+            if M is None:
+                self.assertIsNone(N)
+                continue
+            self.assertEqual(spa.issparse(M), spa.issparse(N))
+            if spa.issparse(M):
+                self.assertEqual(M.format, N.format)
+                M, N = M.toarray(), N.toarray()
+            self.assertTrue(np.array_equal(M, N))
+
+    def test_dense(self):
+        """
+        Dense problems are saved and loaded back.
+        """
+        problem = Problem(self.c, self.G, self.h, self.A, self.b)
+        save_problem(problem, self.path, "cvxopt", abstol=1e-8)
+        snapshot = load_problem(self.path)
+        self.assert_same_problem(problem, snapshot.problem)
+        self.assertEqual(snapshot.solver, "cvxopt")
+        self.assertEqual(snapshot.kwargs, {"abstol": 1e-8})
+        self.assertEqual(snapshot.metadata["lpsolvers_version"], __version__)
+        self.assertIsNone(snapshot.initvals)
+
+    def test_sparse_mmap(self):
+        """
+        Sparse matrices are memory-mapped from their index and data arrays.
+        """
+        G = spa.csc_matrix(self.G)
+        A = spa.csr_matrix(self.A)
+        lb = np.array([-np.inf, -5.0, -5.0])
+        problem = Problem(self.c, G, self.h, A, self.b, lb=lb)
+        save_problem(problem, self.path, initvals=np.zeros(3))
+        snapshot = load_problem(self.path)
+        self.assert_same_problem(problem, snapshot.problem)
+        self.assertIsNone(snapshot.solver)
+        self.assertTrue(np.array_equal(snapshot.initvals, np.zeros(3)))
+        base = snapshot.problem.G.data
+        while base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        self.assertIsInstance(base, np.memmap)
+        self.assertFalse(snapshot.problem.G.data.flags.writeable)
+
+    def test_no_mmap(self):
+        """
+        Snapshots can be read into memory.
+        """
+        problem = Problem(self.c, spa.coo_matrix(self.G), self.h)
+        save_problem(problem, self.path)
+        snapshot = load_problem(self.path, mmap=False)
+        self.assertEqual(snapshot.problem.G.format, "csc")
+        self.assertTrue(snapshot.problem.c.flags.writeable)
+        self.assertTrue(np.array_equal(snapshot.problem.G.toarray(), self.G))
+
+    def test_numpy_kwargs(self):
+        """
+        NumPy values in solver arguments are saved as Python values.
+        """
+        problem = Problem(self.c, self.G, self.h)
+        save_problem(problem, self.path, tol=np.float64(1e-6), n=np.int64(3))
+        self.assertEqual(
+            load_problem(self.path).kwargs, {"tol": 1e-6, "n": 3}
+        )
+        with self.assertRaises(TypeError):
+            save_problem(problem, self.path, callback=print)
+
+    def test_invalid_file(self):
+        """
+        Loading a file that is not a snapshot raises a ProblemError.
+        """
+        with open(self.path, "wb") as file:
+            file.write(b"not a snapshot")
+        with self.assertRaises(ProblemError):
+            load_problem(self.path)
+
+    @staticmethod
+    def get_test_replay_dense(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            problem = Problem(self.c, self.G, self.h, self.A, self.b)
+            # ProxQP reports spurious infeasibility with default settings
+            kwargs = {"eps_primal_inf": 1e-12} if solver == "proxqp" else {}
+            save_problem(problem, self.path, solver, **kwargs)
+            solution = load_problem(self.path).solve()
+            self.assertTrue(solution.found)
+            self.assertTrue(
+                np.allclose(solution.x, [2.2, -0.8, -3.4], atol=1e-4)
+            )
+
+        return test
+
+    @staticmethod
+    def get_test_replay(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            problem = Problem(
+                self.c,
+                spa.csc_matrix(self.G),
+                self.h,
+                spa.csc_matrix(self.A),
+                self.b,
+            )
+            # ProxQP reports spurious infeasibility with default settings
+            kwargs = {"eps_primal_inf": 1e-12} if solver == "proxqp" else {}
+            save_problem(problem, self.path, solver, **kwargs)
+            snapshot = load_problem(self.path)
+            self.assertIn("backend_version", snapshot.metadata)
+            solution = snapshot.solve()
+            self.assertTrue(solution.found)
+            self.assertTrue(
+                np.allclose(solution.x, [2.2, -0.8, -3.4], atol=1e-4)
+            )
+
+        return test
+
+
+for solver in available_solvers:
+    setattr(
+        TestSnapshot,
+        f"test_replay_{solver}",
+        TestSnapshot.get_test_replay(solver),
+    )
+    setattr(
+        TestSnapshot,
+        f"test_replay_dense_{solver}",
+        TestSnapshot.get_test_replay_dense(solver),
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()
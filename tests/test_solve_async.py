@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for asynchronous solve functions.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+import unittest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from lpsolvers import (
+    Problem,
+    available_solvers,
+    solve_async,
+    solve_lp,
+    solve_lp_async,
+    solve_lps_async,
+    solve_problem_async,
+)
+from lpsolvers.exceptions import NoSolverSelected, SolverNotFound
+from lpsolvers.solve_async import configure_async
+
+run_in_worker = getattr(solve_async, "__run")  # module-private helper
+
+
+def sleep_and_return(duration: float) -> float:
+    """
+    Sleep, then return the sleep duration.
+    """
+    time.sleep(duration)
+    return duration
+
+
+def sleep_and_get_pid(duration: float) -> int:
+    """
+    Sleep, then return the identifier of the current process.
+    """
+    time.sleep(duration)
+    return os.getpid()
+
+
+class TestSolveAsync(unittest.TestCase):
+    """
+    Test fixture for asynchronous solve functions.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        if not available_solvers:
+            self.skipTest("no solver available")
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+
+    def test_concurrent_solves(self):
+        """
+        Solutions of concurrent solves match sequential ones.
+        """
+        solver = available_solvers[0]
+        C = np.array([self.c, 2.0 * self.c, 0.5 * self.c])
+
+        async def solve_all():
+            return await asyncio.gather(
+                *(solve_lp_async(c, self.G, self.h, solver=solver) for c in C)
+            )
+
+        for x, c in zip(asyncio.run(solve_all()), C):
+            x_sequential = solve_lp(c, self.G, self.h, solver=solver)
+            self.assertTrue(np.allclose(x, x_sequential, atol=1e-4))
+
+    def test_pools(self):
+        """
+        Solvers run on threads and in worker processes.
+        """
+        problem = Problem(self.c, self.G, self.h)
+        for pool in ("thread", "process"):
+            solution = asyncio.run(
+                solve_problem_async(problem, "auto", pool=pool)
+            )
+            self.assertTrue(solution.found)
+            self.assertTrue(
+                np.allclose(solution.x, [2.2, -0.8, -3.4], atol=1e-4)
+            )
+        with self.assertRaises(ValueError):
+            asyncio.run(solve_problem_async(problem, "auto", pool="fiber"))
+
+    def test_executor(self):
+        """
+        Solves are submitted to a user executor.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            x = asyncio.run(
+                solve_lp_async(
+                    self.c,
+                    self.G,
+                    self.h,
+                    solver=available_solvers[0],
+                    executor=executor,
+                )
+            )
+        self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-4))
+
+    def test_infeasible(self):
+        """
+        Infeasible problems raise from solve_lp_async.
+        """
+        G = np.vstack([self.G, -self.G[:1]])
+        h = np.hstack([self.h, [-5.0]])
+        for pool in ("thread", "process"):
+            with self.assertRaises(ValueError):
+                asyncio.run(
+                    solve_lp_async(
+                        self.c, G, h, solver=available_solvers[0], pool=pool
+                    )
+                )
+
+    def test_batch(self):
+        """
+        Batches are split into chunks solved concurrently.
+        """
+        solver = available_solvers[0]
+        C = np.array([self.c, 2.0 * self.c, 0.5 * self.c])
+        H = np.tile(self.h, (3, 1))
+        for pool in ("thread", "process"):
+            X, found = asyncio.run(
+                solve_lps_async(
+                    C, self.G, H, solver=solver, n_jobs=2, pool=pool
+                )
+            )
+            self.assertEqual(X.shape, C.shape)
+            self.assertTrue(found.all())
+            for i in range(3):
+                x = solve_lp(C[i], self.G, H[i], solver=solver)
+                self.assertTrue(np.allclose(X[i], x, atol=1e-4))
+
+    def test_cancellation(self):
+        """
+        Cancelling a solve that waits for a worker process drops it, while
+        the running solve completes.
+        """
+        configure_async(max_processes=1)
+        try:
+
+            async def cancel():
+                running = asyncio.ensure_future(
+                    run_in_worker(sleep_and_return, (0.5,), True, None)
+                )
+                pending = asyncio.ensure_future(
+                    run_in_worker(sleep_and_return, (10.0,), True, None)
+                )
+                await asyncio.sleep(0.2)
+                pending.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await pending
+                return await running
+
+            start = time.perf_counter()
+            self.assertEqual(asyncio.run(cancel()), 0.5)
+            self.assertLess(time.perf_counter() - start, 5.0)
+        finally:
+            configure_async(max_processes=multiprocessing.cpu_count())
+
+    def test_process_reuse(self):
+        """
+        Worker processes are started once and reused across solves.
+        """
+        configure_async(max_processes=1)
+        try:
+            pids = [
+                asyncio.run(
+                    run_in_worker(sleep_and_get_pid, (0.0,), True, None)
+                )
+                for _ in range(3)
+            ]
+            self.assertEqual(len(set(pids)), 1)
+            self.assertNotEqual(pids[0], os.getpid())
+        finally:
+            configure_async(max_processes=multiprocessing.cpu_count())
+
+    def test_concurrency_limit(self):
+        """
+        No more worker processes than the limit run at the same time.
+        """
+        configure_async(max_processes=1)
+        try:
+
+            async def run_two():
+                return await asyncio.gather(
+                    run_in_worker(sleep_and_return, (0.3,), True, None),
+                    run_in_worker(sleep_and_return, (0.3,), True, None),
+                )
+
+            start = time.perf_counter()
+            asyncio.run(run_two())
+            self.assertGreaterEqual(time.perf_counter() - start, 0.6)
+        finally:
+            configure_async(max_processes=multiprocessing.cpu_count())
+        with self.assertRaises(ValueError):
+            configure_async(max_threads=0)
+
+    def test_race(self):
+        """
+        Lists of solvers are raced in a worker process.
+        """
+        solvers = available_solvers[:2]
+        x = asyncio.run(
+            solve_lp_async(self.c, self.G, self.h, solver=solvers, race=True)
+        )
+        self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-4))
+        solution = asyncio.run(
+            solve_problem_async(
+                Problem(self.c, self.G, self.h), solvers, race=True
+            )
+        )
+        self.assertTrue(solution.found)
+        self.assertIn(solution.extras["solver"], solvers)
+
+    def test_errors(self):
+        """
+        Missing and unknown solvers raise before dispatching.
+        """
+        problem = Problem(self.c, self.G, self.h)
+        with self.assertRaises(NoSolverSelected):
+            asyncio.run(solve_problem_async(problem))
+        with self.assertRaises(SolverNotFound):
+            asyncio.run(solve_problem_async(problem, "unknown"))
+        with self.assertRaises(SolverNotFound):
+            asyncio.run(
+                solve_problem_async(
+                    problem, [available_solvers[0], "unknown"], race=True
+                )
+            )
+        with self.assertRaises(ValueError):
+            asyncio.run(solve_problem_async(problem, available_solvers))
+        with self.assertRaises(NoSolverSelected):
+            asyncio.run(solve_lps_async(self.c[None], self.G, self.h[None]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -100,6 +100,75 @@ class TestSolveLP(unittest.TestCase):
 
         return test
 
+    @staticmethod
+    def get_test_initvals(solver):
+        """
+        Get test function for a given solver. In this variant, the solver is
+        given primal and dual initial guesses.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            c, G, h = self.get_small_problem()
+            kwargs = {"eps_abs": 1e-8} if solver == "proxqp" else {}
+            known_solution = np.array([2.2, -0.8, -3.4])
+            x = solve_lp(
+                c,
+                G,
+                h,
+                solver=solver,
+                initvals=known_solution + 0.1,
+                dual_initvals=np.array([0.0, 0.5, 0.0, 1.0]),
+                **kwargs,
+            )
+            sol_tolerance = (
+                1e-5
+                if solver == "pdlp"
+                else 1e-6 if solver in ("cvxpy", "proxqp") else 1e-8
+            )
+            self.assertLess(np.linalg.norm(x - known_solution), sol_tolerance)
+
+        return test
+
+    @staticmethod
+    def get_test_equality(solver):
+        """
+        Get test function for a given solver. In this variant, there are
+        both inequality and equality constraints.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            c, G, h = self.get_small_problem()
+            A = np.array([[2.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+            b = np.array([1.0, 0.0])
+            kwargs = {"eps_abs": 1e-8} if solver == "proxqp" else {}
+            x = solve_lp(c, G, h, A, b, solver=solver, **kwargs)
+            known_solution = np.array([0.5, -2.5, 0.0])
+            sol_tolerance = 1e-6 if solver in ("cvxpy", "pdlp") else 1e-8
+            self.assertLess(np.linalg.norm(x - known_solution), sol_tolerance)
+            self.assertLess(np.linalg.norm(A @ x - b), sol_tolerance)
+
+        return test
+
     @staticmethod
     def get_test_one_ineq(solver):
         """
@@ -154,6 +223,16 @@ class TestSolveLP(unittest.TestCase):
 # Generate test fixtures for each solver
 for solver in available_solvers:
     setattr(TestSolveLP, f"test_{solver}", TestSolveLP.get_test(solver))
+    setattr(
+        TestSolveLP,
+        f"test_initvals_{solver}",
+        TestSolveLP.get_test_initvals(solver),
+    )
+    setattr(
+        TestSolveLP,
+        f"test_equality_{solver}",
+        TestSolveLP.get_test_equality(solver),
+    )
     setattr(
         TestSolveLP,
         f"test_one_ineq_{solver}",
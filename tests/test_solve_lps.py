@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for the batched `solve_lps` function.
+"""
+
+import importlib
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import (
+    available_solvers,
+    solve_lp,
+    solve_lp_multi_cost,
+    solve_lps,
+)
+from lpsolvers.exceptions import NoSolverSelected, SolverNotFound
+
+
+class TestSolveLPs(unittest.TestCase):
+    """
+    Test fixture for batches of linear programs.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+        self.C = np.vstack([c, c + 0.1, c - 0.1, 2.0 * c])
+
+    def test_no_solver_selected(self):
+        """
+        Check that NoSolverSelected is raised when the solver is not set.
+        """
+        with self.assertRaises(NoSolverSelected):
+            solve_lps(self.C, self.G, self.h)
+
+    def test_solver_not_found(self):
+        """
+        Check that SolverNotFound is raised when the solver does not exist.
+        """
+        with self.assertRaises(SolverNotFound):
+            solve_lps(self.C, self.G, self.h, solver="ideal")
+
+    def test_inconsistent_batch_sizes(self):
+        """
+        Check that stacked arguments must have the same batch size.
+        """
+        H = np.vstack([self.h, self.h])
+        with self.assertRaises(ValueError):
+            solve_lps(self.C, self.G, H, solver=available_solvers[0])
+
+    def test_inconsistent_dimensions(self):
+        """
+        Check that matrices must have as many columns as variables.
+        """
+        with self.assertRaises(ValueError):
+            solve_lps(
+                self.C, self.G[:, :2], self.h, solver=available_solvers[0]
+            )
+
+    def test_inconsistent_rows(self):
+        """
+        Check that vectors must have one entry per constraint row.
+        """
+        with self.assertRaises(ValueError):
+            solve_lps(self.C, self.G[:3], self.h, solver=available_solvers[0])
+
+    def test_shared_setup(self):
+        """
+        Check that shared matrices are set up once per batch, and that
+        infeasible problems in the batch are reported as not found.
+        """
+        module = importlib.import_module("lpsolvers.solve_lps")
+        G = np.vstack([self.G, -self.G[:1]])
+        H = np.tile(np.hstack([self.h, 0.0]), (4, 1))
+        H[2, -1] = -5.0  # contradicts the first row
+        with mock.patch.object(
+            module, "make_lp_solver", wraps=module.make_lp_solver
+        ) as make_lp_solver:
+            X, found = solve_lps(self.C, G, H, solver="highs")
+        self.assertEqual(make_lp_solver.call_count, 1)
+        self.assertEqual(found.tolist(), [True, True, False, True])
+        self.assertTrue(np.isnan(X[2]).all())
+
+    @staticmethod
+    def get_test_shared(solver, **solve_kwargs):
+        """
+        Get test function for a batch of costs with shared constraints.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+        solve_kwargs : dict
+            Keyword arguments for ``solve_lps``.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            kwargs = {"eps_abs": 1e-8} if solver == "proxqp" else {}
+            tolerance = 1e-5 if solver in ("cvxpy", "pdlp", "proxqp") else 1e-7
+            X, found = solve_lps(
+                self.C, self.G, self.h, solver=solver, **solve_kwargs, **kwargs
+            )
+            self.assertEqual(X.shape, self.C.shape)
+            self.assertTrue(np.all(found))
+            for c, x in zip(self.C, X):
+                x_ref = solve_lp(c, self.G, self.h, solver=solver, **kwargs)
+                self.assertLess(np.linalg.norm(x - x_ref), tolerance)
+
+        return test
+
+    @unittest.skipUnless("cvxpy" in available_solvers, "requires CVXPY")
+    def test_shared_sparse(self):
+        """
+        Check that shared constraint matrices can be sparse.
+        """
+        X, found = solve_lps(
+            self.C, spa.csc_matrix(self.G), self.h, solver="cvxpy"
+        )
+        self.assertTrue(np.all(found))
+        X_dense, _ = solve_lps(self.C, self.G, self.h, solver="cvxpy")
+        self.assertLess(np.linalg.norm(X - X_dense), 1e-6)
+
+    @staticmethod
+    def get_test_stacked_infeasible(solver):
+        """
+        Get test function for a batch of stacked constraints where one problem
+        is infeasible.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            G = np.stack([self.G, self.G, self.G, self.G])
+            G[2, 1] *= -1.0  # makes third problem unfeasible
+            X, found = solve_lps(self.C, G, self.h, solver=solver)
+            self.assertListEqual(list(found), [True, True, False, True])
+            self.assertTrue(np.all(np.isnan(X[2])))
+            self.assertFalse(np.any(np.isnan(X[found])))
+
+        return test
+
+    @staticmethod
+    def get_test_multi_cost(solver):
+        """
+        Get test function for a stack of costs solved against constraints
+        set up once.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            kwargs = {"eps_abs": 1e-8} if solver == "proxqp" else {}
+            tolerance = 1e-5 if solver in ("cvxpy", "pdlp", "proxqp") else 1e-7
+            X, found = solve_lp_multi_cost(
+                self.C, self.G, self.h, solver=solver, **kwargs
+            )
+            self.assertEqual(X.shape, self.C.shape)
+            self.assertTrue(np.all(found))
+            for c, x in zip(self.C, X):
+                x_ref = solve_lp(c, self.G, self.h, solver=solver, **kwargs)
+                self.assertLess(np.linalg.norm(x - x_ref), tolerance)
+
+        return test
+
+    def test_multi_cost_infeasible(self):
+        """
+        Check that no cost vector has a solution when constraints are
+        infeasible, and that cost vectors must be stacked.
+        """
+        G = np.vstack([self.G, -self.G[:1]])
+        h = np.hstack([self.h, [-5.0]])
+        X, found = solve_lp_multi_cost(self.C, G, h, solver="simplex")
+        self.assertFalse(np.any(found))
+        self.assertTrue(np.all(np.isnan(X)))
+        with self.assertRaises(ValueError):
+            solve_lp_multi_cost(self.C[0], self.G, self.h, solver="simplex")
+        with self.assertRaises(NoSolverSelected):
+            solve_lp_multi_cost(self.C, self.G, self.h)
+
+
+for solver in available_solvers:
+    setattr(
+        TestSolveLPs,
+        f"test_multi_cost_{solver}",
+        TestSolveLPs.get_test_multi_cost(solver),
+    )
+    setattr(
+        TestSolveLPs,
+        f"test_shared_{solver}",
+        TestSolveLPs.get_test_shared(solver),
+    )
+    setattr(
+        TestSolveLPs,
+        f"test_stacked_infeasible_{solver}",
+        TestSolveLPs.get_test_stacked_infeasible(solver),
+    )
+
+for solver in ("cvxopt", "proxqp"):
+    if solver in available_solvers:
+        setattr(
+            TestSolveLPs,
+            f"test_thread_pool_{solver}",
+            TestSolveLPs.get_test_shared(solver, n_jobs=2, pool="thread"),
+        )
+        setattr(
+            TestSolveLPs,
+            f"test_process_pool_{solver}",
+            TestSolveLPs.get_test_shared(solver, n_jobs=2, pool="process"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for the solve_problem function and the solutions it returns.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+
+from lpsolvers import (
+    Problem,
+    ProblemError,
+    available_solvers,
+    make_lp_solver,
+    solve_problem,
+)
+from lpsolvers.exceptions import NoSolverSelected, SolverNotFound
+
+
+class TestSolveProblem(unittest.TestCase):
+    """
+    Test fixture for full solutions returned by LP solvers.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        c = np.array([1.0, 2.0, 3.0])
+        G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        h = np.array([4.0, 1.0, 3.0, 2.0])
+        A = np.array([[2.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        b = np.array([1.0, 0.0])
+        self.problem = Problem(c, G, h)
+        self.eq_problem = Problem(c, G, h, A, b)
+
+    def test_no_solver_selected(self):
+        """
+        Check that NoSolverSelected is raised when the solver is not set.
+        """
+        with self.assertRaises(NoSolverSelected):
+            solve_problem(self.problem)
+
+    def test_solver_not_found(self):
+        """
+        Check that SolverNotFound is raised when the solver does not exist.
+        """
+        with self.assertRaises(SolverNotFound):
+            solve_problem(self.problem, solver="ideal")
+
+    def test_problem_error(self):
+        """
+        Check that ProblemError is raised on incomplete constraints.
+        """
+        problem = Problem(self.problem.c, self.problem.G, None)
+        with self.assertRaises(ProblemError):
+            solve_problem(problem, solver="ideal")
+
+    @staticmethod
+    def get_test_optimality(solver):
+        """
+        Get test function checking primal and dual optimality of the
+        solution returned by a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            kwargs = {"eps_abs": 1e-8} if solver == "proxqp" else {}
+            eps_abs = 1e-5 if solver in ("cvxpy", "pdlp", "proxqp") else 1e-7
+            for problem in (self.problem, self.eq_problem):
+                solution = solve_problem(problem, solver=solver, **kwargs)
+                self.assertTrue(solution.found)
+                self.assertIs(solution.problem, problem)
+                self.assertIsNotNone(solution.status)
+                self.assertTrue(solution.is_optimal(eps_abs))
+                self.assertTrue(np.all(solution.z > -eps_abs))
+                self.assertAlmostEqual(
+                    solution.obj, problem.c.dot(solution.x), places=5
+                )
+                if problem.A is None:
+                    self.assertIsNone(solution.y)
+                else:
+                    self.assertEqual(solution.y.shape, (2,))
+                self.assertGreaterEqual(solution.conversion_time, 0.0)
+                self.assertGreaterEqual(solution.setup_time, 0.0)
+                self.assertGreater(solution.solve_time, 0.0)
+                self.assertGreaterEqual(solution.run_time, solution.solve_time)
+                if solver in ("pdlp", "proxqp"):
+                    self.assertGreater(solution.iter, 0)
+
+        return test
+
+    @staticmethod
+    def get_test_unfeasible(solver):
+        """
+        Get test function checking that unfeasible problems give a solution
+        that is not found, rather than an exception.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            problem = Problem(
+                self.problem.c,
+                self.problem.G,
+                self.problem.h,
+                np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]),
+                np.array([0.5, 10.0]),  # 2 x[0] + x[2] <= 1 is violated
+            )
+            solution = solve_problem(problem, solver=solver)
+            self.assertFalse(solution.found)
+            self.assertIsNone(solution.x)
+            self.assertIsNotNone(solution.status)
+            self.assertEqual(solution.primal_residual(), np.inf)
+
+        return test
+
+    @staticmethod
+    def get_test_repeated_timings(solver):
+        """
+        Get test function checking that repeated solves of a linear program
+        kept alive only report setup time once.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            c, G, h, _, _, _, _ = self.problem.unpack()
+            lp = make_lp_solver(c, G, h, solver=solver)
+            first = lp.solve_problem()
+            lp.update(c=c + 0.1)
+            second = lp.solve_problem()
+            self.assertTrue(first.found and second.found)
+            self.assertTrue(np.allclose(second.problem.c, c + 0.1))
+            if solver in ("pdlp", "proxqp"):  # model built in constructor
+                self.assertGreater(first.setup_time, second.setup_time)
+
+        return test
+
+
+for solver in available_solvers:
+    for name in ("optimality", "unfeasible", "repeated_timings"):
+        setattr(
+            TestSolveProblem,
+            f"test_{name}_{solver}",
+            getattr(TestSolveProblem, f"get_test_{name}")(solver),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for sparse constraint matrices, which should not be densified.
+"""
+
+import tracemalloc
+import unittest
+import warnings
+
+import numpy as np
+import scipy.sparse as spa
+
+from lpsolvers import Problem, available_solvers, solve_lp, solve_problem
+
+
+class TestSparse(unittest.TestCase):
+    """
+    Test fixture for linear programs with sparse constraint matrices.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+        self.A = np.array([[2.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        self.b = np.array([1.0, 0.0])
+
+    @staticmethod
+    def get_large_problem(n: int = 1000, m: int = 5000) -> Problem:
+        """
+        Get a feasible and bounded LP with a sparse inequality matrix.
+
+        Parameters
+        ----------
+        n : int
+            Number of optimization variables.
+        m : int
+            Number of random inequality constraints, in addition to box
+            constraints.
+
+        Returns
+        -------
+        problem : Problem
+            Linear program whose constraint matrix has density below 0.1%.
+        """
+        rng = np.random.default_rng(42)
+        G_rand = spa.random(m, n, density=1e-3, format="csc", random_state=rng)
+        eye = spa.eye(n, format="csc")
+        G = spa.vstack([G_rand, eye, -eye], format="csc")
+        x_feas = rng.uniform(-0.5, 0.5, n)
+        h = np.hstack([G_rand @ x_feas + 1.0, np.ones(2 * n)])
+        c = rng.standard_normal(n)
+        return Problem(c, G, h)
+
+    @staticmethod
+    def get_test_formats(solver):
+        """
+        Get test function checking that a solver gives the same solution
+        with dense, CSC and CSR constraint matrices.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            tolerance = 1e-5 if solver in ("cvxpy", "pdlp", "proxqp") else 1e-7
+            x_dense = solve_lp(
+                self.c, self.G, self.h, self.A, self.b, solver=solver
+            )
+            for to_sparse in (spa.csc_matrix, spa.csr_matrix):
+                for G, A in (
+                    (to_sparse(self.G), self.A),
+                    (self.G, to_sparse(self.A)),
+                    (to_sparse(self.G), to_sparse(self.A)),
+                ):
+                    x = solve_lp(self.c, G, self.h, A, self.b, solver=solver)
+                    self.assertLess(np.linalg.norm(x - x_dense), tolerance)
+
+        return test
+
+    @unittest.skipIf("proxqp" not in available_solvers, "requires ProxQP")
+    def test_proxqp_sparse_backend(self):
+        """
+        Check that the sparse backend of ProxQP, which reports false
+        infeasibility on LPs, is deprecated in favor of the dense backend.
+        """
+        G = spa.csc_matrix(self.G)
+        x_dense = solve_lp(self.c, self.G, self.h, solver="proxqp")
+        with self.assertWarns(DeprecationWarning):
+            x = solve_lp(self.c, G, self.h, solver="proxqp", backend="sparse")
+        self.assertLess(np.linalg.norm(x - x_dense), 1e-6)
+        with self.assertRaises(ValueError):
+            solve_lp(self.c, G, self.h, solver="proxqp", backend="unknown")
+
+    @staticmethod
+    def get_test_random(solver):
+        """
+        Get test function checking that a solver finds the optimum of random
+        feasible LPs with sparse constraint matrices.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            kwargs = {"eps_abs": 1e-8} if solver == "proxqp" else {}
+            rng = np.random.default_rng(42)
+            n, m = 20, 60
+            for _ in range(5):
+                G_rand = spa.random(m, n, density=0.3, random_state=rng)
+                eye = spa.eye(n)
+                G = spa.vstack([G_rand, eye, -eye], format="csc")
+                x_feas = rng.uniform(-0.5, 0.5, n)
+                h = np.hstack([G_rand @ x_feas + 1.0, np.ones(2 * n)])
+                c = rng.standard_normal(n)
+                problem = Problem(c, G, h)
+                solution = solve_problem(problem, solver=solver, **kwargs)
+                reference = solve_problem(problem, solver="highs")
+                self.assertTrue(solution.found)
+                self.assertAlmostEqual(solution.obj, reference.obj, places=4)
+
+        return test
+
+    @staticmethod
+    def get_test_large(solver):
+        """
+        Get test function checking that a solver handles a large sparse LP
+        without densifying its constraint matrix.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            problem = TestSparse.get_large_problem()
+            dense_size = np.prod(problem.G.shape) * problem.G.dtype.itemsize
+            solve_lp(  # import and warm up the backend outside of tracing
+                np.ones(2), -np.eye(2), np.ones(2), solver=solver
+            )
+            tracemalloc.start()
+            try:
+                solution = solve_problem(problem, solver=solver)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertLess(peak, 0.1 * dense_size)
+            self.assertLess(solution.conversion_time, 1.0)
+            self.assertLess(solution.run_time, 30.0)
+            self.assertTrue(solution.found)
+            self.assertLess(solution.primal_residual(), 1e-5)
+
+        return test
+
+
+for solver in available_solvers:
+    setattr(
+        TestSparse,
+        f"test_formats_{solver}",
+        TestSparse.get_test_formats(solver),
+    )
+    setattr(
+        TestSparse,
+        f"test_random_{solver}",
+        TestSparse.get_test_random(solver),
+    )
+    if solver not in ("cdd", "proxqp", "simplex"):  # which densify matrices
+        setattr(
+            TestSparse,
+            f"test_large_{solver}",
+            TestSparse.get_test_large(solver),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
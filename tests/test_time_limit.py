@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2016-2022 Stéphane Caron
+
+"""
+Tests for wall-clock time limits.
+"""
+
+import multiprocessing
+import time
+import unittest
+import warnings
+
+import numpy as np
+
+from lpsolvers import (
+    Problem,
+    SolverTimeout,
+    available_solvers,
+    solve_lp,
+    solve_problem,
+)
+from lpsolvers.benchmark import generate_problem
+from lpsolvers.exceptions import LPSolverException
+
+
+class TestTimeLimit(unittest.TestCase):
+    """
+    Test fixture for wall-clock time limits.
+    """
+
+    def setUp(self):
+        """
+        Prepare test fixture.
+        """
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        warnings.simplefilter("ignore", category=UserWarning)
+        self.c = np.array([1.0, 2.0, 3.0])
+        self.G = np.array(
+            [
+                [1.0, 2.0, -1.0],
+                [2.0, 0.0, 1.0],
+                [1.0, 2.0, 1.0],
+                [-1.0, -1.0, -1.0],
+            ]
+        )
+        self.h = np.array([4.0, 1.0, 3.0, 2.0])
+
+    def test_exception(self):
+        """
+        Timeouts are lpsolvers exceptions carrying a solution.
+        """
+        exception = SolverTimeout("message", solution=None)
+        self.assertIsInstance(exception, LPSolverException)
+        self.assertIsNone(exception.solution)
+
+    def test_supervised_timeout(self):
+        """
+        Solvers without native time limits are terminated.
+        """
+        if "cdd" not in available_solvers:
+            self.skipTest("cdd is not available")
+        children = set(multiprocessing.active_children())
+        problem = generate_problem("feasible", 300, "dense").problem
+        start_time = time.perf_counter()
+        with self.assertRaises(SolverTimeout) as context:
+            solve_problem(problem, "cdd", time_limit=0.2)
+        self.assertLess(time.perf_counter() - start_time, 5.0)
+        self.assertFalse(context.exception.solution.found)
+        self.assertEqual(set(multiprocessing.active_children()), children)
+
+    def test_native_timeout(self):
+        """
+        PDLP stops by itself and reports its last iterate.
+        """
+        if "pdlp" not in available_solvers:
+            self.skipTest("PDLP is not available")
+        problem = generate_problem("feasible", 2000, "sparse").problem
+        with self.assertRaises(SolverTimeout) as context:
+            solve_problem(problem, "pdlp", time_limit=1e-3)
+        solution = context.exception.solution
+        self.assertEqual(solution.status, "TERMINATION_REASON_TIME_LIMIT")
+        self.assertEqual(solution.extras["iterate"].shape, (2000,))
+
+    @staticmethod
+    def get_test_within_limit(solver: str):
+        """
+        Get test function for a given solver.
+
+        Parameters
+        ----------
+        solver : string
+            Name of the solver to test.
+
+        Returns
+        -------
+        test : function
+            Test function for that solver.
+        """
+
+        def test(self):
+            x = solve_lp(
+                self.c, self.G, self.h, solver=solver, time_limit=30.0
+            )
+            self.assertTrue(np.allclose(x, [2.2, -0.8, -3.4], atol=1e-4))
+            solution = solve_problem(
+                Problem(self.c, self.G, self.h), solver, time_limit=30.0
+            )
+            self.assertTrue(solution.found)
+
+        return test
+
+
+for solver in available_solvers:
+    setattr(
+        TestTimeLimit,
+        f"test_within_limit_{solver}",
+        TestTimeLimit.get_test_within_limit(solver),
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()